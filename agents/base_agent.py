@@ -52,6 +52,7 @@ class BaseAgent(ABC):
         
         # Tracking
         self.total_offspring = 0
+        self.death_cause = None       # 'predation' jika dimangsa, selain itu 'natural'
     
     def calculate_mortality_probability(self, environment_cell) -> float:
         """
@@ -126,9 +127,10 @@ class BaseAgent(ABC):
         self.age += 1
         self.energy = max(0, self.energy - self.metabolic_cost)
     
-    def die(self):
-        """Tandai agen sebagai mati"""
+    def die(self, cause: str = 'natural'):
+        """Tandai agen sebagai mati beserta penyebabnya"""
         self.alive = False
+        self.death_cause = cause
     
     def __str__(self):
         return f"{self.species_name}({self.agent_id}) at ({self.x},{self.y}) - Energy: {self.energy:.1f}"
@@ -157,28 +159,32 @@ class HerbivoreAgent(BaseAgent):
         max_x, max_y = grid_bounds
         best_score = float('-inf')
         best_position = (self.x, self.y)
+        conditions = environment.cell_conditions
         
         # Cek semua posisi dalam radius mobilitas
         for dx in range(-self.mobility, self.mobility + 1):
+            new_x = max(0, min(max_x - 1, self.x + dx))
             for dy in range(-self.mobility, self.mobility + 1):
-                new_x = max(0, min(max_x - 1, self.x + dx))
                 new_y = max(0, min(max_y - 1, self.y + dy))
                 
-                cell = environment.get_cell(new_x, new_y)
+                food, temperature, humidity = conditions(new_x, new_y)
                 distance = abs(dx) + abs(dy)  # Manhattan distance
                 
                 # Heuristik: makanan - biaya jarak
-                score = cell.food * 2.0 - distance * 1.0
+                score = food * 2.0 - distance * 1.0
                 
                 # Bonus untuk kondisi lingkungan yang sesuai
-                if (self.min_temp <= cell.temperature <= self.max_temp and
-                    self.min_humidity <= cell.humidity <= self.max_humidity):
+                if (self.min_temp <= temperature <= self.max_temp and
+                    self.min_humidity <= humidity <= self.max_humidity):
                     score += 10.0
                 
                 if score > best_score:
                     best_score = score
                     best_position = (new_x, new_y)
         
+        if environment.probe is not None:
+            window = 2 * self.mobility + 1
+            environment.probe.cells(window * window)
         return best_position
     
     def forage(self, environment_cell) -> float:
@@ -227,6 +233,8 @@ class HerbivoreAgent(BaseAgent):
         
         # 3. Makan
         current_cell = environment.get_cell(self.x, self.y)
+        if environment.probe is not None:
+            environment.probe.cells()
         food_consumed = self.forage(current_cell)
         self.energy += food_consumed
         
@@ -275,32 +283,36 @@ class ElkAgent(BaseAgent):
         max_x, max_y = grid_bounds
         best_score = float('-inf')
         best_position = (self.x, self.y)
+        conditions = environment.cell_conditions
         
         # Cek semua posisi dalam radius mobilitas
         for dx in range(-self.mobility, self.mobility + 1):
+            new_x = max(0, min(max_x - 1, self.x + dx))
             for dy in range(-self.mobility, self.mobility + 1):
-                new_x = max(0, min(max_x - 1, self.x + dx))
                 new_y = max(0, min(max_y - 1, self.y + dy))
                 
-                cell = environment.get_cell(new_x, new_y)
+                food, temperature, humidity = conditions(new_x, new_y)
                 distance = abs(dx) + abs(dy)
                 
                 # Elk butuh makanan banyak karena ukuran besar
-                score = cell.food * 3.0 - distance * 1.5
+                score = food * 3.0 - distance * 1.5
                 
                 # Bonus untuk kondisi lingkungan yang sesuai
-                if (self.min_temp <= cell.temperature <= self.max_temp and
-                    self.min_humidity <= cell.humidity <= self.max_humidity):
+                if (self.min_temp <= temperature <= self.max_temp and
+                    self.min_humidity <= humidity <= self.max_humidity):
                     score += 15.0
                 
                 # Bonus untuk area terbuka (elk suka grassland)
-                if cell.food > 50:  # Area dengan banyak rumput
+                if food > 50:  # Area dengan banyak rumput
                     score += 20.0
                 
                 if score > best_score:
                     best_score = score
                     best_position = (new_x, new_y)
         
+        if environment.probe is not None:
+            window = 2 * self.mobility + 1
+            environment.probe.cells(window * window)
         return best_position
     
     def forage(self, environment_cell) -> float:
@@ -370,10 +382,15 @@ class ElkAgent(BaseAgent):
         
         # 2. Cek predator dan flee jika perlu
         predator_nearby = self.check_predator_nearby(all_agents)
+        if environment.probe is not None:
+            environment.probe.scan()
         
         if predator_nearby:
             # Flee behavior - cari posisi terjauh dari predator
             self._flee_from_predators(environment, all_agents)
+            if environment.probe is not None:
+                window = 2 * self.mobility + 1
+                environment.probe.flee(window * window)
         else:
             # Normal foraging behavior
             grid_bounds = (environment.width, environment.height)
@@ -382,6 +399,8 @@ class ElkAgent(BaseAgent):
         
         # 3. Makan
         current_cell = environment.get_cell(self.x, self.y)
+        if environment.probe is not None:
+            environment.probe.cells()
         food_consumed = self.forage(current_cell)
         self.energy += food_consumed
         
@@ -476,27 +495,31 @@ class CarnivoreAgent(BaseAgent):
         max_x, max_y = grid_bounds
         best_score = float('-inf')
         best_position = (self.x, self.y)
+        conditions = environment.cell_conditions
         
         for dx in range(-self.mobility, self.mobility + 1):
+            new_x = max(0, min(max_x - 1, self.x + dx))
             for dy in range(-self.mobility, self.mobility + 1):
-                new_x = max(0, min(max_x - 1, self.x + dx))
                 new_y = max(0, min(max_y - 1, self.y + dy))
                 
-                cell = environment.get_cell(new_x, new_y)
+                food, temperature, humidity = conditions(new_x, new_y)
                 distance = abs(dx) + abs(dy)
                 
                 # Karnivora tertarik area dengan makanan (menarik herbivora)
-                score = cell.food * 0.5 - distance * 1.0
+                score = food * 0.5 - distance * 1.0
                 
                 # Bonus kondisi lingkungan yang sesuai
-                if (self.min_temp <= cell.temperature <= self.max_temp and
-                    self.min_humidity <= cell.humidity <= self.max_humidity):
+                if (self.min_temp <= temperature <= self.max_temp and
+                    self.min_humidity <= humidity <= self.max_humidity):
                     score += 8.0
                 
                 if score > best_score:
                     best_score = score
                     best_position = (new_x, new_y)
         
+        if environment.probe is not None:
+            window = 2 * self.mobility + 1
+            environment.probe.cells(window * window)
         return best_position
     
     def scan_for_prey(self, all_agents: List[BaseAgent]) -> List[BaseAgent]:
@@ -605,7 +628,7 @@ class CarnivoreAgent(BaseAgent):
             self.energy += energy_gained
             
             # Kill the prey
-            target.die()
+            target.die('predation')
             
             return True
         else:
@@ -655,13 +678,20 @@ class CarnivoreAgent(BaseAgent):
         
         # 3. Scan untuk mangsa
         available_prey = self.scan_for_prey(all_agents)
+        probe = environment.probe
+        if probe is not None:
+            probe.prey_scan(len(all_agents))
         
         if available_prey and self.energy > 20:  # Hanya berburu jika punya energi cukup
             # Ada mangsa, pilih target berdasarkan preferensi
             target = self.select_preferred_target(available_prey)
             
             if target:
+                if probe is not None and target.alive and all_agents:
+                    probe.scan()   # _count_nearby_carnivores di attempt_hunt
                 hunt_success = self.attempt_hunt(target, all_agents)
+                if probe is not None:
+                    probe.hunt(target.species_type.value, hunt_success)
                 
                 if not hunt_success:
                     # Jika gagal, coba pindah lebih dekat ke target
@@ -676,6 +706,8 @@ class CarnivoreAgent(BaseAgent):
         
         # 4. Mortalitas dengan starvation tolerance
         current_cell = environment.get_cell(self.x, self.y)
+        if environment.probe is not None:
+            environment.probe.cells()
         mortality_prob = self.calculate_mortality_probability(current_cell)
         
         # Penalti kelaparan hanya setelah melewati toleransi
@@ -0,0 +1,290 @@
+"""
+Kernel teroptimasi (NumPy) untuk method agen di hot path
+Setiap kernel memproses banyak agen sekaligus dari array dan harus memberi
+hasil identik dengan method referensi berbasis objek di base_agent.py:
+    find_optimal_position, _flee_from_predators, scan_for_prey,
+    _count_nearby_carnivores, forage, calculate_mortality_probability
+Kesetaraan dicek oleh harness di benchmarks/kernels.py
+"""
+
+import numpy as np
+from typing import Dict, Tuple, List, Callable
+
+# Bobot heuristik gerak per spesies, sama dengan find_optimal_position:
+# (bobot makanan, bobot jarak, bonus lingkungan sesuai, bonus grassland)
+MOVEMENT_WEIGHTS = {
+    'herbivore': (2.0, 1.0, 10.0, 0.0),
+    'elk': (3.0, 1.5, 15.0, 20.0),
+    'carnivore': (0.5, 1.0, 8.0, 0.0)
+}
+GRASSLAND_FOOD_THRESHOLD = 50  # Elk: bonus jika cell.food > 50
+
+# Faktor forage (kondisi ideal, kondisi buruk) per spesies herbivora
+FORAGE_FACTORS = {
+    'herbivore': (1.2, 0.7),
+    'elk': (1.3, 0.6)
+}
+
+PREDATOR_DETECTION_RADIUS = 3  # check_predator_nearby
+PACK_RADIUS = 3                # _count_nearby_carnivores
+
+
+def _offsets(mobility: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Offset (dx, dy) dalam urutan loop referensi: dx luar, dy dalam
+    """
+    span = np.arange(-mobility, mobility + 1)
+    dx = np.repeat(span, span.size)
+    dy = np.tile(span, span.size)
+    return dx, dy
+
+
+def _candidate_cells(xs: np.ndarray, ys: np.ndarray, mobility: int,
+                     width: int, height: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Posisi kandidat (N, K) yang sudah di-clamp ke grid plus jarak Manhattan (K,)
+    """
+    dx, dy = _offsets(mobility)
+    cand_x = np.clip(xs[:, None] + dx[None, :], 0, width - 1)
+    cand_y = np.clip(ys[:, None] + dy[None, :], 0, height - 1)
+    distance = np.abs(dx) + np.abs(dy)
+    return cand_x, cand_y, distance
+
+
+def _in_tolerance(temperature: np.ndarray, humidity: np.ndarray, tolerance) -> np.ndarray:
+    min_temp, max_temp, min_humidity, max_humidity = tolerance
+    return ((min_temp <= temperature) & (temperature <= max_temp) &
+            (min_humidity <= humidity) & (humidity <= max_humidity))
+
+
+# ----------------------------------------------------------------------
+# find_optimal_position
+# ----------------------------------------------------------------------
+
+def find_optimal_positions(food: np.ndarray, temperature: np.ndarray, humidity: np.ndarray,
+                           xs: np.ndarray, ys: np.ndarray, mobility: int, species: str,
+                           tolerance: Tuple[float, float, float, float]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versi batch find_optimal_position untuk N agen satu spesies
+    Move to = arg max [Makanan(x,y) - Jarak(x,y)] (+ bonus), tie -> kandidat pertama
+
+    Args:
+        food, temperature, humidity: Array grid (width, height)
+        xs, ys: Posisi agen (N,)
+        mobility: Radius gerak spesies
+        species: 'herbivore', 'elk', atau 'carnivore'
+        tolerance: (min_temp, max_temp, min_humidity, max_humidity)
+    """
+    width, height = food.shape
+    food_weight, distance_weight, env_bonus, grass_bonus = MOVEMENT_WEIGHTS[species]
+    cand_x, cand_y, distance = _candidate_cells(xs, ys, mobility, width, height)
+
+    cell_food = food[cand_x, cand_y]
+    score = cell_food * food_weight - distance * distance_weight
+    suitable = _in_tolerance(temperature[cand_x, cand_y], humidity[cand_x, cand_y], tolerance)
+    score = score + np.where(suitable, env_bonus, 0.0)
+    if grass_bonus:
+        score = score + np.where(cell_food > GRASSLAND_FOOD_THRESHOLD, grass_bonus, 0.0)
+
+    best = np.argmax(score, axis=1)
+    rows = np.arange(xs.size)
+    return cand_x[rows, best], cand_y[rows, best]
+
+
+# ----------------------------------------------------------------------
+# _flee_from_predators
+# ----------------------------------------------------------------------
+
+def _sum_abs_distance(sorted_values: np.ndarray, prefix: np.ndarray, query: np.ndarray) -> np.ndarray:
+    """
+    sum_i |v_i - q| untuk setiap q memakai prefix sum dari nilai terurut
+    """
+    count = sorted_values.size
+    below = np.searchsorted(sorted_values, query, side='right')
+    total = prefix[-1]
+    return (query * below - prefix[below]) + ((total - prefix[below]) - query * (count - below))
+
+
+def flee_positions(xs: np.ndarray, ys: np.ndarray, mobility: int,
+                   predator_x: np.ndarray, predator_y: np.ndarray,
+                   width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Versi batch _flee_from_predators: pilih kandidat dengan total jarak
+    Manhattan terbesar ke semua predator hidup
+    Jarak x dan y dipisah sehingga biaya O(N*K*log P), bukan O(N*K*P)
+    """
+    cand_x, cand_y, _ = _candidate_cells(xs, ys, mobility, width, height)
+    if predator_x.size == 0:
+        return cand_x[:, 0], cand_y[:, 0]
+
+    px = np.sort(predator_x.astype(np.int64))
+    py = np.sort(predator_y.astype(np.int64))
+    prefix_x = np.concatenate(([0], np.cumsum(px)))
+    prefix_y = np.concatenate(([0], np.cumsum(py)))
+
+    score = (_sum_abs_distance(px, prefix_x, cand_x.astype(np.int64)) +
+             _sum_abs_distance(py, prefix_y, cand_y.astype(np.int64)))
+    best = np.argmax(score, axis=1)
+    rows = np.arange(xs.size)
+    return cand_x[rows, best], cand_y[rows, best]
+
+
+# ----------------------------------------------------------------------
+# Query tetangga: scan_for_prey, _count_nearby_carnivores, check_predator_nearby
+# ----------------------------------------------------------------------
+
+def scan_for_prey_numpy(x: int, y: int, hunt_range: int, agent_x: np.ndarray, agent_y: np.ndarray,
+                        prey_mask: np.ndarray) -> np.ndarray:
+    """
+    Indeks agen mangsa (urut sesuai daftar agen) dalam radius Manhattan hunt_range
+    prey_mask: agen hidup dan berjenis herbivora/elk
+    """
+    distance = np.abs(agent_x - x) + np.abs(agent_y - y)
+    return np.flatnonzero(prey_mask & (distance <= hunt_range))
+
+
+def count_nearby_numpy(x: int, y: int, radius: int, agent_x: np.ndarray, agent_y: np.ndarray,
+                       mask: np.ndarray, exclude: int = -1) -> int:
+    """
+    Jumlah agen pada mask dalam radius Manhattan (tanpa agen exclude)
+    """
+    distance = np.abs(agent_x - x) + np.abs(agent_y - y)
+    hits = mask & (distance <= radius)
+    if 0 <= exclude < hits.size and hits[exclude]:
+        return int(np.count_nonzero(hits)) - 1
+    return int(np.count_nonzero(hits))
+
+
+class GridIndex:
+    """
+    Indeks spasial bucket per sel grid untuk query radius Manhattan
+    Agen diurutkan berdasarkan id sel (stable) sehingga setiap sel adalah slice
+    Hasil query dikembalikan urut indeks agen, sama dengan loop referensi
+    """
+
+    def __init__(self, agent_x: np.ndarray, agent_y: np.ndarray, mask: np.ndarray,
+                 width: int, height: int):
+        self.width = width
+        self.height = height
+        self.indices = np.flatnonzero(mask)
+        cell_ids = agent_x[self.indices].astype(np.int64) * height + agent_y[self.indices]
+        order = np.argsort(cell_ids, kind='stable')
+        self.indices = self.indices[order]
+        self.sorted_cells = cell_ids[order]
+
+    def query(self, x: int, y: int, radius: int) -> np.ndarray:
+        """Indeks agen (terurut) dalam radius Manhattan dari (x, y)"""
+        x0, x1 = max(0, x - radius), min(self.width - 1, x + radius)
+        if self.indices.size == 0:
+            return self.indices
+        parts = []
+        for cx in range(x0, x1 + 1):
+            reach = radius - abs(cx - x)
+            y0, y1 = max(0, y - reach), min(self.height - 1, y + reach)
+            start = np.searchsorted(self.sorted_cells, cx * self.height + y0, side='left')
+            stop = np.searchsorted(self.sorted_cells, cx * self.height + y1, side='right')
+            if stop > start:
+                parts.append(self.indices[start:stop])
+        if not parts:
+            return self.indices[:0]
+        return np.sort(np.concatenate(parts))
+
+    def count(self, x: int, y: int, radius: int, exclude: int = -1) -> int:
+        """Jumlah agen dalam radius (tanpa agen exclude)"""
+        hits = self.query(x, y, radius)
+        if exclude >= 0 and np.any(hits == exclude):
+            return hits.size - 1
+        return hits.size
+
+
+def scan_for_prey_grid(x: int, y: int, hunt_range: int, index: GridIndex) -> np.ndarray:
+    """Versi GridIndex dari scan_for_prey (index dibangun dari prey_mask)"""
+    return index.query(x, y, hunt_range)
+
+
+def count_nearby_grid(x: int, y: int, radius: int, index: GridIndex, exclude: int = -1) -> int:
+    """Versi GridIndex dari _count_nearby_carnivores"""
+    return index.count(x, y, radius, exclude)
+
+
+# ----------------------------------------------------------------------
+# forage
+# ----------------------------------------------------------------------
+
+def forage_batch(food: np.ndarray, temperature: np.ndarray, humidity: np.ndarray,
+                 xs: np.ndarray, ys: np.ndarray, consumption_rate: np.ndarray,
+                 foraging_efficiency: np.ndarray, good_factor: np.ndarray, bad_factor: np.ndarray,
+                 tolerance: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Versi batch forage: array food diubah in-place, mengembalikan konsumsi per agen
+    Agen di sel yang sama diproses berurutan sesuai urutan input (per "ronde"
+    ke-k untuk agen ke-k di setiap sel) sehingga hasil identik dengan loop referensi
+    Semua parameter per agen berupa array (N,) agar spesies bisa dicampur
+    """
+    count = xs.size
+    consumed = np.zeros(count)
+    if count == 0:
+        return consumed
+
+    height = food.shape[1]
+    cell_ids = xs.astype(np.int64) * height + ys
+    order = np.argsort(cell_ids, kind='stable')
+    sorted_cells = cell_ids[order]
+    group_start = np.r_[0, np.flatnonzero(np.diff(sorted_cells)) + 1]
+    rank_sorted = np.arange(count) - np.repeat(group_start, np.diff(np.r_[group_start, count]))
+    rank = np.empty(count, dtype=np.int64)
+    rank[order] = rank_sorted
+
+    suitable = _in_tolerance(temperature[xs, ys], humidity[xs, ys], tolerance)
+    factor = np.where(suitable, good_factor, bad_factor)
+
+    for k in range(int(rank.max()) + 1):
+        members = np.flatnonzero(rank == k)
+        mx, my = xs[members], ys[members]
+        available = food[mx, my]
+        desired = np.minimum(consumption_rate[members], available)
+        actual = desired * foraging_efficiency[members]
+        actual = actual * factor[members]
+        actual = np.minimum(actual, available)
+        actual = np.where(available <= 0, 0.0, actual)
+        food[mx, my] = available - actual
+        consumed[members] = actual
+    return consumed
+
+
+# ----------------------------------------------------------------------
+# calculate_mortality_probability
+# ----------------------------------------------------------------------
+
+def mortality_probabilities(energy: np.ndarray, age: np.ndarray, max_age: np.ndarray,
+                            mortality_rate: np.ndarray, temperature: np.ndarray, humidity: np.ndarray,
+                            tolerance: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]) -> np.ndarray:
+    """
+    Versi batch calculate_mortality_probability:
+    P_mati = d + f_lingkungan + f_kelaparan (+ penalti usia), maksimum 1.0
+    temperature/humidity adalah kondisi sel tempat masing-masing agen
+    """
+    min_temp, max_temp, min_humidity, max_humidity = tolerance
+    f_lingkungan = (0.0 + np.where((temperature < min_temp) | (temperature > max_temp), 0.1, 0.0)
+                    + np.where((humidity < min_humidity) | (humidity > max_humidity), 0.05, 0.0))
+    f_kelaparan = np.where(energy <= 0, 0.2, np.where(energy < 30, 0.1, 0.0))
+    old_age = max_age * 0.8
+    age_penalty = np.where(age > old_age, 0.02 * (age - old_age), 0.0)
+    total = mortality_rate + f_lingkungan + f_kelaparan + age_penalty
+    return np.minimum(1.0, total)
+
+
+# Registry backend teroptimasi per kernel (referensi = method objek)
+KERNEL_BACKENDS: Dict[str, Dict[str, Callable]] = {
+    'find_optimal_position': {'numpy': find_optimal_positions},
+    '_flee_from_predators': {'numpy': flee_positions},
+    'scan_for_prey': {'numpy': scan_for_prey_numpy, 'grid': scan_for_prey_grid},
+    '_count_nearby_carnivores': {'numpy': count_nearby_numpy, 'grid': count_nearby_grid},
+    'forage': {'numpy': forage_batch},
+    'calculate_mortality_probability': {'numpy': mortality_probabilities}
+}
+
+
+def kernel_names() -> List[str]:
+    """Nama method agen yang punya kernel teroptimasi"""
+    return list(KERNEL_BACKENDS)
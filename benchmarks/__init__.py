@@ -0,0 +1,5 @@
+"""
+Modul benchmarks untuk mengukur performa simulasi ekosistem
+"""
+
+from .scenarios import Scenario, SCENARIOS, get_scenarios
@@ -0,0 +1,162 @@
+"""
+Harness regresi kompleksitas empiris untuk fase pipeline EcosystemSimulation
+
+Populasi digandakan (1k, 2k, 4k, ...) dengan kepadatan agen per sel konstan
+(sisi grid dikali sqrt(2) setiap penggandaan), lalu eksponen pertumbuhan waktu
+langkah setiap fase di-fit pada skala log-log: t ~ n^k. Jika k suatu fase
+melebihi batas (default 1.2), harness gagal (exit code 1) sehingga jalur
+kuadratik seperti scan_for_prey / check_predator_nearby tidak kembali diam-diam
+
+Pemakaian:
+    python -m benchmarks.complexity
+    python -m benchmarks.complexity --sizes 500 1000 2000 4000 --max-exponent 1.2
+    python -m benchmarks.complexity --phase-bound agents=1.3 --output complexity.json
+"""
+
+import os
+import sys
+import json
+import math
+import argparse
+import contextlib
+from typing import Dict, Any, List
+
+import numpy as np
+
+from .scenarios import Scenario
+from .suite import build_simulation
+
+# Kepadatan awal (agen per sel) sama dengan skenario grid100_pop3k
+DEFAULT_DENSITY = 0.3
+
+# Fase yang waktunya di bawah ini (detik, pada ukuran terbesar) terlalu bising untuk di-fit
+MIN_PHASE_TIME = 1e-3
+
+
+def scaled_scenario(population: int, density: float = DEFAULT_DENSITY, mix: str = 'balanced',
+                    steps: int = 3, seed: int = 12345) -> Scenario:
+    """Skenario dengan grid persegi yang luasnya sebanding dengan populasi"""
+    side = max(10, int(round(math.sqrt(population / density))))
+    return Scenario(f"complexity_pop{population}", side, side, population, mix,
+                    steps=steps, seed=seed)
+
+
+def measure(scenario: Scenario, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Jalankan skenario dan kembalikan waktu rata-rata per langkah setiap fase
+    serta rata-rata jumlah agen yang benar-benar diproses per langkah
+    """
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        sim = build_simulation(scenario)
+        for _ in range(warmup):
+            sim.step()
+        sim.pipeline.reset_timings()
+        for _ in range(scenario.steps):
+            sim.step()
+
+    timings = sim.phase_timings()
+    agents = timings.get('agents', {})
+    processed = agents.get('counters', {}).get('agents_processed', 0)
+    return {
+        'population': scenario.population,
+        'grid': scenario.width,
+        'agents': processed / agents['calls'] if agents.get('calls') else float(scenario.population),
+        'phases': {name: info['mean_time'] for name, info in timings.items() if info['calls']}
+    }
+
+
+def fit_exponent(sizes: List[float], times: List[float]) -> float:
+    """Kemiringan regresi log(t) terhadap log(n)"""
+    slope, _ = np.polyfit(np.log(sizes), np.log(times), 1)
+    return float(slope)
+
+
+def analyze(measurements: List[Dict[str, Any]], max_exponent: float,
+            phase_bounds: Dict[str, float]) -> List[Dict[str, Any]]:
+    """
+    Fit eksponen setiap fase; fase yang terlalu cepat untuk diukur dilewati
+    """
+    sizes = [m['agents'] for m in measurements]
+    phases = [name for name in measurements[-1]['phases']
+              if all(name in m['phases'] for m in measurements)]
+
+    findings = []
+    for name in phases:
+        times = [m['phases'][name] for m in measurements]
+        bound = phase_bounds.get(name, max_exponent)
+        if times[-1] < MIN_PHASE_TIME or min(times) <= 0:
+            findings.append({'phase': name, 'exponent': None, 'bound': bound,
+                             'times': times, 'failed': False})
+            continue
+        exponent = fit_exponent(sizes, times)
+        findings.append({'phase': name, 'exponent': exponent, 'bound': bound,
+                         'times': times, 'failed': exponent > bound})
+    return findings
+
+
+def print_report(measurements: List[Dict[str, Any]], findings: List[Dict[str, Any]]):
+    header = ''.join(f"{int(m['agents']):>11}" for m in measurements)
+    print(f"\n{'Fase':<14}{header}   {'k':>6} {'batas':>6}")
+    print("-" * (30 + 11 * len(measurements)))
+    for item in findings:
+        row = ''.join(f"{1e3 * t:>9.2f}ms" for t in item['times'])
+        if item['exponent'] is None:
+            print(f"{item['phase']:<14}{row}   {'-':>6} {item['bound']:>6.2f}  (terlalu cepat)")
+            continue
+        status = "❌" if item['failed'] else "✅"
+        print(f"{item['phase']:<14}{row}   {item['exponent']:>6.2f} {item['bound']:>6.2f}  {status}")
+
+
+def _parse_phase_bounds(items: List[str]) -> Dict[str, float]:
+    bounds = {}
+    for item in items or []:
+        name, _, value = item.partition('=')
+        if not value:
+            raise argparse.ArgumentTypeError(f"Format --phase-bound harus FASE=EKSPONEN: {item}")
+        bounds[name] = float(value)
+    return bounds
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Regresi kompleksitas empiris per fase pipeline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 2000, 4000],
+                        help="Populasi awal (sebaiknya berlipat dua)")
+    parser.add_argument('--density', type=float, default=DEFAULT_DENSITY, help="Agen per sel")
+    parser.add_argument('--mix', default='balanced')
+    parser.add_argument('--steps', type=int, default=3, help="Langkah terukur per ukuran")
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=12345)
+    parser.add_argument('--max-exponent', type=float, default=1.2,
+                        help="Batas eksponen pertumbuhan untuk semua fase")
+    parser.add_argument('--phase-bound', action='append', default=[],
+                        help="Batas khusus per fase, mis. agents=1.3 (bisa diulang)")
+    parser.add_argument('--output', default=None, help="Simpan hasil ke file JSON")
+    args = parser.parse_args(argv)
+
+    if len(args.sizes) < 2:
+        parser.error("Minimal dua ukuran populasi untuk fit eksponen")
+
+    measurements = []
+    for population in sorted(args.sizes):
+        scenario = scaled_scenario(population, args.density, args.mix, args.steps, args.seed)
+        print(f"⏱️  {population} agen, grid {scenario.width}x{scenario.height}...", flush=True)
+        measurements.append(measure(scenario, args.warmup))
+
+    findings = analyze(measurements, args.max_exponent, _parse_phase_bounds(args.phase_bound))
+    print_report(measurements, findings)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'measurements': measurements, 'findings': findings}, f, indent=2)
+        print(f"📁 Hasil disimpan: {args.output}")
+
+    failed = [item['phase'] for item in findings if item['failed']]
+    if failed:
+        print(f"❌ Pertumbuhan melebihi batas: {', '.join(failed)}")
+        return 1
+    print("✅ Semua fase dalam batas kompleksitas")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
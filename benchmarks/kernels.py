@@ -0,0 +1,384 @@
+"""
+Microbenchmark dan harness kesetaraan untuk kernel agen (agents/kernels.py)
+
+Untuk setiap method referensi berbasis objek:
+    HerbivoreAgent/ElkAgent/CarnivoreAgent.find_optimal_position
+    ElkAgent._flee_from_predators
+    CarnivoreAgent.scan_for_prey dan _count_nearby_carnivores
+    HerbivoreAgent/ElkAgent.forage
+    BaseAgent.calculate_mortality_probability
+harness membangun fixture sintetis (grid, awan agen, kepadatan), mengukur waktu
+referensi vs setiap backend teroptimasi, dan memastikan hasilnya identik
+dengan draw RNG yang sama
+
+Pemakaian:
+    python -m benchmarks.kernels
+    python -m benchmarks.kernels --kernel scan_for_prey --agents 500 5000 --clustered
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import contextlib
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Callable, Tuple
+
+import numpy as np
+
+from agents import kernels
+from agents.base_agent import HerbivoreAgent, ElkAgent, CarnivoreAgent, SpeciesType
+
+SPECIES_CLASSES = {'herbivore': HerbivoreAgent, 'elk': ElkAgent, 'carnivore': CarnivoreAgent}
+FIXTURE_MIX = {'herbivore': 0.55, 'elk': 0.25, 'carnivore': 0.20}
+
+
+@dataclass
+class KernelFixture:
+    """
+    Grid dan populasi agen sintetis untuk satu ukuran uji
+    """
+    width: int
+    height: int
+    food: np.ndarray
+    temperature: np.ndarray
+    humidity: np.ndarray
+    environment: Any
+    agents: List[Any]
+    seed: int
+    arrays: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def species(self, key: str) -> List[Any]:
+        cls = SPECIES_CLASSES[key]
+        return [a for a in self.agents if type(a) is cls]
+
+    def restore_food(self):
+        """Kembalikan makanan di Environment ke nilai fixture"""
+        for x in range(self.width):
+            row = self.environment.grid[x]
+            for y in range(self.height):
+                row[y].food = float(self.food[x, y])
+
+
+def build_fixture(width: int, height: int, n_agents: int, seed: int = 7,
+                  clustered: bool = False) -> KernelFixture:
+    """
+    Buat fixture: array lingkungan acak, Environment dengan nilai yang sama,
+    dan agen campuran spesies (seragam atau mengelompok di beberapa hotspot)
+    """
+    from models.environment import Environment
+    from agents.config_helper import get_herbivore_config, get_carnivore_config, get_elk_config
+
+    rng = np.random.default_rng(seed)
+    food = rng.uniform(0.0, 120.0, (width, height))
+    food[rng.random((width, height)) < 0.1] = 0.0         # Sebagian sel kosong
+    temperature = rng.uniform(-25.0, 40.0, (width, height))
+    humidity = rng.uniform(10.0, 100.0, (width, height))
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        environment = Environment(width, height)
+    for x in range(width):
+        for y in range(height):
+            cell = environment.grid[x][y]
+            cell.food = float(food[x, y])
+            cell.temperature = float(temperature[x, y])
+            cell.humidity = float(humidity[x, y])
+
+    configs = {'herbivore': get_herbivore_config(), 'elk': get_elk_config(),
+               'carnivore': get_carnivore_config()}
+    kinds = rng.choice(list(FIXTURE_MIX), size=n_agents, p=list(FIXTURE_MIX.values()))
+
+    if clustered:
+        hotspots = rng.integers(0, [width, height], size=(max(1, n_agents // 200), 2))
+        centers = hotspots[rng.integers(0, len(hotspots), n_agents)]
+        spread = max(2, min(width, height) // 20)
+        xs = np.clip(np.round(centers[:, 0] + rng.normal(0, spread, n_agents)), 0, width - 1)
+        ys = np.clip(np.round(centers[:, 1] + rng.normal(0, spread, n_agents)), 0, height - 1)
+    else:
+        xs = rng.integers(0, width, n_agents)
+        ys = rng.integers(0, height, n_agents)
+
+    agents = []
+    for i, kind in enumerate(kinds):
+        config = configs[kind]
+        agent = SPECIES_CLASSES[kind](f"{kind[0].upper()}_{i}", int(xs[i]), int(ys[i]), config)
+        agent.energy = float(rng.uniform(-10.0, 220.0))
+        agent.age = int(rng.integers(0, int(config['max_age'] * 1.1)))
+        agents.append(agent)
+
+    fixture = KernelFixture(width, height, food, temperature, humidity, environment, agents, seed)
+    fixture.arrays = agent_arrays(agents)
+    return fixture
+
+
+def agent_arrays(agents: List[Any]) -> Dict[str, np.ndarray]:
+    """Ekstrak posisi dan status agen ke array (representasi struct-of-arrays)"""
+    types = [a.species_type for a in agents]
+    return {
+        'x': np.fromiter((a.x for a in agents), dtype=np.int64, count=len(agents)),
+        'y': np.fromiter((a.y for a in agents), dtype=np.int64, count=len(agents)),
+        'alive': np.fromiter((a.alive for a in agents), dtype=bool, count=len(agents)),
+        'prey': np.array([t in (SpeciesType.HERBIVORE, SpeciesType.LARGE_HERBIVORE) for t in types], dtype=bool),
+        'carnivore': np.array([t == SpeciesType.CARNIVORE for t in types], dtype=bool)
+    }
+
+
+def _tolerance(agent) -> Tuple[float, float, float, float]:
+    return (agent.min_temp, agent.max_temp, agent.min_humidity, agent.max_humidity)
+
+
+def _best_time(func: Callable, repeats: int) -> Tuple[float, Any]:
+    """Waktu terbaik dari beberapa pengulangan (detik) dan hasil terakhir"""
+    best = float('inf')
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+# ----------------------------------------------------------------------
+# Pemeriksaan per kernel: kembalikan (waktu referensi, {backend: (waktu, cocok)})
+# ----------------------------------------------------------------------
+
+def check_find_optimal_position(fixture: KernelFixture, repeats: int):
+    bounds = (fixture.width, fixture.height)
+    reference_time = 0.0
+    backends = {'numpy': [0.0, True]}
+
+    for key in ('herbivore', 'elk', 'carnivore'):
+        members = fixture.species(key)
+        if not members:
+            continue
+        elapsed, expected = _best_time(
+            lambda: [a.find_optimal_position(fixture.environment, bounds) for a in members], repeats)
+        reference_time += elapsed
+
+        xs = np.array([a.x for a in members])
+        ys = np.array([a.y for a in members])
+        elapsed, (best_x, best_y) = _best_time(
+            lambda: kernels.find_optimal_positions(fixture.food, fixture.temperature, fixture.humidity,
+                                                   xs, ys, members[0].mobility, key, _tolerance(members[0])),
+            repeats)
+        backends['numpy'][0] += elapsed
+        backends['numpy'][1] &= expected == list(zip(best_x.tolist(), best_y.tolist()))
+
+    return reference_time, backends
+
+
+def check_flee_from_predators(fixture: KernelFixture, repeats: int):
+    elk = fixture.species('elk')
+    predators = [a for a in fixture.species('carnivore') if a.alive]
+
+    def reference():
+        moves = []
+        for agent in elk:
+            origin = (agent.x, agent.y)
+            agent._flee_from_predators(fixture.environment, fixture.agents)
+            moves.append((agent.x, agent.y))
+            agent.x, agent.y = origin
+        return moves
+
+    reference_time, expected = _best_time(reference, repeats)
+
+    xs = np.array([a.x for a in elk], dtype=np.int64)
+    ys = np.array([a.y for a in elk], dtype=np.int64)
+    px = np.array([a.x for a in predators], dtype=np.int64)
+    py = np.array([a.y for a in predators], dtype=np.int64)
+    mobility = elk[0].mobility if elk else 0
+    elapsed, (best_x, best_y) = _best_time(
+        lambda: kernels.flee_positions(xs, ys, mobility, px, py, fixture.width, fixture.height), repeats)
+    match = expected == list(zip(best_x.tolist(), best_y.tolist()))
+    return reference_time, {'numpy': [elapsed, match]}
+
+
+def check_scan_for_prey(fixture: KernelFixture, repeats: int):
+    carnivores = fixture.species('carnivore')
+    position = {id(a): i for i, a in enumerate(fixture.agents)}
+    arrays = fixture.arrays
+    prey_mask = arrays['alive'] & arrays['prey']
+
+    reference_time, expected_agents = _best_time(
+        lambda: [c.scan_for_prey(fixture.agents) for c in carnivores], repeats)
+    expected = [[position[id(a)] for a in prey] for prey in expected_agents]
+
+    elapsed_np, found_np = _best_time(
+        lambda: [kernels.scan_for_prey_numpy(c.x, c.y, c.hunt_range, arrays['x'], arrays['y'], prey_mask)
+                 for c in carnivores], repeats)
+
+    def grid_backend():
+        index = kernels.GridIndex(arrays['x'], arrays['y'], prey_mask, fixture.width, fixture.height)
+        return [kernels.scan_for_prey_grid(c.x, c.y, c.hunt_range, index) for c in carnivores]
+
+    elapsed_grid, found_grid = _best_time(grid_backend, repeats)
+
+    # Target terpilih harus sama dengan draw RNG yang sama
+    def targets(prey_lists):
+        rng_state = random.getstate()
+        random.seed(fixture.seed)
+        chosen = []
+        for carnivore, prey in zip(carnivores, prey_lists):
+            target = carnivore.select_preferred_target([fixture.agents[i] for i in prey])
+            chosen.append(position[id(target)] if target is not None else None)
+        random.setstate(rng_state)
+        return chosen
+
+    expected_targets = targets(expected)
+    results = {}
+    for name, elapsed, found in (('numpy', elapsed_np, found_np), ('grid', elapsed_grid, found_grid)):
+        found = [f.tolist() for f in found]
+        results[name] = [elapsed, found == expected and targets(found) == expected_targets]
+    return reference_time, results
+
+
+def check_count_nearby_carnivores(fixture: KernelFixture, repeats: int):
+    carnivores = fixture.species('carnivore')
+    position = {id(a): i for i, a in enumerate(fixture.agents)}
+    arrays = fixture.arrays
+    mask = arrays['alive'] & arrays['carnivore']
+    radius = kernels.PACK_RADIUS
+
+    reference_time, expected = _best_time(
+        lambda: [c._count_nearby_carnivores(fixture.agents) for c in carnivores], repeats)
+    elapsed_np, found_np = _best_time(
+        lambda: [kernels.count_nearby_numpy(c.x, c.y, radius, arrays['x'], arrays['y'], mask, position[id(c)])
+                 for c in carnivores], repeats)
+
+    def grid_backend():
+        index = kernels.GridIndex(arrays['x'], arrays['y'], mask, fixture.width, fixture.height)
+        return [kernels.count_nearby_grid(c.x, c.y, radius, index, position[id(c)]) for c in carnivores]
+
+    elapsed_grid, found_grid = _best_time(grid_backend, repeats)
+    return reference_time, {'numpy': [elapsed_np, found_np == expected],
+                            'grid': [elapsed_grid, found_grid == expected]}
+
+
+def check_forage(fixture: KernelFixture, repeats: int):
+    foragers = [a for a in fixture.agents if type(a) in (HerbivoreAgent, ElkAgent)]
+
+    def reference():
+        fixture.restore_food()
+        consumed = [a.forage(fixture.environment.get_cell(a.x, a.y)) for a in foragers]
+        final = [[cell.food for cell in row] for row in fixture.environment.grid]
+        return consumed, final
+
+    reference_time, (expected, expected_food) = _best_time(reference, repeats)
+    fixture.restore_food()
+
+    xs = np.array([a.x for a in foragers], dtype=np.int64)
+    ys = np.array([a.y for a in foragers], dtype=np.int64)
+    keys = ['elk' if type(a) is ElkAgent else 'herbivore' for a in foragers]
+    rate = np.array([a.consumption_rate for a in foragers])
+    efficiency = np.array([a.foraging_efficiency for a in foragers])
+    good = np.array([kernels.FORAGE_FACTORS[k][0] for k in keys])
+    bad = np.array([kernels.FORAGE_FACTORS[k][1] for k in keys])
+    tolerance = tuple(np.array(values) for values in zip(*[_tolerance(a) for a in foragers])) \
+        if foragers else (np.array([]),) * 4
+
+    def backend():
+        food = fixture.food.copy()
+        consumed = kernels.forage_batch(food, fixture.temperature, fixture.humidity, xs, ys,
+                                        rate, efficiency, good, bad, tolerance)
+        return consumed, food
+
+    elapsed, (consumed, food) = _best_time(backend, repeats)
+    match = consumed.tolist() == expected and food.tolist() == expected_food
+    return reference_time, {'numpy': [elapsed, match]}
+
+
+def check_mortality(fixture: KernelFixture, repeats: int):
+    agents = fixture.agents
+    env = fixture.environment
+
+    reference_time, expected = _best_time(
+        lambda: [a.calculate_mortality_probability(env.get_cell(a.x, a.y)) for a in agents], repeats)
+
+    xs, ys = fixture.arrays['x'], fixture.arrays['y']
+    energy = np.array([a.energy for a in agents])
+    age = np.array([a.age for a in agents])
+    max_age = np.array([a.max_age for a in agents])
+    rate = np.array([a.mortality_rate for a in agents])
+    tolerance = tuple(np.array(values) for values in zip(*[_tolerance(a) for a in agents]))
+
+    elapsed, probabilities = _best_time(
+        lambda: kernels.mortality_probabilities(energy, age, max_age, rate, fixture.temperature[xs, ys],
+                                                fixture.humidity[xs, ys], tolerance), repeats)
+
+    # Keputusan mati dengan draw RNG yang sama: random.random() < P_mati
+    draws_rng = random.Random(fixture.seed)
+    draws = [draws_rng.random() for _ in agents]
+    expected_deaths = [d < p for d, p in zip(draws, expected)]
+    deaths = (np.array(draws) < probabilities).tolist()
+
+    match = probabilities.tolist() == expected and deaths == expected_deaths
+    return reference_time, {'numpy': [elapsed, match]}
+
+
+CHECKS: Dict[str, Callable] = {
+    'find_optimal_position': check_find_optimal_position,
+    '_flee_from_predators': check_flee_from_predators,
+    'scan_for_prey': check_scan_for_prey,
+    '_count_nearby_carnivores': check_count_nearby_carnivores,
+    'forage': check_forage,
+    'calculate_mortality_probability': check_mortality
+}
+
+
+def run_harness(kernel_names: List[str], sizes: List[int], grid: int, seed: int,
+                clustered: bool, repeats: int) -> List[Dict[str, Any]]:
+    """
+    Jalankan pemeriksaan untuk setiap kernel dan ukuran populasi
+    """
+    results = []
+    for n_agents in sizes:
+        fixture = build_fixture(grid, grid, n_agents, seed, clustered)
+        for name in kernel_names:
+            reference_time, backends = CHECKS[name](fixture, repeats)
+            for backend, (elapsed, match) in backends.items():
+                results.append({
+                    'kernel': name, 'agents': n_agents, 'grid': grid, 'backend': backend,
+                    'reference_time': reference_time, 'backend_time': elapsed,
+                    'speedup': reference_time / elapsed if elapsed > 0 else float('inf'),
+                    'equivalent': bool(match)
+                })
+    return results
+
+
+def print_results(results: List[Dict[str, Any]]):
+    print(f"{'Kernel':<34} {'agen':>7} {'backend':<8} {'ref (ms)':>10} {'opt (ms)':>10} "
+          f"{'speedup':>8}  setara")
+    print("-" * 92)
+    for item in results:
+        status = "✅" if item['equivalent'] else "❌"
+        print(f"{item['kernel']:<34} {item['agents']:>7} {item['backend']:<8} "
+              f"{item['reference_time'] * 1e3:>10.2f} {item['backend_time'] * 1e3:>10.2f} "
+              f"{item['speedup']:>7.1f}x  {status}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Harness kesetaraan dan microbenchmark kernel agen")
+    parser.add_argument('--kernel', action='append', choices=list(CHECKS), dest='kernels',
+                        help="Kernel yang dicek (default: semua)")
+    parser.add_argument('--agents', type=int, nargs='+', default=[200, 2000], help="Ukuran populasi")
+    parser.add_argument('--grid', type=int, default=100, help="Ukuran grid (persegi)")
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--clustered', action='store_true', help="Agen mengelompok di hotspot")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    results = run_harness(args.kernels or list(CHECKS), args.agents, args.grid,
+                          args.seed, args.clustered, args.repeats)
+    print_results(results)
+
+    mismatches = [item for item in results if not item['equivalent']]
+    if mismatches:
+        print(f"❌ {len(mismatches)} backend tidak setara dengan referensi")
+        return 1
+    print("✅ Semua backend setara dengan referensi")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
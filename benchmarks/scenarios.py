@@ -0,0 +1,77 @@
+"""
+Skenario benchmark end-to-end untuk EcosystemSimulation
+Ukuran grid 50x50 sampai 1000x1000, populasi ratusan sampai ratusan ribu agen
+dengan komposisi spesies berbeda
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+# Komposisi spesies (proporsi kelinci : elk : serigala)
+SPECIES_MIXES = {
+    'balanced': {'herbivore': 0.58, 'elk': 0.25, 'carnivore': 0.17},      # Rasio populasi awal default
+    'prey_heavy': {'herbivore': 0.85, 'elk': 0.13, 'carnivore': 0.02},
+    'predator_heavy': {'herbivore': 0.45, 'elk': 0.20, 'carnivore': 0.35}
+}
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Satu skenario benchmark
+    """
+    name: str
+    width: int
+    height: int
+    population: int
+    mix: str = 'balanced'
+    steps: int = 20
+    max_seconds: float = 60.0      # Batas waktu run; proses skenario dihentikan jika lewat
+    seed: int = 12345
+    tier: str = 'quick'            # 'quick' atau 'full'
+
+    def species_counts(self) -> Dict[str, int]:
+        """Jumlah agen awal per spesies sesuai komposisi"""
+        fractions = SPECIES_MIXES[self.mix]
+        counts = {species: int(round(self.population * fraction))
+                  for species, fraction in fractions.items()}
+        # Pastikan total tepat sama dengan population
+        counts['herbivore'] += self.population - sum(counts.values())
+        return counts
+
+    @property
+    def carrying_capacity(self) -> int:
+        """Carrying capacity diskalakan dengan populasi agar reproduksi tetap aktif"""
+        return max(200, self.population)
+
+
+SCENARIOS: List[Scenario] = [
+    # Tier quick - cukup cepat untuk dijalankan setiap perubahan
+    Scenario('grid50_pop300_balanced', 50, 50, 300, 'balanced', steps=50),
+    Scenario('grid50_pop300_prey_heavy', 50, 50, 300, 'prey_heavy', steps=50),
+    Scenario('grid100_pop3k_balanced', 100, 100, 3_000, 'balanced', steps=10),
+    Scenario('grid100_pop3k_predator_heavy', 100, 100, 3_000, 'predator_heavy', steps=10),
+    Scenario('grid250_pop3k_prey_heavy', 250, 250, 3_000, 'prey_heavy', steps=10),
+
+    # Tier full - skala besar
+    Scenario('grid500_pop30k_balanced', 500, 500, 30_000, 'balanced', steps=5, tier='full'),
+    Scenario('grid500_pop30k_prey_heavy', 500, 500, 30_000, 'prey_heavy', steps=5, tier='full'),
+    Scenario('grid1000_pop30k_balanced', 1000, 1000, 30_000, 'balanced', steps=5, tier='full'),
+    Scenario('grid1000_pop300k_prey_heavy', 1000, 1000, 300_000, 'prey_heavy', steps=3,
+             max_seconds=600.0, tier='full'),
+]
+
+
+def get_scenarios(tier: str = 'quick', names: Optional[List[str]] = None) -> List[Scenario]:
+    """
+    Pilih skenario berdasarkan tier ('quick', 'full', 'all') atau daftar nama
+    """
+    if names:
+        by_name = {scenario.name: scenario for scenario in SCENARIOS}
+        unknown = [name for name in names if name not in by_name]
+        if unknown:
+            raise ValueError(f"Skenario tidak dikenal: {', '.join(unknown)}")
+        return [by_name[name] for name in names]
+    if tier == 'all':
+        return list(SCENARIOS)
+    return [scenario for scenario in SCENARIOS if scenario.tier == tier]
@@ -0,0 +1,314 @@
+"""
+Benchmark suite end-to-end untuk EcosystemSimulation
+
+Pemakaian:
+    python -m benchmarks.suite run --tier quick --output bench_results.json
+    python -m benchmarks.suite run --scenario grid100_pop3k_balanced
+    python -m benchmarks.suite compare baseline.json bench_results.json --threshold 0.10
+
+Setiap skenario dijalankan di proses baru (spawn) sehingga peak RSS terukur
+bersih. Hasil: steps/sec, agent-updates/sec, peak RSS, dan waktu per fase pipeline
+Batas max_seconds ditegakkan proses induk: proses skenario yang melewatinya
+dihentikan dan hasil langkah terakhir yang selesai dicatat sebagai terpotong
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import contextlib
+import traceback
+import multiprocessing
+from pathlib import Path
+from dataclasses import asdict
+from typing import Dict, Any, List
+
+from .scenarios import Scenario, get_scenarios, SCENARIOS
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Fase dengan porsi waktu di bawah ini tidak ikut dicek regresi (terlalu bising)
+MIN_PHASE_SHARE = 0.05
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size proses ini dalam MB"""
+    try:
+        import resource
+    except ImportError:
+        return float('nan')
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def build_simulation(scenario: Scenario):
+    """
+    Buat simulasi untuk satu skenario (tanpa menjalankan langkah)
+    """
+    from models.ecosystem import EcosystemSimulation
+
+    random.seed(scenario.seed)
+    sim = EcosystemSimulation(scenario.width, scenario.height)
+    sim.carrying_capacity = scenario.carrying_capacity
+    for species, count in scenario.species_counts().items():
+        sim.add_agents(species, count)
+    return sim
+
+
+def _collect(scenario: Scenario, sim, steps_done: int, setup_time: float,
+             run_time: float, initial_agents: int) -> Dict[str, Any]:
+    """Metrik skenario setelah `steps_done` langkah"""
+    timings = sim.phase_timings()
+    agent_updates = timings['agents']['counters']['agents_processed'] if 'agents' in timings else 0
+    history = sim.population_history
+
+    return {
+        'scenario': asdict(scenario),
+        'steps_completed': steps_done,
+        'truncated': steps_done < scenario.steps,
+        'setup_time': setup_time,
+        'run_time': run_time,
+        'steps_per_sec': steps_done / run_time if run_time > 0 else 0.0,
+        'agent_updates_per_sec': agent_updates / run_time if run_time > 0 else 0.0,
+        'peak_rss_mb': _peak_rss_mb(),
+        'initial_agents': initial_agents,
+        'final_populations': {key: history[key][-1] if len(history[key]) else 0
+                              for key in ('herbivore', 'elk', 'carnivore')},
+        'phases': {name: {'mean_time': info['mean_time'],
+                          'total_time': info['total_time'],
+                          'counters': info['counters']}
+                   for name, info in timings.items()}
+    }
+
+
+def run_scenario(scenario: Scenario, progress=None) -> Dict[str, Any]:
+    """
+    Jalankan satu skenario dan kembalikan metriknya
+    Output print simulasi dibuang agar tidak ikut terukur di terminal
+    progress (Connection) menerima ('setup', hasil) lalu ('step', hasil) setiap
+    langkah selesai; waktu kirim tidak ikut run_time
+    """
+    os.chdir(REPO_ROOT)
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        setup_start = time.perf_counter()
+        sim = build_simulation(scenario)
+        setup_time = time.perf_counter() - setup_start
+        initial_agents = len(sim.agents)
+        if progress is not None:
+            progress.send(('setup', _collect(scenario, sim, 0, setup_time, 0.0, initial_agents)))
+
+        steps_done = 0
+        run_time = 0.0
+        while steps_done < scenario.steps and run_time <= scenario.max_seconds:
+            step_start = time.perf_counter()
+            sim.step()
+            run_time += time.perf_counter() - step_start
+            steps_done += 1
+            if progress is not None:
+                progress.send(('step', _collect(scenario, sim, steps_done, setup_time,
+                                                run_time, initial_agents)))
+
+    return _collect(scenario, sim, steps_done, setup_time, run_time, initial_agents)
+
+
+def _scenario_worker(scenario: Scenario, progress):
+    """Target proses spawn: kirim progres lalu ('done', hasil) atau ('error', traceback)"""
+    try:
+        progress.send(('done', run_scenario(scenario, progress)))
+    except Exception:
+        progress.send(('error', traceback.format_exc()))
+    finally:
+        progress.close()
+
+
+def _run_isolated(scenario: Scenario) -> Dict[str, Any]:
+    """
+    Jalankan skenario di proses spawn baru
+    Setelah setup, proses diberi max_seconds; jika habis proses dihentikan
+    (terminate) dan hasil langkah terakhir yang selesai dikembalikan dengan truncated=True
+    """
+    context = multiprocessing.get_context('spawn')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_scenario_worker, args=(scenario, sender), daemon=True)
+    process.start()
+    sender.close()
+
+    result = None
+    deadline = None
+    finished = False
+    try:
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not receiver.poll(timeout):
+                break
+            try:
+                kind, payload = receiver.recv()
+            except EOFError:
+                break
+            if kind == 'error':
+                raise RuntimeError(f"Skenario {scenario.name} gagal:\n{payload}")
+            result = payload
+            if kind == 'setup':
+                deadline = time.monotonic() + scenario.max_seconds
+            elif kind == 'done':
+                finished = True
+                break
+    finally:
+        # Selesai normal: tunggu proses keluar; batas waktu habis: hentikan sekarang
+        process.join(timeout=10.0 if finished else 0)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+        receiver.close()
+
+    if result is None:
+        raise RuntimeError(f"Proses skenario {scenario.name} berhenti tanpa hasil "
+                           f"(exit code {process.exitcode})")
+    result['truncated'] = result['steps_completed'] < scenario.steps
+    return result
+
+
+def _metadata() -> Dict[str, Any]:
+    import numpy as np
+
+    commit = None
+    head = REPO_ROOT / '.git' / 'HEAD'
+    try:
+        ref = head.read_text().strip()
+        if ref.startswith('ref: '):
+            commit = (REPO_ROOT / '.git' / ref[5:]).read_text().strip()
+        else:
+            commit = ref
+    except OSError:
+        pass
+
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'commit': commit
+    }
+
+
+def run_suite(scenarios: List[Scenario], isolate: bool = True) -> Dict[str, Any]:
+    """
+    Jalankan daftar skenario dan kumpulkan hasilnya
+    """
+    results = {'meta': _metadata(), 'scenarios': {}}
+    for scenario in scenarios:
+        print(f"⏱️  {scenario.name} ({scenario.width}x{scenario.height}, "
+              f"{scenario.population} agen, {scenario.mix})...", flush=True)
+        result = _run_isolated(scenario) if isolate else run_scenario(scenario)
+        results['scenarios'][scenario.name] = result
+        note = " (dipotong: batas waktu)" if result['truncated'] else ""
+        print(f"   {result['steps_per_sec']:9.3f} steps/s | "
+              f"{result['agent_updates_per_sec']:12.0f} agent-updates/s | "
+              f"{result['peak_rss_mb']:8.1f} MB{note}")
+    return results
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """
+    Bandingkan hasil dengan baseline
+    Regresi: throughput turun, peak RSS naik, atau waktu fase dominan naik
+    lebih dari threshold (proporsi, 0.10 = 10%)
+    """
+    findings = []
+
+    def check(name: str, metric: str, old: float, new: float, higher_is_better: bool):
+        if not old or old != old or new != new:
+            return
+        change = (new - old) / old
+        regression = -change > threshold if higher_is_better else change > threshold
+        findings.append({'scenario': name, 'metric': metric, 'baseline': old, 'current': new,
+                         'change': change, 'regression': regression})
+
+    for name, old in baseline.get('scenarios', {}).items():
+        new = current.get('scenarios', {}).get(name)
+        if new is None:
+            continue
+        check(name, 'steps_per_sec', old['steps_per_sec'], new['steps_per_sec'], True)
+        check(name, 'agent_updates_per_sec', old['agent_updates_per_sec'],
+              new['agent_updates_per_sec'], True)
+        check(name, 'peak_rss_mb', old['peak_rss_mb'], new['peak_rss_mb'], False)
+
+        step_time = sum(phase['mean_time'] for phase in old['phases'].values()) or 1.0
+        for phase, info in old['phases'].items():
+            if phase not in new['phases'] or info['mean_time'] / step_time < MIN_PHASE_SHARE:
+                continue
+            check(name, f"phase:{phase}", info['mean_time'], new['phases'][phase]['mean_time'], False)
+
+    return findings
+
+
+def print_comparison(findings: List[Dict[str, Any]], threshold: float):
+    """Tampilkan tabel perbandingan"""
+    print(f"{'Skenario':<32} {'Metrik':<24} {'baseline':>12} {'current':>12} {'change':>8}")
+    print("-" * 92)
+    for item in findings:
+        flag = " ❌" if item['regression'] else ""
+        print(f"{item['scenario']:<32} {item['metric']:<24} {item['baseline']:>12.4g} "
+              f"{item['current']:>12.4g} {100 * item['change']:>+7.1f}%{flag}")
+    regressions = [item for item in findings if item['regression']]
+    print("-" * 92)
+    if regressions:
+        print(f"❌ {len(regressions)} regresi melebihi {100 * threshold:.0f}%")
+    else:
+        print(f"✅ Tidak ada regresi melebihi {100 * threshold:.0f}%")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark suite simulasi ekosistem")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = sub.add_parser('run', help="Jalankan skenario benchmark")
+    run_parser.add_argument('--tier', choices=['quick', 'full', 'all'], default='quick')
+    run_parser.add_argument('--scenario', action='append', dest='scenarios',
+                            help="Nama skenario (bisa diulang)")
+    run_parser.add_argument('--output', default='bench_results.json', help="File JSON hasil")
+    run_parser.add_argument('--no-isolate', action='store_true',
+                            help="Jalankan di proses ini (peak RSS tidak akurat)")
+    run_parser.add_argument('--list', action='store_true', help="Tampilkan daftar skenario saja")
+
+    compare_parser = sub.add_parser('compare', help="Bandingkan hasil dengan baseline")
+    compare_parser.add_argument('baseline', help="File JSON baseline")
+    compare_parser.add_argument('current', help="File JSON hasil terbaru")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="Batas regresi relatif (default 0.10 = 10%%)")
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        if args.list:
+            for scenario in SCENARIOS:
+                print(f"{scenario.name:<32} {scenario.tier:<6} {scenario.width}x{scenario.height} "
+                      f"{scenario.population:>8} agen  {scenario.mix}")
+            return 0
+        results = run_suite(get_scenarios(args.tier, args.scenarios), isolate=not args.no_isolate)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"📁 Hasil disimpan: {args.output}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+    findings = compare_results(baseline, current, args.threshold)
+    print_comparison(findings, args.threshold)
+    return 1 if any(item['regression'] for item in findings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Benchmark scaling mode thread (models/threads.py) terhadap jumlah thread
+
+Simulasi kohort besar (kelinci + elk sebagai kohort, serigala agen) dijalankan
+dengan jalur serial lalu dengan 1, 2, 4, ... thread. Waktu fase environment dan
+cohorts diukur per langkah, lalu speedup dibanding jalur serial dilaporkan.
+Pada build dengan GIL thread dijalankan dengan force=True sehingga angka yang
+muncul menunjukkan batas GIL (speedup ~1x); scaling nyata hanya terlihat di
+build free-threaded (python3.13t). Setiap konfigurasi juga dicek kesetaraan
+populasi kohort dengan konfigurasi 1 thread (hasil tidak boleh bergantung jumlah thread)
+
+Pemakaian:
+    python -m benchmarks.threads
+    python3.13t -m benchmarks.threads --grid 400 --herbivores 2000000 --workers 1 2 4 8
+"""
+
+import io
+import sys
+import time
+import random
+import argparse
+import contextlib
+from typing import Dict, Any, List, Optional
+
+from models.threads import free_threading
+
+MEASURED_PHASES = ('environment', 'cohorts')
+
+
+def build(grid: int, herbivores: int, seed: int):
+    """Simulasi kohort untuk benchmark (output init dibuang)"""
+    from models.ecosystem import EcosystemSimulation
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(seed)
+        sim = EcosystemSimulation(grid, grid)
+        sim.verbose = False
+        sim.environment.reseed(seed)
+        sim.setup_species()
+        sim.enable_cohorts('herbivore')
+        sim.enable_cohorts('elk')
+        sim.add_agents('herbivore', herbivores)
+    return sim
+
+
+def measure(grid: int, herbivores: int, steps: int, seed: int,
+            workers: Optional[int], warmup: int = 1) -> Dict[str, Any]:
+    """Jalankan warmup + `steps` langkah; workers=None = jalur serial"""
+    sim = build(grid, herbivores, seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if workers is not None:
+            sim.enable_threads(workers, force=True)
+        for _ in range(warmup):
+            sim.step()
+        sim.pipeline.reset_timings()
+        start = time.perf_counter()
+        for _ in range(steps):
+            sim.step()
+        elapsed = time.perf_counter() - start
+        timings = sim.phase_timings()
+        if workers is not None:
+            sim.disable_threads()
+
+    return {'workers': workers,
+            'step_time': elapsed / steps,
+            'phases': {name: timings[name]['mean_time'] for name in MEASURED_PHASES if name in timings},
+            'populations': sim.population_counts(),
+            'food': float(sim.environment.food.sum())}
+
+
+def print_report(results: List[Dict[str, Any]]):
+    serial = results[0]
+    print(f"{'thread':>8} {'langkah':>10} {'environment':>12} {'cohorts':>10} {'speedup':>8}  setara")
+    reference = next((item for item in results if item['workers'] == 1), None)
+    for item in results:
+        label = 'serial' if item['workers'] is None else str(item['workers'])
+        phases = item['phases']
+        speedup = serial['step_time'] / item['step_time']
+        same = ('-' if item['workers'] is None or reference is None else
+                '✅' if (item['populations'], item['food']) == (reference['populations'], reference['food'])
+                else '❌')
+        print(f"{label:>8} {item['step_time'] * 1000:>8.1f}ms "
+              f"{phases.get('environment', 0) * 1000:>10.1f}ms {phases.get('cohorts', 0) * 1000:>8.1f}ms "
+              f"{speedup:>7.2f}x  {same}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scaling mode thread fase lingkungan/kohort")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help="Jumlah thread")
+    parser.add_argument('--grid', type=int, default=300, help="Ukuran grid (persegi)")
+    parser.add_argument('--herbivores', type=int, default=500000, help="Kelinci (kohort)")
+    parser.add_argument('--steps', type=int, default=5, help="Langkah terukur per konfigurasi")
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    mode = 'free-threaded' if free_threading() else 'GIL aktif (thread dipaksa, scaling tidak diharapkan)'
+    print(f"🧵 Python {sys.version.split()[0]}: {mode}")
+    results = [measure(args.grid, args.herbivores, args.steps, args.seed, None, args.warmup)]
+    for workers in args.workers:
+        print(f"⏱️  {workers} thread...", flush=True)
+        results.append(measure(args.grid, args.herbivores, args.steps, args.seed, workers, args.warmup))
+    print_report(results)
+
+    reference = next((item for item in results if item['workers'] == 1), None)
+    mismatched = [item['workers'] for item in results[1:]
+                  if reference is not None and
+                  (item['populations'], item['food']) != (reference['populations'], reference['food'])]
+    if mismatched:
+        print(f"❌ Hasil bergantung jumlah thread: {mismatched}")
+        return 1
+    print("✅ Hasil sama untuk semua jumlah thread")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,4 +3,19 @@ Modul models untuk logika simulasi ekosistem
 """
 
 from .environment import Environment, EnvironmentCell
-from .ecosystem import EcosystemSimulation
\ No newline at end of file
+from .ecosystem import EcosystemSimulation
+from .replicates import run_forked_replicates, remove_fraction, set_carrying_capacity, stack_replicates, load_ensemble
+
+from .pipeline import StepPipeline, StepPhase
+
+from .metrics import MetricsRegistry
+
+from .timeseries import TimeSeriesRecorder, read_timeseries
+from .history import HistoryArchive
+from .online_stats import OnlineStatistics, RollingStats, RunningStats
+from .snapshots import SnapshotRecorder, SnapshotReader
+from .cohorts import CohortPopulation
+from .engine import AdaptiveEngine, calibrate
+from .domain import DomainDecomposition, split_grid
+from .threads import ThreadedStep, free_threading
+from .synchronous import SynchronousUpdate
\ No newline at end of file
@@ -0,0 +1,541 @@
+"""
+Representasi kohort (super-individu) untuk populasi herbivora yang sangat besar
+Setiap kohort = sekelompok individu satu spesies di sel yang sama dengan kelas
+usia dan bin energi yang sama, disimpan sebagai array (x, y, usia, bin, jumlah).
+Memori dan waktu sebanding dengan jumlah kohort yang terisi, bukan jumlah individu
+
+Satu langkah kohort memakai rumus yang sama dengan agen (kernel di agents/kernels.py):
+    1. age_one_step  - energi dikurangi metabolic_cost, naik kelas usia dengan
+                       peluang 1/lebar kelas
+    2. gerak         - find_optimal_positions per sel (semua individu di sel yang
+                       sama memilih sel tujuan yang sama); elk yang melihat serigala
+                       dalam radius 3 lari dengan flee_positions
+    3. forage        - asupan min(consumption_rate, makanan) × efisiensi × faktor
+                       lingkungan; jika makanan sel tidak cukup, dibagi rata
+    4. mortalitas    - mortality_probabilities (usia = nilai tengah kelas) → binomial
+    5. reproduksi    - peluang logistik can_reproduce r·(1 - N/K) untuk bin energi
+                       >= reproduction_threshold; induk kehilangan energi yang sama
+                       dengan create_offspring, anak muncul di sel tetangga acak
+
+Energi yang jatuh di antara dua bin dibagi ke kedua bin secara acak (binomial)
+sehingga rata-rata energi tetap. Serigala (agen biasa) berburu kohort lewat
+CohortMember: wakil individu yang punya atribut yang dipakai attempt_hunt
+
+Contoh:
+    sim.enable_cohorts('herbivore')         # kelinci jadi kohort, serigala tetap agen
+    sim.add_agents('herbivore', 1_000_000)
+    sim.run(steps=500)
+"""
+
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Spesies yang bisa dijadikan kohort -> SpeciesType.value agen
+COHORT_SPECIES = {'herbivore': 'herbivore', 'elk': 'large_herbivore'}
+
+# Biaya energi induk per kelahiran (create_offspring) sebagai fraksi reproduction_threshold
+OFFSPRING_COST = {'herbivore': 0.3, 'elk': 0.35}
+
+DEFAULT_ENERGY_BINS = 16
+# Batas kelas usia sebagai fraksi max_age (kelas terakhir terbuka);
+# lebih rapat di atas 0.8 karena penalti usia mulai di sana
+DEFAULT_AGE_EDGES = (0.0, 0.2, 0.4, 0.6, 0.8, 0.85, 0.9)
+
+
+# Ukuran potongan kernel saat dijalankan lewat mapper (thread pool)
+CHUNK_SIZE = 8192
+
+
+def _chunks(size: int, chunk: int = CHUNK_SIZE) -> List[slice]:
+    return [slice(start, min(start + chunk, size)) for start in range(0, max(size, 1), chunk)]
+
+
+def _cohort_phase(simulation, phase):
+    """Fase pipeline: gerak, makan, dan mortalitas semua populasi kohort"""
+    from agents.base_agent import SpeciesType
+
+    wolves = [agent for agent in simulation.agents
+              if agent.alive and agent.species_type == SpeciesType.CARNIVORE]
+    predators = (np.fromiter((agent.x for agent in wolves), dtype=np.int64, count=len(wolves)),
+                 np.fromiter((agent.y for agent in wolves), dtype=np.int64, count=len(wolves)))
+    threads = simulation.threads
+    mapper = threads.map if threads is not None and threads.active else None
+    for population in simulation.cohorts.values():
+        population.update(simulation.environment, predators, mapper)
+        phase.count('agents_processed', len(population))
+        phase.count('cells_touched', population.cells_touched)
+
+
+def _cohort_reproduction_phase(simulation, phase):
+    """Fase pipeline: reproduksi kohort lalu catat kejadian langkah ini"""
+    events = simulation.step_events
+    for key, population in simulation.cohorts.items():
+        population.reproduce(population.capacity(simulation.carrying_capacity))
+        phase.count('agents_processed', len(population))
+        events['births'][key] += population.births
+        events['deaths'][key] += population.deaths
+        events['kills'][key] += population.kills
+
+
+class CohortMember:
+    """
+    Wakil satu individu kohort untuk CarnivoreAgent (scan_for_prey, attempt_hunt)
+    Objek yang sama muncul sebanyak jumlah individu kohort di daftar mangsa,
+    sehingga random.choice tetap memilih per individu
+    """
+
+    def __init__(self, population: 'CohortPopulation', group: int):
+        self.population = population
+        self.group = group
+        self.agent_id = f"{population.species}_cohort_{group}"
+        self.species_type = population.species_type
+        self.x = int(population.x[group])
+        self.y = int(population.y[group])
+        self.energy = float(population.energy_values[population.energy_bin[group]])
+        self.age = float(population.age_values[population.age_class[group]])
+        self.defense_strength = population.config.get('defense_strength', 0.4)
+
+    @property
+    def alive(self) -> bool:
+        return self.population.count[self.group] > 0
+
+    def defend_against_predator(self) -> float:
+        """Sama dengan ElkAgent.defend_against_predator"""
+        return self.defense_strength * min(1.5, self.energy / 100.0)
+
+    def die(self, cause: str = 'natural'):
+        """Satu individu kohort mati (mis. dimangsa)"""
+        self.population.remove(self.group, cause)
+
+
+class CohortPopulation:
+    """
+    Populasi satu spesies herbivora dalam bentuk kohort
+
+    Contoh:
+        population = CohortPopulation('herbivore', 500, 500)
+        population.add(1_000_000)
+        population.attach(sim)
+    """
+
+    def __init__(self, species: str, width: int, height: int, config: dict = None,
+                 energy_bins: int = DEFAULT_ENERGY_BINS, age_edges: Sequence[float] = DEFAULT_AGE_EDGES,
+                 max_energy: Optional[float] = None, seed: Optional[int] = None):
+        from agents.base_agent import SpeciesType
+        from agents.config_helper import get_herbivore_config, get_elk_config
+
+        if species not in COHORT_SPECIES:
+            raise ValueError(f"Spesies kohort tidak didukung: {species} "
+                             f"(pilihan: {', '.join(COHORT_SPECIES)})")
+        if energy_bins < 2:
+            raise ValueError("energy_bins harus >= 2")
+        self.species = species
+        self.species_type = SpeciesType(COHORT_SPECIES[species])
+        self.width = width
+        self.height = height
+        if config is None:
+            config = get_herbivore_config() if species == 'herbivore' else get_elk_config()
+        self.config = config
+        self.tolerance = (config['min_temp'], config['max_temp'],
+                          config['min_humidity'], config['max_humidity'])
+
+        # Bin energi 0 .. max_energy (di atas max_energy digabung ke bin teratas)
+        if max_energy is None:
+            max_energy = 2.0 * max(config['reproduction_threshold'], config['initial_energy'])
+        self.energy_step = max_energy / (energy_bins - 1)
+        self.energy_values = np.arange(energy_bins) * self.energy_step
+
+        # Kelas usia: nilai tengah untuk penalti usia, peluang naik kelas per langkah
+        edges = np.asarray(age_edges, dtype=np.float64) * config['max_age']
+        widths = np.diff(edges)
+        last_width = widths[-1] if len(widths) else config['max_age']
+        self.age_edges = edges
+        self.age_values = np.append(edges[:-1] + widths / 2, edges[-1] + last_width / 2)
+        self.age_transition = np.append(1.0 / np.maximum(widths, 1.0), 0.0)
+
+        self.rng = np.random.default_rng(seed)
+
+        # Kohort: satu elemen per (sel, kelas usia, bin energi)
+        self.x = np.empty(0, dtype=np.int32)
+        self.y = np.empty(0, dtype=np.int32)
+        self.age_class = np.empty(0, dtype=np.int16)
+        self.energy_bin = np.empty(0, dtype=np.int16)
+        self.count = np.empty(0, dtype=np.int64)
+
+        # Kejadian langkah terakhir
+        self.births = 0
+        self.deaths = 0
+        self.kills = 0
+        self.cells_touched = 0
+
+        # Indeks sel untuk prey_near (dibangun ulang setelah update)
+        self._cell_order = None
+        self._sorted_cells = None
+        self._members: Dict[int, CohortMember] = {}
+
+    # ------------------------------------------------------------------
+    # Pemasangan ke simulasi
+    # ------------------------------------------------------------------
+
+    def attach(self, simulation):
+        """Daftarkan populasi dan pasang fase kohort di sekitar fase agents/reproduction"""
+        simulation.cohorts[self.species] = self
+        if 'cohorts' not in simulation.pipeline:
+            before = 'agents' if 'agents' in simulation.pipeline else None
+            simulation.pipeline.register('cohorts', _cohort_phase, before=before)
+        if 'cohort_reproduction' not in simulation.pipeline:
+            after = 'reproduction' if 'reproduction' in simulation.pipeline else None
+            simulation.pipeline.register('cohort_reproduction', _cohort_reproduction_phase, after=after)
+
+    def detach(self, simulation):
+        """Lepas populasi; fase kohort dilepas jika tidak ada populasi kohort lagi"""
+        if simulation.cohorts.get(self.species) is self:
+            del simulation.cohorts[self.species]
+        if not simulation.cohorts:
+            for name in ('cohorts', 'cohort_reproduction'):
+                if name in simulation.pipeline:
+                    simulation.pipeline.remove(name)
+
+    def reseed(self, seed: int):
+        self.rng = np.random.default_rng(seed)
+
+    def capacity(self, carrying_capacity: int) -> int:
+        """Carrying capacity spesies ini, sama dengan _process_reproduction"""
+        if self.species == 'elk':
+            return max(30, carrying_capacity // 7)
+        return carrying_capacity
+
+    # ------------------------------------------------------------------
+    # Isi populasi
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Jumlah individu"""
+        return int(self.count.sum())
+
+    @property
+    def groups(self) -> int:
+        """Jumlah kohort terisi"""
+        return len(self.count)
+
+    def add(self, count: int, xs: np.ndarray = None, ys: np.ndarray = None,
+            energy: float = None, age: float = 0.0):
+        """
+        Tambah `count` individu (default: posisi acak seragam, energi awal config, usia 0)
+        """
+        if xs is None:
+            xs = self.rng.integers(0, self.width, count)
+            ys = self.rng.integers(0, self.height, count)
+        energy = self.config['initial_energy'] if energy is None else energy
+        age_class = np.full(len(xs), self._age_class(age), dtype=np.int16)
+        self._append_energy(np.asarray(xs), np.asarray(ys), age_class,
+                            np.full(len(xs), float(energy)), np.ones(len(xs), dtype=np.int64))
+        self._merge()
+
+    def add_agents(self, agents: List[Any]):
+        """Ubah agen objek spesies ini menjadi kohort (posisi, energi, usia dipertahankan)"""
+        if not agents:
+            return
+        xs = np.fromiter((a.x for a in agents), dtype=np.int64, count=len(agents))
+        ys = np.fromiter((a.y for a in agents), dtype=np.int64, count=len(agents))
+        energy = np.fromiter((a.energy for a in agents), dtype=np.float64, count=len(agents))
+        ages = np.fromiter((a.age for a in agents), dtype=np.float64, count=len(agents))
+        age_class = (np.searchsorted(self.age_edges, ages, side='right') - 1).astype(np.int16)
+        self._append_energy(xs, ys, age_class, energy, np.ones(len(agents), dtype=np.int64))
+        self._merge()
+
+    def to_agents(self, simulation) -> List[Any]:
+        """Buat agen objek untuk setiap individu kohort (energi/usia = nilai bin/kelas)"""
+        from agents.base_agent import HerbivoreAgent, ElkAgent
+
+        cls, prefix = (HerbivoreAgent, 'H') if self.species == 'herbivore' else (ElkAgent, 'E')
+        agents = []
+        for x, y, age_class, energy_bin, count in zip(self.x.tolist(), self.y.tolist(),
+                                                      self.age_class.tolist(),
+                                                      self.energy_bin.tolist(), self.count.tolist()):
+            for _ in range(count):
+                agent = cls(f"{prefix}_{simulation.agent_counter}", x, y, self.config)
+                agent.energy = float(self.energy_values[energy_bin])
+                agent.age = int(self.age_values[age_class])
+                simulation.agent_counter += 1
+                agents.append(agent)
+        return agents
+
+    def density(self) -> np.ndarray:
+        """Jumlah individu per sel (width, height)"""
+        cells = np.bincount(self.x.astype(np.int64) * self.height + self.y,
+                            weights=self.count, minlength=self.width * self.height)
+        return cells.reshape(self.width, self.height).astype(np.int64)
+
+    def _age_class(self, age: float) -> int:
+        return int(np.searchsorted(self.age_edges, age, side='right') - 1)
+
+    def _append_energy(self, xs, ys, age_class, energy, count):
+        """
+        Tambah kohort dengan energi kontinu: setiap kohort dibagi ke dua bin
+        terdekat secara binomial (nilai harapan energi tetap)
+        """
+        position = np.clip(energy, 0.0, self.energy_values[-1]) / self.energy_step
+        lower = np.minimum(np.floor(position).astype(np.int64), len(self.energy_values) - 1)
+        upper_share = np.clip(position - lower, 0.0, 1.0)
+        upper = self.rng.binomial(count, upper_share)
+        upper_bin = np.minimum(lower + 1, len(self.energy_values) - 1)
+        self.x = np.concatenate((self.x, xs, xs)).astype(np.int32)
+        self.y = np.concatenate((self.y, ys, ys)).astype(np.int32)
+        self.age_class = np.concatenate((self.age_class, age_class, age_class)).astype(np.int16)
+        self.energy_bin = np.concatenate((self.energy_bin, lower, upper_bin)).astype(np.int16)
+        self.count = np.concatenate((self.count, count - upper, upper)).astype(np.int64)
+
+    def _merge(self):
+        """Gabungkan kohort dengan kunci (sel, usia, bin) yang sama dan buang yang kosong"""
+        keep = self.count > 0
+        bins = len(self.energy_values)
+        classes = len(self.age_values)
+        key = ((self.x[keep].astype(np.int64) * self.height + self.y[keep]) * classes
+               + self.age_class[keep]) * bins + self.energy_bin[keep]
+        unique, inverse = np.unique(key, return_inverse=True)
+        self.count = np.bincount(inverse.ravel(), weights=self.count[keep],
+                                 minlength=len(unique)).astype(np.int64)
+        self.energy_bin = (unique % bins).astype(np.int16)
+        rest = unique // bins
+        self.age_class = (rest % classes).astype(np.int16)
+        cells = rest // classes
+        self.x = (cells // self.height).astype(np.int32)
+        self.y = (cells % self.height).astype(np.int32)
+        self._cell_order = None
+        self._members = {}
+
+    # ------------------------------------------------------------------
+    # Satu langkah
+    # ------------------------------------------------------------------
+
+    def update(self, environment, predators: Tuple[np.ndarray, np.ndarray] = None, mapper=None):
+        """
+        Gerak, makan, dan mortalitas untuk satu langkah (fase 'cohorts')
+        predators: posisi (xs, ys) serigala hidup, dipakai respons lari elk
+        mapper: lihat plan/settle (thread pool models/threads.py)
+        """
+        plan = self.plan(environment, predators, mapper)
+        self.forage(plan, environment)
+        self.settle(plan, environment, mapper)
+
+    def plan(self, environment, predators: Tuple[np.ndarray, np.ndarray] = None,
+             mapper=None) -> Optional[Dict[str, Any]]:
+        """
+        Tahap 1-2 update: penuaan dan pilihan sel tujuan (hanya membaca lingkungan)
+        mapper(func, chunks) opsional untuk menghitung skor gerak per potongan sel
+        (dipakai models/threads.py); hasil sama untuk ukuran potongan apa pun
+        """
+        from agents.kernels import find_optimal_positions, flee_positions, PREDATOR_DETECTION_RADIUS
+
+        self.births = self.deaths = self.kills = 0
+        if len(self.count) == 0:
+            self.cells_touched = 0
+            return None
+        config = self.config
+
+        # 1. age_one_step: energi berkurang, sebagian naik kelas usia
+        energy = np.maximum(0.0, self.energy_values[self.energy_bin] - config['metabolic_cost'])
+        promoted = self.rng.binomial(self.count, self.age_transition[self.age_class])
+        x = np.concatenate((self.x, self.x))
+        y = np.concatenate((self.y, self.y))
+        age_class = np.concatenate((self.age_class, np.minimum(self.age_class + 1,
+                                                               len(self.age_values) - 1)))
+        energy = np.concatenate((energy, energy))
+        count = np.concatenate((self.count - promoted, promoted))
+        live = count > 0
+        x, y, age_class, energy, count = x[live], y[live], age_class[live], energy[live], count[live]
+
+        # 2. Gerak: satu find_optimal_position per sel terisi
+        cell = x.astype(np.int64) * self.height + y
+        cells, inverse = np.unique(cell, return_inverse=True)
+        inverse = inverse.ravel()
+        cx, cy = cells // self.height, cells % self.height
+
+        def score(chunk):
+            return find_optimal_positions(environment.food, environment.temperature,
+                                          environment.humidity, cx[chunk], cy[chunk],
+                                          config['mobility'], self.species, self.tolerance)
+        if mapper is None:
+            ux, uy = score(slice(None))
+        else:
+            parts = mapper(score, _chunks(len(cells)))
+            ux = np.concatenate([part[0] for part in parts])
+            uy = np.concatenate([part[1] for part in parts])
+        if self.species == 'elk' and predators is not None and len(predators[0]):
+            fleeing = self._near_predator(cx, cy, predators, PREDATOR_DETECTION_RADIUS)
+            if fleeing.any():
+                fx, fy = flee_positions(cx[fleeing], cy[fleeing], config['mobility'],
+                                        predators[0], predators[1], self.width, self.height)
+                ux[fleeing], uy[fleeing] = fx, fy
+        window = 2 * config['mobility'] + 1
+        self.cells_touched = len(cells) * (window * window + 1)
+        return {'x': ux[inverse], 'y': uy[inverse], 'age_class': age_class,
+                'energy': energy, 'count': count}
+
+    def forage(self, plan: Optional[Dict[str, Any]], environment):
+        """
+        Tahap 3 update: makan di sel tujuan (menulis environment.food)
+        Asupan per individu dibagi rata jika makanan sel kurang
+        """
+        from agents.kernels import FORAGE_FACTORS
+
+        if plan is None:
+            return
+        config = self.config
+        cell = plan['x'].astype(np.int64) * self.height + plan['y']
+        targets, inverse = np.unique(cell, return_inverse=True)
+        inverse = inverse.ravel()
+        tx, ty = targets // self.height, targets % self.height
+        count = plan['count']
+        present = np.bincount(inverse, weights=count, minlength=len(targets))
+        available = environment.food[tx, ty]
+        temperature = environment.temperature[tx, ty]
+        humidity = environment.humidity[tx, ty]
+        min_temp, max_temp, min_humidity, max_humidity = self.tolerance
+        suitable = ((min_temp <= temperature) & (temperature <= max_temp) &
+                    (min_humidity <= humidity) & (humidity <= max_humidity))
+        good, bad = FORAGE_FACTORS[self.species]
+        demand = (np.minimum(config['consumption_rate'], available) * config['foraging_efficiency']
+                  * np.where(suitable, good, bad))
+        demand = np.minimum(demand, available)
+        intake = np.where(present * demand <= available, demand, available / np.maximum(present, 1))
+        intake = np.where(available <= 0, 0.0, intake)
+        environment.food[tx, ty] = np.maximum(0.0, available - present * intake)
+        plan['energy'] = np.minimum(plan['energy'] + intake[inverse], self.energy_values[-1])
+
+    def settle(self, plan: Optional[Dict[str, Any]], environment, mapper=None):
+        """
+        Tahap 4 update: mortalitas dengan energi setelah makan dan kondisi sel tujuan
+        mapper(func, chunks) opsional untuk menghitung peluang per potongan kohort
+        """
+        from agents.kernels import mortality_probabilities
+
+        if plan is None:
+            return
+        config = self.config
+        x, y, age_class, energy, count = (plan['x'], plan['y'], plan['age_class'],
+                                          plan['energy'], plan['count'])
+        temperature = environment.temperature[x, y]
+        humidity = environment.humidity[x, y]
+
+        def probabilities(chunk):
+            return mortality_probabilities(
+                energy[chunk], self.age_values[age_class[chunk]], config['max_age'],
+                config['mortality_rate'], temperature[chunk], humidity[chunk], self.tolerance)
+        if mapper is None:
+            probability = probabilities(slice(None))
+        else:
+            probability = np.concatenate(mapper(probabilities, _chunks(len(count))))
+        died = self.rng.binomial(count, probability)
+        self.deaths = int(died.sum())
+
+        self.x = np.empty(0, dtype=np.int32)
+        self.y = np.empty(0, dtype=np.int32)
+        self.age_class = np.empty(0, dtype=np.int16)
+        self.energy_bin = np.empty(0, dtype=np.int16)
+        self.count = np.empty(0, dtype=np.int64)
+        self._append_energy(x, y, age_class, energy, count - died)
+        self._merge()
+
+    @staticmethod
+    def _near_predator(xs: np.ndarray, ys: np.ndarray, predators: Tuple[np.ndarray, np.ndarray],
+                       radius: int, block: int = 65536) -> np.ndarray:
+        """Sel yang punya predator dalam radius Manhattan (check_predator_nearby)"""
+        px, py = predators
+        near = np.zeros(len(xs), dtype=bool)
+        for start in range(0, len(xs), block):
+            stop = start + block
+            distance = (np.abs(xs[start:stop, None] - px[None, :]) +
+                        np.abs(ys[start:stop, None] - py[None, :]))
+            near[start:stop] = (distance <= radius).any(axis=1)
+        return near
+
+    def reproduce(self, carrying_capacity: int):
+        """
+        Reproduksi logistik (fase 'cohort_reproduction'): kohort dengan energi
+        >= reproduction_threshold melahirkan dengan peluang r·max(0, 1 - N/K)
+        """
+        self.births = 0
+        if len(self.count) == 0 or carrying_capacity <= 0:
+            return
+        config = self.config
+        probability = config['reproduction_rate'] * max(0.0, 1.0 - len(self) / carrying_capacity)
+        energy = self.energy_values[self.energy_bin]
+        eligible = energy >= config['reproduction_threshold']
+        if probability <= 0 or not eligible.any():
+            return
+
+        parents = np.where(eligible, self.rng.binomial(self.count, probability), 0)
+        has = parents > 0
+        self.births = int(parents.sum())
+        if self.births == 0:
+            return
+
+        # Induk: energi dikurangi biaya create_offspring
+        px, py = self.x[has], self.y[has]
+        page, pcount = self.age_class[has], parents[has]
+        cost = config['reproduction_threshold'] * OFFSPRING_COST[self.species]
+        parent_energy = energy[has] - cost
+        self.count = self.count - parents
+
+        # Anak: sel induk + offset acak -1..1 per sumbu (di-clamp ke grid)
+        spread = self.rng.multinomial(pcount, np.full(9, 1.0 / 9.0))
+        dx = np.repeat(np.arange(-1, 2), 3)
+        dy = np.tile(np.arange(-1, 2), 3)
+        rows, offset = np.nonzero(spread)
+        kids = spread[rows, offset]
+        kx = np.clip(px[rows] + dx[offset], 0, self.width - 1)
+        ky = np.clip(py[rows] + dy[offset], 0, self.height - 1)
+
+        self._append_energy(px, py, page, parent_energy, pcount)
+        self._append_energy(kx, ky, np.zeros(len(kids), dtype=np.int16),
+                            np.full(len(kids), float(config['initial_energy'])), kids)
+        self._merge()
+
+    # ------------------------------------------------------------------
+    # Predasi oleh agen serigala
+    # ------------------------------------------------------------------
+
+    def remove(self, group: int, cause: str = 'natural'):
+        """Kurangi satu individu dari kohort `group`"""
+        if self.count[group] <= 0:
+            return
+        self.count[group] -= 1
+        self.deaths += 1
+        if cause == 'predation':
+            self.kills += 1
+
+    def prey_near(self, x: int, y: int, radius: int) -> List[CohortMember]:
+        """
+        Daftar mangsa dalam radius Manhattan dari (x, y) untuk scan_for_prey:
+        satu CohortMember per kohort, diulang sebanyak individu yang masih hidup
+        """
+        if self._cell_order is None:
+            cells = self.x.astype(np.int64) * self.height + self.y
+            self._cell_order = np.argsort(cells, kind='stable')
+            self._sorted_cells = cells[self._cell_order]
+        prey = []
+        for cx in range(max(0, x - radius), min(self.width - 1, x + radius) + 1):
+            reach = radius - abs(cx - x)
+            y0, y1 = max(0, y - reach), min(self.height - 1, y + reach)
+            start = np.searchsorted(self._sorted_cells, cx * self.height + y0, side='left')
+            stop = np.searchsorted(self._sorted_cells, cx * self.height + y1, side='right')
+            for group in self._cell_order[start:stop].tolist():
+                alive = int(self.count[group])
+                if alive > 0:
+                    member = self._members.get(group)
+                    if member is None:
+                        member = self._members[group] = CohortMember(self, group)
+                    prey.extend([member] * alive)
+        return prey
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan populasi kohort"""
+        total = len(self)
+        mean_energy = (float((self.energy_values[self.energy_bin] * self.count).sum()) / total
+                       if total else 0.0)
+        return {'species': self.species, 'individuals': total, 'cohorts': self.groups,
+                'occupied_cells': int(len(np.unique(self.x.astype(np.int64) * self.height + self.y))),
+                'mean_energy': mean_energy}
@@ -0,0 +1,868 @@
+"""
+Dekomposisi domain spasial: grid dibagi menjadi tile persegi panjang dan setiap
+tile disimulasikan oleh satu proses worker
+
+Data bersama lewat multiprocessing.shared_memory:
+    lingkungan  - temperature/humidity/food/water seluruh grid (Environment simulasi
+                  dipindah ke buffer ini); setiap worker hanya menulis sel miliknya
+    halo        - region tile + halo selebar max(mobility, hunt_range, radius pack/
+                  deteksi predator) disalin ke array privat worker di awal fase agents
+    ghost       - agen di pita tepi tile (dalam jarak halo dari batas) diekspor
+                  sebagai tabel (spesies, x, y, energi, defense) untuk dibaca tetangga
+    delta       - makanan yang dimakan agen worker di region halo, dikurangkan oleh
+                  pemilik sel saat merge
+
+Satu langkah = tiga ronde perintah ke semua worker (setiap ronde = barrier):
+    advance - terima imigran, tulis tabel ghost, update lingkungan tile sendiri
+    agents  - salin halo, update agen (serigala juga berburu ghost), tulis delta
+    merge   - terapkan delta tetangga dan ghost yang terbunuh, reproduksi dengan
+              populasi global, hapus agen mati, kirim emigran ke tile tujuan
+Statistik per tile digabung coordinator dengan urutan tile tetap sehingga hasil
+deterministik untuk seed dan tiling yang sama
+
+Rebalancing (rebalance_every=N): setiap N langkah batas tile dihitung ulang dengan
+recursive coordinate bisection atas bobot per sel = jumlah agen × biaya CPU per
+agen yang diukur di tile pemiliknya (rata-rata jendela terakhir). Partisi baru
+dipakai jika prediksi imbalance turun minimal min_gain; agen yang berpindah
+pemilik dimigrasikan seperti emigran biasa. Imbalance (maks/rata-rata waktu CPU
+tile), efisiensi, dan perkiraan speedup dicatat setiap langkah di load_history
+
+Perbedaan dengan simulasi satu proses: ghost dan makanan halo dibaca dari awal
+langkah (gerakan tetangga pada langkah yang sama tidak terlihat), elk lari
+berdasarkan serigala di tile + halo saja, dan mangsa yang diburu dua serigala dari
+tile berbeda hanya mati sekali
+
+Pemakaian:
+    sim.enable_domain_decomposition(tiles=(2, 2))
+    sim.run(steps=1000)
+    sim.disable_domain_decomposition()      # agen dikumpulkan kembali ke sim.agents
+    sim.enable_domain_decomposition(tiles=(4, 2), rebalance_every=50)
+    sim.domain.load_report()
+"""
+
+import time
+import random
+import traceback
+import multiprocessing
+from multiprocessing import shared_memory
+from types import SimpleNamespace
+from collections import deque
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .ecosystem import SPECIES_KEYS
+from .environment import Environment, EnvironmentCell, GridCell, update_region
+
+SPECIES = ('herbivore', 'elk', 'carnivore')
+_SPECIES_CODE = {'herbivore': 0, 'large_herbivore': 1, 'carnivore': 2}
+OFFSPRING_PREFIX = {'herbivore': 'H', 'elk': 'E', 'carnivore': 'C'}
+
+GHOST_DTYPE = np.dtype([('species', np.int8), ('x', np.int32), ('y', np.int32),
+                        ('energy', np.float64), ('defense', np.float64)])
+
+Bounds = Tuple[int, int, int, int]   # (x0, x1, y0, y1), batas atas eksklusif
+
+# Bobot per sel untuk update lingkungan, dalam satuan "agen" (rebalancing)
+CELL_WEIGHT = 0.01
+
+
+# ----------------------------------------------------------------------
+# Geometri tile
+# ----------------------------------------------------------------------
+
+def split_grid(width: int, height: int, tiles_x: int, tiles_y: int) -> List[Bounds]:
+    """Bagi grid menjadi tiles_x × tiles_y tile hampir sama besar (urut baris)"""
+    if not (1 <= tiles_x <= width and 1 <= tiles_y <= height):
+        raise ValueError(f"Jumlah tile {tiles_x}x{tiles_y} tidak muat di grid {width}x{height}")
+    xs = np.linspace(0, width, tiles_x + 1).round().astype(int)
+    ys = np.linspace(0, height, tiles_y + 1).round().astype(int)
+    return [(int(xs[i]), int(xs[i + 1]), int(ys[j]), int(ys[j + 1]))
+            for j in range(tiles_y) for i in range(tiles_x)]
+
+
+def halo_width() -> int:
+    """Lebar halo: jangkauan terjauh agen dalam satu langkah (gerak, berburu, pack, deteksi)"""
+    from agents.config_helper import get_herbivore_config, get_elk_config, get_carnivore_config
+    from agents.kernels import PACK_RADIUS, PREDATOR_DETECTION_RADIUS
+
+    configs = (get_herbivore_config(), get_elk_config(), get_carnivore_config())
+    reach = [config['mobility'] for config in configs] + [configs[2]['hunt_range']]
+    return max(reach + [PACK_RADIUS, PREDATOR_DETECTION_RADIUS])
+
+
+def extend(bounds: Bounds, halo: int, width: int, height: int) -> Bounds:
+    """Region tile + halo, dipotong ke grid"""
+    x0, x1, y0, y1 = bounds
+    return max(0, x0 - halo), min(width, x1 + halo), max(0, y0 - halo), min(height, y1 + halo)
+
+
+def intersect(a: Bounds, b: Bounds) -> Optional[Bounds]:
+    x0, x1 = max(a[0], b[0]), min(a[1], b[1])
+    y0, y1 = max(a[2], b[2]), min(a[3], b[3])
+    if x0 >= x1 or y0 >= y1:
+        return None
+    return x0, x1, y0, y1
+
+
+def owner_of(bounds: Sequence[Bounds], x: int, y: int) -> int:
+    """Indeks tile yang memiliki sel (x, y)"""
+    for tile, (x0, x1, y0, y1) in enumerate(bounds):
+        if x0 <= x < x1 and y0 <= y < y1:
+            return tile
+    raise ValueError(f"Sel ({x}, {y}) di luar semua tile")
+
+
+def bisect_partition(weights: np.ndarray, parts: int, bounds: Optional[Bounds] = None) -> List[Bounds]:
+    """
+    Recursive coordinate bisection: potong region di sumbu terpanjang sehingga
+    bobot kedua sisi sebanding dengan jumlah tile masing-masing sisi
+    Tile diurutkan mengikuti urutan rekursi (kiri/bawah dulu)
+    """
+    if bounds is None:
+        bounds = (0, weights.shape[0], 0, weights.shape[1])
+    if parts == 1:
+        return [bounds]
+    x0, x1, y0, y1 = bounds
+    left = parts // 2
+    along_x = (x1 - x0) >= (y1 - y0)
+    length = (x1 - x0) if along_x else (y1 - y0)
+    if length < 2:
+        along_x = not along_x
+        length = (x1 - x0) if along_x else (y1 - y0)
+
+    region = weights[x0:x1, y0:y1]
+    profile = region.sum(axis=1 if along_x else 0)
+    cumulative = np.cumsum(profile)
+    total = cumulative[-1]
+    if total > 0:
+        cut = int(np.searchsorted(cumulative, total * left / parts)) + 1
+    else:
+        cut = int(round(length * left / parts))
+    # Sisa sel di kedua sisi harus cukup untuk jumlah tile masing-masing
+    other = (y1 - y0) if along_x else (x1 - x0)
+    lowest, highest = -(-left // other), length - (-(-(parts - left) // other))
+    if lowest > highest:
+        raise ValueError(f"Region {bounds} terlalu kecil untuk {parts} tile")
+    cut = min(max(cut, lowest), highest)
+    if along_x:
+        first, second = (x0, x0 + cut, y0, y1), (x0 + cut, x1, y0, y1)
+    else:
+        first, second = (x0, x1, y0, y0 + cut), (x0, x1, y0 + cut, y1)
+    return bisect_partition(weights, left, first) + bisect_partition(weights, parts - left, second)
+
+
+def imbalance(values: Sequence[float]) -> float:
+    """Maks / rata-rata beban tile (1.0 = seimbang sempurna)"""
+    values = np.asarray(values, dtype=np.float64)
+    mean = values.mean() if values.size else 0.0
+    return float(values.max() / mean) if mean > 0 else 1.0
+
+
+def _local(region: Bounds, origin: Bounds) -> Tuple[slice, slice]:
+    """Slice region (koordinat global) di dalam array yang dimulai dari origin"""
+    return (slice(region[0] - origin[0], region[1] - origin[0]),
+            slice(region[2] - origin[2], region[3] - origin[2]))
+
+
+# ----------------------------------------------------------------------
+# Sisi worker
+# ----------------------------------------------------------------------
+
+class TileEnvironment:
+    """
+    Salinan privat region tile + halo dengan antarmuka Environment yang dipakai agen
+    (width/height global, get_cell(x, y) dengan koordinat global)
+    """
+
+    FIELDS = Environment.FIELDS
+    probe = None
+
+    def __init__(self, width: int, height: int, region: Bounds, base_temperature: float,
+                 base_humidity: float):
+        self.width = width
+        self.height = height
+        self.region = region
+        self.base_temperature = base_temperature
+        self.base_humidity = base_humidity
+        x0, x1, y0, y1 = region
+        shape = (x1 - x0, y1 - y0)
+        for name in self.FIELDS:
+            setattr(self, name, np.zeros(shape))
+        views = SimpleNamespace(height=shape[1], _views={
+            name: memoryview(getattr(self, name)).cast('B').cast('d') for name in self.FIELDS})
+        self._food_view = views._views['food']
+        self._temperature_view = views._views['temperature']
+        self._humidity_view = views._views['humidity']
+        self.grid: List[List[GridCell]] = []
+        for lx in range(shape[0]):
+            column = []
+            for ly in range(shape[1]):
+                cell = GridCell(views, lx, ly)
+                cell.x, cell.y = x0 + lx, y0 + ly
+                column.append(cell)
+            self.grid.append(column)
+
+    def load(self, shared: Dict[str, np.ndarray]):
+        """Salin region dari array bersama (pertukaran halo)"""
+        x0, x1, y0, y1 = self.region
+        for name in self.FIELDS:
+            getattr(self, name)[:] = shared[name][x0:x1, y0:y1]
+
+    def get_cell(self, x: int, y: int):
+        lx, ly = x - self.region[0], y - self.region[2]
+        if 0 <= lx < len(self.grid) and 0 <= ly < self.region[3] - self.region[2]:
+            return self.grid[lx][ly]
+        return EnvironmentCell(x, y, self.base_temperature, self.base_humidity, 0, 0)
+
+    def cell_conditions(self, x: int, y: int):
+        """(food, temperature, humidity) seperti Environment.cell_conditions"""
+        lx, ly = x - self.region[0], y - self.region[2]
+        local_height = self.region[3] - self.region[2]
+        if 0 <= lx < len(self.grid) and 0 <= ly < local_height:
+            index = lx * local_height + ly
+            return self._food_view[index], self._temperature_view[index], self._humidity_view[index]
+        cell = self.get_cell(x, y)
+        return cell.food, cell.temperature, cell.humidity
+
+
+class GhostAgent:
+    """
+    Salinan baca-saja agen tile tetangga di halo (mangsa atau serigala)
+    Jika dimangsa, permintaan kematian dikirim ke tile pemiliknya saat merge
+    """
+
+    __slots__ = ('owner', 'row', 'agent_id', 'species_type', 'x', 'y', 'energy',
+                 'defense_strength', 'alive', 'death_cause', '_kills')
+
+    def __init__(self, owner: int, row: int, species_type, x: int, y: int, energy: float,
+                 defense_strength: float, kills: Dict[int, List[int]]):
+        self.owner = owner
+        self.row = row
+        self.agent_id = f"ghost_{owner}_{row}"
+        self.species_type = species_type
+        self.x = x
+        self.y = y
+        self.energy = energy
+        self.defense_strength = defense_strength
+        self.alive = True
+        self.death_cause = None
+        self._kills = kills
+
+    def defend_against_predator(self) -> float:
+        """Sama dengan ElkAgent.defend_against_predator"""
+        return self.defense_strength * min(1.5, self.energy / 100.0)
+
+    def die(self, cause: str = 'natural'):
+        self.alive = False
+        self.death_cause = cause
+        self._kills.setdefault(self.owner, []).append(self.row)
+
+
+def _update_agents(agents: List[Any], ghosts: List[GhostAgent], environment):
+    """
+    Update agen tile berurutan (seperti backend 'indexed'): serigala menerima
+    tetangga dari GridIndex atas agen sendiri + ghost, elk menerima semua serigala
+    """
+    from agents.base_agent import SpeciesType
+    from agents.kernels import GridIndex, PACK_RADIUS
+
+    everyone = agents + ghosts
+    if not agents:
+        return
+    count = len(everyone)
+    xs = np.fromiter((agent.x for agent in everyone), dtype=np.int64, count=count)
+    ys = np.fromiter((agent.y for agent in everyone), dtype=np.int64, count=count)
+    index = GridIndex(xs, ys, np.ones(count, dtype=bool), environment.width, environment.height)
+    slack = 2 * max(agent.mobility for agent in agents)
+    carnivores = [agent for agent in everyone if agent.species_type == SpeciesType.CARNIVORE]
+
+    for agent in agents:
+        if agent.species_type != SpeciesType.CARNIVORE:
+            agent.update(environment, carnivores)
+            continue
+        if not agent.alive:
+            continue
+        radius = max(agent.hunt_range, PACK_RADIUS) + slack
+        nearby = [everyone[i] for i in index.query(agent.x, agent.y, radius).tolist()]
+        agent.update(environment, nearby)
+
+
+class _TileWorker:
+    """State dan handler perintah satu worker tile"""
+
+    def __init__(self, tile: int, layout: Dict[str, Any], agents: List[Any], seed: int,
+                 next_id: int):
+        from agents.base_agent import SpeciesType
+
+        self.tile = tile
+        self.width = layout['width']
+        self.height = layout['height']
+        self.halo = layout['halo']
+        self.stride = layout['tiles']
+        self.base_temperature = layout['base_temperature']
+        self.base_humidity = layout['base_humidity']
+        self.agents = agents
+        self.next_id = next_id
+        self.species_types = {code: SpeciesType(value) for value, code in _SPECIES_CODE.items()}
+
+        random.seed(f"{seed}:{tile}")
+        self.rng = np.random.default_rng([seed, tile])
+
+        self._shm_env = shared_memory.SharedMemory(name=layout['environment'])
+        size = self.width * self.height
+        self.shared = {name: np.ndarray((self.width, self.height), dtype=np.float64,
+                                        buffer=self._shm_env.buf, offset=i * size * 8)
+                       for i, name in enumerate(Environment.FIELDS)}
+
+        self._attached: Dict[str, shared_memory.SharedMemory] = {}
+        self._export = None
+        self.exported: List[Any] = []
+        self._delta = None
+        self.set_bounds(layout['bounds'])
+
+    # --- shared memory milik worker ---------------------------------------
+
+    def _create(self, nbytes: int) -> shared_memory.SharedMemory:
+        return shared_memory.SharedMemory(create=True, size=max(1, nbytes))
+
+    @staticmethod
+    def _release(shm: Optional[shared_memory.SharedMemory]):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def _open(self, name: str) -> shared_memory.SharedMemory:
+        shm = self._attached.get(name)
+        if shm is None:
+            shm = self._attached[name] = shared_memory.SharedMemory(name=name)
+        return shm
+
+    def _forget(self, live: Sequence[str]):
+        """Tutup attachment ke buffer tetangga yang sudah diganti"""
+        for name in list(self._attached):
+            if name not in live:
+                self._attached.pop(name).close()
+
+    def set_bounds(self, bounds: List[Bounds]):
+        """Pasang batas semua tile; region halo dan buffer delta dibangun ulang"""
+        self.bounds = [tuple(b) for b in bounds]
+        self.own = self.bounds[self.tile]
+        self.region = extend(self.own, self.halo, self.width, self.height)
+        self.environment = TileEnvironment(self.width, self.height, self.region,
+                                           self.base_temperature, self.base_humidity)
+        shape = (self.region[1] - self.region[0], self.region[3] - self.region[2])
+        self._release(self._delta)
+        self._delta = self._create(shape[0] * shape[1] * 8)
+        self.delta = np.ndarray(shape, dtype=np.float64, buffer=self._delta.buf)
+        self.delta[:] = 0.0
+
+    # --- perintah ------------------------------------------------------------
+
+    def handle(self, command: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return getattr(self, f"_cmd_{command}")(**payload)
+
+    def _cmd_hello(self) -> Dict[str, Any]:
+        return {'delta': self._delta.name, 'region': self.region}
+
+    def _cmd_advance(self, step: int, immigrants: List[Any]) -> Dict[str, Any]:
+        """Terima imigran, ekspor ghost, update lingkungan tile sendiri"""
+        self.agents.extend(immigrants)
+        export = self._write_export()
+        x0, x1, y0, y1 = self.own
+        update_region(step, self.rng, self.shared['temperature'][x0:x1, y0:y1],
+                      self.shared['humidity'][x0:x1, y0:y1], self.shared['food'][x0:x1, y0:y1],
+                      self.base_temperature, self.base_humidity)
+        return {'export': export}
+
+    def _write_export(self) -> Tuple[str, int]:
+        """Tulis agen di pita tepi tile (dibutuhkan tetangga sebagai ghost)"""
+        x0, x1, y0, y1 = self.own
+        h = self.halo
+        self.exported = [agent for agent in self.agents if agent.alive and
+                         (agent.x < x0 + h or agent.x >= x1 - h or agent.y < y0 + h or agent.y >= y1 - h)]
+        count = len(self.exported)
+        if self._export is None or self._export.size < count * GHOST_DTYPE.itemsize:
+            self._release(self._export)
+            self._export = self._create(max(1024, 2 * count) * GHOST_DTYPE.itemsize)
+        table = np.ndarray((count,), dtype=GHOST_DTYPE, buffer=self._export.buf)
+        for row, agent in enumerate(self.exported):
+            table[row] = (_SPECIES_CODE[agent.species_type.value], agent.x, agent.y, agent.energy,
+                          getattr(agent, 'defense_strength', 0.0))
+        return self._export.name, count
+
+    def _cmd_agents(self, exports: List[Tuple[str, int]]) -> Dict[str, Any]:
+        """Salin halo, bangun ghost, update agen, tulis delta makanan"""
+        began = time.process_time()
+        self.environment.load(self.shared)
+        start_food = self.environment.food.copy()
+
+        kills: Dict[int, List[int]] = {}
+        ghosts = []
+        x0, x1, y0, y1 = self.region
+        for tile, (name, count) in enumerate(exports):
+            if tile == self.tile or count == 0:
+                continue
+            table = np.ndarray((count,), dtype=GHOST_DTYPE, buffer=self._open(name).buf)
+            inside = np.flatnonzero((table['x'] >= x0) & (table['x'] < x1) &
+                                    (table['y'] >= y0) & (table['y'] < y1))
+            for row in inside.tolist():
+                item = table[row]
+                ghosts.append(GhostAgent(tile, row, self.species_types[int(item['species'])],
+                                         int(item['x']), int(item['y']), float(item['energy']),
+                                         float(item['defense']), kills))
+        self._forget([name for name, _ in exports])
+
+        alive = [agent for agent in self.agents if agent.alive]
+        _update_agents(alive, ghosts, self.environment)
+        np.subtract(start_food, self.environment.food, out=self.delta)
+
+        counts = {key: 0 for key in SPECIES}
+        for agent in self.agents:
+            if agent.alive:
+                counts[SPECIES_KEYS[agent.species_type.value]] += 1
+        self.elapsed = time.process_time() - began
+        return {'counts': counts, 'kills': kills, 'processed': len(alive)}
+
+    def _cmd_merge(self, counts: Dict[str, int], carrying_capacity: int, kills: List[int],
+                   deltas: List[Tuple[str, Bounds]]) -> Dict[str, Any]:
+        """Gabung delta tetangga, terapkan kematian ghost, reproduksi, compaction, emigrasi"""
+        began = time.process_time()
+
+        # Makanan sel sendiri = salinan privat - konsumsi tetangga (urutan tile tetap)
+        own = _local(self.own, self.region)
+        food = self.environment.food[own]
+        for tile, (name, region) in enumerate(deltas):
+            if tile == self.tile:
+                continue
+            overlap = intersect(tuple(region), self.own)
+            if overlap is None:
+                continue
+            delta = np.ndarray((region[1] - region[0], region[3] - region[2]), dtype=np.float64,
+                               buffer=self._open(name).buf)
+            food[_local(overlap, self.own)] -= delta[_local(overlap, tuple(region))]
+        x0, x1, y0, y1 = self.own
+        np.maximum(food, 0.0, out=self.shared['food'][x0:x1, y0:y1])
+
+        for row in kills:
+            agent = self.exported[row]
+            if agent.alive:
+                agent.die('predation')
+
+        births = self._reproduce(counts, carrying_capacity)
+
+        deaths = {key: 0 for key in SPECIES}
+        predation = {key: 0 for key in SPECIES}
+        survivors = []
+        for agent in self.agents:
+            if agent.alive:
+                survivors.append(agent)
+            else:
+                key = SPECIES_KEYS[agent.species_type.value]
+                deaths[key] += 1
+                if agent.death_cause == 'predation':
+                    predation[key] += 1
+
+        final = {key: 0 for key in SPECIES}
+        staying = []
+        emigrants: Dict[int, List[Any]] = {}
+        for agent in survivors:
+            final[SPECIES_KEYS[agent.species_type.value]] += 1
+            if x0 <= agent.x < x1 and y0 <= agent.y < y1:
+                staying.append(agent)
+            else:
+                emigrants.setdefault(owner_of(self.bounds, agent.x, agent.y), []).append(agent)
+        self.agents = staying
+        self.elapsed += time.process_time() - began
+        return {'counts': final, 'births': births, 'deaths': deaths, 'kills': predation,
+                'emigrants': emigrants, 'agents': len(staying), 'seconds': self.elapsed}
+
+    def _reproduce(self, counts: Dict[str, int], carrying_capacity: int) -> Dict[str, int]:
+        """Reproduksi logistik seperti _process_reproduction, N = populasi global"""
+        capacity = {'herbivore': carrying_capacity, 'elk': max(30, carrying_capacity // 7),
+                    'carnivore': max(15, carrying_capacity // 13)}
+        births = {key: 0 for key in SPECIES}
+        newborn = []
+        for key in SPECIES:
+            for agent in self.agents:
+                if (agent.alive and SPECIES_KEYS[agent.species_type.value] == key and
+                        agent.can_reproduce(counts[key], capacity[key])):
+                    offspring = agent.create_offspring(f"{OFFSPRING_PREFIX[key]}_{self.next_id}")
+                    if offspring:
+                        offspring.x = max(0, min(self.width - 1, offspring.x))
+                        offspring.y = max(0, min(self.height - 1, offspring.y))
+                        newborn.append(offspring)
+                        births[key] += 1
+                        self.next_id += self.stride
+        self.agents.extend(newborn)
+        return births
+
+    def _cmd_density(self) -> Dict[str, Any]:
+        """Jumlah agen per sel tile sendiri (bobot rebalancing)"""
+        x0, x1, y0, y1 = self.own
+        counts = np.zeros((x1 - x0, y1 - y0), dtype=np.int32)
+        for agent in self.agents:
+            if agent.alive:
+                counts[agent.x - x0, agent.y - y0] += 1
+        return {'counts': counts}
+
+    def _cmd_repartition(self, bounds: List[Bounds]) -> Dict[str, Any]:
+        """Pasang batas baru; agen di luar tile baru dikirim ke pemilik barunya"""
+        self.set_bounds(bounds)
+        x0, x1, y0, y1 = self.own
+        staying = []
+        emigrants: Dict[int, List[Any]] = {}
+        for agent in self.agents:
+            if x0 <= agent.x < x1 and y0 <= agent.y < y1:
+                staying.append(agent)
+            else:
+                emigrants.setdefault(owner_of(self.bounds, agent.x, agent.y), []).append(agent)
+        self.agents = staying
+        return {'delta': self._delta.name, 'region': self.region, 'emigrants': emigrants}
+
+    def _cmd_collect(self, immigrants: List[Any]) -> Dict[str, Any]:
+        self.agents.extend(immigrants)
+        return {'agents': self.agents, 'next_id': self.next_id}
+
+    def close(self):
+        self._forget([])
+        self._release(self._export)
+        self._release(self._delta)
+        self._export = self._delta = None
+        self.shared = {}
+        self._shm_env.close()
+
+
+def _worker_main(conn, tile: int, layout: Dict[str, Any], seed: int, next_id: int):
+    """Loop perintah proses worker tile"""
+    worker = None
+    try:
+        agents = conn.recv()
+        worker = _TileWorker(tile, layout, agents, seed, next_id)
+        while True:
+            command, payload = conn.recv()
+            if command == 'close':
+                break
+            try:
+                conn.send(('ok', worker.handle(command, payload)))
+            except Exception:
+                conn.send(('error', traceback.format_exc()))
+    except (EOFError, KeyboardInterrupt):
+        pass
+    finally:
+        if worker is not None:
+            worker.close()
+        conn.close()
+
+
+# ----------------------------------------------------------------------
+# Sisi coordinator (fase pipeline EcosystemSimulation)
+# ----------------------------------------------------------------------
+
+def _domain_environment_phase(simulation, phase):
+    simulation.environment.time_step += 1
+    simulation.domain.advance(simulation.environment.time_step)
+    phase.count('cells_touched', simulation.width * simulation.height)
+
+
+def _domain_agents_phase(simulation, phase):
+    processed = simulation.domain.update_agents()
+    phase.count('agents_processed', processed)
+
+
+def _domain_reproduction_phase(simulation, phase):
+    phase.count('agents_processed', simulation.domain.merge(simulation))
+
+
+def _domain_compaction_phase(simulation, phase):
+    """Compaction sudah dilakukan worker saat merge"""
+
+
+DOMAIN_PHASES = {'environment': _domain_environment_phase, 'agents': _domain_agents_phase,
+                 'reproduction': _domain_reproduction_phase, 'compaction': _domain_compaction_phase}
+
+
+class DomainDecomposition:
+    """
+    Coordinator tile paralel: membagi agen, memegang shared memory lingkungan,
+    dan menjalankan tiga ronde per langkah ke semua worker
+
+    Contoh:
+        domain = DomainDecomposition(tiles=(4, 2))
+        domain.attach(sim)
+        sim.run(steps=1000)
+        domain.detach(sim)
+    """
+
+    def __init__(self, tiles: Tuple[int, int] = (2, 2), bounds: Optional[List[Bounds]] = None,
+                 halo: Optional[int] = None, seed: Optional[int] = None,
+                 rebalance_every: Optional[int] = None, min_gain: float = 0.05,
+                 history: int = 10000):
+        if rebalance_every is not None and rebalance_every < 1:
+            raise ValueError("rebalance_every harus >= 1")
+        self.tiles = tiles
+        self.bounds = bounds
+        self.halo = halo
+        self.seed = seed
+        self.rebalance_every = rebalance_every
+        self.min_gain = min_gain
+        self.load_history = deque(maxlen=history)
+        self.rebalances: List[Dict[str, Any]] = []
+        self.counts = {key: 0 for key in SPECIES}
+        self.tile_stats: List[Dict[str, Any]] = []
+        self._processes = []
+        self._connections = []
+        self._pending: List[List[Any]] = []
+        self._exports: List[Tuple[str, int]] = []
+        self._kills: List[List[int]] = []
+        self._shm = None
+        self._original_phases: Dict[str, Any] = {}
+
+    # --- komunikasi -----------------------------------------------------------
+
+    def _exchange(self, command: str, payloads: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Kirim perintah ke semua worker lalu tunggu semua balasan (barrier)"""
+        for connection, payload in zip(self._connections, payloads):
+            connection.send((command, payload))
+        replies = []
+        errors = []
+        for tile, connection in enumerate(self._connections):
+            status, reply = connection.recv()
+            if status == 'error':
+                errors.append(f"tile {tile}:\n{reply}")
+            replies.append(reply)
+        if errors:
+            raise RuntimeError("Worker tile gagal\n" + "\n".join(errors))
+        return replies
+
+    # --- siklus hidup ----------------------------------------------------------
+
+    def attach(self, simulation):
+        """Pindahkan lingkungan ke shared memory, bagi agen per tile, jalankan worker"""
+        if simulation.cohorts or simulation.engine is not None:
+            raise ValueError("Dekomposisi domain belum mendukung mode kohort atau engine adaptif")
+        if simulation.threads is not None and simulation.threads.active:
+            raise ValueError("Dekomposisi domain tidak bisa digabung dengan mode thread")
+        if simulation.synchronous is not None:
+            raise ValueError("Dekomposisi domain belum mendukung mode sinkron")
+        width, height = simulation.width, simulation.height
+        if self.bounds is None:
+            self.bounds = split_grid(width, height, *self.tiles)
+            if self.rebalance_every:
+                # Partisi awal dari kepadatan agen (biaya per agen dianggap sama)
+                density = np.zeros((width, height))
+                for agent in simulation.agents:
+                    if agent.alive:
+                        density[agent.x, agent.y] += 1
+                self.bounds = bisect_partition(density + CELL_WEIGHT, len(self.bounds))
+        if self.halo is None:
+            self.halo = halo_width()
+        if self.seed is None:
+            self.seed = random.getrandbits(32)
+        count = len(self.bounds)
+
+        environment = simulation.environment
+        self._shm = shared_memory.SharedMemory(create=True, size=len(Environment.FIELDS) * width * height * 8)
+        environment.use_shared_buffer(self._shm.buf)
+
+        groups: List[List[Any]] = [[] for _ in range(count)]
+        for agent in simulation.agents:
+            if agent.alive:
+                groups[owner_of(self.bounds, agent.x, agent.y)].append(agent)
+
+        layout = {'width': width, 'height': height, 'halo': self.halo, 'tiles': count,
+                  'bounds': self.bounds, 'environment': self._shm.name,
+                  'base_temperature': environment.base_temperature,
+                  'base_humidity': environment.base_humidity}
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+        for tile in range(count):
+            parent, child = context.Pipe()
+            process = context.Process(target=_worker_main, daemon=True,
+                                      args=(child, tile, layout, self.seed,
+                                            simulation.agent_counter + tile))
+            process.start()
+            child.close()
+            parent.send(groups[tile])
+            self._processes.append(process)
+            self._connections.append(parent)
+
+        hello = self._exchange('hello', [{} for _ in range(count)])
+        self._deltas = [(reply['delta'], reply['region']) for reply in hello]
+        self._pending = [[] for _ in range(count)]
+        self._kills = [[] for _ in range(count)]
+        self.counts = simulation.population_counts()
+
+        simulation.agents = []
+        simulation.domain = self
+        for name, func in DOMAIN_PHASES.items():
+            if name in simulation.pipeline:
+                self._original_phases[name] = simulation.pipeline.get(name).func
+                simulation.pipeline.replace(name, func)
+        print(f"🧩 Dekomposisi domain: {count} tile ({len(self._processes)} worker), halo {self.halo} sel")
+
+    def detach(self, simulation):
+        """Kumpulkan agen kembali ke simulasi, hentikan worker, lepas shared memory"""
+        if not self._connections:
+            return
+        try:
+            replies = self._exchange('collect', [{'immigrants': pending} for pending in self._pending])
+            simulation.agents = [agent for reply in replies for agent in reply['agents']]
+            simulation.agent_counter = max([simulation.agent_counter] +
+                                           [reply['next_id'] for reply in replies])
+        finally:
+            self.close()
+            simulation.environment.release_shared_buffer()
+            self._release_environment()
+            for name, func in self._original_phases.items():
+                if name in simulation.pipeline:
+                    simulation.pipeline.replace(name, func)
+            self._original_phases = {}
+            if simulation.domain is self:
+                simulation.domain = None
+
+    def close(self):
+        """Hentikan semua worker (idempoten)"""
+        for connection in self._connections:
+            try:
+                connection.send(('close', None))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        for connection in self._connections:
+            connection.close()
+        self._processes = []
+        self._connections = []
+
+    def _release_environment(self):
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    # --- ronde per langkah -----------------------------------------------------
+
+    def advance(self, step: int):
+        replies = self._exchange('advance', [{'step': step, 'immigrants': pending}
+                                             for pending in self._pending])
+        self._pending = [[] for _ in self._pending]
+        self._exports = [reply['export'] for reply in replies]
+
+    def update_agents(self) -> int:
+        replies = self._exchange('agents', [{'exports': self._exports} for _ in self._connections])
+        self._alive = {key: sum(reply['counts'][key] for reply in replies) for key in SPECIES}
+        self._kills = [[] for _ in self._connections]
+        for reply in replies:
+            for owner, rows in sorted(reply['kills'].items()):
+                self._kills[owner].extend(rows)
+        return sum(reply['processed'] for reply in replies)
+
+    def merge(self, simulation) -> int:
+        payloads = [{'counts': self._alive, 'carrying_capacity': simulation.carrying_capacity,
+                     'kills': kills, 'deltas': self._deltas} for kills in self._kills]
+        replies = self._exchange('merge', payloads)
+
+        events = simulation.step_events
+        for kind in ('births', 'deaths', 'kills'):
+            for key in SPECIES:
+                events[kind][key] = sum(reply[kind][key] for reply in replies)
+        self.counts = {key: sum(reply['counts'][key] for reply in replies) for key in SPECIES}
+        for reply in replies:
+            for destination, agents in sorted(reply['emigrants'].items()):
+                self._pending[destination].extend(agents)
+        self.tile_stats = [{'tile': tile, 'bounds': self.bounds[tile], 'agents': reply['agents'],
+                            'seconds': reply['seconds']} for tile, reply in enumerate(replies)]
+        self._record_load(simulation.time_step)
+        if self.rebalance_every and simulation.time_step % self.rebalance_every == 0:
+            self.rebalance(simulation)
+        return sum(self.counts.values())
+
+    # --- keseimbangan beban ------------------------------------------------------
+
+    def _record_load(self, step: int):
+        seconds = [stats['seconds'] for stats in self.tile_stats]
+        agents = [stats['agents'] for stats in self.tile_stats]
+        slowest = max(seconds) if seconds else 0.0
+        self.load_history.append({
+            'step': step,
+            'seconds': seconds,
+            'agents': agents,
+            'imbalance': imbalance(seconds),
+            'agent_imbalance': imbalance(agents),
+            'efficiency': (sum(seconds) / len(seconds) / slowest) if slowest > 0 else 1.0,
+            'speedup': (sum(seconds) / slowest) if slowest > 0 else 1.0
+        })
+
+    def rebalance(self, simulation, force: bool = False) -> bool:
+        """
+        Hitung partisi baru dari kepadatan agen × biaya CPU per agen per tile
+        Partisi dipakai jika prediksi imbalance turun minimal min_gain (atau force)
+        """
+        window = list(self.load_history)[-(self.rebalance_every or 1):]
+        count = len(self.bounds)
+        seconds = np.zeros(count)
+        agents = np.zeros(count)
+        for record in window:
+            seconds += record['seconds']
+            agents += record['agents']
+        measured = agents > 0
+        fallback = seconds[measured].sum() / agents[measured].sum() if measured.any() else 1.0
+        cost = np.where(measured, seconds / np.maximum(agents, 1), fallback)
+        if fallback <= 0:
+            cost = np.ones(count)
+        current = imbalance(seconds) if seconds.sum() > 0 else imbalance(agents)
+
+        replies = self._exchange('density', [{} for _ in range(count)])
+        weights = np.zeros((simulation.width, simulation.height))
+        for tile, reply in enumerate(replies):
+            x0, x1, y0, y1 = self.bounds[tile]
+            weights[x0:x1, y0:y1] = reply['counts'] * cost[tile]
+        weights += CELL_WEIGHT * max(cost.mean(), 1e-12)
+
+        bounds = bisect_partition(weights, count)
+        predicted = imbalance([weights[x0:x1, y0:y1].sum() for x0, x1, y0, y1 in bounds])
+        record = {'step': simulation.time_step, 'imbalance_before': current,
+                  'imbalance_predicted': predicted, 'applied': False}
+        if bounds != [tuple(b) for b in self.bounds] and (force or predicted < current * (1.0 - self.min_gain)):
+            self._repartition(bounds)
+            record['applied'] = True
+            if simulation.verbose:
+                print(f"  ⚖️  Rebalance langkah {simulation.time_step}: imbalance "
+                      f"{current:.2f} → {predicted:.2f} (prediksi)")
+        self.rebalances.append(record)
+        return record['applied']
+
+    def _repartition(self, bounds: List[Bounds]):
+        """Kirim batas baru ke worker dan arahkan ulang agen yang berpindah pemilik"""
+        replies = self._exchange('repartition', [{'bounds': bounds} for _ in self._connections])
+        self.bounds = bounds
+        self._deltas = [(reply['delta'], reply['region']) for reply in replies]
+        pending = [agent for group in self._pending for agent in group]
+        self._pending = [[] for _ in self._connections]
+        for agent in pending:
+            self._pending[owner_of(bounds, agent.x, agent.y)].append(agent)
+        for reply in replies:
+            for destination, agents in sorted(reply['emigrants'].items()):
+                self._pending[destination].extend(agents)
+
+    def load_report(self, last: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Ringkasan beban tile: imbalance waktu CPU dan agen, efisiensi paralel,
+        perkiraan speedup (total CPU / tile terlambat), dan riwayat rebalance
+        """
+        records = list(self.load_history)[-last:] if last else list(self.load_history)
+        if not records:
+            return {'steps': 0, 'rebalances': 0}
+        return {
+            'steps': len(records),
+            'imbalance': float(np.mean([r['imbalance'] for r in records])),
+            'agent_imbalance': float(np.mean([r['agent_imbalance'] for r in records])),
+            'efficiency': float(np.mean([r['efficiency'] for r in records])),
+            'speedup': float(np.mean([r['speedup'] for r in records])),
+            'tiles': len(self.bounds),
+            'rebalances': sum(1 for r in self.rebalances if r['applied']),
+            'bounds': list(self.bounds)
+        }
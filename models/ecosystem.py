@@ -6,15 +6,25 @@ Implementasi algoritma simulasi berdasarkan rumus PDF
 
 from typing import List, Dict, Any
 from .environment import Environment
+from .pipeline import StepPipeline, StepPhase, AgentProbe
+from .history import HistoryArchive
+from .online_stats import OnlineStatistics
 from data.config_fixed import SIMULATION_CONFIG
 
+# Kunci spesies di population_history berdasarkan SpeciesType.value agen
+SPECIES_KEYS = {
+    'herbivore': 'herbivore',
+    'large_herbivore': 'elk',
+    'carnivore': 'carnivore'
+}
+
 class EcosystemSimulation:
     """
     Kelas utama untuk menjalankan simulasi ekosistem
     Support untuk 3 spesies: kelinci (herbivora), elk (herbivora besar), serigala (karnivora)
     """
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, history_window: int = 2000):
         self.width = width
         self.height = height
         self.time_step = 0
@@ -27,19 +37,75 @@ class EcosystemSimulation:
         self.agents: List[Any] = []
         
         # Data untuk analisis - ditambah elk tracking
-        self.population_history = {
-            'herbivore': [],      # Kelinci
-            'elk': [],            # Elk
-            'carnivore': [],      # Serigala
-            'total_food': [],
-            'avg_temperature': []
-        }
+        # Arsip multi-resolusi: history_window langkah terakhir resolusi penuh,
+        # langkah lebih lama sebagai agregat min/mean/max 10x/100x/1000x
+        self.population_history = HistoryArchive(
+            ('herbivore', 'elk', 'carnivore', 'total_food', 'avg_temperature',
+             'carnivore_herbivore_ratio', 'herbivore_rolling_std', 'carnivore_rolling_std'),
+            window=history_window
+        )
+        
+        # Statistik bergulir online (diperbarui sekali per langkah)
+        self.online_stats = OnlineStatistics()
         
         # Counter untuk ID unik
         self.agent_counter = 0
         
+        # Kejadian ekologis pada langkah terakhir (kelahiran/kematian per spesies)
+        self.step_events = self._empty_step_events()
+        
+        # Statistik langkah terakhir (dipakai recorder dan dashboard)
+        self.latest_record = None
+        
+        # Metrics registry (None = instrumentasi nonaktif)
+        self.metrics = None
+        
+        # Recorder time-series streaming (None = nonaktif)
+        self.recorder = None
+        
+        # Recorder snapshot spasial untuk render offline (None = nonaktif)
+        self.snapshots = None
+        
+        # Dashboard terminal (None = nonaktif)
+        self.dashboard = None
+        
+        # Populasi kohort per spesies ('herbivore'/'elk' -> CohortPopulation)
+        self.cohorts: Dict[str, Any] = {}
+        
+        # Backend fase agents ('object' atau 'indexed') dan engine adaptif (None = nonaktif)
+        self.agent_backend = 'object'
+        self.engine = None
+        
+        # Dekomposisi domain ke worker tile (None = satu proses)
+        self.domain = None
+        
+        # Thread pool fase lingkungan/kohort untuk build free-threaded (None = serial)
+        self.threads = None
+        
+        # Update agen sinkron intensi → resolve (None = in-place berurutan)
+        self.synchronous = None
+        
+        # False = tanpa print per langkah (progress dan kelahiran)
+        self.verbose = True
+        
+        # Pipeline fase per langkah (bisa diganti/dinonaktifkan per fase)
+        self.pipeline = self._build_default_pipeline()
+        
         print(f"🦎 EcosystemSimulation initialized: {width}x{height} dengan 3 spesies")
     
+    def reseed(self, seed: int):
+        """
+        Set ulang seed random generator yang dipakai agen dan lingkungan
+        Dipakai saat replikasi bercabang dari state yang sama
+        """
+        import random
+        random.seed(seed)
+        self.environment.reseed(random.getrandbits(64))
+        for population in self.cohorts.values():
+            population.reseed(random.getrandbits(64))
+        if self.synchronous is not None:
+            self.synchronous.reseed(random.getrandbits(64))
+    
     def setup_species(self):
         """
         Setup populasi awal semua spesies: kelinci, elk, dan serigala
@@ -73,7 +139,7 @@ class EcosystemSimulation:
         # Info habitat zones
         print(f"🌍 Habitat zones: River Valley (center), Grassland (middle), Mountain (edge)")
     
-    def _create_herbivore(self):
+    def _create_herbivore(self, config: dict = None):
         """
         Buat herbivora (kelinci) baru di posisi acak
         """
@@ -85,11 +151,11 @@ class EcosystemSimulation:
         agent_id = f"H_{self.agent_counter}"
         self.agent_counter += 1
         
-        herbivore = HerbivoreAgent(agent_id, x, y)
+        herbivore = HerbivoreAgent(agent_id, x, y, config)
         self.agents.append(herbivore)
         return herbivore
     
-    def _create_elk(self):
+    def _create_elk(self, config: dict = None):
         """
         Buat elk baru di posisi acak
         """
@@ -101,11 +167,11 @@ class EcosystemSimulation:
         agent_id = f"E_{self.agent_counter}"
         self.agent_counter += 1
         
-        elk = ElkAgent(agent_id, x, y)
+        elk = ElkAgent(agent_id, x, y, config)
         self.agents.append(elk)
         return elk
     
-    def _create_carnivore(self):
+    def _create_carnivore(self, config: dict = None):
         """
         Buat karnivora (serigala) baru di posisi acak
         """
@@ -117,35 +183,383 @@ class EcosystemSimulation:
         agent_id = f"C_{self.agent_counter}"
         self.agent_counter += 1
         
-        carnivore = CarnivoreAgent(agent_id, x, y)
+        carnivore = CarnivoreAgent(agent_id, x, y, config)
         self.agents.append(carnivore)
         return carnivore
     
+    def add_agents(self, species: str, count: int, config: dict = None):
+        """
+        Tambah sejumlah agen satu spesies ('herbivore', 'elk', 'carnivore') di posisi acak
+        Config dibaca sekali lalu dipakai bersama (cepat untuk populasi besar)
+        Spesies dalam mode kohort ditambahkan ke populasi kohortnya
+        """
+        from agents.config_helper import get_herbivore_config, get_carnivore_config, get_elk_config
+        
+        factories = {
+            'herbivore': (self._create_herbivore, get_herbivore_config),
+            'elk': (self._create_elk, get_elk_config),
+            'carnivore': (self._create_carnivore, get_carnivore_config)
+        }
+        if species not in factories:
+            raise ValueError(f"Spesies tidak dikenal: {species}")
+        if species in self.cohorts:
+            self.cohorts[species].add(count)
+            return []
+        
+        create, get_config = factories[species]
+        if config is None:
+            config = get_config()
+        return [create(config) for _ in range(count)]
+    
+    def _build_default_pipeline(self) -> StepPipeline:
+        """
+        Susun pipeline langkah default sesuai flowchart PDF
+        """
+        cls = type(self)
+        pipeline = StepPipeline()
+        pipeline.register('environment', cls._phase_environment)
+        pipeline.register('agents', cls._phase_agents)
+        pipeline.register('reproduction', cls._phase_reproduction)
+        pipeline.register('compaction', cls._phase_compaction)
+        pipeline.register('statistics', cls._phase_statistics)
+        return pipeline
+    
     def step(self):
         """
         Satu langkah simulasi - implementasi algoritma dari flowchart PDF
         Dengan support untuk elk dan food zones
+        Urutan fase diatur oleh self.pipeline
         """
         self.time_step += 1
-        
-        # 1. Update lingkungan (termasuk seasonal changes dan food regeneration)
+        self.step_events = self._empty_step_events()
+        self.pipeline.run(self)
+    
+    @staticmethod
+    def _empty_step_events() -> Dict[str, Dict[str, int]]:
+        """
+        Counter kejadian per spesies untuk satu langkah
+        (kills = kematian karena dimangsa, bagian dari deaths)
+        """
+        return {
+            'births': {key: 0 for key in SPECIES_KEYS.values()},
+            'deaths': {key: 0 for key in SPECIES_KEYS.values()},
+            'kills': {key: 0 for key in SPECIES_KEYS.values()}
+        }
+    
+    def _phase_environment(self, phase: StepPhase):
+        """
+        1. Update lingkungan (termasuk seasonal changes dan food regeneration)
+        """
         self.environment.update()
-        
-        # 2. Update semua agen (kelinci, elk, serigala)
+        phase.count('cells_touched', self.width * self.height)
+    
+    def _phase_agents(self, phase: StepPhase):
+        """
+        2. Update semua agen (kelinci, elk, serigala)
+        cells_touched = panggilan get_cell, queries_issued = scan populasi
+        (predator terdekat, lari, cari mangsa, hitung kawanan), dihitung agen
+        sendiri lewat AgentProbe di environment simulasi ini
+        """
         alive_agents = [agent for agent in self.agents if agent.alive]
+        self.environment.probe = AgentProbe(phase, self.metrics)
+        try:
+            self._run_agents(alive_agents)
+        finally:
+            self.environment.probe = None
+        phase.count('agents_processed', len(alive_agents))
+    
+    def _run_agents(self, alive_agents: List[Any]):
+        """Panggil update setiap agen hidup sesuai backend dan mode kohort"""
+        from agents.base_agent import SpeciesType
+        
+        if self.agent_backend == 'indexed':
+            self._update_agents_indexed(alive_agents)
+        elif self.cohorts:
+            # Serigala melihat individu kohort di sekitar posisinya sebagai mangsa
+            for agent in alive_agents:
+                if agent.species_type == SpeciesType.CARNIVORE and agent.alive:
+                    nearby = [member for population in self.cohorts.values()
+                              for member in population.prey_near(agent.x, agent.y, agent.hunt_range)]
+                    agent.update(self.environment, self.agents + nearby)
+                else:
+                    agent.update(self.environment, self.agents)
+        else:
+            for agent in alive_agents:
+                agent.update(self.environment, self.agents)
+    
+    def _update_agents_indexed(self, alive_agents: List[Any]):
+        """
+        Update agen berurutan seperti backend object, tetapi all_agents untuk
+        serigala hanya berisi tetangga dari GridIndex dan untuk elk hanya serigala
+        Indeks dibangun dari posisi awal fase; radius query ditambah 2 × mobilitas
+        maksimum karena setiap agen bergerak paling jauh sekali per fase, lalu
+        method agen sendiri memfilter jarak sebenarnya. Urutan tetangga mengikuti
+        urutan daftar agen sehingga draw RNG dan hasilnya identik
+        """
+        import numpy as np
+        from agents.base_agent import SpeciesType
+        from agents.kernels import GridIndex, PACK_RADIUS
         
-        for agent in alive_agents:
-            agent.update(self.environment, self.agents)
+        count = len(alive_agents)
+        if count == 0:
+            return
+        xs = np.fromiter((agent.x for agent in alive_agents), dtype=np.int64, count=count)
+        ys = np.fromiter((agent.y for agent in alive_agents), dtype=np.int64, count=count)
+        index = GridIndex(xs, ys, np.ones(count, dtype=bool), self.width, self.height)
+        slack = 2 * max(agent.mobility for agent in alive_agents)
+        carnivores = [agent for agent in alive_agents if agent.species_type == SpeciesType.CARNIVORE]
         
-        # 3. Proses reproduksi untuk semua spesies
+        for agent in alive_agents:
+            if agent.species_type != SpeciesType.CARNIVORE:
+                agent.update(self.environment, carnivores)
+                continue
+            if not agent.alive:
+                continue
+            radius = max(agent.hunt_range, PACK_RADIUS) + slack
+            nearby = [alive_agents[i] for i in index.query(agent.x, agent.y, radius).tolist()]
+            for population in self.cohorts.values():
+                nearby.extend(population.prey_near(agent.x, agent.y, agent.hunt_range))
+            agent.update(self.environment, nearby)
+    
+    def _phase_reproduction(self, phase: StepPhase):
+        """
+        3. Proses reproduksi untuk semua spesies
+        """
+        phase.count('agents_processed', len(self.agents))
         self._process_reproduction()
+    
+    def _phase_compaction(self, phase: StepPhase):
+        """
+        4. Hapus agen yang mati
+        """
+        phase.count('agents_processed', len(self.agents))
         
-        # 4. Hapus agen yang mati
-        self.agents = [agent for agent in self.agents if agent.alive]
-        
-        # 5. Catat statistik untuk semua spesies
+        deaths = self.step_events['deaths']
+        kills = self.step_events['kills']
+        survivors = []
+        for agent in self.agents:
+            if agent.alive:
+                survivors.append(agent)
+            else:
+                key = SPECIES_KEYS[agent.species_type.value]
+                deaths[key] += 1
+                if agent.death_cause == 'predation':
+                    kills[key] += 1
+        self.agents = survivors
+    
+    def _phase_statistics(self, phase: StepPhase):
+        """
+        5. Catat statistik untuk semua spesies
+        """
+        phase.count('agents_processed', len(self.agents))
+        phase.count('cells_touched', self.width * self.height)
         self._record_statistics()
     
+    def enable_metrics(self, capacity: int = 10000):
+        """
+        Aktifkan instrumentasi hot path dan sampling metrics per langkah
+        """
+        from .metrics import MetricsRegistry
+        
+        if self.metrics is None:
+            self.metrics = MetricsRegistry(capacity=capacity)
+            self.metrics.attach(self)
+        return self.metrics
+    
+    def disable_metrics(self):
+        """
+        Matikan sampling metrics (agen berhenti mengisi counter registry)
+        """
+        if self.metrics is not None:
+            self.metrics.detach(self)
+            self.metrics = None
+    
+    def enable_recorder(self, path: str, fmt: str = 'npy', chunk_size: int = 1000,
+                        window: int = 1000):
+        """
+        Aktifkan perekaman time-series streaming ke disk (resolusi penuh seluruh run)
+        """
+        from .timeseries import TimeSeriesRecorder
+        
+        if self.recorder is None:
+            recorder = TimeSeriesRecorder(path, fmt=fmt, chunk_size=chunk_size, window=window)
+            recorder.attach(self)
+        return self.recorder
+    
+    def disable_recorder(self):
+        """
+        Matikan recorder dan tulis sisa buffer ke disk
+        """
+        if self.recorder is not None:
+            self.recorder.detach(self)
+    
+    def enable_snapshots(self, path: str, every: int = 1, chunk_size: int = 100):
+        """
+        Aktifkan perekaman snapshot spasial (raster makanan + posisi agen) setiap
+        `every` langkah untuk dirender offline
+        """
+        from .snapshots import SnapshotRecorder
+        
+        if self.snapshots is None:
+            recorder = SnapshotRecorder(path, self.width, self.height,
+                                        every=every, chunk_size=chunk_size)
+            recorder.attach(self)
+        return self.snapshots
+    
+    def disable_snapshots(self):
+        """
+        Matikan perekaman snapshot dan tulis sisa buffer ke disk
+        """
+        if self.snapshots is not None:
+            self.snapshots.detach(self)
+    
+    def enable_cohorts(self, species: str, energy_bins: int = None, age_edges=None,
+                       max_energy: float = None):
+        """
+        Jalankan satu spesies herbivora ('herbivore'/'elk') sebagai kohort
+        Agen spesies itu yang sudah ada diubah menjadi kohort; spesies lain tetap agen
+        """
+        import random
+        from .cohorts import CohortPopulation, DEFAULT_ENERGY_BINS, DEFAULT_AGE_EDGES
+        
+        if species in self.cohorts:
+            return self.cohorts[species]
+        if self.synchronous is not None:
+            raise ValueError("Mode kohort tidak bisa digabung dengan mode sinkron")
+        population = CohortPopulation(species, self.width, self.height,
+                                      energy_bins=energy_bins or DEFAULT_ENERGY_BINS,
+                                      age_edges=age_edges or DEFAULT_AGE_EDGES,
+                                      max_energy=max_energy,
+                                      seed=random.getrandbits(64))
+        converted = [agent for agent in self.agents
+                     if agent.alive and SPECIES_KEYS[agent.species_type.value] == species]
+        population.add_agents(converted)
+        self.agents = [agent for agent in self.agents
+                       if SPECIES_KEYS[agent.species_type.value] != species]
+        population.attach(self)
+        print(f"🧮 Mode kohort {species}: {len(population)} individu dalam {population.groups} kohort")
+        return population
+    
+    def disable_cohorts(self, species: str, materialize: bool = True):
+        """
+        Kembalikan spesies ke mode agen; materialize=True membuat agen objek
+        untuk setiap individu kohort
+        """
+        population = self.cohorts.get(species)
+        if population is None:
+            return
+        population.detach(self)
+        if materialize:
+            self.agents.extend(population.to_agents(self))
+    
+    def enable_adaptive_engine(self, thresholds: Dict[str, Any] = None, min_speedup: float = 10.0,
+                               hysteresis: float = 0.5, species=('herbivore', 'elk')):
+        """
+        Pilih backend per fase otomatis dari populasi (lihat models/engine.py)
+        Tanpa thresholds, threshold dikalibrasi dengan micro-benchmark di grid ini
+        """
+        from .engine import AdaptiveEngine, calibrate
+        
+        if self.engine is not None:
+            self.engine.detach(self)
+        if thresholds is None:
+            print("⚙️  Kalibrasi backend...")
+            thresholds = calibrate(self.width, self.height, min_speedup=min_speedup)
+        engine = AdaptiveEngine(thresholds, hysteresis=hysteresis, species=species)
+        engine.attach(self)
+        summary = engine.summary()['thresholds']
+        print("⚙️  Threshold backend: " + ", ".join(f"{key} {value if value is not None else '-'}"
+                                                   for key, value in summary.items()))
+        return engine
+    
+    def disable_adaptive_engine(self):
+        """
+        Lepas engine adaptif (backend dan representasi terakhir tetap dipakai)
+        """
+        if self.engine is not None:
+            self.engine.detach(self)
+    
+    def enable_domain_decomposition(self, tiles=(2, 2), seed: int = None, rebalance_every: int = None):
+        """
+        Jalankan fase lingkungan/agen/reproduksi paralel per tile grid (models/domain.py)
+        Agen dipindah ke worker; sim.agents kosong sampai disable_domain_decomposition
+        rebalance_every=N menghitung ulang batas tile dari beban terukur setiap N langkah
+        """
+        from .domain import DomainDecomposition
+        
+        if self.domain is not None:
+            return self.domain
+        domain = DomainDecomposition(tiles=tiles, seed=seed, rebalance_every=rebalance_every)
+        domain.attach(self)
+        return domain
+    
+    def disable_domain_decomposition(self):
+        """
+        Kumpulkan agen dari worker tile dan kembali ke simulasi satu proses
+        """
+        if self.domain is not None:
+            self.domain.detach(self)
+    
+    def enable_threads(self, workers: int = None, force: bool = False):
+        """
+        Jalankan update lingkungan dan kernel kohort di thread pool (models/threads.py)
+        Pada build dengan GIL jalur serial tetap dipakai kecuali force=True
+        """
+        from .threads import ThreadedStep
+        
+        if self.threads is not None:
+            return self.threads
+        threads = ThreadedStep(workers=workers, force=force)
+        threads.attach(self)
+        return threads
+    
+    def disable_threads(self):
+        """
+        Kembali ke fase serial dan hentikan thread pool
+        """
+        if self.threads is not None:
+            self.threads.detach(self)
+    
+    def enable_synchronous(self, conflicts: str = 'random'):
+        """
+        Update agen sinkron: intensi dari state beku lalu fase resolve konflik
+        (models/synchronous.py); conflicts = 'random' atau 'share'
+        """
+        from .synchronous import SynchronousUpdate
+        
+        if self.synchronous is not None:
+            self.synchronous.detach(self)
+        update = SynchronousUpdate(conflicts=conflicts)
+        update.attach(self)
+        return update
+    
+    def disable_synchronous(self):
+        """
+        Kembali ke update agen in-place berurutan
+        """
+        if self.synchronous is not None:
+            self.synchronous.detach(self)
+    
+    def population_counts(self) -> Dict[str, int]:
+        """
+        Jumlah individu hidup per spesies (agen objek + kohort)
+        """
+        if self.domain is not None:
+            return dict(self.domain.counts)
+        counts = {key: 0 for key in SPECIES_KEYS.values()}
+        for agent in self.agents:
+            if agent.alive:
+                counts[SPECIES_KEYS[agent.species_type.value]] += 1
+        for species, population in self.cohorts.items():
+            counts[species] += len(population)
+        return counts
+    
+    def phase_timings(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Ringkasan waktu dan counter per fase pipeline
+        """
+        return self.pipeline.timings()
+    
     def _process_reproduction(self):
         """
         Proses reproduksi berdasarkan model logistik untuk semua spesies
@@ -200,40 +614,49 @@ class EcosystemSimulation:
         # Tambahkan agen baru
         self.agents.extend(new_agents)
         
-        if new_agents:
-            herb_births = len([a for a in new_agents if isinstance(a, HerbivoreAgent)])
-            elk_births = len([a for a in new_agents if isinstance(a, ElkAgent)])
-            carn_births = len([a for a in new_agents if isinstance(a, CarnivoreAgent)])
-            
+        herb_births = len([a for a in new_agents if isinstance(a, HerbivoreAgent)])
+        elk_births = len([a for a in new_agents if isinstance(a, ElkAgent)])
+        carn_births = len([a for a in new_agents if isinstance(a, CarnivoreAgent)])
+        self.step_events['births'] = {'herbivore': herb_births, 'elk': elk_births, 'carnivore': carn_births}
+        
+        if new_agents and self.verbose:
             print(f"  🍼 Kelahiran: {herb_births} kelinci, {elk_births} elk, {carn_births} serigala")
     
     def _record_statistics(self):
         """
         Catat statistik populasi dan lingkungan untuk semua spesies
         """
-        from agents.base_agent import HerbivoreAgent, CarnivoreAgent, ElkAgent
-        
         # Hitung populasi
-        herbivore_count = len([a for a in self.agents if a.alive and isinstance(a, HerbivoreAgent)])
-        elk_count = len([a for a in self.agents if a.alive and isinstance(a, ElkAgent)])
-        carnivore_count = len([a for a in self.agents if a.alive and isinstance(a, CarnivoreAgent)])
+        counts = self.population_counts()
+        herbivore_count, elk_count, carnivore_count = counts['herbivore'], counts['elk'], counts['carnivore']
         
         # Statistik lingkungan
         env_stats = self.environment.get_stats()
         
-        # Simpan ke history
-        self.population_history['herbivore'].append(herbivore_count)
-        self.population_history['elk'].append(elk_count)
-        self.population_history['carnivore'].append(carnivore_count)
-        self.population_history['total_food'].append(env_stats['total_food'])
-        self.population_history['avg_temperature'].append(env_stats['avg_temperature'])
+        self.latest_record = {
+            'herbivore': herbivore_count,
+            'elk': elk_count,
+            'carnivore': carnivore_count,
+            'total_food': env_stats['total_food'],
+            'avg_temperature': env_stats['avg_temperature'],
+            'avg_humidity': env_stats['avg_humidity']
+        }
+        
+        # Perbarui statistik online lalu simpan ke history (beserta seri turunan)
+        derived = self.online_stats.update(self.latest_record)
+        self.population_history.append({**self.latest_record, **derived})
     
-    def run(self, steps: int, realtime_vis: bool = False):
+    def run(self, steps: int, realtime_vis: bool = False, vis_process: bool = True,
+            max_fps: float = 10.0, density_threshold: int = None,
+            dashboard: bool = False, dashboard_hz: float = 2.0):
         """
         Jalankan simulasi untuk sejumlah langkah dengan support elk
+        Dengan vis_process=True, real-time visualization berjalan di proses terpisah
+        (frame dibatasi max_fps dan dibuang jika renderer tertinggal)
+        Di atas density_threshold agen, peta digambar sebagai raster kepadatan
+        Dengan dashboard=True, progress ditampilkan di dashboard terminal
+        (print per langkah dimatikan selama run)
         """
-        from agents.base_agent import HerbivoreAgent, CarnivoreAgent, ElkAgent
-        
         print(f"🚀 Memulai simulasi untuk {steps} langkah...")
         if realtime_vis:
             print("🎬 Real-time visualization enabled")
@@ -241,58 +664,90 @@ class EcosystemSimulation:
         
         # Setup real-time visualizer jika diminta
         visualizer = None
-        if realtime_vis:
+        if realtime_vis and vis_process:
+            try:
+                from visualization.realtime_process import create_visualizer_process
+                visualizer = create_visualizer_process(self.width, self.height, max_fps=max_fps,
+                                                       density_threshold=density_threshold)
+                visualizer.start(self.environment)
+            except (ImportError, OSError) as e:
+                print(f"⚠️  Visualizer proses terpisah gagal ({e}), memakai mode langsung")
+                visualizer = None
+                vis_process = False
+        if realtime_vis and not vis_process:
             try:
                 from visualization.realtime import create_realtime_visualizer
-                visualizer = create_realtime_visualizer(self.width, self.height)
+                visualizer = create_realtime_visualizer(self.width, self.height,
+                                                        history=self.population_history,
+                                                        density_threshold=density_threshold)
                 visualizer.show()
             except ImportError as e:
                 print(f"⚠️  Real-time visualization tidak tersedia: {e}")
                 realtime_vis = False
         
+        terminal = None
+        verbose = self.verbose
+        if dashboard:
+            from visualization.terminal import create_terminal_dashboard
+            terminal = create_terminal_dashboard(refresh_hz=dashboard_hz)
+            terminal.attach(self)
+            self.verbose = False
+        notify = terminal.log if terminal else print
+        
+        try:
+            self._run_steps(steps, realtime_vis, vis_process, visualizer, notify)
+        finally:
+            if terminal:
+                self.verbose = verbose
+                terminal.detach(self)
+        
+        # Tutup visualizer
+        if visualizer:
+            print("\n🎬 Tekan Enter untuk menutup real-time visualization...")
+            input()
+            visualizer.close()
+        
+        print(f"\n✅ Simulasi selesai pada langkah {self.time_step}")
+    
+    def _run_steps(self, steps: int, realtime_vis: bool, vis_process: bool, visualizer, notify):
+        """
+        Loop langkah run(): visualisasi, progress, dan cek kepunahan
+        """
         for step in range(steps):
             self.step()
             
             # Update real-time visualization
             if realtime_vis and visualizer:
-                env_stats = self.environment.get_stats()
-                visualizer.update_data(step, self.agents, self.environment, env_stats)
+                if vis_process:
+                    # Statistik lingkungan dihitung hanya jika frame benar-benar dikirim
+                    visualizer.update_data(step, self.agents, self.environment)
+                else:
+                    env_stats = self.environment.get_stats()
+                    visualizer.update_data(step, self.agents, self.environment, env_stats)
             
             # Tampilkan progress
-            if step % SIMULATION_CONFIG['show_progress_every'] == 0:
+            if self.verbose and step % SIMULATION_CONFIG['show_progress_every'] == 0:
                 self._show_progress(step)
             
             # Cek kondisi berhenti (kepunahan)
-            herbivore_count = len([a for a in self.agents if a.alive and isinstance(a, HerbivoreAgent)])
-            elk_count = len([a for a in self.agents if a.alive and isinstance(a, ElkAgent)])
-            carnivore_count = len([a for a in self.agents if a.alive and isinstance(a, CarnivoreAgent)])
+            counts = self.population_counts()
+            herbivore_count, elk_count, carnivore_count = counts['herbivore'], counts['elk'], counts['carnivore']
             
             # Kondisi berhenti: semua herbivora punah ATAU semua karnivora punah
             total_prey = herbivore_count + elk_count
             if total_prey == 0:
-                print(f"\n⚠️  Simulasi dihentikan pada langkah {step}: Semua herbivora punah!")
+                notify(f"\n⚠️  Simulasi dihentikan pada langkah {step}: Semua herbivora punah!")
                 break
             elif carnivore_count == 0:
-                print(f"\n⚠️  Simulasi dihentikan pada langkah {step}: Karnivora punah!")
+                notify(f"\n⚠️  Simulasi dihentikan pada langkah {step}: Karnivora punah!")
                 break
-        
-        # Tutup visualizer
-        if visualizer:
-            print("\n🎬 Tekan Enter untuk menutup real-time visualization...")
-            input()
-            visualizer.close()
-        
-        print(f"\n✅ Simulasi selesai pada langkah {self.time_step}")
     
     def _show_progress(self, step: int):
         """
         Tampilkan progress simulasi dengan semua spesies
         """
-        from agents.base_agent import HerbivoreAgent, CarnivoreAgent, ElkAgent
-        
-        herbivore_count = len([a for a in self.agents if a.alive and isinstance(a, HerbivoreAgent)])
-        elk_count = len([a for a in self.agents if a.alive and isinstance(a, ElkAgent)])
-        carnivore_count = len([a for a in self.agents if a.alive and isinstance(a, CarnivoreAgent)])
+        counts = self.population_counts()
+        herbivore_count, elk_count, carnivore_count = counts['herbivore'], counts['elk'], counts['carnivore']
         env_stats = self.environment.get_stats()
         
         print(f"Langkah {step:3d}: "
@@ -302,24 +757,43 @@ class EcosystemSimulation:
               f"🌡️  {env_stats['avg_temperature']:5.1f}°C | "
               f"🍃 {env_stats['total_food']:6.0f}")
     
-    def get_statistics(self) -> Dict[str, Any]:
+    def get_statistics(self, start: int = None, stop: int = None) -> Dict[str, Any]:
         """
         Hitung statistik analisis ekosistem untuk semua spesies
+        Tanpa rentang: dibaca dari statistik online (std 100 langkah terakhir,
+        rata-rata 50 langkah terakhir) tanpa menghitung ulang history.
+        Dengan start/stop: seluruh rentang langkah [start, stop) dari arsip history
+        dengan resolusi terbaik yang tersedia
         """
         if len(self.population_history['herbivore']) < 10:
             return {"error": "Data tidak cukup untuk analisis"}
         
         import numpy as np
+        from .online_stats import lag1_autocorrelation
+        
+        species = ('herbivore', 'elk', 'carnivore')
+        if start is None and stop is None:
+            online = self.online_stats
+            stability = {key: online.rolling(key, 100).std for key in species}
+            recent = {key: online.rolling(key, 50).mean for key in species}
+            autocorrelation = {key: online.rolling(key, 100).autocorrelation for key in species}
+        else:
+            series = {key: self.population_history.query(key, start, stop)['mean'] for key in species}
+            if len(series['herbivore']) == 0:
+                return {"error": "Tidak ada data pada rentang langkah tersebut"}
+            stability = {key: np.std(values) for key, values in series.items()}
+            recent = {key: np.mean(values) for key, values in series.items()}
+            autocorrelation = {key: lag1_autocorrelation(values) for key, values in series.items()}
         
         # Stabilitas populasi (standard deviation)
-        herb_stability = np.std(self.population_history['herbivore'][-100:])
-        elk_stability = np.std(self.population_history['elk'][-100:])
-        carn_stability = np.std(self.population_history['carnivore'][-100:])
+        herb_stability = stability['herbivore']
+        elk_stability = stability['elk']
+        carn_stability = stability['carnivore']
         
         # Keseimbangan predator-mangsa (total prey vs predator)
-        recent_herbs = np.mean(self.population_history['herbivore'][-50:])
-        recent_elk = np.mean(self.population_history['elk'][-50:])
-        recent_carns = np.mean(self.population_history['carnivore'][-50:])
+        recent_herbs = recent['herbivore']
+        recent_elk = recent['elk']
+        recent_carns = recent['carnivore']
         
         total_prey = recent_herbs + recent_elk
         predator_prey_ratio = recent_carns / max(1, total_prey)
@@ -338,6 +812,9 @@ class EcosystemSimulation:
             'carnivore_stability': carn_stability,
             'predator_prey_ratio': predator_prey_ratio,
             'wolf_elk_ratio': wolf_elk_ratio,  # Yellowstone comparison
+            'herbivore_autocorrelation': autocorrelation['herbivore'],
+            'carnivore_autocorrelation': autocorrelation['carnivore'],
+            'online_statistics': self.online_stats.summary(),
             'population_history': self.population_history.copy()
         }
     
@@ -0,0 +1,247 @@
+"""
+Engine adaptif: pilih backend per fase dari ukuran populasi dan grid saat ini
+Backend yang tersedia:
+    object     - loop objek agen, all_agents = seluruh daftar agen (implementasi asli)
+    indexed    - loop objek yang sama, tetapi elk/serigala hanya menerima tetangga
+                 dari GridIndex (hasil identik, draw RNG sama)
+    vectorized - spesies herbivora dijalankan sebagai kohort (models/cohorts.py,
+                 kernel array); agen objek dikonversi ke kohort dan sebaliknya
+
+Threshold dikalibrasi saat start dengan micro-benchmark di simulasi sementara
+berukuran grid yang sama:
+    agents     - populasi total saat indexed mulai lebih cepat dari object
+    herbivore/ - populasi spesies saat kohort min_speedup kali lebih cepat dari
+    elk          update objek (kohort merangkum energi/usia dalam bin, jadi hanya
+                 dipakai jika menghemat banyak waktu)
+Pergantian ke bawah memakai histeresis (threshold × hysteresis) agar backend
+tidak bolak-balik saat populasi berfluktuasi di sekitar threshold
+
+Pemakaian:
+    sim.enable_adaptive_engine()            # kalibrasi lalu pasang fase 'engine'
+    sim.run(steps=5000)
+    print(sim.engine.switches)
+"""
+
+import io
+import time
+import math
+import random
+import contextlib
+from typing import Dict, Any, List, Optional, Sequence
+
+AGENT_BACKENDS = ('object', 'indexed')
+COHORT_SPECIES = ('herbivore', 'elk')
+
+# Ukuran populasi untuk micro-benchmark kalibrasi
+AGENT_SIZES = (25, 50, 100, 200, 400)
+COHORT_SIZES = (25, 100, 400, 1600)
+
+# Campuran spesies populasi kalibrasi fase agents (setup_species default)
+CALIBRATION_MIX = {'herbivore': 0.55, 'elk': 0.25, 'carnivore': 0.20}
+
+
+def _engine_phase(simulation, phase):
+    """Fase pipeline: pilih backend untuk langkah ini sebelum cohorts/agents"""
+    changed = simulation.engine.select(simulation)
+    phase.count('queries_issued', len(changed))
+
+
+def _crossover(sizes: Sequence[int], ratios: Sequence[float], target: float) -> Optional[int]:
+    """
+    Ukuran pertama saat ratio >= target (interpolasi log-linear antar ukuran)
+    None jika target tidak tercapai sampai ukuran terbesar
+    """
+    previous = None
+    for size, ratio in zip(sizes, ratios):
+        if ratio >= target:
+            if previous is None or previous[1] <= 0 or ratio <= previous[1]:
+                return int(size)
+            low_size, low_ratio = previous
+            share = (math.log(target) - math.log(low_ratio)) / (math.log(ratio) - math.log(low_ratio))
+            return int(round(math.exp(math.log(low_size) + share * (math.log(size) - math.log(low_size)))))
+        previous = (size, ratio)
+    return None
+
+
+def _best_time(func, repeats: int) -> float:
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _scratch_simulation(width: int, height: int, counts: Dict[str, int], seed: int):
+    """Simulasi sementara (output init dibuang) berisi populasi counts"""
+    from .ecosystem import EcosystemSimulation
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = EcosystemSimulation(width, height)
+        simulation.verbose = False
+        random.seed(seed)
+        simulation.environment.reseed(seed)
+        for species, count in counts.items():
+            simulation.add_agents(species, count)
+    return simulation
+
+
+def calibrate(width: int, height: int, min_speedup: float = 10.0, repeats: int = 3,
+              seed: int = 0) -> Dict[str, Any]:
+    """
+    Micro-benchmark backend di grid width × height
+
+    Returns:
+        dict threshold {'agents': N, 'herbivore': N, 'elk': N} (None = backend
+        alternatif tidak pernah lebih cepat di ukuran yang diuji) dan waktu
+        mentah per ukuran di 'timings'
+    """
+    from .cohorts import CohortPopulation
+
+    state = random.getstate()
+    timings: Dict[str, List[Dict[str, float]]] = {'agents': []}
+    thresholds: Dict[str, Any] = {}
+    try:
+        # Fase agents: object vs indexed pada dua salinan state yang sama
+        ratios = []
+        for size in AGENT_SIZES:
+            counts = {key: max(1, int(size * share)) for key, share in CALIBRATION_MIX.items()}
+            elapsed = {}
+            for backend in AGENT_BACKENDS:
+                def run_phase():
+                    simulation = _scratch_simulation(width, height, counts, seed)
+                    simulation.agent_backend = backend
+                    start = time.perf_counter()
+                    simulation.pipeline.get('agents').run(simulation)
+                    return time.perf_counter() - start
+                elapsed[backend] = min(run_phase() for _ in range(repeats))
+            ratios.append(elapsed['object'] / max(elapsed['indexed'], 1e-9))
+            timings['agents'].append({'size': size, **elapsed})
+            if ratios[-1] >= 1.0:
+                break
+        thresholds['agents'] = _crossover(AGENT_SIZES, ratios, 1.0)
+
+        # Representasi herbivora: update objek vs kohort
+        for species in COHORT_SPECIES:
+            timings[species] = []
+            ratios = []
+            for size in COHORT_SIZES:
+                simulation = _scratch_simulation(width, height, {species: size}, seed)
+                environment = simulation.environment
+                agents = list(simulation.agents)
+                object_time = _best_time(lambda: [agent.update(environment, agents) for agent in agents], 1)
+
+                population = CohortPopulation(species, width, height, seed=seed)
+                population.add(size)
+
+                def step_cohorts():
+                    population.update(environment)
+                    population.reproduce(population.capacity(simulation.carrying_capacity))
+                cohort_time = _best_time(step_cohorts, repeats)
+                ratios.append(object_time / max(cohort_time, 1e-9))
+                timings[species].append({'size': size, 'object': object_time, 'vectorized': cohort_time})
+                if ratios[-1] >= min_speedup:
+                    break
+            thresholds[species] = _crossover(COHORT_SIZES, ratios, min_speedup)
+    finally:
+        random.setstate(state)
+
+    thresholds['timings'] = timings
+    return thresholds
+
+
+class AdaptiveEngine:
+    """
+    Pemilih backend per fase berdasarkan populasi saat ini
+
+    Contoh:
+        engine = AdaptiveEngine.calibrated(sim.width, sim.height)
+        engine.attach(sim)
+    """
+
+    def __init__(self, thresholds: Dict[str, Any], hysteresis: float = 0.5,
+                 species: Sequence[str] = COHORT_SPECIES):
+        if not 0.0 < hysteresis <= 1.0:
+            raise ValueError("hysteresis harus di antara 0 dan 1")
+        unknown = set(species) - set(COHORT_SPECIES)
+        if unknown:
+            raise ValueError(f"Spesies tidak bisa divektorisasi: {', '.join(sorted(unknown))}")
+        self.thresholds = thresholds
+        self.hysteresis = hysteresis
+        self.species = tuple(species)
+        self.current: Dict[str, str] = {}
+        self.switches: List[Dict[str, Any]] = []
+
+    @classmethod
+    def calibrated(cls, width: int, height: int, min_speedup: float = 10.0, **kwargs) -> 'AdaptiveEngine':
+        """Buat engine dengan threshold hasil calibrate()"""
+        return cls(calibrate(width, height, min_speedup=min_speedup), **kwargs)
+
+    def attach(self, simulation):
+        """Pasang fase 'engine' sebelum fase cohorts/agents"""
+        if simulation.synchronous is not None:
+            raise ValueError("Engine adaptif tidak bisa digabung dengan mode sinkron")
+        simulation.engine = self
+        self.current = {'agents': simulation.agent_backend}
+        for species in self.species:
+            self.current[species] = 'vectorized' if species in simulation.cohorts else 'object'
+        if 'engine' not in simulation.pipeline:
+            before = next((name for name in ('cohorts', 'agents') if name in simulation.pipeline), None)
+            simulation.pipeline.register('engine', _engine_phase, before=before)
+
+    def detach(self, simulation):
+        """Lepas fase engine; backend terakhir tetap dipakai"""
+        if 'engine' in simulation.pipeline:
+            simulation.pipeline.remove('engine')
+        if simulation.engine is self:
+            simulation.engine = None
+
+    def _choose(self, name: str, population: int, fast: str) -> str:
+        """Backend untuk satu target dengan histeresis di sekitar threshold"""
+        threshold = self.thresholds.get(name)
+        if threshold is None:
+            return self.current[name]
+        if population >= threshold:
+            return fast
+        if self.current[name] == fast and population >= threshold * self.hysteresis:
+            return fast
+        return 'object'
+
+    def select(self, simulation) -> List[str]:
+        """
+        Terapkan backend untuk populasi saat ini; kembalikan target yang berganti
+        Spesies herbivora dikonversi (enable_cohorts/disable_cohorts) sebelum
+        backend fase agents dipilih, karena konversi mengubah jumlah agen objek
+        """
+        counts = simulation.population_counts()
+        changed = []
+        for species in self.species:
+            backend = self._choose(species, counts[species], 'vectorized')
+            if backend != self.current[species]:
+                if backend == 'vectorized':
+                    simulation.enable_cohorts(species)
+                else:
+                    simulation.disable_cohorts(species, materialize=True)
+                self._record(simulation, species, backend, counts[species])
+                changed.append(species)
+
+        objects = sum(1 for agent in simulation.agents if agent.alive)
+        backend = self._choose('agents', objects, 'indexed')
+        if backend != self.current['agents']:
+            simulation.agent_backend = backend
+            self._record(simulation, 'agents', backend, objects)
+            changed.append('agents')
+        return changed
+
+    def _record(self, simulation, name: str, backend: str, population: int):
+        self.switches.append({'step': simulation.time_step, 'target': name,
+                              'from': self.current[name], 'to': backend, 'population': population})
+        self.current[name] = backend
+        if simulation.verbose:
+            print(f"  ⚙️  Backend {name}: {backend} (populasi {population})")
+
+    def summary(self) -> Dict[str, Any]:
+        """Backend aktif, threshold, dan jumlah pergantian"""
+        return {'current': dict(self.current),
+                'thresholds': {key: value for key, value in self.thresholds.items() if key != 'timings'},
+                'switches': len(self.switches)}
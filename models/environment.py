@@ -1,12 +1,22 @@
 """
 Kelas untuk mengelola lingkungan simulasi
 Implementasi rumus perubahan lingkungan: T(t) = T0 + A*sin(wt)
+
+Kondisi lingkungan disimpan sebagai array NumPy (width x height): temperature,
+humidity, food, water. grid[x][y] berisi GridCell, view ringan ke array tersebut,
+sehingga kode agen tetap memakai cell.food / cell.temperature, sedangkan update
+lingkungan, statistik, dan visualisasi bekerja langsung pada array (zero-copy)
+Loop kandidat gerak agen membaca lewat cell_conditions(x, y) (satu panggilan per
+sel) karena property GridCell lebih mahal dari atribut biasa
 """
 
 import random
 import math
 from dataclasses import dataclass
 from typing import List
+
+import numpy as np
+
 from data.config_fixed import ENVIRONMENT_CONFIG
 
 @dataclass
@@ -28,11 +38,70 @@ class EnvironmentCell:
         self.food = max(0, min(ENVIRONMENT_CONFIG['max_food_per_cell'], self.food))
         self.water = max(0, min(100, self.water))
 
+class GridCell:
+    """
+    View satu sel grid ke array Environment
+    Atribut dibaca/ditulis langsung ke array (float Python, tanpa salinan)
+    """
+    
+    __slots__ = ('x', 'y', '_index', '_temperature', '_humidity', '_food', '_water')
+    
+    def __init__(self, environment: 'Environment', x: int, y: int):
+        self.x = x
+        self.y = y
+        self._index = x * environment.height + y
+        self._temperature = environment._views['temperature']
+        self._humidity = environment._views['humidity']
+        self._food = environment._views['food']
+        self._water = environment._views['water']
+    
+    @property
+    def temperature(self) -> float:
+        return self._temperature[self._index]
+    
+    @temperature.setter
+    def temperature(self, value: float):
+        self._temperature[self._index] = value
+    
+    @property
+    def humidity(self) -> float:
+        return self._humidity[self._index]
+    
+    @humidity.setter
+    def humidity(self, value: float):
+        self._humidity[self._index] = value
+    
+    @property
+    def food(self) -> float:
+        return self._food[self._index]
+    
+    @food.setter
+    def food(self, value: float):
+        self._food[self._index] = value
+    
+    @property
+    def water(self) -> float:
+        return self._water[self._index]
+    
+    @water.setter
+    def water(self, value: float):
+        self._water[self._index] = value
+    
+    def __repr__(self):
+        return (f"GridCell(x={self.x}, y={self.y}, temperature={self.temperature}, "
+                f"humidity={self.humidity}, food={self.food}, water={self.water})")
+
 class Environment:
     """
     Kelas utama untuk mengelola lingkungan simulasi
     """
     
+    # Nama array kondisi sel
+    FIELDS = ('temperature', 'humidity', 'food', 'water')
+    
+    # AgentProbe simulasi selama fase agen (None = agen tidak menghitung apa pun)
+    probe = None
+    
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
@@ -42,95 +111,126 @@ class Environment:
         self.base_temperature = ENVIRONMENT_CONFIG['base_temperature']
         self.base_humidity = ENVIRONMENT_CONFIG['base_humidity']
         
+        # Generator acak lingkungan, diturunkan dari modul random agar random.seed tetap berlaku
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        
         # Inisialisasi grid lingkungan
-        self.grid = self._create_initial_grid()
+        self._create_initial_grid()
         
         print(f"🌍 Environment dibuat: {width}x{height} grid")
     
-    def _create_initial_grid(self) -> List[List[EnvironmentCell]]:
+    def reseed(self, seed: int):
+        """Set ulang generator acak lingkungan"""
+        self.rng = np.random.default_rng(seed)
+    
+    def _create_initial_grid(self):
         """
         Buat grid lingkungan awal dengan variasi acak
         """
-        grid = []
+        shape = (self.width, self.height)
+        
+        # Variasi suhu dan kelembaban di sekitar nilai dasar
+        temperature = self.base_temperature + self.rng.uniform(-3, 3, shape)
+        humidity = self.base_humidity + self.rng.uniform(-10, 10, shape)
         
-        for x in range(self.width):
-            row = []
-            for y in range(self.height):
-                # Variasi suhu dan kelembaban di sekitar nilai dasar
-                temp = self.base_temperature + random.uniform(-3, 3)
-                humidity = self.base_humidity + random.uniform(-10, 10)
-                
-                # Makanan awal acak
-                food = random.uniform(30, 70)
-                
-                # Air tersedia penuh
-                water = ENVIRONMENT_CONFIG['water_per_cell']
-                
-                cell = EnvironmentCell(x, y, temp, humidity, food, water)
-                row.append(cell)
-            
-            grid.append(row)
+        # Makanan awal acak
+        food = self.rng.uniform(30, 70, shape)
         
-        return grid
+        # Air tersedia penuh
+        water = np.full(shape, float(ENVIRONMENT_CONFIG['water_per_cell']))
+        
+        # Validasi nilai dalam batas wajar (sama dengan EnvironmentCell)
+        self._bind_arrays({
+            'temperature': np.clip(temperature, -20, 50),
+            'humidity': np.clip(humidity, 0, 100),
+            'food': np.clip(food, 0, ENVIRONMENT_CONFIG['max_food_per_cell']),
+            'water': np.clip(water, 0, 100)
+        })
+    
+    def _bind_arrays(self, arrays: dict):
+        """
+        Pasang array kondisi (C-contiguous float64) dan bangun view sel grid
+        """
+        for name in self.FIELDS:
+            array = arrays[name]
+            if array.dtype != np.float64 or not array.flags['C_CONTIGUOUS']:
+                array = np.ascontiguousarray(array, dtype=np.float64)
+            setattr(self, name, array)
+        self._views = {name: memoryview(getattr(self, name)).cast('B').cast('d')
+                       for name in self.FIELDS}
+        self._food_view = self._views['food']
+        self._temperature_view = self._views['temperature']
+        self._humidity_view = self._views['humidity']
+        self.grid: List[List[GridCell]] = [[GridCell(self, x, y) for y in range(self.height)]
+                                           for x in range(self.width)]
+    
+    def use_food_buffer(self, buffer):
+        """
+        Pindahkan array makanan ke buffer eksternal (mis. shared memory) agar bisa
+        dibaca proses lain tanpa salinan. Isi makanan saat ini disalin sekali
+        """
+        food = np.ndarray((self.width, self.height), dtype=np.float64, buffer=buffer)
+        food[:] = self.food
+        arrays = {name: getattr(self, name) for name in self.FIELDS}
+        arrays['food'] = food
+        self._bind_arrays(arrays)
+        return food
+    
+    def release_food_buffer(self):
+        """Salin makanan kembali ke array milik sendiri (sebelum buffer eksternal ditutup)"""
+        arrays = {name: getattr(self, name) for name in self.FIELDS}
+        arrays['food'] = np.array(self.food)
+        self._bind_arrays(arrays)
+    
+    def __getstate__(self):
+        # memoryview dan GridCell tidak bisa di-pickle; dibangun ulang saat load
+        state = self.__dict__.copy()
+        for key in ('_views', '_food_view', '_temperature_view', '_humidity_view', 'grid'):
+            state.pop(key, None)
+        for name in self.FIELDS:
+            state[name] = np.array(state[name])
+        return state
+    
+    def __setstate__(self, state):
+        arrays = {name: state.pop(name) for name in self.FIELDS}
+        self.__dict__.update(state)
+        self._bind_arrays(arrays)
+    
+    def use_shared_buffer(self, buffer):
+        """
+        Pindahkan semua array kondisi ke satu buffer eksternal berurutan
+        (FIELDS × width × height float64, mis. shared memory untuk worker tile)
+        Isi saat ini disalin sekali
+        """
+        size = self.width * self.height
+        arrays = {}
+        for i, name in enumerate(self.FIELDS):
+            array = np.ndarray((self.width, self.height), dtype=np.float64, buffer=buffer, offset=i * size * 8)
+            array[:] = getattr(self, name)
+            arrays[name] = array
+        self._bind_arrays(arrays)
+        return arrays
+    
+    def release_shared_buffer(self):
+        """Salin semua array kembali ke memori milik sendiri (sebelum buffer ditutup)"""
+        self._bind_arrays({name: np.array(getattr(self, name)) for name in self.FIELDS})
     
     def update(self):
         """
-        Update kondisi lingkungan setiap time step
+        Update kondisi lingkungan setiap time step (vektorial untuk seluruh grid)
         Implementasi rumus musiman: T(t) = T0 + A * sin(ωt)
         """
         self.time_step += 1
-        
-        # Parameter musiman dari config
-        amplitude = ENVIRONMENT_CONFIG['seasonal_amplitude']
-        frequency = ENVIRONMENT_CONFIG['seasonal_frequency']
-        
-        for x in range(self.width):
-            for y in range(self.height):
-                cell = self.grid[x][y]
-                
-                # Update suhu musiman: T(t) = T0 + A * sin(ωt)
-                seasonal_temp = (self.base_temperature + 
-                               amplitude * math.sin(frequency * self.time_step))
-                
-                # Tambah variasi acak kecil
-                cell.temperature = seasonal_temp + random.uniform(-1.5, 1.5)
-                
-                # Update kelembaban dengan pola berbeda
-                seasonal_humidity = (self.base_humidity + 
-                                   amplitude * 0.8 * math.cos(frequency * self.time_step))
-                cell.humidity = seasonal_humidity + random.uniform(-5, 5)
-                
-                # Pastikan dalam batas
-                cell.humidity = max(0, min(100, cell.humidity))
-                
-                # Regenerasi makanan
-                self._regenerate_food(cell)
-    
-    def _regenerate_food(self, cell: EnvironmentCell):
+        update_region(self.time_step, self.rng, self.temperature, self.humidity, self.food,
+                      self.base_temperature, self.base_humidity)
+    
+    def _regenerate_food(self):
         """
         Regenerasi makanan berdasarkan kondisi lingkungan
         """
-        base_regen = ENVIRONMENT_CONFIG['food_regeneration_rate']
-        
-        # Faktor suhu optimal (25°C)
-        optimal_temp = 25.0
-        temp_factor = max(0.3, 1.0 - abs(cell.temperature - optimal_temp) / 15.0)
-        
-        # Faktor kelembaban optimal (60%)
-        optimal_humidity = 60.0
-        humidity_factor = max(0.3, 1.0 - abs(cell.humidity - optimal_humidity) / 30.0)
-        
-        # Regenerasi dengan faktor lingkungan
-        regeneration = base_regen * temp_factor * humidity_factor
-        
-        # Tambah variasi acak
-        regeneration += random.uniform(-0.5, 1.0)
-        
-        # Update makanan (tidak melebihi maksimum)
-        cell.food = min(ENVIRONMENT_CONFIG['max_food_per_cell'], 
-                       cell.food + max(0, regeneration))
+        regenerate_food(self.rng, self.temperature, self.humidity, self.food)
     
-    def get_cell(self, x: int, y: int) -> EnvironmentCell:
+    def get_cell(self, x: int, y: int):
         """
         Ambil sel pada koordinat tertentu
         """
@@ -141,21 +241,26 @@ class Environment:
             return EnvironmentCell(x, y, self.base_temperature, 
                                  self.base_humidity, 0, 0)
     
+    def cell_conditions(self, x: int, y: int):
+        """
+        (food, temperature, humidity) sel (x, y) langsung dari array, tanpa GridCell
+        Dipakai loop kandidat find_optimal_position: satu panggilan per sel, bukan
+        satu property per atribut. Di luar grid = nilai sel default get_cell
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            index = x * self.height + y
+            return self._food_view[index], self._temperature_view[index], self._humidity_view[index]
+        cell = self.get_cell(x, y)
+        return cell.food, cell.temperature, cell.humidity
+    
     def get_stats(self) -> dict:
         """
         Hitung statistik lingkungan keseluruhan
         """
-        total_food = 0
-        total_temp = 0
-        total_humidity = 0
         cell_count = self.width * self.height
-        
-        for x in range(self.width):
-            for y in range(self.height):
-                cell = self.grid[x][y]
-                total_food += cell.food
-                total_temp += cell.temperature
-                total_humidity += cell.humidity
+        total_food = float(self.food.sum())
+        total_temp = float(self.temperature.sum())
+        total_humidity = float(self.humidity.sum())
         
         return {
             'time_step': self.time_step,
@@ -163,4 +268,60 @@ class Environment:
             'avg_temperature': total_temp / cell_count,
             'avg_humidity': total_humidity / cell_count,
             'food_density': total_food / cell_count
-        }
\ No newline at end of file
+        }
+
+
+def update_region(time_step: int, rng, temperature: np.ndarray, humidity: np.ndarray,
+                  food: np.ndarray, base_temperature: float, base_humidity: float):
+    """
+    Update musiman + regenerasi makanan untuk satu region grid (array diubah in-place)
+    Dipakai Environment.update (seluruh grid) dan worker tile (models/domain.py)
+    """
+    shape = temperature.shape
+    
+    # Parameter musiman dari config
+    amplitude = ENVIRONMENT_CONFIG['seasonal_amplitude']
+    frequency = ENVIRONMENT_CONFIG['seasonal_frequency']
+    
+    # Update suhu musiman: T(t) = T0 + A * sin(ωt)
+    seasonal_temp = (base_temperature + 
+                     amplitude * math.sin(frequency * time_step))
+    
+    # Tambah variasi acak kecil
+    temperature[:] = seasonal_temp + rng.uniform(-1.5, 1.5, shape)
+    
+    # Update kelembaban dengan pola berbeda
+    seasonal_humidity = (base_humidity + 
+                         amplitude * 0.8 * math.cos(frequency * time_step))
+    values = seasonal_humidity + rng.uniform(-5, 5, shape)
+    
+    # Pastikan dalam batas
+    np.clip(values, 0, 100, out=humidity)
+    
+    # Regenerasi makanan
+    regenerate_food(rng, temperature, humidity, food)
+
+
+def regenerate_food(rng, temperature: np.ndarray, humidity: np.ndarray, food: np.ndarray):
+    """
+    Regenerasi makanan berdasarkan kondisi lingkungan (food diubah in-place)
+    """
+    base_regen = ENVIRONMENT_CONFIG['food_regeneration_rate']
+    
+    # Faktor suhu optimal (25°C)
+    optimal_temp = 25.0
+    temp_factor = np.maximum(0.3, 1.0 - np.abs(temperature - optimal_temp) / 15.0)
+    
+    # Faktor kelembaban optimal (60%)
+    optimal_humidity = 60.0
+    humidity_factor = np.maximum(0.3, 1.0 - np.abs(humidity - optimal_humidity) / 30.0)
+    
+    # Regenerasi dengan faktor lingkungan
+    regeneration = base_regen * temp_factor * humidity_factor
+    
+    # Tambah variasi acak
+    regeneration += rng.uniform(-0.5, 1.0, regeneration.shape)
+    
+    # Update makanan (tidak melebihi maksimum)
+    np.minimum(ENVIRONMENT_CONFIG['max_food_per_cell'],
+               food + np.maximum(0, regeneration), out=food)
\ No newline at end of file
@@ -0,0 +1,221 @@
+"""
+Arsip history multi-resolusi (round-robin) untuk run panjang
+Resolusi penuh disimpan untuk K langkah terakhir; langkah yang lebih lama
+diringkas menjadi agregat min/mean/max pada tier 10x, 100x, dan 1000x lebih kasar.
+Semua array dialokasikan di awal sehingga memori konstan berapa pun panjang run
+
+Tetap kompatibel dengan pola lama population_history (dict of list):
+    history['herbivore'][-1], history['elk'][-100:], len(history['carnivore'])
+mengakses jendela resolusi penuh, sedangkan query() mengambil rentang waktu apa pun
+dengan resolusi terbaik yang tersedia
+"""
+
+import copy
+from typing import Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_KEYS = ('herbivore', 'elk', 'carnivore', 'total_food', 'avg_temperature')
+DEFAULT_FACTORS = (10, 100, 1000)
+
+
+class _Tier:
+    """
+    Ring buffer bucket agregat untuk satu faktor resolusi
+    """
+
+    def __init__(self, factor: int, capacity: int, n_keys: int):
+        self.factor = factor
+        self.capacity = capacity
+        self.mean = np.zeros((capacity, n_keys))
+        self.min = np.zeros((capacity, n_keys))
+        self.max = np.zeros((capacity, n_keys))
+        self.start = np.zeros(capacity, dtype=np.int64)
+        self.filled = 0
+        self.head = 0                  # Slot yang akan ditulis berikutnya
+
+        # Akumulator bucket yang sedang berjalan
+        self._sum = np.zeros(n_keys)
+        self._min = np.full(n_keys, np.inf)
+        self._max = np.full(n_keys, -np.inf)
+        self._count = 0
+
+    def add(self, step: int, row: np.ndarray):
+        self._sum += row
+        np.minimum(self._min, row, out=self._min)
+        np.maximum(self._max, row, out=self._max)
+        self._count += 1
+        if self._count == self.factor:
+            slot = self.head
+            self.mean[slot] = self._sum / self.factor
+            self.min[slot] = self._min
+            self.max[slot] = self._max
+            self.start[slot] = step - self.factor + 1
+            self.head = (slot + 1) % self.capacity
+            self.filled = min(self.filled + 1, self.capacity)
+            self._sum[:] = 0.0
+            self._min[:] = np.inf
+            self._max[:] = -np.inf
+            self._count = 0
+
+    def order(self) -> np.ndarray:
+        """Indeks slot terisi dalam urutan kronologis"""
+        first = (self.head - self.filled) % self.capacity
+        return (first + np.arange(self.filled)) % self.capacity
+
+
+class HistoryArchive:
+    """
+    History populasi dan lingkungan dengan memori konstan
+
+    Contoh:
+        history = HistoryArchive(window=2000)
+        history.append({'herbivore': 80, 'elk': 30, ...})
+        recent = history['herbivore'][-100:]              # resolusi penuh
+        data = history.query('herbivore', 0, 50_000)      # resolusi terbaik per bagian
+    """
+
+    def __init__(self, keys: Iterable[str] = DEFAULT_KEYS, window: int = 2000,
+                 factors: Tuple[int, ...] = DEFAULT_FACTORS, tier_capacity: Optional[int] = None):
+        if window < 1:
+            raise ValueError("window harus >= 1")
+        if any(fine <= 0 or coarse % fine for fine, coarse in zip((1,) + tuple(factors), factors)):
+            raise ValueError("factors harus naik dan setiap faktor kelipatan faktor sebelumnya")
+        self.series_keys = tuple(keys)
+        self._index = {key: i for i, key in enumerate(self.series_keys)}
+        self.window = window
+        self.factors = tuple(factors)
+
+        # Resolusi penuh: ring buffer K langkah terakhir
+        self._full = np.zeros((window, len(self.series_keys)))
+        self._head = 0
+        self._filled = 0
+
+        capacity = tier_capacity or window
+        self.tiers = [_Tier(factor, capacity, len(self.series_keys)) for factor in self.factors]
+
+        # Jumlah langkah yang pernah dicatat (langkah berikutnya = self.steps)
+        self.steps = 0
+
+    # ------------------------------------------------------------------
+    # Penulisan
+    # ------------------------------------------------------------------
+
+    def append(self, values: Dict[str, float]):
+        """Catat satu langkah (kunci yang tidak dikenal diabaikan)"""
+        row = np.fromiter((values[key] for key in self.series_keys), dtype=np.float64,
+                          count=len(self.series_keys))
+        self._full[self._head] = row
+        self._head = (self._head + 1) % self.window
+        self._filled = min(self._filled + 1, self.window)
+        for tier in self.tiers:
+            tier.add(self.steps, row)
+        self.steps += 1
+
+    # ------------------------------------------------------------------
+    # Akses gaya dict (jendela resolusi penuh)
+    # ------------------------------------------------------------------
+
+    def _full_order(self) -> np.ndarray:
+        first = (self._head - self._filled) % self.window
+        return (first + np.arange(self._filled)) % self.window
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        """Jendela resolusi penuh satu seri (array baru, urut waktu)"""
+        return self._full[self._full_order(), self._index[key]]
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def __iter__(self):
+        return iter(self.series_keys)
+
+    def __len__(self) -> int:
+        return len(self.series_keys)
+
+    def keys(self):
+        return list(self.series_keys)
+
+    def values(self):
+        return [self[key] for key in self.series_keys]
+
+    def items(self):
+        return [(key, self[key]) for key in self.series_keys]
+
+    def copy(self) -> 'HistoryArchive':
+        """Salinan independen (ukuran tetap)"""
+        return copy.deepcopy(self)
+
+    @property
+    def first_full_step(self) -> int:
+        """Langkah tertua yang masih tersedia dalam resolusi penuh"""
+        return self.steps - self._filled
+
+    # ------------------------------------------------------------------
+    # Query rentang waktu
+    # ------------------------------------------------------------------
+
+    def _levels(self, column: int):
+        """
+        Semua level dari yang paling halus: (faktor, start, mean, min, max) kronologis
+        """
+        order = self._full_order()
+        values = self._full[order, column]
+        steps = np.arange(self.first_full_step, self.steps)
+        yield 1, steps, values, values, values
+        for tier in self.tiers:
+            order = tier.order()
+            yield (tier.factor, tier.start[order], tier.mean[order, column],
+                   tier.min[order, column], tier.max[order, column])
+
+    def query(self, key: str, start: Optional[int] = None,
+              stop: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Ambil seri untuk rentang langkah [start, stop) dengan resolusi terbaik
+        yang tersedia di setiap bagian rentang
+
+        Returns:
+            dict dengan array 'step' (awal bucket), 'mean', 'min', 'max',
+            'resolution' (lebar bucket per titik dalam langkah)
+        """
+        column = self._index[key]
+        start = 0 if start is None else max(0, start)
+        stop = self.steps if stop is None else min(stop, self.steps)
+
+        pieces = []
+        upper = stop
+        for factor, steps, mean, low, high in self._levels(column):
+            if upper <= start:
+                break
+            if len(steps) == 0:
+                continue
+            # Bucket yang dimulai di dalam rentang dan sebelum data yang lebih halus
+            mask = (steps + factor > start) & (steps < upper)
+            if not mask.any():
+                continue
+            kept = steps[mask]
+            end = int(kept[-1]) + factor
+            if end > upper:
+                # Bucket terakhir melewati awal level yang lebih halus: buang titik halus
+                # yang sudah tercakup agar tidak ada langkah yang terhitung dua kali
+                # (faktor bertingkat sehingga batas bucket selalu sejajar)
+                pieces = [tuple(part[piece[0] >= end] for part in piece) for piece in pieces]
+            pieces.append((kept, mean[mask], low[mask], high[mask],
+                           np.full(len(kept), factor, dtype=np.int64)))
+            upper = int(kept[0])
+
+        if not pieces:
+            empty = np.empty(0)
+            return {'step': empty.astype(np.int64), 'mean': empty, 'min': empty,
+                    'max': empty, 'resolution': empty.astype(np.int64)}
+
+        pieces.reverse()
+        step, mean, low, high, resolution = (np.concatenate(parts) for parts in zip(*pieces))
+        return {'step': step, 'mean': mean, 'min': low, 'max': high, 'resolution': resolution}
+
+    def memory_bytes(self) -> int:
+        """Total memori array yang dialokasikan (konstan)"""
+        total = self._full.nbytes
+        for tier in self.tiers:
+            total += tier.mean.nbytes + tier.min.nbytes + tier.max.nbytes + tier.start.nbytes
+        return total
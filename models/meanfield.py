@@ -0,0 +1,479 @@
+"""
+Mode mean-field (non-spasial) untuk screening cepat sebelum run agen
+Sistem ODE tiga spesies (kelinci, elk, serigala) + makanan rata-rata per sel
+diturunkan dari config spesies yang sama dengan agen:
+
+    dN/dt = r·N·(1 - N/K)·φ_N - P_mati·N - predasi        (kelinci, elk)
+    dP/dt = r·P·(1 - P/K)·φ_P - P_mati·P                   (serigala)
+    dF/dt = regenerasi(t) - konsumsi/sel                    (makanan)
+
+    φ        - fraksi individu yang cukup makan (asupan / kebutuhan energi, maks 1)
+    P_mati   - mortality_rate + f_lingkungan (suhu/kelembaban musiman) + kelaparan
+    predasi  - peluang menemukan mangsa dalam hunt_range × peluang sukses
+               attempt_hunt (base_success, kondisi predator/mangsa, predation_rate,
+               pack bonus) dengan preferensi 70% elk
+
+Energi agen diwakili energi referensi tetap (default reproduction_threshold) dan
+faktor usia diabaikan, sehingga hasilnya adalah pendekatan untuk menyaring
+parameter, bukan pengganti simulasi agen
+
+Semua parameter berupa array (satu elemen per set parameter) dan diintegrasikan
+bersamaan dengan RK4 tervektorisasi. Hasil berbentuk ensemble (set x langkah)
+seperti stack_replicates, sehingga bisa langsung dipakai EnsemblePlotter, dan
+to_history()/to_statistics() mengubah satu set menjadi population_history /
+hasil get_statistics()
+
+Pemakaian:
+    params = sample_parameters(5000, {'carnivore.predation_rate': (0.1, 0.4)})
+    result = integrate_meanfield(1000, params)
+    lolos = coexistence_mask(result)
+    python -m models.meanfield --sets 5000 --steps 1000 --vary carnivore.predation_rate=0.1:0.4
+"""
+
+import sys
+import time
+import argparse
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+SPECIES_KEYS = ('herbivore', 'elk', 'carnivore')
+PREY_KEYS = ('herbivore', 'elk')
+
+# Parameter per spesies yang dibaca dari config agen
+SPECIES_PARAMETERS = ('reproduction_rate', 'mortality_rate', 'metabolic_cost', 'reproduction_threshold',
+                      'min_temp', 'max_temp', 'min_humidity', 'max_humidity', 'initial_population')
+PREY_PARAMETERS = ('consumption_rate', 'foraging_efficiency')
+CARNIVORE_PARAMETERS = ('predation_rate', 'conversion_efficiency', 'energy_per_kill', 'hunting_cost',
+                        'hunt_range', 'starvation_tolerance')
+
+# Bonus/penalti konsumsi forage(): (kondisi ideal, kondisi buruk)
+FORAGE_FACTORS = {'herbivore': (1.2, 0.7), 'elk': (1.3, 0.6)}
+
+# Radius pack hunting di _count_nearby_carnivores (jarak Manhattan)
+PACK_RADIUS = 3
+
+# Ukuran blok suku lingkungan (titik waktu x set parameter) yang dihitung sekaligus
+ENV_BLOCK_ELEMENTS = 1_000_000
+
+# Parameter spesies yang ikut menentukan suku lingkungan
+ENVIRONMENT_SUFFIXES = ('.min_temp', '.max_temp', '.min_humidity', '.max_humidity', '.mortality_rate')
+
+
+def _diamond_cells(radius: float) -> float:
+    """Jumlah sel dengan jarak Manhattan <= radius"""
+    return 2 * radius * (radius + 1) + 1
+
+
+def default_parameters() -> Dict[str, float]:
+    """
+    Parameter default dari config spesies dan simulasi
+    Kunci berbentuk '<spesies>.<parameter>', mis. 'carnivore.predation_rate'
+    """
+    from agents.config_helper import get_herbivore_config, get_elk_config, get_carnivore_config
+    from data.config_fixed import SIMULATION_CONFIG, ENVIRONMENT_CONFIG
+
+    configs = {'herbivore': get_herbivore_config(), 'elk': get_elk_config(),
+               'carnivore': get_carnivore_config()}
+    capacity = SIMULATION_CONFIG['carrying_capacity']
+    # Sama dengan _process_reproduction
+    capacities = {'herbivore': capacity, 'elk': max(30, capacity // 7),
+                  'carnivore': max(15, capacity // 13)}
+
+    parameters = {}
+    for species, config in configs.items():
+        names = SPECIES_PARAMETERS + (PREY_PARAMETERS if species in PREY_KEYS else CARNIVORE_PARAMETERS)
+        for name in names:
+            parameters[f"{species}.{name}"] = float(config[name])
+        parameters[f"{species}.carrying_capacity"] = float(capacities[species])
+        # Energi referensi individu untuk faktor kondisi attempt_hunt
+        parameters[f"{species}.reference_energy"] = float(config['reproduction_threshold'])
+    parameters['elk.defense_strength'] = float(configs['elk']['defense_strength'])
+
+    for name in ('food_regeneration_rate', 'max_food_per_cell', 'base_temperature', 'base_humidity',
+                 'seasonal_amplitude', 'seasonal_frequency'):
+        parameters[f"environment.{name}"] = float(ENVIRONMENT_CONFIG[name])
+    parameters['environment.initial_food'] = 50.0          # Rata-rata uniform(30, 70)
+    parameters['environment.width'] = float(SIMULATION_CONFIG['grid_width'])
+    parameters['environment.height'] = float(SIMULATION_CONFIG['grid_height'])
+    return parameters
+
+
+def sample_parameters(count: int, ranges: Dict[str, Tuple[float, float]],
+                      seed: Optional[int] = None,
+                      base: Optional[Dict[str, float]] = None) -> Dict[str, np.ndarray]:
+    """
+    count set parameter: kunci di ranges diambil uniform dari (low, high),
+    sisanya sama dengan base (default_parameters())
+    """
+    base = default_parameters() if base is None else dict(base)
+    unknown = set(ranges) - set(base)
+    if unknown:
+        raise KeyError(f"Parameter tidak dikenal: {', '.join(sorted(unknown))}")
+    rng = np.random.default_rng(seed)
+    parameters = {key: np.full(count, value, dtype=np.float64) for key, value in base.items()}
+    for key, (low, high) in ranges.items():
+        parameters[key] = rng.uniform(low, high, count)
+    return parameters
+
+
+def _broadcast(parameters: Optional[Dict[str, Any]]) -> Tuple[Dict[str, np.ndarray], int]:
+    """Lengkapi dengan default lalu samakan semua parameter menjadi array (M,)"""
+    merged = default_parameters()
+    if parameters:
+        unknown = set(parameters) - set(merged)
+        if unknown:
+            raise KeyError(f"Parameter tidak dikenal: {', '.join(sorted(unknown))}")
+        merged.update(parameters)
+    arrays = [np.atleast_1d(np.asarray(value, dtype=np.float64)) for value in merged.values()]
+    count = max(len(array) for array in arrays)
+    broadcast = {}
+    for key, array in zip(merged, arrays):
+        if len(array) not in (1, count):
+            raise ValueError(f"Panjang {key} ({len(array)}) tidak sama dengan jumlah set ({count})")
+        broadcast[key] = np.broadcast_to(array, (count,)).copy()
+    return broadcast, count
+
+
+def _prepare(p: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """
+    Konstanta per set yang tidak bergantung pada state (dihitung sekali)
+    Parameter herbivora ditumpuk menjadi array (2, M): baris kelinci dan elk
+    """
+    def prey(name):
+        return np.stack([p[f"{key}.{name}"] for key in PREY_KEYS])
+
+    c = {}
+    cells = p['environment.width'] * p['environment.height']
+    c['cells'] = cells
+    c['scan_fraction'] = np.minimum(1.0, _diamond_cells(p['carnivore.hunt_range']) / cells)
+    c['pack_fraction'] = np.minimum(1.0, _diamond_cells(PACK_RADIUS) / cells)
+
+    c['prey_consumption'] = prey('consumption_rate')
+    c['prey_efficiency'] = prey('foraging_efficiency')
+    c['prey_inverse_cost'] = 1.0 / prey('metabolic_cost')
+    c['prey_growth'] = prey('reproduction_rate')
+    c['prey_inverse_capacity'] = 1.0 / prey('carrying_capacity')
+    c['wolf_growth'] = p['carnivore.reproduction_rate']
+    c['wolf_inverse_capacity'] = 1.0 / p['carnivore.carrying_capacity']
+    c['wolf_metabolic_cost'] = p['carnivore.metabolic_cost']
+    c['wolf_hunting_cost'] = p['carnivore.hunting_cost']
+    c['wolf_tolerance'] = p['carnivore.starvation_tolerance'] + 1.0
+    c['food_ceiling'] = p['environment.max_food_per_cell']
+
+    # Faktor attempt_hunt dengan energi referensi
+    predator_condition = np.minimum(1.5, p['carnivore.reference_energy'] / 80.0)
+    conditions = {key: np.maximum(0.3, 1.0 - p[f"{key}.reference_energy"] / 100.0) for key in PREY_KEYS}
+    defense = p['elk.defense_strength'] * np.minimum(1.5, p['elk.reference_energy'] / 100.0)
+    rate = p['carnivore.predation_rate'] * predator_condition
+    c['success_herbivore'] = 0.4 * conditions['herbivore'] * rate
+    c['success_elk'] = 0.25 * (1.0 - defense) * conditions['elk'] * rate
+    c['reward'] = p['carnivore.conversion_efficiency'] * p['carnivore.energy_per_kill']
+    return c
+
+
+def _comfort(p: Dict[str, np.ndarray], species: str, temperature: np.ndarray,
+             humidity: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(kondisi ideal, f_lingkungan) seperti forage() dan calculate_mortality_probability()"""
+    temp_ok = (p[f"{species}.min_temp"] <= temperature) & (temperature <= p[f"{species}.max_temp"])
+    humidity_ok = (p[f"{species}.min_humidity"] <= humidity) & (humidity <= p[f"{species}.max_humidity"])
+    penalty = np.where(temp_ok, 0.0, 0.1) + np.where(humidity_ok, 0.0, 0.05)
+    return temp_ok & humidity_ok, penalty
+
+
+def _environment(p: Dict[str, np.ndarray], times: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Suku yang hanya bergantung pada waktu untuk beberapa titik waktu sekaligus (n, ..., M):
+    faktor forage(), mortalitas dasar + f_lingkungan, dan regenerasi makanan per sel
+    Suhu/kelembaban = rata-rata musiman Environment.update() tanpa noise
+    """
+    times = times[:, None]
+    amplitude = p['environment.seasonal_amplitude']
+    phase = p['environment.seasonal_frequency'] * times
+    temperature = p['environment.base_temperature'] + amplitude * np.sin(phase)
+    humidity = np.clip(p['environment.base_humidity'] + amplitude * 0.8 * np.cos(phase), 0, 100)
+
+    forage, mortality = [], []
+    for key in PREY_KEYS:
+        ideal, penalty = _comfort(p, key, temperature, humidity)
+        good, bad = FORAGE_FACTORS[key]
+        forage.append(np.where(ideal, good, bad))
+        mortality.append(p[f"{key}.mortality_rate"] + penalty)
+    _, penalty = _comfort(p, 'carnivore', temperature, humidity)
+    return {
+        'temperature': temperature,
+        'prey_forage': np.stack(forage, axis=1),
+        'prey_mortality': np.stack(mortality, axis=1),
+        'wolf_mortality': p['carnivore.mortality_rate'] + penalty,
+        'regeneration': (p['environment.food_regeneration_rate']
+                         * np.maximum(0.3, 1.0 - np.abs(temperature - 25.0) / 15.0)
+                         * np.maximum(0.3, 1.0 - np.abs(humidity - 60.0) / 30.0)
+                         + 0.25)                 # Rata-rata variasi uniform(-0.5, 1.0)
+    }
+
+
+def _environment_sets(p: Dict[str, np.ndarray]) -> Tuple[Dict[str, np.ndarray], Optional[np.ndarray]]:
+    """
+    Kombinasi unik parameter yang dipakai _environment() beserta indeks baliknya
+    (biasanya sweep tidak mengubah lingkungan sehingga cukup dihitung sekali)
+    Mengembalikan (p, None) jika semua set berbeda
+    """
+    keys = [key for key in p if key.startswith('environment.') or key.endswith(ENVIRONMENT_SUFFIXES)]
+    columns = np.stack([p[key] for key in keys], axis=1)
+    unique, inverse = np.unique(columns, axis=0, return_inverse=True)
+    if len(unique) == len(columns):
+        return p, None
+    return {key: unique[:, j] for j, key in enumerate(keys)}, inverse.ravel()
+
+
+def _forage(food: np.ndarray, c: Dict[str, np.ndarray], env: Dict[str, np.ndarray],
+            i: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Herbivora (2, M): asupan forage() per individu, fraksi yang cukup makan, dan
+    peluang mati (mortalitas dasar + f_lingkungan + f_kelaparan 0.2 bagi yang lapar)
+    """
+    intake = np.minimum(np.minimum(c['prey_consumption'], food) * c['prey_efficiency']
+                        * env['prey_forage'][i], food)
+    fed = np.minimum(intake * c['prey_inverse_cost'], 1.0)
+    mortality = np.minimum(1.0, env['prey_mortality'][i] + 0.2 * (1.0 - fed))
+    return intake, fed, mortality
+
+
+def _hunt(prey: np.ndarray, w: np.ndarray,
+          c: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Peluang per serigala per hari: menargetkan kelinci/elk (ada mangsa dalam
+    hunt_range, preferensi 70% elk) dan berhasil membunuhnya (attempt_hunt)
+    """
+    found_h, found_e = 1.0 - np.exp(-prey * c['scan_fraction'])
+    target_h = found_h * (1.0 - 0.7 * found_e)
+    target_e = found_e * (1.0 - 0.3 * found_h)
+    pack = np.maximum(0.0, w - 1.0) * c['pack_fraction']
+    kill_h = target_h * np.minimum(0.9, c['success_herbivore'] * np.minimum(1.8, 1.0 + 0.3 * pack))
+    kill_e = target_e * np.minimum(0.9, c['success_elk'] * np.minimum(2.5, 1.0 + 0.5 * pack))
+    return target_h, target_e, kill_h, kill_e
+
+
+def _derivatives(state: np.ndarray, c: Dict[str, np.ndarray], env: Dict[str, np.ndarray],
+                 i: int) -> np.ndarray:
+    """
+    Laju perubahan per hari untuk state (4, M): kelinci, elk, serigala, makanan per sel
+    i = indeks titik waktu di env
+    """
+    state = np.maximum(state, 0.0)
+    prey, w, food = state[:2], state[2], state[3]
+    derivative = np.empty_like(state)
+
+    intake, fed, mortality = _forage(food, c, env, i)
+    target_h, target_e, kill_h, kill_e = _hunt(prey, w, c)
+
+    capacity = np.maximum(0.0, 1.0 - prey * c['prey_inverse_capacity'])
+    derivative[:2] = prey * (c['prey_growth'] * capacity * fed - mortality)
+    derivative[0] -= w * kill_h                  # Peluang membunuh per serigala per hari
+    derivative[1] -= w * kill_e
+
+    # Serigala: neraca energi dan kelaparan setelah starvation_tolerance hari tanpa mangsa
+    intake_w = c['reward'] * (kill_h + 2.5 * kill_e)
+    spend_w = c['wolf_metabolic_cost'] + c['wolf_hunting_cost'] * (target_h + 1.5 * target_e)
+    fed_w = np.minimum(intake_w / spend_w, 1.0)
+    starving = np.clip(1.0 - kill_h - kill_e, 0.0, 1.0) ** c['wolf_tolerance']
+    mortality_w = np.minimum(1.0, env['wolf_mortality'][i] + 0.15 * starving)
+    capacity_w = np.maximum(0.0, 1.0 - w * c['wolf_inverse_capacity'])
+    derivative[2] = w * (c['wolf_growth'] * capacity_w * fed_w - mortality_w)
+
+    # Makanan tidak tumbuh melewati max_food_per_cell
+    growth = np.where(food < c['food_ceiling'], env['regeneration'][i], 0.0)
+    derivative[3] = growth - (prey * intake).sum(axis=0) / c['cells']
+    return derivative
+
+
+def integrate_meanfield(steps: int, parameters: Optional[Dict[str, Any]] = None,
+                        initial: Optional[Dict[str, Any]] = None, substeps: int = 1,
+                        every: int = 1) -> Dict[str, Any]:
+    """
+    Integrasikan sistem mean-field untuk semua set parameter sekaligus (RK4)
+
+    Args:
+        steps: jumlah hari (langkah simulasi)
+        parameters: dict kunci default_parameters() -> nilai atau array (M,)
+        initial: populasi/makanan awal per set ('herbivore', 'elk', 'carnivore',
+                 'food'); default initial_population dan initial_food
+        substeps: langkah RK4 per hari
+        every: simpan setiap `every` hari (to_history/to_statistics butuh every=1)
+
+    Returns:
+        dict 'steps' (langkah tercatat), 'herbivore'/'elk'/'carnivore'/'total_food'/
+        'avg_temperature' sebagai array (M, langkah) dan 'parameters'
+    """
+    if steps < 0 or substeps < 1 or every < 1:
+        raise ValueError("steps harus >= 0, substeps dan every harus >= 1")
+    p, count = _broadcast(parameters)
+    c = _prepare(p)
+    initial = initial or {}
+
+    state = np.empty((4, count))
+    for row, key in enumerate(SPECIES_KEYS):
+        state[row] = initial.get(key, p[f"{key}.initial_population"])
+    state[3] = initial.get('food', p['environment.initial_food'])
+
+    recorded = np.arange(0, steps + 1, every)
+    output = np.empty((len(recorded), 4, count))
+    output[0] = state
+    slot = 1
+    dt = 1.0 / substeps
+    # Titik waktu RK4 dalam satu hari: awal, tengah, dan akhir setiap substep;
+    # suku lingkungan dihitung per blok hari (paling banyak ~ENV_BLOCK_ELEMENTS elemen)
+    points = 2 * substeps + 1
+    offsets = np.arange(points) * (0.5 * dt)
+    unique, inverse = _environment_sets(p)
+    block = max(1, ENV_BLOCK_ELEMENTS // (points * count))
+    for day in range(steps):
+        if day % block == 0:
+            days = np.arange(day, min(day + block, steps), dtype=np.float64)
+            env = _environment(unique, (days[:, None] + offsets).ravel())
+            if inverse is not None:
+                env = {key: value[..., inverse] for key, value in env.items()}
+        base = (day % block) * points
+        for sub in range(substeps):
+            i = base + 2 * sub
+            k1 = _derivatives(state, c, env, i)
+            k2 = _derivatives(state + 0.5 * dt * k1, c, env, i + 1)
+            k3 = _derivatives(state + 0.5 * dt * k2, c, env, i + 1)
+            k4 = _derivatives(state + dt * k3, c, env, i + 2)
+            state += dt / 6.0 * (k1 + 2.0 * k2 + 2.0 * k3 + k4)
+            np.maximum(state, 0.0, out=state)
+            np.minimum(state[3], c['food_ceiling'], out=state[3])
+        if (day + 1) % every == 0:
+            output[slot] = state
+            slot += 1
+
+    result = {'steps': recorded, 'parameters': p}
+    # View (set x langkah) tanpa salinan; kolom per langkah tetap bersebelahan di memori
+    for row, key in enumerate(SPECIES_KEYS):
+        result[key] = output[:, row].T
+    result['total_food'] = output[:, 3].T * c['cells'][:, None]
+    result['avg_temperature'] = (p['environment.base_temperature'][:, None]
+                                 + p['environment.seasonal_amplitude'][:, None]
+                                 * np.sin(p['environment.seasonal_frequency'][:, None] * recorded))
+    return result
+
+
+def coexistence_mask(result: Dict[str, Any], threshold: float = 1.0,
+                     species: Sequence[str] = SPECIES_KEYS) -> np.ndarray:
+    """
+    Set parameter yang semua spesiesnya tetap >= threshold individu sepanjang run
+    """
+    mask = np.ones(len(result[species[0]]), dtype=bool)
+    for key in species:
+        mask &= result[key].min(axis=1) >= threshold
+    return mask
+
+
+def _replay(result: Dict[str, Any], index: int, window: int):
+    """
+    Isi HistoryArchive dan OnlineStatistics dengan satu set hasil, langkah demi langkah
+    Hanya untuk hasil per hari (every=1): setiap baris dihitung sebagai satu langkah
+    arsip dan jendela rolling OnlineStatistics dihitung dalam baris
+    """
+    from .history import HistoryArchive
+    from .online_stats import OnlineStatistics
+
+    history = HistoryArchive(
+        ('herbivore', 'elk', 'carnivore', 'total_food', 'avg_temperature',
+         'carnivore_herbivore_ratio', 'herbivore_rolling_std', 'carnivore_rolling_std'),
+        window=window
+    )
+    if np.any(np.diff(result['steps']) != 1):
+        raise ValueError("to_history/to_statistics butuh hasil per hari; jalankan "
+                         "integrate_meanfield dengan every=1")
+    stats = OnlineStatistics()
+    columns = {key: result[key][index].tolist()
+               for key in SPECIES_KEYS + ('total_food', 'avg_temperature')}
+    for row in range(len(result['steps'])):
+        record = {key: values[row] for key, values in columns.items()}
+        history.append({**record, **stats.update(record)})
+    return history, stats
+
+
+def to_history(result: Dict[str, Any], index: int = 0, window: int = 2000):
+    """
+    Ubah satu set hasil mean-field menjadi HistoryArchive dengan kunci yang sama
+    seperti EcosystemSimulation.population_history (seri turunan dari OnlineStatistics)
+    Hasil harus dari integrate_meanfield(..., every=1)
+    """
+    return _replay(result, index, window)[0]
+
+
+def to_statistics(result: Dict[str, Any], index: int = 0, window: int = 2000) -> Dict[str, Any]:
+    """
+    Statistik satu set hasil dengan bentuk yang sama seperti
+    EcosystemSimulation.get_statistics() (bisa langsung dipakai create_plots)
+    Hasil harus dari integrate_meanfield(..., every=1)
+    """
+    history, stats = _replay(result, index, window)
+    recent = {key: stats.rolling(key, 50).mean for key in SPECIES_KEYS}
+    total_prey = recent['herbivore'] + recent['elk']
+    return {
+        'total_steps': int(result['steps'][-1]),
+        'final_herbivores': recent['herbivore'],
+        'final_elk': recent['elk'],
+        'final_carnivores': recent['carnivore'],
+        'total_prey': total_prey,
+        'herbivore_stability': stats.rolling('herbivore', 100).std,
+        'elk_stability': stats.rolling('elk', 100).std,
+        'carnivore_stability': stats.rolling('carnivore', 100).std,
+        'predator_prey_ratio': recent['carnivore'] / max(1, total_prey),
+        'wolf_elk_ratio': recent['carnivore'] / max(1, recent['elk']),
+        'herbivore_autocorrelation': stats.rolling('herbivore', 100).autocorrelation,
+        'carnivore_autocorrelation': stats.rolling('carnivore', 100).autocorrelation,
+        'online_statistics': stats.summary(),
+        'population_history': history
+    }
+
+
+def _parse_range(text: str) -> Tuple[str, Tuple[float, float]]:
+    """'kunci=low:high' -> (kunci, (low, high))"""
+    key, _, bounds = text.partition('=')
+    low, _, high = bounds.partition(':')
+    return key, (float(low), float(high))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Screening parameter dengan model mean-field")
+    parser.add_argument('--sets', type=int, default=1000, help="Jumlah set parameter")
+    parser.add_argument('--steps', type=int, default=1000, help="Jumlah hari")
+    parser.add_argument('--substeps', type=int, default=1, help="Langkah RK4 per hari")
+    parser.add_argument('--vary', action='append', default=[], metavar='KUNCI=LOW:HIGH',
+                        help="Parameter yang diacak uniform, mis. carnivore.predation_rate=0.1:0.4")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--threshold', type=float, default=1.0,
+                        help="Populasi minimal agar spesies dianggap bertahan")
+    args = parser.parse_args(argv)
+
+    try:
+        ranges = dict(_parse_range(text) for text in args.vary)
+        parameters = sample_parameters(args.sets, ranges, seed=args.seed)
+    except (KeyError, ValueError) as error:
+        parser.error(str(error))
+
+    began = time.perf_counter()
+    result = integrate_meanfield(args.steps, parameters, substeps=args.substeps)
+    elapsed = time.perf_counter() - began
+    mask = coexistence_mask(result, args.threshold)
+
+    print(f"📐 {args.sets} set parameter x {args.steps} hari dalam {elapsed:.2f} detik "
+          f"({args.sets / elapsed:.0f} set/detik)")
+    print(f"✅ Ketiga spesies bertahan: {int(mask.sum())}/{args.sets} set")
+    for key, (low, high) in ranges.items():
+        values = parameters[key][mask]
+        if len(values):
+            print(f"   {key}: {values.min():.4g} .. {values.max():.4g} (diacak {low:g} .. {high:g})")
+    for key in SPECIES_KEYS:
+        final = result[key][:, -1]
+        print(f"   {key}: akhir median {np.median(final):.1f}, "
+              f"punah {int((final < args.threshold).sum())} set")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Metrics registry untuk instrumentasi hot path simulasi
+Counter diisi agen lewat AgentProbe simulasinya sendiri (get_cell, scan_for_prey,
+attempt_hunt, _flee_from_predators), sehingga beberapa simulasi dalam satu proses
+punya counter terpisah dan method kelas agen tidak pernah diganti
+Sampel per langkah disimpan di ring buffer dan bisa diekspor ke JSON lines
+atau teks OpenMetrics
+"""
+
+import json
+import time
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+# Nama counter hot path (per langkah)
+HOT_PATH_COUNTERS = (
+    'get_cell_calls',
+    'prey_queries',
+    'prey_candidates_examined',
+    'flee_events'
+)
+
+# Counter berlabel spesies mangsa
+HUNT_COUNTERS = ('hunt_attempts', 'hunt_successes')
+
+# Kunci spesies berdasarkan SpeciesType.value
+_PREY_KEYS = {'herbivore': 'herbivore', 'large_herbivore': 'elk', 'carnivore': 'carnivore'}
+
+
+class MetricsRegistry:
+    """
+    Kumpulan counter hot path dengan ring buffer sampel per langkah
+    """
+
+    def __init__(self, capacity: int = 10000):
+        self.capacity = capacity
+
+        # Counter langkah berjalan (di-reset setiap sampel)
+        self.step_counters: Dict[str, int] = {name: 0 for name in HOT_PATH_COUNTERS}
+        self.hunt_counters: Dict[str, Dict[str, int]] = {
+            name: {'herbivore': 0, 'elk': 0} for name in HUNT_COUNTERS
+        }
+
+        # Akumulasi sepanjang run
+        self.totals: Dict[str, Any] = {name: 0 for name in HOT_PATH_COUNTERS}
+        for name in HUNT_COUNTERS:
+            self.totals[name] = {'herbivore': 0, 'elk': 0}
+        self.totals['births'] = {'herbivore': 0, 'elk': 0, 'carnivore': 0}
+        self.totals['deaths'] = {'herbivore': 0, 'elk': 0, 'carnivore': 0}
+
+        # Ring buffer sampel per langkah
+        self.samples: deque = deque(maxlen=capacity)
+
+    # ------------------------------------------------------------------
+    # Pemasangan instrumentasi
+    # ------------------------------------------------------------------
+
+    def attach(self, simulation):
+        """
+        Pasang fase sampling di pipeline simulasi; counter hot path diisi
+        AgentProbe fase agen selama simulation.metrics menunjuk registry ini
+        """
+        if 'metrics' not in simulation.pipeline:
+            simulation.pipeline.register('metrics', _metrics_phase)
+
+    def detach(self, simulation):
+        """
+        Lepas fase sampling
+        """
+        if 'metrics' in simulation.pipeline:
+            simulation.pipeline.remove('metrics')
+
+    def count(self, name: str, n: int = 1):
+        """Tambah counter hot path langkah berjalan"""
+        self.step_counters[name] += n
+
+    def record_hunt(self, prey_type: str, success: bool):
+        """Catat percobaan berburu berdasarkan SpeciesType.value mangsa"""
+        prey = _PREY_KEYS[prey_type]
+        self.hunt_counters['hunt_attempts'][prey] += 1
+        if success:
+            self.hunt_counters['hunt_successes'][prey] += 1
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    def record_step(self, simulation) -> Dict[str, Any]:
+        """
+        Ambil sampel untuk langkah yang baru selesai lalu reset counter langkah
+        """
+        phase_times = {}
+        step_ns = 0
+        for phase in simulation.pipeline:
+            if phase.enabled and phase.name != 'metrics':
+                phase_times[phase.name] = phase.last_ns / 1e9
+                step_ns += phase.last_ns
+
+        record = simulation.latest_record or {}
+        populations = {key: record.get(key, 0) for key in ('herbivore', 'elk', 'carnivore')}
+
+        counters = dict(self.step_counters)
+        for name in HUNT_COUNTERS:
+            counters[name] = dict(self.hunt_counters[name])
+        counters['births'] = dict(simulation.step_events['births'])
+        counters['deaths'] = dict(simulation.step_events['deaths'])
+
+        sample = {
+            'step': simulation.time_step,
+            'timestamp': time.time(),
+            'step_time': step_ns / 1e9,
+            'phase_times': phase_times,
+            'populations': populations,
+            'counters': counters
+        }
+        self.samples.append(sample)
+
+        # Akumulasi dan reset counter langkah (in-place)
+        for name in HOT_PATH_COUNTERS:
+            self.totals[name] += self.step_counters[name]
+            self.step_counters[name] = 0
+        for name in HUNT_COUNTERS + ('births', 'deaths'):
+            for key, value in counters[name].items():
+                self.totals[name][key] = self.totals[name].get(key, 0) + value
+        for name in HUNT_COUNTERS:
+            for key in self.hunt_counters[name]:
+                self.hunt_counters[name][key] = 0
+
+        return sample
+
+    def recent(self, n: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Ambil n sampel terakhir (semua jika None)"""
+        samples = list(self.samples)
+        return samples if n is None else samples[-n:]
+
+    def slowest_steps(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Sampel dengan waktu langkah terlama, untuk korelasi dengan kejadian ekologis"""
+        return sorted(self.samples, key=lambda s: s['step_time'], reverse=True)[:n]
+
+    # ------------------------------------------------------------------
+    # Ekspor
+    # ------------------------------------------------------------------
+
+    def export_jsonl(self, path: str) -> int:
+        """
+        Tulis sampel di ring buffer sebagai JSON lines (satu sampel per baris)
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            for sample in self.samples:
+                f.write(json.dumps(sample))
+                f.write('\n')
+        return len(self.samples)
+
+    def export_openmetrics(self, path: str) -> int:
+        """
+        Tulis sampel di ring buffer sebagai teks OpenMetrics
+        Counter ditulis kumulatif (mulai dari sampel tertua di buffer) dengan
+        timestamp per langkah; populasi dan waktu langkah sebagai gauge
+        """
+        families: Dict[str, Dict[str, Any]] = {}
+
+        def add(name: str, metric_type: str, help_text: str, labels: str, value: float, ts: float):
+            family = families.setdefault(name, {'type': metric_type, 'help': help_text, 'series': {}})
+            family['series'].setdefault(labels, []).append((value, ts))
+
+        cumulative: Dict[str, float] = {}
+
+        def add_counter(name: str, help_text: str, labels: str, value: float, ts: float):
+            key = name + labels
+            cumulative[key] = cumulative.get(key, 0) + value
+            add(name, 'counter', help_text, labels, cumulative[key], ts)
+
+        for sample in self.samples:
+            ts = sample['timestamp']
+            counters = sample['counters']
+
+            add('ecosystem_step', 'gauge', 'Langkah simulasi', '', sample['step'], ts)
+            add('ecosystem_step_seconds', 'gauge', 'Waktu satu langkah simulasi', '',
+                sample['step_time'], ts)
+            for phase, seconds in sample['phase_times'].items():
+                add('ecosystem_phase_seconds', 'gauge', 'Waktu per fase pipeline',
+                    f'{{phase="{phase}"}}', seconds, ts)
+            for species, count in sample['populations'].items():
+                add('ecosystem_population', 'gauge', 'Populasi per spesies',
+                    f'{{species="{species}"}}', count, ts)
+
+            add_counter('ecosystem_get_cell_calls', 'Sel lingkungan yang dibaca agen (get_cell/cell_conditions)', '',
+                        counters['get_cell_calls'], ts)
+            add_counter('ecosystem_prey_queries', 'Panggilan scan_for_prey', '',
+                        counters['prey_queries'], ts)
+            add_counter('ecosystem_prey_candidates_examined', 'Kandidat yang diperiksa scan_for_prey', '',
+                        counters['prey_candidates_examined'], ts)
+            add_counter('ecosystem_flee_events', 'Kejadian elk melarikan diri', '',
+                        counters['flee_events'], ts)
+            for name, help_text in (('hunt_attempts', 'Percobaan berburu per mangsa'),
+                                    ('hunt_successes', 'Perburuan berhasil per mangsa')):
+                for prey, value in counters[name].items():
+                    add_counter(f'ecosystem_{name}', help_text, f'{{prey="{prey}"}}', value, ts)
+            for name, help_text in (('births', 'Kelahiran per spesies'),
+                                    ('deaths', 'Kematian per spesies')):
+                for species, value in counters[name].items():
+                    add_counter(f'ecosystem_{name}', help_text, f'{{species="{species}"}}', value, ts)
+
+        with open(path, 'w', encoding='utf-8') as f:
+            for name, family in families.items():
+                f.write(f"# TYPE {name} {family['type']}\n")
+                f.write(f"# HELP {name} {family['help']}\n")
+                suffix = '_total' if family['type'] == 'counter' else ''
+                for labels, points in family['series'].items():
+                    for value, ts in points:
+                        f.write(f"{name}{suffix}{labels} {value} {ts:.3f}\n")
+            f.write("# EOF\n")
+        return len(self.samples)
+
+
+def _metrics_phase(simulation, phase):
+    """
+    Fase pipeline: ambil sampel metrics di akhir langkah
+    """
+    if simulation.metrics is not None:
+        simulation.metrics.record_step(simulation)
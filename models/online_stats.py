@@ -0,0 +1,242 @@
+"""
+Statistik bergulir online (diperbarui sekali per langkah, O(1) per update)
+Menggantikan np.std/np.mean atas potongan history dan loop rolling std di plotter:
+    RollingStats  - jendela geser: mean, std (Welford windowed), min/max
+                    (deque monoton), autokorelasi lag-1
+    RunningStats  - akumulasi sepanjang run: mean, std, min, max (Welford)
+    lag1_autocorrelation - autokorelasi lag-1 dengan definisi yang sama untuk
+                    array utuh (rentang langkah dari arsip history)
+    OnlineStatistics - kumpulan estimator untuk populasi dan rasio ekosistem
+"""
+
+import math
+from collections import deque
+from typing import Dict, Any, Iterable, Tuple
+
+# Seri yang dilacak dan ukuran jendela default (sama dengan get_statistics)
+TRACKED_SERIES = ('herbivore', 'elk', 'carnivore', 'predator_prey_ratio', 'wolf_elk_ratio')
+DEFAULT_WINDOWS = (50, 100)
+
+# Jendela rolling std yang diplot EcosystemPlotter
+PLOT_STD_WINDOW = 50
+
+
+class RollingStats:
+    """
+    Estimator jendela geser berukuran tetap
+    Mean dan varians memakai update Welford untuk penggantian nilai (tambah baru,
+    buang lama sekaligus); dihitung ulang penuh secara berkala untuk mencegah drift
+    """
+
+    RESYNC_EVERY = 10_000
+
+    def __init__(self, size: int):
+        if size < 1:
+            raise ValueError("Ukuran jendela harus >= 1")
+        self.size = size
+        self.values = [0.0] * size
+        self.head = 0
+        self.count = 0
+        self.total = 0               # Jumlah nilai yang pernah masuk
+
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._lag_products = 0.0     # Σ x_t * x_{t-1} untuk pasangan dalam jendela
+        self._minq: deque = deque()  # (indeks, nilai) naik monoton
+        self._maxq: deque = deque()  # (indeks, nilai) turun monoton
+
+    def update(self, x: float):
+        x = float(x)
+        index = self.total
+        if self.count == self.size:
+            old = self.values[self.head]
+            following = self.values[(self.head + 1) % self.size]
+            new_mean = self.mean + (x - old) / self.size
+            self._m2 += (x - old) * (x - new_mean + old - self.mean)
+            self.mean = new_mean
+            if self.size > 1:
+                self._lag_products -= old * following
+        else:
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self._m2 += delta * (x - self.mean)
+        if self.count > 1:
+            self._lag_products += x * self.values[(self.head - 1) % self.size]
+
+        self.values[self.head] = x
+        self.head = (self.head + 1) % self.size
+        self.total += 1
+
+        while self._minq and self._minq[-1][1] >= x:
+            self._minq.pop()
+        self._minq.append((index, x))
+        while self._maxq and self._maxq[-1][1] <= x:
+            self._maxq.pop()
+        self._maxq.append((index, x))
+        oldest = index - self.count + 1
+        if self._minq[0][0] < oldest:
+            self._minq.popleft()
+        if self._maxq[0][0] < oldest:
+            self._maxq.popleft()
+
+        if self.total % self.RESYNC_EVERY == 0:
+            self._resync()
+
+    def window(self) -> list:
+        """Nilai dalam jendela, urut waktu"""
+        start = (self.head - self.count) % self.size
+        return [self.values[(start + i) % self.size] for i in range(self.count)]
+
+    def _resync(self):
+        """Hitung ulang mean, M2, dan jumlah perkalian lag dari isi jendela"""
+        window = self.window()
+        self.mean = math.fsum(window) / len(window)
+        self._m2 = math.fsum((v - self.mean) ** 2 for v in window)
+        self._lag_products = math.fsum(a * b for a, b in zip(window, window[1:]))
+
+    @property
+    def variance(self) -> float:
+        """Varians populasi (ddof=0, sama dengan np.var)"""
+        return max(0.0, self._m2 / self.count) if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        return self._minq[0][1] if self._minq else 0.0
+
+    @property
+    def max(self) -> float:
+        return self._maxq[0][1] if self._maxq else 0.0
+
+    @property
+    def autocorrelation(self) -> float:
+        """
+        Autokorelasi lag-1: Σ(x_t - m)(x_{t-1} - m) / Σ(x_t - m)^2
+        """
+        if self.count < 2 or self._m2 <= 0:
+            return 0.0
+        first = self.values[(self.head - self.count) % self.size]
+        last = self.values[(self.head - 1) % self.size]
+        total = self.mean * self.count
+        covariance = (self._lag_products
+                      - self.mean * ((total - first) + (total - last))
+                      + (self.count - 1) * self.mean * self.mean)
+        return covariance / self._m2
+
+    def summary(self) -> Dict[str, float]:
+        return {'mean': self.mean, 'std': self.std, 'min': self.min, 'max': self.max,
+                'autocorrelation': self.autocorrelation, 'count': self.count}
+
+
+def lag1_autocorrelation(values) -> float:
+    """
+    Autokorelasi lag-1 sebuah array: Σ(x_t - m)(x_{t-1} - m) / Σ(x_t - m)^2
+    Definisi yang sama dengan RollingStats.autocorrelation atas jendela penuh
+    """
+    import numpy as np
+
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) < 2:
+        return 0.0
+    deviations = values - values.mean()
+    m2 = float(np.dot(deviations, deviations))
+    if m2 <= 0:
+        return 0.0
+    return float(np.dot(deviations[1:], deviations[:-1])) / m2
+
+
+class RunningStats:
+    """
+    Mean/std/min/max sepanjang run (Welford, memori konstan)
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (x - self.mean)
+        self.min = min(self.min, x)
+        self.max = max(self.max, x)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / self.count) if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {'mean': self.mean, 'std': self.std, 'min': self.min, 'max': self.max,
+                'count': self.count}
+
+
+class OnlineStatistics:
+    """
+    Estimator online untuk populasi per spesies dan rasio ekosistem
+
+    Contoh:
+        stats = OnlineStatistics(windows=(50, 100))
+        derived = stats.update({'herbivore': 80, 'elk': 30, 'carnivore': 12})
+        stats.rolling('herbivore', 100).std
+        stats.running('predator_prey_ratio').mean
+    """
+
+    def __init__(self, windows: Iterable[int] = DEFAULT_WINDOWS,
+                 series: Tuple[str, ...] = TRACKED_SERIES):
+        self.windows = tuple(sorted(set(windows) | {PLOT_STD_WINDOW}))
+        self.series = tuple(series)
+        self._rolling = {(key, size): RollingStats(size) for key in self.series for size in self.windows}
+        self._running = {key: RunningStats() for key in self.series + ('plot_ratio',)}
+        self.steps = 0
+
+    @staticmethod
+    def ratios(record: Dict[str, float]) -> Dict[str, float]:
+        """Rasio ekosistem untuk satu langkah (rumus sama dengan analisis lama)"""
+        prey = record['herbivore'] + record['elk']
+        return {
+            'predator_prey_ratio': record['carnivore'] / max(1, prey),
+            'wolf_elk_ratio': record['carnivore'] / max(1, record['elk']),
+            'plot_ratio': record['carnivore'] / max(1, record['herbivore'])
+        }
+
+    def update(self, record: Dict[str, float]) -> Dict[str, float]:
+        """
+        Perbarui semua estimator dengan satu langkah
+        Mengembalikan seri turunan untuk disimpan di arsip history
+        """
+        values = dict(record)
+        values.update(self.ratios(record))
+        for (key, _), tracker in self._rolling.items():
+            tracker.update(values[key])
+        for key, tracker in self._running.items():
+            tracker.update(values[key])
+        self.steps += 1
+
+        return {
+            'carnivore_herbivore_ratio': values['plot_ratio'],
+            'herbivore_rolling_std': self._rolling[('herbivore', PLOT_STD_WINDOW)].std,
+            'carnivore_rolling_std': self._rolling[('carnivore', PLOT_STD_WINDOW)].std
+        }
+
+    def rolling(self, key: str, size: int) -> RollingStats:
+        return self._rolling[(key, size)]
+
+    def running(self, key: str) -> RunningStats:
+        return self._running[key]
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan semua estimator (untuk get_statistics dan plotter)"""
+        return {
+            'steps': self.steps,
+            'rolling': {f"{key}@{size}": tracker.summary()
+                        for (key, size), tracker in self._rolling.items()},
+            'running': {key: tracker.summary() for key, tracker in self._running.items()}
+        }
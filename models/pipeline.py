@@ -0,0 +1,231 @@
+"""
+Pipeline langkah simulasi yang terdiri dari fase-fase bernama dan berurutan
+Setiap fase punya timer resolusi tinggi dan counter (sel, agen, query)
+sehingga waktu per langkah bisa diurai dan fase bisa diganti implementasinya
+"""
+
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+# Counter bawaan yang dicatat setiap fase
+PHASE_COUNTERS = ('cells_touched', 'agents_processed', 'queries_issued')
+
+PhaseFunction = Callable[[Any, 'StepPhase'], None]
+
+
+class StepPhase:
+    """
+    Satu fase dalam pipeline langkah simulasi
+
+    Fungsi fase dipanggil sebagai func(simulation, phase) dan boleh menambah
+    counter lewat phase.count('cells_touched', n)
+    """
+
+    def __init__(self, name: str, func: PhaseFunction, enabled: bool = True):
+        self.name = name
+        self.func = func
+        self.enabled = enabled
+
+        # Counter untuk pemanggilan terakhir dan akumulasi
+        self.counters: Dict[str, int] = {key: 0 for key in PHASE_COUNTERS}
+        self.totals: Dict[str, int] = {key: 0 for key in PHASE_COUNTERS}
+
+        # Timing (nanodetik)
+        self.calls = 0
+        self.total_ns = 0
+        self.last_ns = 0
+        self.max_ns = 0
+
+    def count(self, key: str, n: int = 1):
+        """Tambah counter untuk pemanggilan saat ini"""
+        self.counters[key] = self.counters.get(key, 0) + n
+
+    def run(self, simulation):
+        """Jalankan fase sambil mengukur waktu dan counter"""
+        counters = self.counters
+        for key in counters:
+            counters[key] = 0
+
+        start = time.perf_counter_ns()
+        self.func(simulation, self)
+        elapsed = time.perf_counter_ns() - start
+
+        self.calls += 1
+        self.total_ns += elapsed
+        self.last_ns = elapsed
+        if elapsed > self.max_ns:
+            self.max_ns = elapsed
+
+        totals = self.totals
+        for key, value in counters.items():
+            totals[key] = totals.get(key, 0) + value
+
+    def reset(self):
+        """Reset timing dan counter akumulasi"""
+        self.calls = 0
+        self.total_ns = 0
+        self.last_ns = 0
+        self.max_ns = 0
+        self.counters = {key: 0 for key in self.counters}
+        self.totals = {key: 0 for key in self.totals}
+
+    def summary(self) -> Dict[str, Any]:
+        """Ringkasan timing dan counter fase ini"""
+        mean_ns = self.total_ns / self.calls if self.calls else 0.0
+        return {
+            'enabled': self.enabled,
+            'calls': self.calls,
+            'total_time': self.total_ns / 1e9,
+            'mean_time': mean_ns / 1e9,
+            'last_time': self.last_ns / 1e9,
+            'max_time': self.max_ns / 1e9,
+            'last_counters': dict(self.counters),
+            'counters': dict(self.totals)
+        }
+
+    def __repr__(self):
+        status = "on" if self.enabled else "off"
+        return f"StepPhase({self.name!r}, {status})"
+
+
+class AgentProbe:
+    """
+    Counter yang diberikan ke agen lewat environment.probe selama fase agen
+    Agen memanggilnya di titik panggilan get_cell, scan populasi, dan berburu,
+    sehingga counter fase (dan MetricsRegistry simulasi, jika aktif) terukur
+    tanpa membungkus method kelas agen
+    """
+
+    __slots__ = ('phase', 'metrics')
+
+    def __init__(self, phase: StepPhase, metrics=None):
+        self.phase = phase
+        self.metrics = metrics
+
+    def cells(self, n: int = 1):
+        """n sel dibaca (get_cell / cell_conditions)"""
+        self.phase.count('cells_touched', n)
+        if self.metrics is not None:
+            self.metrics.count('get_cell_calls', n)
+
+    def scan(self, n: int = 1):
+        """n scan daftar agen (predator terdekat, kawanan)"""
+        self.phase.count('queries_issued', n)
+
+    def prey_scan(self, candidates: int):
+        """Satu scan_for_prey atas `candidates` agen"""
+        self.phase.count('queries_issued')
+        if self.metrics is not None:
+            self.metrics.count('prey_queries')
+            self.metrics.count('prey_candidates_examined', candidates)
+
+    def flee(self, scans: int):
+        """_flee_from_predators: satu scan daftar agen per sel kandidat"""
+        self.phase.count('queries_issued', scans)
+        if self.metrics is not None:
+            self.metrics.count('flee_events')
+
+    def hunt(self, prey_type: str, success: bool):
+        """Hasil attempt_hunt (prey_type = SpeciesType.value mangsa)"""
+        if self.metrics is not None:
+            self.metrics.record_hunt(prey_type, success)
+
+
+class StepPipeline:
+    """
+    Daftar fase berurutan yang dijalankan setiap langkah simulasi
+    Fase bisa didaftarkan, diganti, dinonaktifkan, atau dihapus berdasarkan nama
+    """
+
+    def __init__(self):
+        self.phases: List[StepPhase] = []
+
+    def _index(self, name: str) -> int:
+        for i, phase in enumerate(self.phases):
+            if phase.name == name:
+                return i
+        raise KeyError(f"Fase tidak ditemukan: {name} (tersedia: {', '.join(self.names())})")
+
+    def register(self, name: str, func: PhaseFunction, before: Optional[str] = None,
+                 after: Optional[str] = None, enabled: bool = True) -> StepPhase:
+        """
+        Daftarkan fase baru
+        Tanpa before/after fase ditambahkan di akhir pipeline
+        """
+        if name in self:
+            raise ValueError(f"Fase '{name}' sudah terdaftar, gunakan replace()")
+        if before is not None and after is not None:
+            raise ValueError("Gunakan salah satu dari before atau after, bukan keduanya")
+
+        phase = StepPhase(name, func, enabled)
+        if before is not None:
+            self.phases.insert(self._index(before), phase)
+        elif after is not None:
+            self.phases.insert(self._index(after) + 1, phase)
+        else:
+            self.phases.append(phase)
+        return phase
+
+    def replace(self, name: str, func: PhaseFunction) -> StepPhase:
+        """Ganti implementasi fase (timing dan counter di-reset)"""
+        phase = self.get(name)
+        phase.func = func
+        phase.reset()
+        return phase
+
+    def remove(self, name: str) -> StepPhase:
+        """Hapus fase dari pipeline"""
+        return self.phases.pop(self._index(name))
+
+    def enable(self, name: str):
+        """Aktifkan fase"""
+        self.get(name).enabled = True
+
+    def disable(self, name: str):
+        """Nonaktifkan fase tanpa menghapusnya"""
+        self.get(name).enabled = False
+
+    def get(self, name: str) -> StepPhase:
+        """Ambil fase berdasarkan nama"""
+        return self.phases[self._index(name)]
+
+    def names(self) -> List[str]:
+        """Nama semua fase sesuai urutan eksekusi"""
+        return [phase.name for phase in self.phases]
+
+    def __contains__(self, name: str) -> bool:
+        return any(phase.name == name for phase in self.phases)
+
+    def __iter__(self):
+        return iter(self.phases)
+
+    def run(self, simulation):
+        """Jalankan semua fase aktif sesuai urutan"""
+        for phase in self.phases:
+            if phase.enabled:
+                phase.run(simulation)
+
+    def timings(self) -> Dict[str, Dict[str, Any]]:
+        """Ringkasan timing dan counter semua fase"""
+        return {phase.name: phase.summary() for phase in self.phases}
+
+    def reset_timings(self):
+        """Reset timing dan counter semua fase"""
+        for phase in self.phases:
+            phase.reset()
+
+    def print_report(self):
+        """Tampilkan tabel waktu per fase"""
+        total_ns = sum(phase.total_ns for phase in self.phases) or 1
+
+        print(f"{'Fase':<16} {'calls':>7} {'total (s)':>10} {'mean (ms)':>10} {'%':>6} "
+              f"{'cells':>12} {'agents':>12} {'queries':>10}")
+        print("-" * 90)
+        for phase in self.phases:
+            mean_ms = phase.total_ns / phase.calls / 1e6 if phase.calls else 0.0
+            status = "" if phase.enabled else " (off)"
+            print(f"{phase.name + status:<16} {phase.calls:>7} {phase.total_ns / 1e9:>10.3f} "
+                  f"{mean_ms:>10.3f} {100.0 * phase.total_ns / total_ns:>5.1f}% "
+                  f"{phase.totals.get('cells_touched', 0):>12} "
+                  f"{phase.totals.get('agents_processed', 0):>12} "
+                  f"{phase.totals.get('queries_issued', 0):>10}")
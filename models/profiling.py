@@ -0,0 +1,335 @@
+"""
+Mode profiling untuk EcosystemSimulation.run
+Profil hanya rentang langkah tertentu, menulis file .pstats dan collapsed-stack
+(format flame graph: "frame;frame;frame count"), serta atribusi waktu ke fase
+pipeline dan kelas spesies (HerbivoreAgent, ElkAgent, CarnivoreAgent)
+Opsional: sampler berbasis sinyal (SIGPROF) dengan overhead rendah untuk run panjang
+"""
+
+import os
+import json
+import cProfile
+import pstats
+import signal
+from collections import defaultdict
+from typing import Dict, Any, Optional, Tuple
+
+AGENT_CLASS_NAMES = ('HerbivoreAgent', 'ElkAgent', 'CarnivoreAgent', 'BaseAgent')
+
+# Batas kedalaman stack saat menyusun collapsed-stack dari pstats
+MAX_STACK_DEPTH = 64
+
+
+def _agent_method_map() -> Dict[Tuple[str, int, str], str]:
+    """
+    Peta (filename, lineno, funcname) pstats -> nama kelas agen pemilik method
+    """
+    from agents import base_agent
+
+    mapping = {}
+    for class_name in AGENT_CLASS_NAMES:
+        cls = getattr(base_agent, class_name)
+        for attr in vars(cls).values():
+            code = getattr(attr, '__code__', None)
+            if code is not None:
+                mapping[(code.co_filename, code.co_firstlineno, code.co_name)] = class_name
+    return mapping
+
+
+def _frame_label(code, agent_class: Optional[str] = None) -> str:
+    """Label satu frame untuk collapsed-stack"""
+    if agent_class:
+        return f"{agent_class}.{code.co_name}"
+    qualname = getattr(code, 'co_qualname', code.co_name)
+    module = os.path.splitext(os.path.basename(code.co_filename))[0]
+    return f"{module}:{qualname}"
+
+
+class SignalSampler:
+    """
+    Sampler stack berbasis SIGPROF (hanya Unix, thread utama)
+    Setiap interval CPU time, stack thread utama dicatat sebagai collapsed-stack
+    Timer berjalan terus selama start()..stop(); sampel hanya dicatat saat
+    `step` tidak None (di dalam langkah yang diprofil)
+    """
+
+    def __init__(self, interval: float = 0.005, phase_codes: Optional[Dict[Any, str]] = None):
+        self.interval = interval
+        self.phase_codes = phase_codes or {}
+        self.stacks: Dict[str, int] = defaultdict(int)
+        self.samples = 0
+        self.running = False
+        self.step: Optional[int] = None
+        self._previous_handler = None
+
+    @staticmethod
+    def available() -> bool:
+        """Cek apakah SIGPROF/setitimer tersedia di platform ini"""
+        return hasattr(signal, 'SIGPROF') and hasattr(signal, 'setitimer')
+
+    def _handle(self, signum, frame):
+        if self.step is None:
+            return
+        labels = []
+        while frame is not None:
+            code = frame.f_code
+            phase = self.phase_codes.get(code)
+            if phase is not None:
+                labels.append(f"phase:{phase}")
+            agent_class = None
+            owner = frame.f_locals.get('self') if code.co_filename.endswith('base_agent.py') else None
+            if owner is not None:
+                agent_class = type(owner).__name__
+            labels.append(_frame_label(code, agent_class))
+            frame = frame.f_back
+        labels.reverse()
+        self.stacks[';'.join(labels)] += 1
+        self.samples += 1
+
+    def start(self):
+        if self.running:
+            return
+        self._previous_handler = signal.signal(signal.SIGPROF, self._handle)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        self.running = True
+
+    def stop(self):
+        if not self.running:
+            return
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        self.running = False
+        self.step = None
+
+    def write_collapsed(self, path: str):
+        """Tulis stack sampel (nilai = jumlah sampel)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.stacks.items()):
+                f.write(f"{stack} {count}\n")
+
+    def attribution(self) -> Dict[str, Dict[str, float]]:
+        """Waktu (detik, perkiraan) per fase dan per kelas spesies dari sampel"""
+        phases: Dict[str, float] = defaultdict(float)
+        species: Dict[str, float] = defaultdict(float)
+        for stack, count in self.stacks.items():
+            seconds = count * self.interval
+            frames = stack.split(';')
+            phase = next((f[len('phase:'):] for f in frames if f.startswith('phase:')), None)
+            if phase:
+                phases[phase] += seconds
+            agent_class = next((f.split('.')[0] for f in reversed(frames)
+                                if f.split('.')[0] in AGENT_CLASS_NAMES), None)
+            if agent_class:
+                species[agent_class] += seconds
+        return {'phases': dict(phases), 'species': dict(species)}
+
+
+class SimulationProfiler:
+    """
+    Profiler untuk rentang langkah [start_step, stop_step) dari EcosystemSimulation.run
+
+    Contoh:
+        profiler = SimulationProfiler('profiles', start_step=10, stop_step=60)
+        profiler.attach(sim)
+        sim.run(steps=100)
+        profiler.detach(sim)
+        profiler.write_outputs()
+    """
+
+    def __init__(self, output_dir: str = 'profiles', start_step: int = 1,
+                 stop_step: Optional[int] = None, sample: bool = False,
+                 sample_interval: float = 0.005):
+        self.output_dir = output_dir
+        self.start_step = start_step
+        self.stop_step = stop_step
+        self.profile = cProfile.Profile()
+        self.profiled_steps = 0
+        self.phase_codes: Dict[Any, str] = {}
+
+        self.sampler = None
+        if sample:
+            if SignalSampler.available():
+                self.sampler = SignalSampler(sample_interval)
+            else:
+                print("⚠️  Sampler sinyal tidak tersedia di platform ini, hanya cProfile")
+
+    def _in_range(self, step: int) -> bool:
+        if step < self.start_step:
+            return False
+        return self.stop_step is None or step < self.stop_step
+
+    def attach(self, simulation):
+        """
+        Bungkus simulation.step agar profiling aktif hanya di rentang langkah
+        """
+        self.phase_codes = {phase.func.__code__: phase.name for phase in simulation.pipeline
+                            if hasattr(phase.func, '__code__')}
+        if self.sampler:
+            self.sampler.phase_codes = self.phase_codes
+
+        original_step = simulation.step
+        profile = self.profile
+        sampler = self.sampler
+
+        def profiled_step():
+            step = simulation.time_step + 1
+            if not self._in_range(step):
+                if sampler:
+                    sampler.stop()
+                return original_step()
+            if sampler:
+                # Timer dipasang sekali untuk seluruh rentang: restart per langkah
+                # me-reset itimer sehingga langkah < interval tidak pernah tersampel
+                sampler.start()
+                sampler.step = step
+                try:
+                    original_step()
+                finally:
+                    sampler.step = None
+                if not self._in_range(step + 1):
+                    sampler.stop()
+            else:
+                profile.enable()
+                try:
+                    original_step()
+                finally:
+                    profile.disable()
+            self.profiled_steps += 1
+
+        simulation.step = profiled_step
+
+    def detach(self, simulation):
+        """Hentikan sampler dan kembalikan simulation.step asli"""
+        if self.sampler:
+            self.sampler.stop()
+        if 'step' in vars(simulation):
+            del simulation.step
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def _range_label(self) -> str:
+        stop = self.stop_step if self.stop_step is not None else 'end'
+        return f"{self.start_step}_{stop}"
+
+    def _stats(self) -> Optional[pstats.Stats]:
+        self.profile.create_stats()
+        if not self.profile.stats:
+            return None
+        return pstats.Stats(self.profile)
+
+    def collapsed_from_pstats(self, stats: pstats.Stats) -> Dict[str, int]:
+        """
+        Susun collapsed-stack (mikrodetik) dari call graph pstats
+        Waktu tiap edge dibagi proporsional terhadap cumulative time pemanggil
+        """
+        raw = stats.stats
+        method_map = _agent_method_map()
+        phase_by_key = {(code.co_filename, code.co_firstlineno, code.co_name): name
+                        for code, name in self.phase_codes.items()}
+
+        callees = defaultdict(list)
+        for func, (_, _, _, _, callers) in raw.items():
+            for caller, edge in callers.items():
+                callees[caller].append((func, edge[3]))
+
+        def label(func) -> str:
+            filename, lineno, name = func
+            if func in phase_by_key:
+                return f"phase:{phase_by_key[func]}"
+            if func in method_map:
+                return f"{method_map[func]}.{name}"
+            if filename == '~':
+                return name
+            module = os.path.splitext(os.path.basename(filename))[0]
+            return f"{module}:{name}"
+
+        stacks: Dict[str, int] = defaultdict(int)
+
+        def walk(func, budget: float, path: list, on_path: set):
+            _, _, tottime, cumtime, _ = raw[func]
+            share = budget / cumtime if cumtime > 0 else 0.0
+            path.append(label(func))
+            self_us = int(round(tottime * share * 1e6))
+            if self_us > 0:
+                stacks[';'.join(path)] += self_us
+            if len(path) < MAX_STACK_DEPTH:
+                for callee, edge_cumtime in callees.get(func, ()):
+                    if callee in on_path or callee not in raw:
+                        continue
+                    on_path.add(callee)
+                    walk(callee, edge_cumtime * share, path, on_path)
+                    on_path.discard(callee)
+            path.pop()
+
+        roots = [func for func, (_, _, _, _, callers) in raw.items() if not callers]
+        for root in roots:
+            walk(root, raw[root][3], [], {root})
+        return dict(stacks)
+
+    def attribution(self, stats: Optional[pstats.Stats] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Atribusi waktu (detik) ke fase pipeline (cumulative) dan kelas agen (self time)
+        Method BaseAgent yang dipakai bersama dicatat sebagai 'BaseAgent'
+        """
+        if self.sampler:
+            return self.sampler.attribution()
+        stats = stats or self._stats()
+        if stats is None:
+            return {'phases': {}, 'species': {}}
+
+        method_map = _agent_method_map()
+        phase_by_key = {(code.co_filename, code.co_firstlineno, code.co_name): name
+                        for code, name in self.phase_codes.items()}
+        phases: Dict[str, float] = defaultdict(float)
+        species: Dict[str, float] = defaultdict(float)
+        for func, (_, _, tottime, cumtime, _) in stats.stats.items():
+            if func in phase_by_key:
+                phases[phase_by_key[func]] += cumtime
+            if func in method_map:
+                species[method_map[func]] += tottime
+        return {'phases': dict(phases), 'species': dict(species)}
+
+    def write_outputs(self) -> Dict[str, str]:
+        """
+        Tulis .pstats, collapsed-stack, dan atribusi JSON ke output_dir
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"profile_{self._range_label()}")
+        outputs = {}
+
+        if self.sampler:
+            outputs['collapsed'] = base + '.sampled.collapsed.txt'
+            self.sampler.write_collapsed(outputs['collapsed'])
+            attribution = self.sampler.attribution()
+        else:
+            stats = self._stats()
+            if stats is None:
+                print("⚠️  Tidak ada langkah yang terprofil (cek rentang langkah)")
+                return outputs
+            outputs['pstats'] = base + '.pstats'
+            stats.dump_stats(outputs['pstats'])
+
+            outputs['collapsed'] = base + '.collapsed.txt'
+            with open(outputs['collapsed'], 'w', encoding='utf-8') as f:
+                for stack, micros in sorted(self.collapsed_from_pstats(stats).items()):
+                    f.write(f"{stack} {micros}\n")
+            attribution = self.attribution(stats)
+
+        outputs['attribution'] = base + '.attribution.json'
+        with open(outputs['attribution'], 'w', encoding='utf-8') as f:
+            json.dump({'start_step': self.start_step, 'stop_step': self.stop_step,
+                       'profiled_steps': self.profiled_steps, **attribution}, f, indent=2)
+        return outputs
+
+    def print_summary(self):
+        """Tampilkan atribusi waktu per fase dan per spesies"""
+        attribution = self.attribution()
+        print(f"\n🔬 PROFIL {self.profiled_steps} langkah ({self._range_label().replace('_', ' → ')})")
+        print("   Fase pipeline:")
+        for name, seconds in sorted(attribution['phases'].items(), key=lambda kv: -kv[1]):
+            print(f"   • {name:<14} {seconds:8.3f} s")
+        print("   Kelas spesies (self time):")
+        for name, seconds in sorted(attribution['species'].items(), key=lambda kv: -kv[1]):
+            print(f"   • {name:<14} {seconds:8.3f} s")
@@ -0,0 +1,309 @@
+"""
+Replikasi simulasi bercabang dari state yang sudah melewati burn-in
+Burn-in dijalankan sekali, lalu N proses anak di-fork (copy-on-write) dan
+masing-masing melanjutkan simulasi dengan seed berbeda
+"""
+
+import os
+import pickle
+import random
+import copy
+import traceback
+from typing import List, Dict, Any, Callable, Optional, Sequence, Union
+
+Perturbation = Callable[[Any], None]
+
+# Kunci spesies yang dipakai di population_history
+SPECIES_KEYS = ('herbivore', 'elk', 'carnivore')
+
+
+def _species_class(species: str):
+    """
+    Ambil kelas agen untuk kunci spesies di population_history
+    """
+    from agents.base_agent import HerbivoreAgent, CarnivoreAgent, ElkAgent
+
+    classes = {
+        'herbivore': HerbivoreAgent,
+        'elk': ElkAgent,
+        'carnivore': CarnivoreAgent
+    }
+    if species not in classes:
+        raise ValueError(f"Spesies tidak dikenal: {species} (pilihan: {', '.join(SPECIES_KEYS)})")
+    return classes[species]
+
+
+def remove_fraction(species: str, fraction: float) -> Perturbation:
+    """
+    Perturbasi: hapus sebagian populasi satu spesies secara acak
+    Contoh: remove_fraction('carnivore', 0.3) menghapus 30% serigala
+    """
+    if not 0.0 <= fraction <= 1.0:
+        raise ValueError(f"fraction harus di antara 0 dan 1, bukan {fraction}")
+    agent_class = _species_class(species)
+
+    def apply(simulation):
+        members = [a for a in simulation.agents if a.alive and isinstance(a, agent_class)]
+        removed = random.sample(members, int(round(len(members) * fraction)))
+        for agent in removed:
+            agent.die()
+        simulation.agents = [a for a in simulation.agents if a.alive]
+
+    apply.__name__ = f"remove_fraction({species}, {fraction})"
+    return apply
+
+
+def set_carrying_capacity(value: int) -> Perturbation:
+    """
+    Perturbasi: ganti carrying capacity (K) simulasi
+    """
+    def apply(simulation):
+        simulation.carrying_capacity = value
+
+    apply.__name__ = f"set_carrying_capacity({value})"
+    return apply
+
+
+def history_span(history, start: int, stop: Optional[int] = None,
+                 keys: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Seri per langkah HistoryArchive untuk langkah simulasi (start, stop] sebagai
+    array float64 (langkah s = rekaman arsip s - 1). Bagian yang sudah keluar dari
+    jendela resolusi penuh diambil dari query(): nilai bucket diulang untuk setiap
+    langkahnya dan 'resolution' mencatat lebar bucket terkasar (1 = persis);
+    langkah yang sudah hilang dari arsip = NaN
+    """
+    import numpy as np
+
+    stop = history.steps if stop is None else stop
+    span: Dict[str, Any] = {}
+    resolution = 1
+    for key in (history.keys() if keys is None else keys):
+        series = np.full(stop - start, np.nan)
+        data = history.query(key, start, stop)
+        if len(data['step']):
+            values = np.repeat(data['mean'], data['resolution'])
+            first = int(data['step'][0])
+            lower = max(first, start)
+            series[lower - start:] = values[lower - first:lower - first + stop - lower]
+            resolution = max(resolution, int(data['resolution'].max()))
+        span[key] = series
+    span['resolution'] = resolution
+    return span
+
+
+def _run_replicate(simulation, index: int, seed: int, steps: int,
+                   perturbation: Optional[Perturbation]) -> Dict[str, Any]:
+    """
+    Lanjutkan satu replikasi dari state simulasi yang diberikan
+    Hanya langkah setelah percabangan yang dikirim balik (burn-in ada di induk)
+    """
+    start_step = simulation.time_step
+    simulation.reseed(seed)
+    if perturbation is not None:
+        perturbation(simulation)
+
+    simulation.run(steps=steps)
+
+    statistics = simulation.get_statistics()
+    statistics.pop('population_history', None)
+    return {
+        'replicate': index,
+        'seed': seed,
+        'perturbation': getattr(perturbation, '__name__', None) if perturbation else None,
+        'start_step': start_step,
+        'total_steps': simulation.time_step,
+        'statistics': statistics,
+        'history': history_span(simulation.population_history, start_step)
+    }
+
+
+def _child_main(simulation, index: int, seed: int, steps: int,
+                perturbation: Optional[Perturbation], write_fd: int, quiet: bool):
+    """
+    Badan proses anak: jalankan replikasi lalu kirim hasil lewat pipe
+    """
+    if quiet:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, 1)
+        os.close(devnull)
+
+    try:
+        result = _run_replicate(simulation, index, seed, steps, perturbation)
+    except BaseException:
+        result = {'replicate': index, 'seed': seed, 'error': traceback.format_exc()}
+
+    with os.fdopen(write_fd, 'wb') as pipe:
+        pickle.dump(result, pipe, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _collect_child(pid: int, read_fd: int, index: int, seed: int) -> Dict[str, Any]:
+    """
+    Baca hasil satu proses anak lalu tunggu prosesnya selesai
+    """
+    with os.fdopen(read_fd, 'rb') as pipe:
+        payload = pipe.read()
+    _, status = os.waitpid(pid, 0)
+
+    if not payload:
+        return {'replicate': index, 'seed': seed,
+                'error': f"Proses anak {pid} berhenti tanpa hasil (status {status})"}
+    return pickle.loads(payload)
+
+
+def run_forked_replicates(simulation, burn_in_steps: int, n_replicates: int, steps: int,
+                          perturbation: Union[Perturbation, Sequence[Optional[Perturbation]], None] = None,
+                          base_seed: Optional[int] = None, max_workers: Optional[int] = None,
+                          quiet: bool = True) -> List[Dict[str, Any]]:
+    """
+    Jalankan burn-in sekali lalu cabangkan n_replicates replikasi dari state tersebut
+
+    Args:
+        simulation: EcosystemSimulation yang sudah di-setup (setup_species)
+        burn_in_steps: Jumlah langkah burn-in bersama (0 = langsung bercabang)
+        n_replicates: Jumlah replikasi
+        steps: Jumlah langkah lanjutan per replikasi
+        perturbation: Satu callable untuk semua replikasi, atau list per replikasi
+        base_seed: Seed replikasi ke-i adalah base_seed + i
+        max_workers: Maksimum proses anak berjalan bersamaan (default: jumlah CPU)
+        quiet: Buang output print dari proses anak
+
+    Returns:
+        List hasil per replikasi (urut sesuai indeks replikasi)
+    """
+    if n_replicates <= 0:
+        return []
+
+    if perturbation is None or callable(perturbation):
+        perturbations = [perturbation] * n_replicates
+    else:
+        perturbations = list(perturbation)
+        if len(perturbations) != n_replicates:
+            raise ValueError(f"Jumlah perturbasi ({len(perturbations)}) harus sama dengan "
+                             f"n_replicates ({n_replicates})")
+
+    if base_seed is None:
+        base_seed = random.randrange(2 ** 31)
+    seeds = [base_seed + i for i in range(n_replicates)]
+
+    # 1. Burn-in bersama (sekali saja)
+    if burn_in_steps > 0:
+        print(f"🔥 Burn-in {burn_in_steps} langkah sebelum bercabang...")
+        simulation.run(steps=burn_in_steps)
+
+    print(f"🌿 Membuat {n_replicates} replikasi dari langkah {simulation.time_step}")
+
+    # Fallback tanpa fork (mis. Windows): salin state lalu jalankan berurutan
+    if not hasattr(os, 'fork'):
+        print("⚠️  os.fork tidak tersedia, replikasi dijalankan berurutan")
+        return [_run_replicate(copy.deepcopy(simulation), i, seeds[i], steps, perturbations[i])
+                for i in range(n_replicates)]
+
+    max_workers = max(1, max_workers or os.cpu_count() or 1)
+    results: List[Optional[Dict[str, Any]]] = [None] * n_replicates
+
+    # 2. Fork per batch agar jumlah proses anak tidak melebihi max_workers
+    for batch_start in range(0, n_replicates, max_workers):
+        running = []
+        for i in range(batch_start, min(n_replicates, batch_start + max_workers)):
+            read_fd, write_fd = os.pipe()
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                exit_code = 0
+                try:
+                    _child_main(simulation, i, seeds[i], steps, perturbations[i], write_fd, quiet)
+                except BaseException:
+                    exit_code = 1
+                finally:
+                    os._exit(exit_code)
+            os.close(write_fd)
+            running.append((pid, read_fd, i))
+
+        # 3. Kumpulkan hasil batch ini di proses induk
+        for pid, read_fd, i in running:
+            results[i] = _collect_child(pid, read_fd, i, seeds[i])
+
+    failed = [r for r in results if 'error' in r]
+    if failed:
+        print(f"⚠️  {len(failed)} replikasi gagal")
+
+    return results
+
+
+def stack_replicates(results: List[Dict[str, Any]], path: Optional[str] = None,
+                     keys: Sequence[str] = SPECIES_KEYS, burn_in=None,
+                     strict: bool = False) -> Dict[str, Any]:
+    """
+    Susun history replikasi menjadi array (replikasi x langkah) per kunci,
+    disejajarkan menurut langkah absolut mulai dari start_step + 1; langkah tanpa
+    data = NaN (mis. setelah run berhenti karena kepunahan)
+
+    Dengan burn_in (population_history simulasi induk setelah run_forked_replicates),
+    langkah burn-in 1..start_step ditambahkan sekali di depan dan dipakai bersama
+    semua baris. 'resolution' di hasil = lebar bucket terkasar yang dipakai
+    (1 = resolusi penuh); run yang lebih panjang dari history_window memakai
+    bucket agregat HistoryArchive untuk bagian awalnya, atau ValueError jika strict
+
+    Dengan path, array ditulis sebagai <path>/<key>.npy (memmap) sehingga ratusan
+    replikasi tidak perlu dimuat sekaligus; baca lagi dengan load_ensemble(path)
+
+    Returns:
+        dict kunci -> array 2D, ditambah 'steps' (langkah absolut per kolom)
+    """
+    import numpy as np
+
+    valid = [r for r in results if 'error' not in r]
+    if not valid:
+        raise ValueError("Tidak ada replikasi yang berhasil untuk disusun")
+
+    fork = min(result['start_step'] for result in valid)
+    prefix = None
+    if burn_in is not None:
+        prefix = history_span(burn_in, 0, fork, keys)
+    resolution = max([result['history']['resolution'] for result in valid] +
+                     ([prefix['resolution']] if prefix else []))
+    if strict and resolution > 1:
+        raise ValueError(f"History tidak beresolusi penuh (bucket {resolution} langkah); "
+                         f"buat simulasi dengan history_window >= total langkah run")
+
+    first = 1 if prefix else fork + 1
+    last = max(result['total_steps'] for result in valid) + 1
+    steps = np.arange(first, last)
+
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+        np.save(os.path.join(path, 'steps.npy'), steps)
+
+    ensemble: Dict[str, Any] = {'steps': steps, 'resolution': resolution}
+    for key in keys:
+        shape = (len(valid), len(steps))
+        if path is not None:
+            array = np.lib.format.open_memmap(os.path.join(path, f"{key}.npy"), mode='w+',
+                                              dtype=np.float64, shape=shape)
+            array[:] = np.nan
+        else:
+            array = np.full(shape, np.nan)
+        if prefix:
+            array[:, :fork] = prefix[key]
+        for row, result in enumerate(valid):
+            offset = result['start_step'] + 1 - first
+            series = result['history'][key]
+            array[row, offset:offset + len(series)] = series
+        if path is not None:
+            array.flush()
+        ensemble[key] = array
+    return ensemble
+
+
+def load_ensemble(path: str) -> Dict[str, Any]:
+    """
+    Buka ensemble hasil stack_replicates(path=...) sebagai memmap (read-only)
+    """
+    import numpy as np
+
+    ensemble = {}
+    for name in sorted(os.listdir(path)):
+        if name.endswith('.npy'):
+            ensemble[name[:-4]] = np.load(os.path.join(path, name), mmap_mode='r')
+    return ensemble
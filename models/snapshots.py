@@ -0,0 +1,210 @@
+"""
+Perekam snapshot spasial per langkah untuk run headless
+Setiap snapshot berisi raster makanan (float16) dan posisi agen per spesies (int16),
+disimpan per chunk sebagai .npz di satu folder. Frame animasi kemudian digambar
+offline dari file ini (visualization/offline.py) tanpa menjalankan ulang simulasi
+
+Struktur folder:
+    manifest.json       - ukuran grid, spesies, interval langkah
+    chunk_000000.npz    - steps (n,), food (n, width, height), counts (n, spesies),
+                          xs/ys (total agen dalam chunk), stats (n, 3)
+"""
+
+import os
+import json
+from typing import Dict, Any, List
+
+import numpy as np
+
+SPECIES = ('herbivore', 'elk', 'carnivore')
+STATS = ('total_food', 'avg_temperature', 'avg_humidity')
+MANIFEST = 'manifest.json'
+
+# Kunci spesies berdasarkan SpeciesType.value agen
+_SPECIES_INDEX = {'herbivore': 0, 'large_herbivore': 1, 'carnivore': 2}
+
+
+def _snapshot_phase(simulation, phase):
+    """Fase pipeline: simpan snapshot langkah ini jika sesuai interval"""
+    recorder = simulation.snapshots
+    if simulation.time_step % recorder.every == 0:
+        recorder.capture(simulation)
+
+
+class SnapshotRecorder:
+    """
+    Recorder snapshot spasial dengan buffer per chunk
+
+    Contoh:
+        sim.enable_snapshots('runs/snapshots', every=5)
+        sim.run(steps=10_000)
+        sim.disable_snapshots()
+        python -m visualization.offline runs/snapshots --output movie.mp4
+    """
+
+    def __init__(self, path: str, width: int, height: int, every: int = 1, chunk_size: int = 100):
+        if every < 1 or chunk_size < 1:
+            raise ValueError("every dan chunk_size harus >= 1")
+        if max(width, height) > np.iinfo(np.int16).max:
+            raise ValueError("Grid terlalu besar untuk posisi int16")
+        self.path = path
+        self.width = width
+        self.height = height
+        self.every = every
+        self.chunk_size = chunk_size
+
+        self.frames_written = 0
+        self.chunks_written = 0
+        self._reset_buffer()
+
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, MANIFEST), 'w', encoding='utf-8') as f:
+            json.dump({'width': width, 'height': height, 'species': list(SPECIES),
+                       'stats': list(STATS), 'every': every, 'chunk_size': chunk_size}, f)
+
+    def _reset_buffer(self):
+        self._steps: List[int] = []
+        self._food = np.empty((self.chunk_size, self.width, self.height), dtype=np.float16)
+        self._counts: List[np.ndarray] = []
+        self._xs: List[np.ndarray] = []
+        self._ys: List[np.ndarray] = []
+        self._stats: List[List[float]] = []
+
+    # ------------------------------------------------------------------
+    # Penulisan
+    # ------------------------------------------------------------------
+
+    def attach(self, simulation):
+        """Pasang fase snapshot setelah fase statistics"""
+        simulation.snapshots = self
+        if 'snapshots' not in simulation.pipeline:
+            after = 'statistics' if 'statistics' in simulation.pipeline else None
+            simulation.pipeline.register('snapshots', _snapshot_phase, after=after)
+
+    def detach(self, simulation):
+        """Lepas fase snapshot dan tulis sisa buffer"""
+        if 'snapshots' in simulation.pipeline:
+            simulation.pipeline.remove('snapshots')
+        if simulation.snapshots is self:
+            simulation.snapshots = None
+        self.close()
+
+    def capture(self, simulation):
+        """Tambah snapshot dari state simulasi saat ini"""
+        environment = simulation.environment
+        alive = [agent for agent in simulation.agents if agent.alive]
+        n = len(alive)
+        species = np.fromiter((_SPECIES_INDEX[agent.species_type.value] for agent in alive),
+                              dtype=np.int8, count=n)
+        xs = np.fromiter((agent.x for agent in alive), dtype=np.int16, count=n)
+        ys = np.fromiter((agent.y for agent in alive), dtype=np.int16, count=n)
+        # Urutkan per spesies sehingga posisi spesies s = potongan berurutan
+        order = np.argsort(species, kind='stable')
+
+        stats = environment.get_stats()
+        row = len(self._steps)
+        self._steps.append(simulation.time_step)
+        self._food[row] = environment.food
+        self._counts.append(np.bincount(species, minlength=len(SPECIES)))
+        self._xs.append(xs[order])
+        self._ys.append(ys[order])
+        self._stats.append([stats[key] for key in STATS])
+
+        if len(self._steps) == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Tulis snapshot yang masih di buffer sebagai satu chunk"""
+        n = len(self._steps)
+        if n == 0:
+            return
+        name = os.path.join(self.path, f"chunk_{self.chunks_written:06d}.npz")
+        temp = name + '.tmp'
+        with open(temp, 'wb') as f:
+            np.savez(f,
+                     steps=np.array(self._steps, dtype=np.int64),
+                     food=self._food[:n],
+                     counts=np.array(self._counts, dtype=np.int64).reshape(n, len(SPECIES)),
+                     xs=np.concatenate(self._xs), ys=np.concatenate(self._ys),
+                     stats=np.array(self._stats, dtype=np.float64))
+        os.replace(temp, name)
+        self.frames_written += n
+        self.chunks_written += 1
+        self._reset_buffer()
+
+    def close(self):
+        """Tulis sisa buffer (idempoten)"""
+        self.flush()
+
+    def __len__(self) -> int:
+        return self.frames_written + len(self._steps)
+
+
+class SnapshotReader:
+    """
+    Akses acak ke snapshot yang sudah ditulis (chunk dimuat saat dibutuhkan)
+    Setiap frame punya bentuk yang sama dengan build_frame() visualizer real-time
+    ditambah array makanan
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.width = self.manifest['width']
+        self.height = self.manifest['height']
+        self.species = tuple(self.manifest['species'])
+        self.stats_keys = tuple(self.manifest['stats'])
+
+        self.chunks = sorted(name for name in os.listdir(path)
+                             if name.startswith('chunk_') and name.endswith('.npz'))
+        sizes = []
+        for name in self.chunks:
+            with np.load(os.path.join(path, name)) as data:
+                sizes.append(len(data['steps']))
+        self._offsets = np.concatenate(([0], np.cumsum(sizes))).astype(np.int64)
+        self._cache_index = None
+        self._cache: Dict[str, np.ndarray] = {}
+        self._cache_starts = None
+
+    def __len__(self) -> int:
+        return int(self._offsets[-1])
+
+    def _load(self, chunk: int):
+        if self._cache_index == chunk:
+            return
+        with np.load(os.path.join(self.path, self.chunks[chunk])) as data:
+            self._cache = {key: data[key] for key in data.files}
+        counts = self._cache['counts']
+        self._cache_starts = np.concatenate(([0], np.cumsum(counts.sum(axis=1))))
+        self._cache_index = chunk
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        chunk = int(np.searchsorted(self._offsets, index, side='right')) - 1
+        self._load(chunk)
+        row = index - int(self._offsets[chunk])
+        data = self._cache
+
+        start = int(self._cache_starts[row])
+        counts = data['counts'][row]
+        positions = {}
+        for key, count in zip(self.species, counts):
+            stop = start + int(count)
+            positions[key] = (data['xs'][start:stop].astype(np.int32),
+                              data['ys'][start:stop].astype(np.int32))
+            start = stop
+        return {
+            'step': int(data['steps'][row]),
+            'counts': {key: int(count) for key, count in zip(self.species, counts)},
+            'env_stats': dict(zip(self.stats_keys, data['stats'][row].tolist())),
+            'positions': positions,
+            'food': data['food'][row]
+        }
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,200 @@
+"""
+Mode populasi stokastik (tau-leaping harian, non-spasial) di antara mean-field dan agen
+Jumlah individu per spesies dimajukan satu hari per langkah dengan undian binomial
+dari peluang per individu yang sama dengan model agen:
+
+    predasi   - setiap serigala berburu sekali: kelinci/elk/gagal dengan peluang
+                _hunt() (hunt_range, preferensi 70% elk, sukses attempt_hunt)
+    kematian  - mortality_rate + f_lingkungan + kelaparan (herbivora: f_kelaparan
+                bagi yang kurang makan; serigala: setelah starvation_tolerance hari
+                tanpa mangsa)
+    kelahiran - peluang logistik can_reproduce r·(1 - N/K) dikali fraksi individu
+                yang energinya cukup
+
+Makanan tetap berupa rata-rata per sel (deterministik, sama dengan mean-field).
+Berbeda dengan ODE, populasi bisa benar-benar mencapai 0 sehingga risiko
+kepunahan bisa diukur. Replikasi dan set parameter dijalankan bersamaan sebagai
+array NumPy (baris = replikasi), hasilnya berbentuk ensemble yang sama dengan
+integrate_meanfield / stack_replicates
+
+Pemakaian:
+    result = run_tau_leaping(1000, replicates=2000, seed=1)
+    risk = extinction_risk(result)          # fraksi replikasi punah per set
+    python -m models.stochastic --replicates 2000 --steps 1000
+"""
+
+import sys
+import time
+import argparse
+from typing import Dict, Any, Optional, Sequence
+
+import numpy as np
+
+from .meanfield import (SPECIES_KEYS, sample_parameters, _broadcast, _prepare, _environment,
+                        _environment_sets, _forage, _hunt, _parse_range, ENV_BLOCK_ELEMENTS)
+
+
+def run_tau_leaping(steps: int, parameters: Optional[Dict[str, Any]] = None,
+                    replicates: int = 1000, initial: Optional[Dict[str, Any]] = None,
+                    seed: Optional[int] = None, every: int = 1) -> Dict[str, Any]:
+    """
+    Jalankan `replicates` replikasi untuk setiap set parameter sekaligus
+
+    Args:
+        steps: jumlah hari (langkah simulasi)
+        parameters: dict kunci default_parameters() -> nilai atau array (M,)
+        replicates: jumlah replikasi per set parameter
+        initial: populasi/makanan awal per set ('herbivore', 'elk', 'carnivore', 'food')
+        seed: seed numpy Generator
+        every: simpan setiap `every` hari
+
+    Returns:
+        dict seperti integrate_meanfield (array (M*replicates, langkah), baris
+        replikasi set k = k*replicates ... (k+1)*replicates - 1), ditambah 'set'
+        (indeks set per baris), 'replicates', dan 'extinction_step' per spesies
+        (hari pertama populasi 0, -1 = bertahan)
+    """
+    if steps < 0 or replicates < 1 or every < 1:
+        raise ValueError("steps harus >= 0, replicates dan every harus >= 1")
+    rng = np.random.default_rng(seed)
+    p, sets = _broadcast(parameters)
+    initial = initial or {}
+    start = {key: np.broadcast_to(np.asarray(initial.get(key, p[f"{key}.initial_population"])), (sets,))
+             for key in SPECIES_KEYS}
+    start_food = np.broadcast_to(np.asarray(initial.get('food', p['environment.initial_food'])), (sets,))
+
+    # Satu kolom per replikasi: ulangi parameter setiap set
+    index = np.repeat(np.arange(sets), replicates)
+    p = {key: value[index] for key, value in p.items()}
+    c = _prepare(p)
+    count = len(index)
+
+    counts = np.empty((3, count), dtype=np.int64)
+    for row, key in enumerate(SPECIES_KEYS):
+        counts[row] = np.round(start[key][index]).astype(np.int64)
+    food = start_food[index].astype(np.float64)
+
+    recorded = np.arange(0, steps + 1, every)
+    output = np.empty((len(recorded), 3, count), dtype=np.int32)
+    food_output = np.empty((len(recorded), count))
+    output[0] = counts
+    food_output[0] = food
+    extinction = np.where(counts == 0, 0, -1)
+    slot = 1
+
+    unique, inverse = _environment_sets(p)
+    block = max(1, ENV_BLOCK_ELEMENTS // count)
+    for day in range(steps):
+        if day % block == 0:
+            env = _environment(unique, np.arange(day, min(day + block, steps), dtype=np.float64))
+            if inverse is not None:
+                env = {key: value[..., inverse] for key, value in env.items()}
+        i = day % block
+        prey, w = counts[:2], counts[2]
+
+        # Regenerasi makanan lalu forage(); konsumsi dibatasi makanan yang ada
+        food = np.where(food < c['food_ceiling'],
+                        np.minimum(c['food_ceiling'], food + env['regeneration'][i]), food)
+        intake, fed, mortality = _forage(food, c, env, i)
+        eaten = (prey * intake).sum(axis=0) / c['cells']
+        shortage = np.minimum(1.0, food / np.maximum(eaten, 1e-12))
+        fed = fed * shortage
+        food = np.maximum(0.0, food - eaten * shortage)
+
+        # Predasi: hasil perburuan setiap serigala (kelinci, elk, gagal) + batas jumlah mangsa
+        target_h, target_e, kill_h, kill_e = _hunt(prey.astype(np.float64), w.astype(np.float64), c)
+        kills_h = np.minimum(rng.binomial(w, kill_h), prey[0])
+        rest = np.clip(kill_e / np.maximum(1.0 - kill_h, 1e-12), 0.0, 1.0)
+        kills_e = np.minimum(rng.binomial(w - kills_h, rest), prey[1])
+
+        # Kematian herbivora yang lolos dari predasi
+        survivors = prey - np.stack((kills_h, kills_e))
+        survivors -= rng.binomial(survivors, mortality)
+
+        # Serigala: energi dari mangsa yang benar-benar didapat
+        hunters = np.maximum(w, 1)
+        intake_w = c['reward'] * (kills_h + 2.5 * kills_e) / hunters
+        spend_w = c['wolf_metabolic_cost'] + c['wolf_hunting_cost'] * (target_h + 1.5 * target_e)
+        fed_w = np.minimum(intake_w / spend_w, 1.0)
+        starving = np.clip(1.0 - kill_h - kill_e, 0.0, 1.0) ** c['wolf_tolerance']
+        mortality_w = np.minimum(1.0, env['wolf_mortality'][i] + 0.15 * starving)
+        wolves = w - rng.binomial(w, mortality_w)
+
+        # Reproduksi logistik dari jumlah setelah kematian (_process_reproduction)
+        capacity = np.maximum(0.0, 1.0 - survivors * c['prey_inverse_capacity'])
+        counts[:2] = survivors + rng.binomial(survivors, np.clip(c['prey_growth'] * capacity * fed, 0.0, 1.0))
+        capacity_w = np.maximum(0.0, 1.0 - wolves * c['wolf_inverse_capacity'])
+        counts[2] = wolves + rng.binomial(wolves, np.clip(c['wolf_growth'] * capacity_w * fed_w, 0.0, 1.0))
+
+        extinction[(extinction < 0) & (counts == 0)] = day + 1
+        if (day + 1) % every == 0:
+            output[slot] = counts
+            food_output[slot] = food
+            slot += 1
+
+    result = {'steps': recorded, 'parameters': p, 'set': index, 'replicates': replicates}
+    for row, key in enumerate(SPECIES_KEYS):
+        result[key] = output[:, row].T
+    result['extinction_step'] = dict(zip(SPECIES_KEYS, extinction))
+    result['total_food'] = food_output.T * c['cells'][:, None]
+    result['avg_temperature'] = (p['environment.base_temperature'][:, None]
+                                 + p['environment.seasonal_amplitude'][:, None]
+                                 * np.sin(p['environment.seasonal_frequency'][:, None] * recorded))
+    return result
+
+
+def extinction_risk(result: Dict[str, Any], step: Optional[int] = None,
+                    species: Sequence[str] = SPECIES_KEYS) -> Dict[str, np.ndarray]:
+    """
+    Fraksi replikasi per set parameter yang spesiesnya punah sampai hari `step`
+    (default: akhir run); 'any' = minimal satu spesies punah
+
+    Returns:
+        dict spesies -> array (M,)
+    """
+    step = int(result['steps'][-1]) if step is None else step
+    sets = result['set'].max() + 1
+    risk = {}
+    extinct_any = np.zeros(len(result['set']), dtype=bool)
+    for key in species:
+        first = result['extinction_step'][key]
+        extinct = (first >= 0) & (first <= step)
+        extinct_any |= extinct
+        risk[key] = np.bincount(result['set'], weights=extinct, minlength=sets) / result['replicates']
+    risk['any'] = np.bincount(result['set'], weights=extinct_any, minlength=sets) / result['replicates']
+    return risk
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Risiko kepunahan dengan model tau-leaping stokastik")
+    parser.add_argument('--sets', type=int, default=1, help="Jumlah set parameter")
+    parser.add_argument('--replicates', type=int, default=1000, help="Replikasi per set")
+    parser.add_argument('--steps', type=int, default=1000, help="Jumlah hari")
+    parser.add_argument('--vary', action='append', default=[], metavar='KUNCI=LOW:HIGH',
+                        help="Parameter yang diacak uniform, mis. carnivore.predation_rate=0.1:0.4")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    try:
+        ranges = dict(_parse_range(text) for text in args.vary)
+        parameters = sample_parameters(args.sets, ranges, seed=args.seed)
+    except (KeyError, ValueError) as error:
+        parser.error(str(error))
+
+    began = time.perf_counter()
+    result = run_tau_leaping(args.steps, parameters, replicates=args.replicates, seed=args.seed)
+    elapsed = time.perf_counter() - began
+    runs = args.sets * args.replicates
+    risk = extinction_risk(result)
+
+    print(f"🎲 {runs} replikasi x {args.steps} hari dalam {elapsed:.2f} detik "
+          f"({runs / elapsed:.0f} replikasi/detik)")
+    for key in SPECIES_KEYS + ('any',):
+        values = risk[key]
+        print(f"   Risiko punah {key}: rata-rata {values.mean():.1%} "
+              f"(min {values.min():.1%}, maks {values.max():.1%} per set)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,406 @@
+"""
+Mode update sinkron (double-buffered) untuk agen objek
+Pada mode default agen di-update in-place sesuai urutan daftar: agen awal makan
+dan memangsa lebih dulu sehingga hasil bias urutan dan harus serial. Pada mode
+sinkron setiap langkah dibagi dua fase pipeline:
+
+    agents  (intensi) - semua agen membaca state beku awal fase (posisi, energi,
+                        makanan sel) dan menulis intensi ke buffer: usia/energi
+                        metabolik, sel tujuan (find_optimal_positions /
+                        flee_positions), target dan hasil undian berburu,
+                        kematian kelaparan serigala. Tidak ada objek atau array
+                        lingkungan yang diubah, jadi setiap perhitungan per agen
+                        bisa divektorisasi/diparalelkan
+    resolve (konflik) - intensi yang bertabrakan diselesaikan lalu di-commit ke
+                        objek agen dan environment.food:
+                          berburu - mangsa yang diburu sukses oleh >1 serigala
+                          makan   - beberapa herbivora di sel yang sama
+                        mangsa yang mati dimangsa tidak ikut makan; mortalitas
+                        dihitung dari energi setelah makan di sel tujuan
+
+Mode konflik:
+    random - urutan acak per langkah: satu pemenang acak per mangsa (serigala
+             lain dihitung gagal), makan berurutan acak per sel (forage_batch)
+    share  - pembagian rata: energi mangsa dibagi ke semua serigala yang sukses,
+             makanan sel dibagi proporsional terhadap permintaan jika tidak cukup
+
+Rumus per agen sama dengan method di base_agent.py; semua undian memakai
+numpy Generator milik mode ini (diturunkan dari modul random, ikut reseed)
+
+Pemakaian:
+    sim.enable_synchronous(conflicts='share')
+    sim.run(steps=1000)
+    print(sim.synchronous.conflicts)
+"""
+
+import random
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+CONFLICT_MODES = ('random', 'share')
+
+# Kode spesies array state beku (urutan = MOVEMENT_WEIGHTS)
+HERBIVORE, ELK, CARNIVORE = 0, 1, 2
+SPECIES_NAMES = ('herbivore', 'elk', 'carnivore')
+_SPECIES_CODE = {'herbivore': HERBIVORE, 'large_herbivore': ELK, 'carnivore': CARNIVORE}
+
+# Konstanta attempt_hunt / update serigala (base_agent.py): per kode mangsa
+HUNT_SUCCESS = {HERBIVORE: 0.4, ELK: 0.25}
+HUNT_REWARD = {HERBIVORE: 1.0, ELK: 2.5}
+HUNT_COST = {HERBIVORE: 1.0, ELK: 1.5}
+PACK_BONUS = {HERBIVORE: (0.3, 1.8), ELK: (0.5, 2.5)}   # (per serigala, maksimum)
+MAX_HUNT_SUCCESS = 0.9
+HUNT_MIN_ENERGY = 20
+ELK_PREFERENCE = 0.7
+
+# Atribut per agen yang dibekukan (default untuk spesies yang tidak memilikinya)
+FROZEN_ATTRIBUTES = {
+    'mobility': 0, 'metabolic_cost': 0.0, 'mortality_rate': 0.0, 'max_age': 0,
+    'min_temp': 0.0, 'max_temp': 0.0, 'min_humidity': 0.0, 'max_humidity': 0.0,
+    'consumption_rate': 0.0, 'foraging_efficiency': 0.0, 'defense_strength': 0.0,
+    'hunt_range': 0, 'predation_rate': 0.0, 'conversion_efficiency': 0.0,
+    'energy_per_kill': 0.0, 'hunting_cost': 0.0, 'starvation_tolerance': 0,
+    'days_without_kill': 0
+}
+TOLERANCE = ('min_temp', 'max_temp', 'min_humidity', 'max_humidity')
+
+
+def _intention_phase(simulation, phase):
+    """Fase pipeline 'agents' mode sinkron: hitung intensi dari state beku"""
+    update = simulation.synchronous
+    update.plan(simulation.agents, simulation.environment)
+    frozen = update.frozen
+    count = len(frozen['agents'])
+    window = 2 * frozen['mobility'] + 1
+    phase.count('agents_processed', count)
+    phase.count('cells_touched', int((window * window + 1).sum()) if count else 0)
+    phase.count('queries_issued', int((frozen['species'] != HERBIVORE).sum()) if count else 0)
+
+
+def _resolve_phase(simulation, phase):
+    """Fase pipeline 'resolve': selesaikan konflik intensi lalu commit ke agen/lingkungan"""
+    update = simulation.synchronous
+    phase.count('agents_processed', len(update.frozen['agents']) if update.frozen else 0)
+    update.resolve(simulation.environment)
+
+
+def _within(xs: np.ndarray, ys: np.ndarray, px: np.ndarray, py: np.ndarray,
+            radius: int, block: int = 65536) -> np.ndarray:
+    """Titik (xs, ys) yang punya titik (px, py) dalam radius Manhattan"""
+    near = np.zeros(len(xs), dtype=bool)
+    if len(px) == 0:
+        return near
+    for start in range(0, len(xs), block):
+        stop = start + block
+        distance = (np.abs(xs[start:stop, None] - px[None, :]) +
+                    np.abs(ys[start:stop, None] - py[None, :]))
+        near[start:stop] = (distance <= radius).any(axis=1)
+    return near
+
+
+def _groups(frozen: Dict[str, np.ndarray], members: np.ndarray) -> List[Tuple[np.ndarray, int, tuple]]:
+    """Bagi agen per (mobilitas, toleransi) agar kernel dipanggil dengan parameter skalar"""
+    if len(members) == 0:
+        return []
+    keys = np.stack([frozen['mobility'][members]] + [frozen[name][members] for name in TOLERANCE], axis=1)
+    unique, inverse = np.unique(keys, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    return [(members[inverse == row], int(key[0]), tuple(float(value) for value in key[1:]))
+            for row, key in enumerate(unique)]
+
+
+class SynchronousUpdate:
+    """
+    Update agen dua fase (intensi → resolve) dengan state beku per langkah
+
+    Contoh:
+        update = SynchronousUpdate(conflicts='random')
+        update.attach(sim)
+    """
+
+    def __init__(self, conflicts: str = 'random', seed: Optional[int] = None):
+        if conflicts not in CONFLICT_MODES:
+            raise ValueError(f"Mode konflik tidak dikenal: {conflicts} (pilih {', '.join(CONFLICT_MODES)})")
+        self.conflicts_mode = conflicts
+        self.rng = np.random.default_rng(random.getrandbits(64) if seed is None else seed)
+        self.frozen: Optional[Dict[str, Any]] = None
+        self.intentions: Optional[Dict[str, Any]] = None
+        self.conflicts = {'food_cells': 0, 'hunt_targets': 0, 'hunters_lost': 0}
+        self._original_agents = None
+
+    def reseed(self, seed: int):
+        """Set ulang generator acak mode sinkron"""
+        self.rng = np.random.default_rng(seed)
+
+    # --- siklus hidup ----------------------------------------------------------
+
+    def attach(self, simulation):
+        """Ganti fase agents dengan fase intensi dan daftarkan fase resolve setelahnya"""
+        if simulation.cohorts or simulation.engine is not None or simulation.domain is not None:
+            raise ValueError("Mode sinkron belum mendukung kohort, engine adaptif, atau dekomposisi domain")
+        simulation.synchronous = self
+        self._original_agents = simulation.pipeline.get('agents').func
+        simulation.pipeline.replace('agents', _intention_phase)
+        if 'resolve' not in simulation.pipeline:
+            simulation.pipeline.register('resolve', _resolve_phase, after='agents')
+        print(f"🔁 Mode sinkron: intensi dari state beku, konflik '{self.conflicts_mode}'")
+
+    def detach(self, simulation):
+        """Kembali ke update in-place berurutan"""
+        if 'resolve' in simulation.pipeline:
+            simulation.pipeline.remove('resolve')
+        if self._original_agents is not None:
+            simulation.pipeline.replace('agents', self._original_agents)
+            self._original_agents = None
+        if simulation.synchronous is self:
+            simulation.synchronous = None
+
+    # --- fase intensi ------------------------------------------------------------
+
+    def _freeze(self, agents: List[Any]) -> Dict[str, Any]:
+        """Salin state agen hidup ke array (buffer depan, hanya dibaca fase intensi)"""
+        alive = [agent for agent in agents if agent.alive]
+        count = len(alive)
+        frozen: Dict[str, Any] = {'agents': alive}
+        frozen['species'] = np.fromiter((_SPECIES_CODE[agent.species_type.value] for agent in alive),
+                                        dtype=np.int8, count=count)
+        for name in ('x', 'y', 'age'):
+            frozen[name] = np.fromiter((getattr(agent, name) for agent in alive), dtype=np.int64, count=count)
+        frozen['energy'] = np.fromiter((agent.energy for agent in alive), dtype=np.float64, count=count)
+        for name, default in FROZEN_ATTRIBUTES.items():
+            dtype = np.int64 if isinstance(default, int) else np.float64
+            frozen[name] = np.fromiter((getattr(agent, name, default) for agent in alive),
+                                       dtype=dtype, count=count)
+        return frozen
+
+    def plan(self, agents: List[Any], environment):
+        """
+        Hitung intensi semua agen dari state beku (objek dan lingkungan tidak diubah)
+        """
+        from agents.kernels import (find_optimal_positions, flee_positions, GridIndex,
+                                    PREDATOR_DETECTION_RADIUS, PACK_RADIUS)
+
+        frozen = self.frozen = self._freeze(agents)
+        count = len(frozen['agents'])
+        width, height = environment.width, environment.height
+        species = frozen['species']
+        x, y = frozen['x'], frozen['y']
+        rng = self.rng
+
+        # 1. age_one_step
+        energy = np.maximum(0.0, frozen['energy'] - frozen['metabolic_cost'])
+        intent = {'x': x.copy(), 'y': y.copy(), 'age': frozen['age'] + 1, 'energy': energy,
+                  'starved': np.zeros(count, dtype=bool),
+                  'hunter': np.empty(0, dtype=np.int64), 'target': np.empty(0, dtype=np.int64),
+                  'success': np.empty(0, dtype=bool)}
+        self.intentions = intent
+        if count == 0:
+            return
+
+        wolves = np.flatnonzero(species == CARNIVORE)
+        prey_mask = species != CARNIVORE
+
+        # 2. Serigala: mati kelaparan jika melewati toleransi
+        days = frozen['days_without_kill'][wolves]
+        over = days - frozen['starvation_tolerance'][wolves]
+        starved = (over > 0) & (rng.random(len(wolves)) < 0.1 * over)
+        intent['starved'][wolves[starved]] = True
+        wolves = wolves[~starved]
+
+        # 3. Herbivora dan elk: lari dari serigala (posisi beku) atau cari sel terbaik
+        movers = np.flatnonzero(prey_mask)
+        elk = movers[species[movers] == ELK]
+        fleeing = elk[_within(x[elk], y[elk], x[species == CARNIVORE], y[species == CARNIVORE],
+                              PREDATOR_DETECTION_RADIUS)]
+        if len(fleeing):
+            px, py = x[species == CARNIVORE], y[species == CARNIVORE]
+            for members, mobility, _ in _groups(frozen, fleeing):
+                intent['x'][members], intent['y'][members] = flee_positions(
+                    x[members], y[members], mobility, px, py, width, height)
+        foragers = np.setdiff1d(movers, fleeing, assume_unique=True)
+
+        # 4. Serigala: pilih target dari mangsa beku dalam hunt_range, undi hasil berburu
+        prey_index = GridIndex(x, y, prey_mask, width, height)
+        pack_index = GridIndex(x, y, species == CARNIVORE, width, height)
+        prefer, pick, draw = rng.random(len(wolves)), rng.random(len(wolves)), rng.random(len(wolves))
+        hunters, targets, packs = [], [], []
+        searching = []
+        for i, wolf in enumerate(wolves.tolist()):
+            candidates = prey_index.query(int(x[wolf]), int(y[wolf]), int(frozen['hunt_range'][wolf]))
+            if len(candidates) == 0 or energy[wolf] <= HUNT_MIN_ENERGY:
+                searching.append(wolf)
+                continue
+            elk_prey = candidates[species[candidates] == ELK]
+            rabbit_prey = candidates[species[candidates] == HERBIVORE]
+            if len(elk_prey) and prefer[i] < ELK_PREFERENCE:
+                chosen = elk_prey
+            elif len(rabbit_prey):
+                chosen = rabbit_prey
+            else:
+                chosen = elk_prey
+            hunters.append(i)
+            targets.append(int(chosen[min(int(pick[i] * len(chosen)), len(chosen) - 1)]))
+            packs.append(pack_index.count(int(x[wolf]), int(y[wolf]), PACK_RADIUS, exclude=wolf))
+
+        if hunters:
+            rows = np.asarray(hunters, dtype=np.int64)
+            hunter = wolves[rows]
+            target = np.asarray(targets, dtype=np.int64)
+            pack = np.asarray(packs, dtype=np.float64)
+            is_elk = species[target] == ELK
+            base = np.where(is_elk, HUNT_SUCCESS[ELK], HUNT_SUCCESS[HERBIVORE])
+            defense = frozen['defense_strength'][target] * np.minimum(1.5, frozen['energy'][target] / 100.0)
+            base = np.where(is_elk, base * (1.0 - defense), base)
+            predator_condition = np.minimum(1.5, energy[hunter] / 80.0)
+            prey_condition = np.maximum(0.3, 1.0 - frozen['energy'][target] / 100.0)
+            per_wolf = np.where(is_elk, PACK_BONUS[ELK][0], PACK_BONUS[HERBIVORE][0])
+            ceiling = np.where(is_elk, PACK_BONUS[ELK][1], PACK_BONUS[HERBIVORE][1])
+            pack_bonus = np.where(pack > 0, np.minimum(ceiling, 1.0 + pack * per_wolf), 1.0)
+            success = np.minimum(MAX_HUNT_SUCCESS, base * predator_condition * prey_condition
+                                 * frozen['predation_rate'][hunter] * pack_bonus)
+            cost = frozen['hunting_cost'][hunter] * np.where(is_elk, HUNT_COST[ELK], HUNT_COST[HERBIVORE])
+            energy[hunter] = np.maximum(0.0, energy[hunter] - cost)
+            intent['hunter'], intent['target'] = hunter, target
+            intent['success'] = draw[rows] < success
+
+        # 5. Gerak herbivora dan serigala yang tidak berburu (makanan beku)
+        searching = np.asarray(searching, dtype=np.int64)
+        for members_all in (foragers, searching):
+            for code in (HERBIVORE, ELK, CARNIVORE):
+                selected = members_all[species[members_all] == code]
+                for members, mobility, tolerance in _groups(frozen, selected):
+                    intent['x'][members], intent['y'][members] = find_optimal_positions(
+                        environment.food, environment.temperature, environment.humidity,
+                        x[members], y[members], mobility, SPECIES_NAMES[code], tolerance)
+
+    # --- fase resolve --------------------------------------------------------------
+
+    def resolve(self, environment):
+        """
+        Selesaikan konflik berburu dan makan, undi mortalitas, lalu commit intensi
+        ke objek agen dan environment.food (buffer belakang → depan)
+        """
+        from agents.kernels import forage_batch, mortality_probabilities, FORAGE_FACTORS
+
+        frozen, intent = self.frozen, self.intentions
+        self.conflicts = {'food_cells': 0, 'hunt_targets': 0, 'hunters_lost': 0}
+        if frozen is None or len(frozen['agents']) == 0:
+            return
+        rng = self.rng
+        species = frozen['species']
+        count = len(species)
+        x, y, energy = intent['x'], intent['y'], intent['energy']
+        days = frozen['days_without_kill'].copy()
+        kills = np.zeros(count, dtype=np.int64)
+        killed = np.zeros(count, dtype=bool)
+
+        # 1. Berburu: satu mangsa hanya bisa mati sekali
+        hunter, target, success = intent['hunter'], intent['target'], intent['success']
+        if len(hunter):
+            winners = np.flatnonzero(success)
+            share = np.ones(len(hunter))
+            if len(winners):
+                unique, inverse, claims = np.unique(target[winners], return_inverse=True, return_counts=True)
+                inverse = inverse.ravel()
+                self.conflicts['hunt_targets'] = int((claims > 1).sum())
+                if self.conflicts_mode == 'random':
+                    # Pemenang = undian terkecil per mangsa, sisanya dihitung gagal
+                    key = rng.random(len(winners))
+                    order = np.lexsort((key, inverse))
+                    first = np.r_[True, inverse[order][1:] != inverse[order][:-1]]
+                    keep = np.zeros(len(winners), dtype=bool)
+                    keep[order[first]] = True
+                    self.conflicts['hunters_lost'] = int((~keep).sum())
+                    success = success.copy()
+                    success[winners[~keep]] = False
+                else:
+                    share[winners] = 1.0 / claims[inverse]
+            won = success
+            is_elk = species[target] == ELK
+            reward = (frozen['energy_per_kill'][hunter] * np.where(is_elk, HUNT_REWARD[ELK], HUNT_REWARD[HERBIVORE])
+                      * frozen['conversion_efficiency'][hunter] * share)
+            energy[hunter[won]] += reward[won]
+            days[hunter[won]] = 0
+            kills[hunter[won]] += 1
+            killed[target[won]] = True
+
+            lost = hunter[~won]
+            days[lost] += 1
+            # Serigala yang gagal mendekat ke posisi (beku) target jika terjangkau
+            lost_target = target[~won]
+            reach = frozen['mobility'][lost]
+            close = ((np.abs(frozen['x'][lost_target] - frozen['x'][lost]) <= reach) &
+                     (np.abs(frozen['y'][lost_target] - frozen['y'][lost]) <= reach))
+            x[lost[close]] = np.clip(frozen['x'][lost_target[close]], 0, environment.width - 1)
+            y[lost[close]] = np.clip(frozen['y'][lost_target[close]], 0, environment.height - 1)
+
+        # 2. Makan: herbivora hidup di sel tujuan, makanan dibaca dari buffer beku
+        eaters = np.flatnonzero((species != CARNIVORE) & ~killed)
+        food = environment.food.copy()
+        if len(eaters):
+            ex, ey = x[eaters], y[eaters]
+            tolerance = tuple(frozen[name][eaters] for name in TOLERANCE)
+            good = np.where(species[eaters] == ELK, FORAGE_FACTORS['elk'][0], FORAGE_FACTORS['herbivore'][0])
+            bad = np.where(species[eaters] == ELK, FORAGE_FACTORS['elk'][1], FORAGE_FACTORS['herbivore'][1])
+            cells = ex * environment.height + ey
+            unique, crowd = np.unique(cells, return_counts=True)
+            self.conflicts['food_cells'] = int((crowd > 1).sum())
+            if self.conflicts_mode == 'random':
+                order = rng.permutation(len(eaters))
+                eaten = np.empty(len(eaters))
+                eaten[order] = forage_batch(food, environment.temperature, environment.humidity,
+                                            ex[order], ey[order], frozen['consumption_rate'][eaters][order],
+                                            frozen['foraging_efficiency'][eaters][order], good[order],
+                                            bad[order], tuple(part[order] for part in tolerance))
+            else:
+                available = food[ex, ey]
+                min_temp, max_temp, min_humidity, max_humidity = tolerance
+                temperature, humidity = environment.temperature[ex, ey], environment.humidity[ex, ey]
+                suitable = ((min_temp <= temperature) & (temperature <= max_temp) &
+                            (min_humidity <= humidity) & (humidity <= max_humidity))
+                claim = (np.minimum(frozen['consumption_rate'][eaters], available)
+                         * frozen['foraging_efficiency'][eaters] * np.where(suitable, good, bad))
+                claim = np.where(available <= 0, 0.0, np.minimum(claim, available))
+                slot = np.searchsorted(unique, cells)
+                demand = np.bincount(slot, weights=claim, minlength=len(unique))
+                supply = food.reshape(-1)[unique]
+                scale = np.where(demand > supply, supply / np.maximum(demand, 1e-300), 1.0)
+                eaten = claim * scale[slot]
+                food.reshape(-1)[unique] = np.maximum(0.0, supply - demand * scale)
+            energy[eaters] += eaten
+
+        # 3. Mortalitas dengan energi setelah makan dan kondisi sel tujuan
+        living = np.flatnonzero(~killed & ~intent['starved'])
+        probability = mortality_probabilities(
+            energy[living], intent['age'][living], frozen['max_age'][living],
+            frozen['mortality_rate'][living], environment.temperature[x[living], y[living]],
+            environment.humidity[x[living], y[living]],
+            tuple(frozen[name][living] for name in TOLERANCE))
+        over = days[living] - frozen['starvation_tolerance'][living]
+        probability = probability + np.where((species[living] == CARNIVORE) & (over > 0), 0.05 * over, 0.0)
+        died = np.zeros(count, dtype=bool)
+        died[living] = rng.random(len(living)) < probability
+
+        # 4. Commit: buffer intensi → objek agen dan lingkungan
+        environment.food[:] = food
+        for i, agent in enumerate(frozen['agents']):
+            agent.age = int(intent['age'][i])
+            agent.energy = float(energy[i])
+            if killed[i]:
+                agent.die('predation')
+                continue
+            if intent['starved'][i]:
+                agent.die()
+                continue
+            agent.x, agent.y = int(x[i]), int(y[i])
+            if species[i] == CARNIVORE:
+                agent.days_without_kill = int(days[i])
+                agent.total_kills += int(kills[i])
+            if died[i]:
+                agent.die()
+        self.frozen = self.intentions = None
+
+    def summary(self) -> Dict[str, Any]:
+        """Mode konflik dan jumlah konflik langkah terakhir"""
+        return {'conflicts': self.conflicts_mode, **self.conflicts}
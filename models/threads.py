@@ -0,0 +1,165 @@
+"""
+Eksekusi langkah paralel berbasis thread untuk CPython free-threaded (3.13t, PEP 703)
+Semua thread berbagi array NumPy simulasi yang sama, tanpa pickling/shared memory
+
+Bagian langkah yang independen dijalankan di ThreadPoolExecutor:
+    environment - update musiman + regenerasi makanan per blok baris grid. Setiap
+                  blok punya Generator sendiri (seed diambil dari environment.rng
+                  sekali per langkah) dan menulis ke buffer belakang; setelah semua
+                  blok selesai, buffer belakang di-commit ke array depan sehingga
+                  GridCell/agen tidak pernah melihat grid setengah ter-update
+    cohorts     - skor gerak (find_optimal_positions) dan peluang mortalitas per
+                  potongan sel/kohort setiap spesies; tahap forage (menulis
+                  makanan) dan undian binomial dari Generator populasi tetap
+                  berurutan, jadi hasil kohort identik dengan jalur serial
+Loop agen objek tetap serial (undian modul random bergantung urutan agen)
+
+Hasil tidak bergantung jumlah thread karena ukuran blok/potongan tetap. Stream
+acak lingkungan berbeda dari Environment.update (satu Generator per blok).
+Pada build dengan GIL, attach() mendeteksinya dan tetap memakai jalur serial;
+force=True menjalankan jalur thread tetap (mis. untuk uji kesetaraan)
+
+Pemakaian:
+    sim.enable_threads(workers=8)
+    sim.run(steps=1000)
+    python -m benchmarks.threads --workers 1 2 4 8
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+# Baris grid per blok update lingkungan
+DEFAULT_ROW_BLOCK = 32
+
+# Array lingkungan yang ditulis update_region (water tidak berubah)
+BUFFERED_FIELDS = ('temperature', 'humidity', 'food')
+
+
+def free_threading() -> bool:
+    """True jika interpreter berjalan tanpa GIL (build free-threaded, GIL tidak diaktifkan ulang)"""
+    is_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_enabled is not None and not is_enabled()
+
+
+def _threaded_environment_phase(simulation, phase):
+    """Fase pipeline: update lingkungan per blok baris di thread pool"""
+    simulation.threads.update_environment(simulation.environment)
+    phase.count('cells_touched', simulation.width * simulation.height)
+
+
+THREADED_PHASES = {
+    'environment': _threaded_environment_phase
+}
+
+
+class ThreadedStep:
+    """
+    Thread pool untuk fase environment (diganti) dan cohorts (_cohort_phase
+    memakai map() selama mode aktif)
+
+    Contoh:
+        threads = ThreadedStep(workers=8)
+        threads.attach(sim)          # tanpa efek pada build dengan GIL
+        ...
+        threads.detach(sim)
+    """
+
+    def __init__(self, workers: Optional[int] = None, row_block: int = DEFAULT_ROW_BLOCK,
+                 force: bool = False):
+        if row_block < 1:
+            raise ValueError("row_block harus >= 1")
+        self.workers = workers or os.cpu_count() or 1
+        self.row_block = row_block
+        self.force = force
+        self.active = False
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._back: Dict[str, np.ndarray] = {}
+        self._original_phases: Dict[str, Any] = {}
+
+    def attach(self, simulation) -> bool:
+        """
+        Ganti fase environment dengan versi thread dan aktifkan map() untuk kohort
+        Kembalikan False (jalur serial tetap dipakai) jika GIL aktif dan force=False
+        """
+        if simulation.domain is not None:
+            raise ValueError("Mode thread tidak bisa digabung dengan dekomposisi domain")
+        simulation.threads = self
+        if not (free_threading() or self.force):
+            print("🔒 GIL aktif: mode thread tidak memberi speedup, jalur serial tetap dipakai")
+            return False
+
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='step')
+        for name, func in THREADED_PHASES.items():
+            if name in simulation.pipeline:
+                self._original_phases[name] = simulation.pipeline.get(name).func
+                simulation.pipeline.replace(name, func)
+        self.active = True
+        mode = 'free-threaded' if free_threading() else 'GIL (force)'
+        print(f"🧵 Mode thread: {self.workers} thread, blok {self.row_block} baris ({mode})")
+        return True
+
+    def detach(self, simulation):
+        """Kembalikan fase serial dan hentikan thread pool"""
+        for name, func in self._original_phases.items():
+            if name in simulation.pipeline:
+                simulation.pipeline.replace(name, func)
+        self._original_phases = {}
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        self._back = {}
+        self.active = False
+        if simulation.threads is self:
+            simulation.threads = None
+
+    def map(self, func, items: List[Any]) -> List[Any]:
+        """Jalankan func untuk setiap item di thread pool (urutan hasil = urutan item)"""
+        if self._pool is None or len(items) < 2:
+            return [func(item) for item in items]
+        return list(self._pool.map(func, items))
+
+    def _buffers(self, environment) -> Dict[str, np.ndarray]:
+        """Buffer belakang seukuran grid, dibuat sekali dan dipakai ulang"""
+        shape = (environment.width, environment.height)
+        if not self._back or self._back['food'].shape != shape:
+            self._back = {name: np.empty(shape) for name in BUFFERED_FIELDS}
+        return self._back
+
+    def update_environment(self, environment):
+        """
+        Environment.update dengan blok baris paralel: baca array depan, tulis buffer
+        belakang, lalu commit ke array depan setelah semua blok selesai
+        """
+        from .environment import update_region
+
+        environment.time_step += 1
+        step = environment.time_step
+        seed = int(environment.rng.integers(2 ** 63))
+        back = self._buffers(environment)
+        blocks = [(index, start, min(start + self.row_block, environment.width))
+                  for index, start in enumerate(range(0, environment.width, self.row_block))]
+
+        def compute(block):
+            index, x0, x1 = block
+            rows = slice(x0, x1)
+            back['food'][rows] = environment.food[rows]
+            update_region(step, np.random.default_rng([seed, index]), back['temperature'][rows],
+                          back['humidity'][rows], back['food'][rows],
+                          environment.base_temperature, environment.base_humidity)
+
+        def commit(block):
+            _, x0, x1 = block
+            for name in BUFFERED_FIELDS:
+                getattr(environment, name)[x0:x1] = back[name][x0:x1]
+
+        self.map(compute, blocks)
+        self.map(commit, blocks)
+
+    def summary(self) -> Dict[str, Any]:
+        """Status mode thread"""
+        return {'active': self.active, 'workers': self.workers, 'row_block': self.row_block,
+                'free_threading': free_threading(), 'phases': list(self._original_phases)}
@@ -0,0 +1,208 @@
+"""
+Perekam time-series streaming dengan memori terbatas
+Setiap langkah satu baris (populasi per spesies, total makanan, rata-rata suhu dan
+kelembaban, kelahiran, kematian, dan mangsa yang dibunuh) ditulis ke file kolumnar
+bertahap di disk. Hanya jendela terbaru berukuran tetap yang disimpan di RAM
+
+Format:
+    'npy' - folder berisi chunk_000000.npy, chunk_000001.npy, ... (array float64
+            baris x kolom) dan columns.json. Chunk ditulis atomik (file sementara
+            lalu os.replace) sehingga pembaca tidak pernah melihat chunk setengah jadi
+    'csv' - satu file CSV dengan header; baris di-buffer dan di-flush per chunk
+
+File bisa dibaca dengan read_timeseries() selama simulasi masih berjalan
+"""
+
+import os
+import csv
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+
+SPECIES = ('herbivore', 'elk', 'carnivore')
+
+COLUMNS = (
+    ('step',) + SPECIES +
+    ('total_food', 'avg_temperature', 'avg_humidity') +
+    tuple(f"births_{s}" for s in SPECIES) +
+    tuple(f"deaths_{s}" for s in SPECIES) +
+    tuple(f"kills_{s}" for s in SPECIES)
+)
+
+MANIFEST = 'columns.json'
+
+
+def build_row(simulation) -> List[float]:
+    """
+    Susun satu baris dari statistik langkah terakhir simulasi
+    """
+    record = simulation.latest_record
+    events = simulation.step_events
+    row = [simulation.time_step]
+    row.extend(record[s] for s in SPECIES)
+    row.extend((record['total_food'], record['avg_temperature'], record['avg_humidity']))
+    for kind in ('births', 'deaths', 'kills'):
+        row.extend(events[kind][s] for s in SPECIES)
+    return row
+
+
+def _recorder_phase(simulation, phase):
+    """Fase pipeline: tulis baris langkah ini ke recorder simulasi"""
+    simulation.recorder.append(build_row(simulation))
+
+
+class TimeSeriesRecorder:
+    """
+    Recorder baris per langkah dengan chunk di disk dan ring buffer di RAM
+
+    Contoh:
+        recorder = sim.enable_recorder('runs/timeseries', fmt='npy', window=1000)
+        sim.run(steps=1_000_000)
+        sim.disable_recorder()
+        data = read_timeseries('runs/timeseries')
+    """
+
+    def __init__(self, path: str, fmt: str = 'npy', chunk_size: int = 1000,
+                 window: int = 1000, columns=COLUMNS):
+        if fmt not in ('npy', 'csv'):
+            raise ValueError(f"Format tidak dikenal: {fmt} (pilih 'npy' atau 'csv')")
+        if chunk_size < 1 or window < 1:
+            raise ValueError("chunk_size dan window harus >= 1")
+
+        self.path = path
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.window = window
+        self.columns = tuple(columns)
+
+        # Buffer chunk yang belum ditulis
+        self._pending = np.empty((chunk_size, len(self.columns)), dtype=np.float64)
+        self._pending_rows = 0
+
+        # Ring buffer jendela terbaru
+        self._ring = np.empty((window, len(self.columns)), dtype=np.float64)
+        self._ring_start = 0
+        self._ring_rows = 0
+
+        self.rows_written = 0
+        self.chunks_written = 0
+        self._file = None
+        self._writer = None
+        self._open()
+
+    def _open(self):
+        if self.fmt == 'npy':
+            os.makedirs(self.path, exist_ok=True)
+            with open(os.path.join(self.path, MANIFEST), 'w', encoding='utf-8') as f:
+                json.dump({'columns': list(self.columns), 'chunk_size': self.chunk_size}, f)
+        else:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(self.path, 'w', newline='', encoding='utf-8')
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(self.columns)
+            self._file.flush()
+
+    # ------------------------------------------------------------------
+    # Penulisan
+    # ------------------------------------------------------------------
+
+    def attach(self, simulation):
+        """Pasang fase perekaman setelah fase statistics"""
+        simulation.recorder = self
+        if 'recorder' not in simulation.pipeline:
+            after = 'statistics' if 'statistics' in simulation.pipeline else None
+            simulation.pipeline.register('recorder', _recorder_phase, after=after)
+
+    def detach(self, simulation):
+        """Lepas fase perekaman dan tulis sisa buffer"""
+        if 'recorder' in simulation.pipeline:
+            simulation.pipeline.remove('recorder')
+        if simulation.recorder is self:
+            simulation.recorder = None
+        self.close()
+
+    def append(self, row):
+        """Tambah satu baris; chunk ditulis ke disk saat buffer penuh"""
+        self._pending[self._pending_rows] = row
+        self._pending_rows += 1
+
+        index = (self._ring_start + self._ring_rows) % self.window
+        self._ring[index] = row
+        if self._ring_rows < self.window:
+            self._ring_rows += 1
+        else:
+            self._ring_start = (self._ring_start + 1) % self.window
+
+        if self._pending_rows == self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Tulis baris yang masih di buffer ke disk"""
+        if self._pending_rows == 0:
+            return
+        rows = self._pending[:self._pending_rows]
+        if self.fmt == 'npy':
+            name = os.path.join(self.path, f"chunk_{self.chunks_written:06d}.npy")
+            temp = name + '.tmp'
+            with open(temp, 'wb') as f:
+                np.save(f, rows)
+            os.replace(temp, name)
+        elif self._file is not None:
+            self._writer.writerows(rows.tolist())
+            self._file.flush()
+        self.rows_written += self._pending_rows
+        self.chunks_written += 1
+        self._pending_rows = 0
+
+    def close(self):
+        """Flush lalu tutup file (idempoten)"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Jendela di RAM
+    # ------------------------------------------------------------------
+
+    def recent(self, column: Optional[str] = None):
+        """
+        Baris-baris dalam jendela terbaru (urut waktu)
+        column=None -> array 2D; nama kolom -> array 1D
+        """
+        order = (self._ring_start + np.arange(self._ring_rows)) % self.window
+        data = self._ring[order]
+        if column is None:
+            return data
+        return data[:, self.columns.index(column)]
+
+    def __len__(self) -> int:
+        return self.rows_written + self._pending_rows
+
+
+def read_timeseries(path: str) -> Dict[str, np.ndarray]:
+    """
+    Baca seluruh time-series yang sudah tertulis di disk (aman saat run berjalan)
+    Mengembalikan dict nama kolom -> array 1D
+    """
+    if os.path.isdir(path):
+        with open(os.path.join(path, MANIFEST), encoding='utf-8') as f:
+            columns = json.load(f)['columns']
+        chunks = sorted(name for name in os.listdir(path)
+                        if name.startswith('chunk_') and name.endswith('.npy'))
+        arrays = [np.load(os.path.join(path, name), mmap_mode='r') for name in chunks]
+        data = np.concatenate(arrays) if arrays else np.empty((0, len(columns)))
+    else:
+        with open(path, newline='', encoding='utf-8') as f:
+            text = f.read()
+        # Abaikan baris terakhir yang mungkin belum selesai ditulis
+        if not text.endswith('\n'):
+            text = text[:text.rfind('\n') + 1]
+        lines = text.splitlines()
+        columns = next(csv.reader(lines[:1]))
+        rows = [[float(value) for value in row] for row in csv.reader(lines[1:]) if row]
+        data = np.array(rows, dtype=np.float64).reshape(-1, len(columns))
+    return {name: data[:, i] for i, name in enumerate(columns)}
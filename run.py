@@ -12,13 +12,99 @@ except ImportError:
     USE_FIXED_CONFIG = False
     print("⚠️  Menggunakan konfigurasi default")
 
+import argparse
+
 from models.ecosystem import EcosystemSimulation
 from visualization.plots import create_plots
 
-def main():
+def parse_args(argv=None):
+    """
+    Argumen command line (semua opsional; tanpa --mode pilihan ditanya interaktif)
+    """
+    parser = argparse.ArgumentParser(description="Simulasi ekosistem - agent based model")
+    parser.add_argument('--mode', choices=['1', '2', '3'],
+                        help="1=normal, 2=real-time visualization, 3=debug (lewati prompt input)")
+    parser.add_argument('--steps', type=int, default=None,
+                        help="Jumlah langkah (default: SIMULATION_CONFIG['max_steps'])")
+    parser.add_argument('--seed', type=int, default=None, help="Seed random generator")
+    parser.add_argument('--no-plots', action='store_true', help="Lewati grafik di akhir simulasi")
+    parser.add_argument('--plots-dir', default=None,
+                        help="Simpan grafik akhir sebagai PNG ke folder ini (tanpa membuka window)")
+    parser.add_argument('--max-fps', type=float, default=10.0,
+                        help="Batas frame per detik real-time visualization")
+    parser.add_argument('--vis-inprocess', action='store_true',
+                        help="Gambar real-time visualization di proses simulasi (mode lama)")
+    parser.add_argument('--density-threshold', type=int, default=None,
+                        help="Populasi minimal untuk menggambar peta sebagai raster kepadatan")
+    parser.add_argument('--dashboard', action='store_true',
+                        help="Dashboard terminal (sparkline, peta kepadatan, waktu fase) untuk run headless")
+    parser.add_argument('--dashboard-hz', type=float, default=2.0,
+                        help="Laju refresh dashboard terminal")
+    parser.add_argument('--cohorts', action='append', default=[], choices=['herbivore', 'elk'],
+                        help="Jalankan spesies herbivora sebagai kohort (super-individu), bisa diulang")
+    parser.add_argument('--adaptive', action='store_true',
+                        help="Pilih backend per fase otomatis dari populasi (kalibrasi saat start)")
+    parser.add_argument('--tiles', default=None, metavar='XxY',
+                        help="Bagi grid menjadi XxY tile, masing-masing di proses worker, mis. 2x2")
+    parser.add_argument('--synchronous', nargs='?', const='random', default=None, choices=['random', 'share'],
+                        help="Update agen sinkron dari state beku; konflik diselesaikan acak (default) atau dibagi rata")
+    parser.add_argument('--threads', type=int, default=None, metavar='N',
+                        help="Thread pool untuk fase lingkungan/kohort (hanya efektif di build free-threaded)")
+    parser.add_argument('--rebalance-every', type=int, default=None, metavar='N',
+                        help="Hitung ulang batas tile dari beban terukur setiap N langkah (butuh --tiles)")
+    
+    recording = parser.add_argument_group('recording')
+    recording.add_argument('--record', default=None, metavar='PATH',
+                           help="Rekam time-series per langkah ke disk (folder .npy atau file .csv)")
+    recording.add_argument('--record-format', choices=['npy', 'csv'], default=None,
+                           help="Format rekaman (default: csv jika PATH berakhiran .csv, selain itu npy)")
+    recording.add_argument('--record-window', type=int, default=1000,
+                           help="Jumlah langkah terbaru yang disimpan di RAM")
+    recording.add_argument('--snapshots', default=None, metavar='PATH',
+                           help="Rekam snapshot spasial untuk render offline (python -m visualization.offline)")
+    recording.add_argument('--snapshot-every', type=int, default=1,
+                           help="Interval langkah antar snapshot")
+    
+    profiling = parser.add_argument_group('profiling')
+    profiling.add_argument('--profile', action='store_true',
+                           help="Profil simulasi (tanpa prompt input, tanpa grafik)")
+    profiling.add_argument('--profile-steps', default=None, metavar='START:STOP',
+                           help="Rentang langkah yang diprofil, mis. 10:60 (default: semua)")
+    profiling.add_argument('--profile-dir', default='profiles',
+                           help="Folder output .pstats dan collapsed-stack")
+    profiling.add_argument('--sample', action='store_true',
+                           help="Gunakan sampler sinyal (SIGPROF) alih-alih cProfile")
+    profiling.add_argument('--sample-interval', type=float, default=0.005,
+                           help="Interval sampler dalam detik CPU")
+    return parser.parse_args(argv)
+
+def _parse_step_range(text):
+    """
+    Ubah 'START:STOP' menjadi (start, stop); bagian kosong = tanpa batas
+    """
+    if not text:
+        return 1, None
+    start, _, stop = text.partition(':')
+    return (int(start) if start else 1), (int(stop) if stop else None)
+
+def _parse_tiles(text):
+    """
+    Ubah 'XxY' menjadi (x, y)
+    """
+    x, _, y = text.lower().partition('x')
+    return int(x), int(y or 1)
+
+def main(argv=None):
     """
     Fungsi utama untuk menjalankan simulasi
     """
+    args = parse_args(argv)
+    if args.profile and args.mode is None:
+        args.mode = '1'
+    if args.seed is not None:
+        import random
+        random.seed(args.seed)
+    
     print("🌱 SIMULASI EKOSISTEM - AGENT BASED MODEL v2.0")
     print("=" * 60)
     # print("📋 Implementasi rumus dari PDF (DIPERBAIKI):")
@@ -53,13 +139,17 @@ def main():
     print("2. Simulasi dengan real-time visualization") 
     print("3. Debug mode (extra monitoring)")
     
-    try:
-        choice = input("\nPilih mode (1, 2, atau 3): ").strip()
-        realtime_vis = (choice == "2")
-        debug_mode = (choice == "3")
-    except KeyboardInterrupt:
-        print("\n❌ Simulasi dibatalkan")
-        return
+    if args.mode is not None:
+        choice = args.mode
+    else:
+        try:
+            choice = input("\nPilih mode (1, 2, atau 3): ").strip()
+        except KeyboardInterrupt:
+            print("\n❌ Simulasi dibatalkan")
+            return
+    realtime_vis = (choice == "2") and not args.profile
+    debug_mode = (choice == "3")
+    max_steps = args.steps if args.steps is not None else SIMULATION_CONFIG['max_steps']
     
     # Inisialisasi simulasi
     print("\n🔧 Inisialisasi simulasi...")
@@ -71,10 +161,20 @@ def main():
     # Setup spesies
     print("🦎 Setup spesies...")
     sim.setup_species()
+    for species in args.cohorts:
+        sim.enable_cohorts(species)
+    if args.adaptive:
+        sim.enable_adaptive_engine()
+    if args.synchronous:
+        sim.enable_synchronous(args.synchronous)
+    if args.threads:
+        sim.enable_threads(args.threads)
+    if args.tiles:
+        sim.enable_domain_decomposition(_parse_tiles(args.tiles), rebalance_every=args.rebalance_every)
     
     print(f"\n📊 Konfigurasi simulasi:")
     print(f"   • Grid: {SIMULATION_CONFIG['grid_width']}x{SIMULATION_CONFIG['grid_height']}")
-    print(f"   • Langkah maksimum: {SIMULATION_CONFIG['max_steps']}")
+    print(f"   • Langkah maksimum: {max_steps}")
     print(f"   • Carrying capacity: {SIMULATION_CONFIG['carrying_capacity']}")
     print(f"   • Progress setiap: {SIMULATION_CONFIG['show_progress_every']} langkah")
     print(f"   • Real-time visualization: {'✅ Ya' if realtime_vis else '❌ Tidak'}")
@@ -91,8 +191,55 @@ def main():
     if debug_mode:
         print("🐛 Debug mode: Monitoring extra untuk troubleshooting")
     
+    profiler = None
+    if args.profile:
+        from models.profiling import SimulationProfiler
+        start_step, stop_step = _parse_step_range(args.profile_steps)
+        profiler = SimulationProfiler(args.profile_dir, start_step, stop_step,
+                                      sample=args.sample, sample_interval=args.sample_interval)
+        profiler.attach(sim)
+        print(f"🔬 Profiling langkah {start_step} → {stop_step or 'akhir'} "
+              f"({'sampler sinyal' if profiler.sampler else 'cProfile'})")
+    
+    if args.record:
+        fmt = args.record_format or ('csv' if args.record.endswith('.csv') else 'npy')
+        sim.enable_recorder(args.record, fmt=fmt, window=args.record_window)
+        print(f"💾 Merekam time-series ke {args.record} ({fmt})")
+    
+    if args.snapshots:
+        sim.enable_snapshots(args.snapshots, every=args.snapshot_every)
+        print(f"🎞️  Merekam snapshot spasial ke {args.snapshots} (setiap {args.snapshot_every} langkah)")
+    
     # ⭐ PERBAIKAN: Monitoring lebih ketat untuk deteksi masalah dini
-    sim.run(steps=SIMULATION_CONFIG['max_steps'], realtime_vis=realtime_vis)
+    try:
+        sim.run(steps=max_steps, realtime_vis=realtime_vis,
+                vis_process=not args.vis_inprocess, max_fps=args.max_fps,
+                density_threshold=args.density_threshold,
+                dashboard=args.dashboard, dashboard_hz=args.dashboard_hz)
+    finally:
+        if sim.threads is not None:
+            sim.disable_threads()
+        if sim.domain is not None:
+            report = sim.domain.load_report()
+            sim.disable_domain_decomposition()
+            if report['steps']:
+                print(f"⚖️  Beban tile: imbalance {report['imbalance']:.2f}, efisiensi {report['efficiency']:.0%}, "
+                      f"perkiraan speedup {report['speedup']:.2f}x ({report['rebalances']} rebalance)")
+        if sim.recorder is not None:
+            rows = len(sim.recorder)
+            sim.disable_recorder()
+            print(f"💾 {rows} baris time-series tersimpan di {args.record}")
+        if sim.snapshots is not None:
+            frames = len(sim.snapshots)
+            sim.disable_snapshots()
+            print(f"🎞️  {frames} snapshot tersimpan di {args.snapshots}")
+    
+    if profiler:
+        profiler.detach(sim)
+        outputs = profiler.write_outputs()
+        profiler.print_summary()
+        for kind, path in outputs.items():
+            print(f"   📁 {kind}: {path}")
     
     # Tampilkan hasil
     print("\n📈 Analisis hasil...")
@@ -124,16 +271,19 @@ def main():
                     print("   ⚠️  SUBOPTIMAL: Rasio di luar range")
     
     # Buat visualisasi
-    print("\n🎨 Membuat visualisasi...")
-    try:
-        stats = sim.get_statistics()
-        if "error" not in stats:
-            create_plots(stats)
-        else:
-            print(f"⚠️  Visualisasi dilewati: {stats['error']}")
-    except Exception as e:
-        print(f"❌ Error visualisasi: {e}")
-        print("💡 Pastikan matplotlib terinstall: pip install matplotlib")
+    if args.no_plots or args.profile:
+        print("\n🎨 Visualisasi dilewati")
+    else:
+        print("\n🎨 Membuat visualisasi...")
+        try:
+            stats = sim.get_statistics()
+            if "error" not in stats:
+                create_plots(stats, output_dir=args.plots_dir)
+            else:
+                print(f"⚠️  Visualisasi dilewati: {stats['error']}")
+        except Exception as e:
+            print(f"❌ Error visualisasi: {e}")
+            print("💡 Pastikan matplotlib terinstall: pip install matplotlib")
     
     print("\n" + "=" * 60)
     print("✅ SIMULASI SELESAI!")
@@ -0,0 +1,42 @@
+import io
+import pickle
+import contextlib
+
+import pytest
+
+from models.domain import TileEnvironment
+from models.environment import Environment
+
+
+def _environment():
+    with contextlib.redirect_stdout(io.StringIO()):
+        return Environment(12, 9)
+
+
+def _assert_conditions(environment, x, y):
+    cell = environment.get_cell(x, y)
+    assert environment.cell_conditions(x, y) == (cell.food, cell.temperature, cell.humidity)
+
+
+@pytest.mark.parametrize('x, y', [(0, 0), (11, 8), (5, 3), (-1, 4), (3, 9), (12, 0)])
+def test_cell_conditions_match_get_cell(x, y):
+    _assert_conditions(_environment(), x, y)
+
+
+def test_cell_conditions_follow_array_writes_and_pickle():
+    environment = _environment()
+    environment.get_cell(4, 5).food = 12.5
+    environment.temperature[4, 5] = 31.0
+    assert environment.cell_conditions(4, 5)[:2] == (12.5, 31.0)
+    restored = pickle.loads(pickle.dumps(environment))
+    assert restored.cell_conditions(4, 5) == environment.cell_conditions(4, 5)
+
+
+def test_tile_cell_conditions_use_global_coordinates():
+    environment = _environment()
+    tile = TileEnvironment(12, 9, (3, 8, 2, 6), environment.base_temperature,
+                           environment.base_humidity)
+    tile.load({name: getattr(environment, name) for name in Environment.FIELDS})
+    for x, y in [(3, 2), (7, 5), (5, 4), (2, 2), (8, 5), (4, 6)]:
+        _assert_conditions(tile, x, y)
+    assert tile.cell_conditions(7, 5) == environment.cell_conditions(7, 5)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from models.history import HistoryArchive
+
+
+def _filled(steps, **kwargs):
+    history = HistoryArchive(['x'], **kwargs)
+    for step in range(steps):
+        history.append({'x': float(step)})
+    return history
+
+
+def _assert_tiles(result, start, stop):
+    step, resolution = result['step'], result['resolution']
+    assert step[0] == start
+    assert np.array_equal(step[1:], step[:-1] + resolution[:-1])
+    assert step[-1] + resolution[-1] == stop
+    assert resolution.sum() == stop - start
+
+
+@pytest.mark.parametrize('window, capacity, steps', [
+    (5, 5, 3000),
+    (2005, None, 10000),
+    (7, 13, 12345),
+    (10, 10, 999),
+    (2000, None, 1500),
+])
+def test_query_tiles_range_without_overlap(window, capacity, steps):
+    history = _filled(steps, window=window, tier_capacity=capacity)
+    result = history.query('x')
+    _assert_tiles(result, int(result['step'][0]), steps)
+    if result['step'][0] == 0:
+        assert result['resolution'].sum() == steps
+
+
+def test_query_mean_matches_covered_steps():
+    history = _filled(3000, window=5, tier_capacity=5)
+    result = history.query('x')
+    for step, mean, resolution in zip(result['step'], result['mean'], result['resolution']):
+        assert mean == pytest.approx(step + (resolution - 1) / 2)
+
+
+def test_query_subrange_inside_full_window():
+    history = _filled(10000, window=2005)
+    result = history.query('x', 9000, 9500)
+    _assert_tiles(result, 9000, 9500)
+    assert (result['resolution'] == 1).all()
+
+
+def test_factors_must_be_nested():
+    with pytest.raises(ValueError):
+        HistoryArchive(['x'], factors=(10, 25))
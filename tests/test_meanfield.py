@@ -0,0 +1,17 @@
+import pytest
+
+from models.meanfield import integrate_meanfield, to_history, to_statistics
+
+
+def test_statistics_count_days():
+    result = integrate_meanfield(50)
+    stats = to_statistics(result)
+    assert stats['total_steps'] == 50
+    assert stats['population_history'].steps == 51
+
+
+@pytest.mark.parametrize('convert', [to_history, to_statistics])
+def test_replay_rejects_sparse_records(convert):
+    result = integrate_meanfield(50, every=7)
+    with pytest.raises(ValueError, match='every=1'):
+        convert(result)
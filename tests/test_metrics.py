@@ -0,0 +1,45 @@
+import io
+import random
+import contextlib
+
+from models.ecosystem import EcosystemSimulation
+
+
+def _simulation(seed):
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(seed)
+        simulation = EcosystemSimulation(20, 20)
+        simulation.verbose = False
+        simulation.setup_species()
+    return simulation
+
+
+def _step(simulation, steps=1):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(steps):
+            simulation.step()
+
+
+def test_registries_are_per_simulation():
+    a, b = _simulation(1), _simulation(2)
+    metrics_a = a.enable_metrics()
+    _step(b, 3)
+    assert all(value == 0 for value in metrics_a.step_counters.values())
+
+    metrics_b = b.enable_metrics()
+    _step(b)
+    sample = metrics_b.recent(1)[0]
+    assert sample['counters']['get_cell_calls'] == b.pipeline.get('agents').counters['cells_touched'] > 0
+    assert all(value == 0 for value in metrics_a.step_counters.values())
+    assert sample['populations'] == {key: b.latest_record[key] for key in ('herbivore', 'elk', 'carnivore')}
+
+    _step(a)
+    assert metrics_a.recent(1)[0]['counters']['get_cell_calls'] > 0
+
+
+def test_disable_metrics_removes_phase():
+    simulation = _simulation(3)
+    simulation.enable_metrics()
+    simulation.disable_metrics()
+    _step(simulation)
+    assert 'metrics' not in simulation.pipeline
@@ -0,0 +1,35 @@
+import io
+import random
+import contextlib
+
+import numpy as np
+import pytest
+
+from models.ecosystem import EcosystemSimulation
+from models.online_stats import RollingStats, lag1_autocorrelation
+
+
+def test_lag1_matches_full_rolling_window():
+    rng = np.random.default_rng(0)
+    values = rng.normal(50, 5, 300).cumsum()
+    rolling = RollingStats(100)
+    for value in values:
+        rolling.update(float(value))
+    assert lag1_autocorrelation(values[-100:]) == pytest.approx(rolling.autocorrelation)
+    assert lag1_autocorrelation([3.0, 3.0, 3.0]) == 0.0
+    assert lag1_autocorrelation([1.0]) == 0.0
+
+
+def test_statistics_autocorrelation_same_with_and_without_range():
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(3)
+        simulation = EcosystemSimulation(20, 20)
+        simulation.verbose = False
+        simulation.setup_species()
+        for _ in range(120):
+            simulation.step()
+    steps = simulation.time_step
+    online = simulation.get_statistics()
+    ranged = simulation.get_statistics(steps - 100, steps)
+    for key in ('herbivore_autocorrelation', 'carnivore_autocorrelation'):
+        assert ranged[key] == pytest.approx(online[key])
@@ -0,0 +1,58 @@
+import io
+import random
+import contextlib
+
+from agents.base_agent import CarnivoreAgent, ElkAgent
+from models.ecosystem import EcosystemSimulation
+from models.environment import Environment
+
+
+def _simulation():
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(3)
+        simulation = EcosystemSimulation(20, 20)
+        simulation.verbose = False
+        simulation.setup_species()
+    return simulation
+
+
+def test_agent_counters_match_call_sites(monkeypatch):
+    simulation = _simulation()
+    calls = {'get_cell': 0, 'scans': 0}
+    get_cell = Environment.get_cell
+    cell_conditions = Environment.cell_conditions
+    originals = {name: getattr(cls, name) for cls, name in (
+        (ElkAgent, 'check_predator_nearby'), (ElkAgent, '_flee_from_predators'),
+        (CarnivoreAgent, 'scan_for_prey'), (CarnivoreAgent, '_count_nearby_carnivores'))}
+
+    def counted_get_cell(self, x, y):
+        calls['get_cell'] += 1
+        return get_cell(self, x, y)
+
+    def counted_conditions(self, x, y):
+        calls['get_cell'] += 1
+        return cell_conditions(self, x, y)
+
+    def scanning(name, scans):
+        def method(self, *args):
+            calls['scans'] += scans(self)
+            return originals[name](self, *args)
+        return method
+
+    monkeypatch.setattr(Environment, 'get_cell', counted_get_cell)
+    monkeypatch.setattr(Environment, 'cell_conditions', counted_conditions)
+    monkeypatch.setattr(ElkAgent, 'check_predator_nearby', scanning('check_predator_nearby', lambda a: 1))
+    monkeypatch.setattr(ElkAgent, '_flee_from_predators',
+                        scanning('_flee_from_predators', lambda a: (2 * a.mobility + 1) ** 2))
+    monkeypatch.setattr(CarnivoreAgent, 'scan_for_prey', scanning('scan_for_prey', lambda a: 1))
+    monkeypatch.setattr(CarnivoreAgent, '_count_nearby_carnivores',
+                        scanning('_count_nearby_carnivores', lambda a: 1))
+    wrapped = CarnivoreAgent.scan_for_prey
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation.step()
+    counters = simulation.pipeline.get('agents').counters
+    assert counters['cells_touched'] == calls['get_cell'] > 0
+    assert counters['queries_issued'] == calls['scans'] > 0
+    assert CarnivoreAgent.scan_for_prey is wrapped
+    assert simulation.environment.probe is None
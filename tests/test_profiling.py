@@ -0,0 +1,30 @@
+import io
+import random
+import contextlib
+
+import pytest
+
+from models.ecosystem import EcosystemSimulation
+from models.profiling import SignalSampler, SimulationProfiler
+
+
+@pytest.mark.skipif(not SignalSampler.available(), reason="SIGPROF tidak tersedia")
+def test_sampler_runs_once_across_range(tmp_path, monkeypatch):
+    with contextlib.redirect_stdout(io.StringIO()):
+        random.seed(1)
+        simulation = EcosystemSimulation(15, 15)
+        simulation.verbose = False
+        simulation.setup_species()
+    profiler = SimulationProfiler(str(tmp_path), start_step=3, stop_step=53, sample=True)
+    starts = []
+    start = SignalSampler.start
+    monkeypatch.setattr(SignalSampler, 'start',
+                        lambda self: (starts.append(self.running), start(self)))
+    profiler.attach(simulation)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(60):
+            simulation.step()
+    assert profiler.profiled_steps == 50
+    assert starts.count(False) == 1
+    assert not profiler.sampler.running
+    profiler.detach(simulation)
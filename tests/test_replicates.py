@@ -0,0 +1,49 @@
+import io
+import contextlib
+
+import numpy as np
+import pytest
+
+from models.ecosystem import EcosystemSimulation
+from models.replicates import run_forked_replicates, stack_replicates
+
+
+def _replicates(history_window, burn_in=10, steps=30):
+    with contextlib.redirect_stdout(io.StringIO()):
+        simulation = EcosystemSimulation(20, 20, history_window=history_window)
+        simulation.verbose = False
+        simulation.setup_species()
+        results = run_forked_replicates(simulation, burn_in, 2, steps, base_seed=1)
+    return simulation, results
+
+
+def test_children_return_post_fork_arrays():
+    _, results = _replicates(history_window=100)
+    for result in results:
+        history = result['history']
+        assert isinstance(history['herbivore'], np.ndarray)
+        assert len(history['herbivore']) == result['total_steps'] - result['start_step']
+        assert history['resolution'] == 1
+        assert 'population_history' not in result['statistics']
+
+
+def test_stack_aligns_on_fork_and_prepends_burn_in():
+    simulation, results = _replicates(history_window=100)
+    ensemble = stack_replicates(results)
+    assert ensemble['steps'][0] == 11
+    assert ensemble['herbivore'].shape == (2, 30)
+
+    ensemble = stack_replicates(results, burn_in=simulation.population_history)
+    assert ensemble['steps'][0] == 1
+    assert ensemble['steps'][-1] == 40
+    burn_in = simulation.population_history['herbivore']
+    assert np.array_equal(ensemble['herbivore'][:, :10], np.tile(burn_in, (2, 1)))
+
+
+def test_long_runs_fall_back_to_buckets():
+    simulation, results = _replicates(history_window=5, burn_in=30, steps=40)
+    ensemble = stack_replicates(results, burn_in=simulation.population_history)
+    assert ensemble['resolution'] > 1
+    assert ensemble['herbivore'].shape == (2, 70)
+    with pytest.raises(ValueError, match='history_window'):
+        stack_replicates(results, strict=True)
@@ -0,0 +1,14 @@
+from benchmarks.scenarios import Scenario
+from benchmarks.suite import _run_isolated
+
+
+def test_isolated_run_completes():
+    result = _run_isolated(Scenario('small', 20, 20, 50, steps=3))
+    assert result['steps_completed'] == 3
+    assert not result['truncated']
+
+
+def test_isolated_run_stops_at_budget():
+    result = _run_isolated(Scenario('budget', 50, 50, 600, steps=10_000, max_seconds=0.5))
+    assert result['truncated']
+    assert result['steps_completed'] < 10_000
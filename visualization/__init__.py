@@ -3,4 +3,7 @@ Modul visualization untuk plotting dan analisis hasil simulasi
 """
 
 from .plots import EcosystemPlotter, create_plots
-from .realtime import RealTimeVisualizer, create_realtime_visualizer
\ No newline at end of file
+from .realtime import RealTimeVisualizer, create_realtime_visualizer
+from .realtime_process import VisualizerProcess, create_visualizer_process
+from .terminal import TerminalDashboard, create_terminal_dashboard
+from .plots import EnsemblePlotter, create_ensemble_plots
\ No newline at end of file
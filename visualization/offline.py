@@ -0,0 +1,241 @@
+"""
+Render offline frame animasi dari snapshot yang direkam saat run headless
+(EcosystemSimulation.enable_snapshots). Frame digambar dengan backend Agg di
+process pool: setiap worker membuka snapshot sendiri dan membuat figure sekali,
+lalu menggambar potongan frame berurutan (artist dipakai ulang)
+
+Output:
+    • PNG bernomor (frame_000000.png, ...) ditulis langsung oleh worker
+    • Video lewat pipe ke ffmpeg jika tersedia; frame RGB dikirim berurutan,
+      worker tetap menggambar paralel
+
+Pemakaian:
+    python -m visualization.offline runs/snapshots --png-dir frames/
+    python -m visualization.offline runs/snapshots --output movie.mp4 --workers 8 --fps 30
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import subprocess
+import multiprocessing
+from collections import deque
+from typing import Dict, Any, Optional
+
+SPECIES_STYLE = {
+    'herbivore': ('#2E8B57', 'o', 'Kelinci'),
+    'elk': ('#8B4513', 's', 'Elk'),
+    'carnivore': ('#CD5C5C', '^', 'Serigala'),
+}
+
+# State per worker (diisi oleh _init_worker)
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(path: str, dpi: int, size: float, density_threshold: int):
+    """Buka snapshot dan siapkan figure Agg sekali per worker"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import LinearSegmentedColormap, to_rgba
+    import numpy as np
+    from models.snapshots import SnapshotReader
+    from data.config_fixed import ENVIRONMENT_CONFIG
+
+    reader = SnapshotReader(path)
+    width, height = reader.width, reader.height
+    fig, ax = plt.subplots(figsize=(size, size * height / width + 0.6), dpi=dpi)
+    ax.set_xlim(0, width)
+    ax.set_ylim(0, height)
+    ax.set_aspect('equal')
+    ax.set_xticks([])
+    ax.set_yticks([])
+
+    food = ax.imshow(np.zeros((height, width)), extent=[0, width, 0, height], origin='lower',
+                     cmap='YlOrBr', alpha=0.6, vmin=0, vmax=ENVIRONMENT_CONFIG['max_food_per_cell'])
+    scatters, rasters = {}, {}
+    for key, (color, marker, _) in SPECIES_STYLE.items():
+        scatters[key] = ax.scatter([], [], c=color, s=12, marker=marker, alpha=0.8)
+        cmap = LinearSegmentedColormap.from_list(f"density_{key}",
+                                                 [to_rgba(color, 0.0), to_rgba(color, 0.9)])
+        rasters[key] = ax.imshow(np.ma.masked_all((height, width)), extent=[0, width, 0, height],
+                                 origin='lower', cmap=cmap, interpolation='nearest',
+                                 vmin=0, vmax=1, visible=False)
+    title = ax.set_title('')
+    fig.tight_layout()
+
+    _worker.update(reader=reader, fig=fig, food=food, scatters=scatters, rasters=rasters,
+                   title=title, density_threshold=density_threshold)
+
+
+def _draw(index: int):
+    """Perbarui artist figure worker dengan satu frame (belum digambar ke canvas)"""
+    import numpy as np
+    from .realtime import density_raster
+
+    frame = _worker['reader'][index]
+    reader = _worker['reader']
+    _worker['food'].set_data(frame['food'].T)
+
+    dense = sum(frame['counts'].values()) > _worker['density_threshold']
+    for key, scatter in _worker['scatters'].items():
+        xs, ys = frame['positions'].get(key, (np.empty(0, np.int32), np.empty(0, np.int32)))
+        raster = _worker['rasters'][key]
+        scatter.set_visible(not dense)
+        raster.set_visible(dense)
+        if dense:
+            counts = density_raster(xs, ys, reader.width, reader.height)
+            raster.set_data(np.ma.masked_equal(counts.T, 0))
+            raster.set_clim(0, max(1, int(counts.max())))
+        else:
+            scatter.set_offsets(np.column_stack((xs + 0.5, ys + 0.5)))
+
+    counts = '  '.join(f"{SPECIES_STYLE[key][2]} {count}" for key, count in frame['counts'].items())
+    _worker['title'].set_text(f"Langkah {frame['step']}   {counts}   "
+                              f"Suhu {frame['env_stats'].get('avg_temperature', 0):.1f}°C")
+
+
+def _render_png(task):
+    """Worker: gambar frame [start, stop) ke PNG bernomor"""
+    start, stop, directory, first = task
+    fig = _worker['fig']
+    for index in range(start, stop):
+        _draw(index)
+        fig.savefig(os.path.join(directory, f"frame_{index - first:06d}.png"))
+    return stop - start
+
+
+def _render_rgb(task):
+    """Worker: gambar frame [start, stop) dan kembalikan bytes RGB (untuk encoder)"""
+    import numpy as np
+
+    start, stop = task
+    canvas = _worker['fig'].canvas
+    frames = []
+    for index in range(start, stop):
+        _draw(index)
+        canvas.draw()
+        frames.append(np.asarray(canvas.buffer_rgba())[..., :3].tobytes())
+    width, height = canvas.get_width_height()
+    return width, height, frames
+
+
+def find_encoder() -> Optional[str]:
+    """Path ffmpeg jika terpasang"""
+    return shutil.which('ffmpeg')
+
+
+def render_snapshots(path: str, png_dir: Optional[str] = None, output: Optional[str] = None,
+                     workers: Optional[int] = None, fps: int = 30, dpi: int = 100,
+                     size: float = 8.0, batch: int = 20, start: int = 0,
+                     stop: Optional[int] = None, density_threshold: int = None) -> Dict[str, Any]:
+    """
+    Gambar frame snapshot [start, stop) paralel ke PNG (png_dir) atau video (output)
+    Jika output diminta tapi ffmpeg tidak ada, frame ditulis sebagai PNG di
+    folder <output>_frames
+    """
+    from models.snapshots import SnapshotReader
+    from .realtime import DENSITY_THRESHOLD
+
+    total = len(SnapshotReader(path))
+    stop = total if stop is None else min(stop, total)
+    if stop <= start:
+        raise ValueError(f"Tidak ada frame untuk dirender (snapshot berisi {total} frame)")
+    workers = workers or os.cpu_count() or 1
+    density_threshold = DENSITY_THRESHOLD if density_threshold is None else density_threshold
+
+    encoder = find_encoder() if output else None
+    if output and encoder is None:
+        png_dir = png_dir or os.path.splitext(output)[0] + '_frames'
+        print(f"⚠️  ffmpeg tidak ditemukan, frame ditulis sebagai PNG di {png_dir}")
+        output = None
+    if not output and not png_dir:
+        raise ValueError("Tentukan png_dir atau output")
+
+    ranges = [(i, min(i + batch, stop)) for i in range(start, stop, batch)]
+    context = multiprocessing.get_context('spawn')
+    began = time.perf_counter()
+    with context.Pool(workers, initializer=_init_worker,
+                      initargs=(path, dpi, size, density_threshold)) as pool:
+        if output:
+            rendered = _encode(pool, ranges, encoder, output, fps, workers)
+        else:
+            os.makedirs(png_dir, exist_ok=True)
+            tasks = [(a, b, png_dir, start) for a, b in ranges]
+            rendered = sum(pool.imap_unordered(_render_png, tasks))
+    elapsed = time.perf_counter() - began
+
+    result = {'frames': rendered, 'workers': workers, 'seconds': elapsed,
+              'fps_rendered': rendered / elapsed if elapsed > 0 else 0.0,
+              'output': output or png_dir}
+    print(f"🎞️  {rendered} frame dirender dengan {workers} worker dalam {elapsed:.1f} detik "
+          f"({result['fps_rendered']:.1f} frame/detik) → {result['output']}")
+    return result
+
+
+def _encode(pool, ranges, encoder: str, output: str, fps: int, workers: int) -> int:
+    """
+    Kirim frame RGB berurutan ke stdin ffmpeg; paling banyak 2 batch per worker
+    menunggu di memori
+    """
+    pending = deque()
+    tasks = iter(ranges)
+    for task in tasks:
+        pending.append(pool.apply_async(_render_rgb, (task,)))
+        if len(pending) >= 2 * workers:
+            break
+
+    process = None
+    rendered = 0
+    try:
+        while pending:
+            width, height, frames = pending.popleft().get()
+            task = next(tasks, None)
+            if task is not None:
+                pending.append(pool.apply_async(_render_rgb, (task,)))
+            if process is None:
+                process = subprocess.Popen(
+                    [encoder, '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                     '-s', f"{width}x{height}", '-r', str(fps), '-i', '-',
+                     '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-c:v', 'libx264',
+                     '-pix_fmt', 'yuv420p', output],
+                    stdin=subprocess.PIPE)
+            for frame in frames:
+                process.stdin.write(frame)
+            rendered += len(frames)
+    finally:
+        if process is not None:
+            process.stdin.close()
+            if process.wait() != 0:
+                raise RuntimeError(f"ffmpeg gagal (exit code {process.returncode})")
+    return rendered
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Render offline frame dari snapshot simulasi")
+    parser.add_argument('snapshots', help="Folder snapshot (enable_snapshots / --snapshots)")
+    parser.add_argument('--png-dir', default=None, help="Tulis PNG bernomor ke folder ini")
+    parser.add_argument('--output', default=None, help="File video (butuh ffmpeg), mis. movie.mp4")
+    parser.add_argument('--workers', type=int, default=None, help="Jumlah proses (default: semua core)")
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--size', type=float, default=8.0, help="Lebar figure dalam inci")
+    parser.add_argument('--batch', type=int, default=20, help="Frame per tugas worker")
+    parser.add_argument('--start', type=int, default=0)
+    parser.add_argument('--stop', type=int, default=None)
+    parser.add_argument('--density-threshold', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    if not args.png_dir and not args.output:
+        parser.error("Tentukan --png-dir atau --output")
+    render_snapshots(args.snapshots, png_dir=args.png_dir, output=args.output,
+                     workers=args.workers, fps=args.fps, dpi=args.dpi, size=args.size,
+                     batch=args.batch, start=args.start, stop=args.stop,
+                     density_threshold=args.density_threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
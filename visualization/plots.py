@@ -3,19 +3,77 @@ Kelas untuk visualisasi dan analisis hasil simulasi ekosistem
 Implementasi grafik berdasarkan metrik evaluasi dari PDF
 """
 
+import os
+
 import matplotlib.pyplot as plt
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+
+# Batas titik per garis yang dikirim ke matplotlib
+DEFAULT_MAX_POINTS = 2000
+
+
+def downsample_indices(*series: np.ndarray, max_points: int = DEFAULT_MAX_POINTS) -> np.ndarray:
+    """
+    Indeks titik yang dipertahankan dengan bucketing min/max (vektorial)
+    Setiap bucket menyimpan indeks minimum dan maksimum setiap seri sehingga puncak
+    dan lembah tetap terlihat; indeks sama untuk semua seri (phase plot tetap konsisten)
+    """
+    n = len(series[0])
+    if n <= max_points:
+        return np.arange(n)
+    buckets = max(1, max_points // (2 * len(series)))
+    size = -(-n // buckets)
+    chosen = [np.array([0, n - 1])]
+    for values in series:
+        values = np.asarray(values, dtype=float)
+        # Isi sisa bucket terakhir dengan nilai tepi agar bisa di-reshape
+        padded = np.concatenate((values, np.full(buckets * size - n, values[-1])))
+        blocks = padded.reshape(buckets, size)
+        offsets = np.arange(buckets) * size
+        chosen.append(offsets + blocks.argmin(axis=1))
+        chosen.append(offsets + blocks.argmax(axis=1))
+    indices = np.unique(np.concatenate(chosen))
+    return indices[indices < n]
+
+
+def finish_figure(fig, name: str, output_dir: str = None, dpi: int = 100):
+    """
+    Simpan figure sebagai <output_dir>/<name>.png lalu tutup, atau plt.show()
+    jika output_dir tidak diberikan. Mengembalikan path file atau None
+    """
+    plt.tight_layout()
+    if not output_dir:
+        plt.show()
+        return None
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{name}.png")
+    fig.savefig(path, dpi=dpi)
+    plt.close(fig)
+    print(f"   📁 {path}")
+    return path
+
 
 class EcosystemPlotter:
     """
     Kelas untuk membuat visualisasi hasil simulasi ekosistem
     """
     
-    def __init__(self, statistics: Dict[str, Any]):
+    def __init__(self, statistics: Dict[str, Any], start: int = None, stop: int = None,
+                 max_points: int = DEFAULT_MAX_POINTS, output_dir: str = None, dpi: int = 100):
         self.stats = statistics
         self.population_history = statistics.get('population_history', {})
         
+        # Rentang langkah yang diplot [start, stop) (None = seluruh history)
+        self.start = start
+        self.stop = stop
+        
+        # Garis di-downsample ke max_points titik; output_dir = simpan PNG tanpa show()
+        self.max_points = max_points
+        self.output_dir = output_dir
+        self.dpi = dpi
+        self.saved_files: List[str] = []
+        
         # Setup matplotlib style
         plt.style.use('default')
         self.colors = {
@@ -25,6 +83,46 @@ class EcosystemPlotter:
             'ratio': '#9370DB'       # Medium Purple
         }
     
+    def _series(self, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ambil (langkah, nilai) satu seri pada rentang plot
+        HistoryArchive di-query dengan resolusi terbaik; dict of list dipotong biasa
+        """
+        history = self.population_history
+        if hasattr(history, 'query'):
+            data = history.query(key, self.start, self.stop)
+            return data['step'], data['mean']
+        values = np.asarray(history[key], dtype=float)
+        steps = np.arange(len(values))
+        window = slice(self.start, self.stop)
+        return steps[window], values[window]
+    
+    def _weights(self, key: str) -> np.ndarray:
+        """
+        Jumlah langkah yang diwakili setiap titik seri (bucket arsip berbobot lebarnya)
+        """
+        history = self.population_history
+        if hasattr(history, 'query'):
+            return history.query(key, self.start, self.stop)['resolution'].astype(float)
+        return np.ones(len(self._series(key)[0]))
+    
+    def _thin(self, steps: np.ndarray, *values: np.ndarray):
+        """Downsample langkah dan seri dengan indeks min/max bersama"""
+        indices = downsample_indices(*values, max_points=self.max_points)
+        return (np.asarray(steps)[indices],) + tuple(np.asarray(v)[indices] for v in values)
+    
+    def _histogram(self, ax, values: np.ndarray, weights: np.ndarray, bins: np.ndarray,
+                   color: str, label: str):
+        """Histogram density dihitung dengan numpy; matplotlib hanya menggambar tangga"""
+        density, edges = np.histogram(values, bins=bins, weights=weights, density=True)
+        ax.stairs(density, edges, fill=True, alpha=0.7, color=color, label=label)
+    
+    def _finish(self, fig, name: str):
+        """Simpan figure ke output_dir (lalu tutup) atau tampilkan"""
+        path = finish_figure(fig, name, self.output_dir, self.dpi)
+        if path:
+            self.saved_files.append(path)
+    
     def plot_population_dynamics(self):
         """
         Plot dinamika populasi predator-mangsa (Lotka-Volterra)
@@ -36,11 +134,13 @@ class EcosystemPlotter:
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 10))
         
         # Plot 1: Populasi vs Waktu
-        time_steps = range(len(self.population_history['herbivore']))
+        time_steps, herbivores = self._series('herbivore')
+        _, carnivores = self._series('carnivore')
+        time_steps, herbivores, carnivores = self._thin(time_steps, herbivores, carnivores)
         
-        ax1.plot(time_steps, self.population_history['herbivore'], 
+        ax1.plot(time_steps, herbivores, 
                 color=self.colors['herbivore'], linewidth=2, label='🐰 Herbivora (Kelinci)')
-        ax1.plot(time_steps, self.population_history['carnivore'], 
+        ax1.plot(time_steps, carnivores, 
                 color=self.colors['carnivore'], linewidth=2, label='🐺 Karnivora (Serigala)')
         
         ax1.set_xlabel('Langkah Waktu')
@@ -50,11 +150,11 @@ class EcosystemPlotter:
         ax1.grid(True, alpha=0.3)
         
         # Plot 2: Phase Plot (Predator vs Prey)
-        ax2.plot(self.population_history['herbivore'], self.population_history['carnivore'], 
+        ax2.plot(herbivores, carnivores, 
                 color=self.colors['ratio'], linewidth=1.5, alpha=0.7)
-        ax2.scatter(self.population_history['herbivore'][0], self.population_history['carnivore'][0], 
+        ax2.scatter(herbivores[0], carnivores[0], 
                    color='green', s=100, marker='o', label='Start', zorder=5)
-        ax2.scatter(self.population_history['herbivore'][-1], self.population_history['carnivore'][-1], 
+        ax2.scatter(herbivores[-1], carnivores[-1], 
                    color='red', s=100, marker='X', label='End', zorder=5)
         
         ax2.set_xlabel('Populasi Herbivora')
@@ -63,8 +163,7 @@ class EcosystemPlotter:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plt.show()
+        self._finish(fig, 'population_dynamics')
     
     def plot_ecosystem_metrics(self):
         """
@@ -76,12 +175,25 @@ class EcosystemPlotter:
         
         fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 10))
         
+        steps, herbivores = self._series('herbivore')
+        _, carnivores = self._series('carnivore')
+        
         # 1. Stabilitas Populasi (Standard Deviation)
+        # Dibaca dari seri rolling std online di arsip; dihitung vektorial jika tidak ada
         window_size = 50
-        herb_rolling_std = self._calculate_rolling_std(self.population_history['herbivore'], window_size)
-        carn_rolling_std = self._calculate_rolling_std(self.population_history['carnivore'], window_size)
-        
-        time_steps = range(window_size, len(herb_rolling_std) + window_size)
+        if 'herbivore_rolling_std' in self.population_history:
+            std_steps, herb_rolling_std = self._series('herbivore_rolling_std')
+            _, carn_rolling_std = self._series('carnivore_rolling_std')
+            full_window = std_steps >= window_size - 1
+            time_steps = std_steps[full_window]
+            herb_rolling_std = herb_rolling_std[full_window]
+            carn_rolling_std = carn_rolling_std[full_window]
+        else:
+            herb_rolling_std = self._calculate_rolling_std(herbivores, window_size)
+            carn_rolling_std = self._calculate_rolling_std(carnivores, window_size)
+            time_steps = steps[window_size:window_size + len(herb_rolling_std)]
+        time_steps, herb_rolling_std, carn_rolling_std = self._thin(
+            time_steps, herb_rolling_std, carn_rolling_std)
         ax1.plot(time_steps, herb_rolling_std, color=self.colors['herbivore'], 
                 label='Herbivora', linewidth=2)
         ax1.plot(time_steps, carn_rolling_std, color=self.colors['carnivore'], 
@@ -93,27 +205,37 @@ class EcosystemPlotter:
         ax1.grid(True, alpha=0.3)
         
         # 2. Rasio Predator:Mangsa
-        ratios = []
-        for i in range(len(self.population_history['herbivore'])):
-            herb_pop = self.population_history['herbivore'][i]
-            carn_pop = self.population_history['carnivore'][i]
-            ratio = carn_pop / max(1, herb_pop)  # Hindari division by zero
-            ratios.append(ratio)
-        
-        ax2.plot(range(len(ratios)), ratios, color=self.colors['ratio'], linewidth=2)
-        ax2.axhline(y=np.mean(ratios), color='red', linestyle='--', alpha=0.7, 
-                   label=f'Rata-rata: {np.mean(ratios):.3f}')
+        if 'carnivore_herbivore_ratio' in self.population_history:
+            ratio_steps, ratios = self._series('carnivore_herbivore_ratio')
+        else:
+            ratio_steps = steps
+            ratios = carnivores / np.maximum(1, herbivores)  # Hindari division by zero
+        
+        # Rata-rata seluruh run dari statistik online (tanpa rentang), selain itu dari seri
+        online = self.stats.get('online_statistics')
+        if online and self.start is None and self.stop is None:
+            mean_ratio = online['running']['plot_ratio']['mean']
+        else:
+            mean_ratio = float(np.mean(ratios)) if len(ratios) else 0.0
+        
+        ax2.plot(*self._thin(ratio_steps, ratios), color=self.colors['ratio'], linewidth=2)
+        ax2.axhline(y=mean_ratio, color='red', linestyle='--', alpha=0.7, 
+                   label=f'Rata-rata: {mean_ratio:.3f}')
         ax2.set_xlabel('Langkah Waktu')
         ax2.set_ylabel('Rasio Predator/Mangsa')
         ax2.set_title('Keseimbangan Ekosistem')
         ax2.legend()
         ax2.grid(True, alpha=0.3)
         
-        # 3. Histogram Distribusi Populasi
-        ax3.hist(self.population_history['herbivore'], bins=20, alpha=0.7, 
-                color=self.colors['herbivore'], label='Herbivora', density=True)
-        ax3.hist(self.population_history['carnivore'], bins=20, alpha=0.7, 
-                color=self.colors['carnivore'], label='Karnivora', density=True)
+        # 3. Histogram Distribusi Populasi (seluruh seri, bukan hasil downsample)
+        herb_weights = self._weights('herbivore')
+        carn_weights = self._weights('carnivore')
+        self._histogram(ax3, herbivores, herb_weights,
+                        np.histogram_bin_edges(herbivores, bins=20),
+                        self.colors['herbivore'], 'Herbivora')
+        self._histogram(ax3, carnivores, carn_weights,
+                        np.histogram_bin_edges(carnivores, bins=20),
+                        self.colors['carnivore'], 'Karnivora')
         ax3.set_xlabel('Populasi')
         ax3.set_ylabel('Density')
         ax3.set_title('Distribusi Populasi')
@@ -125,16 +247,16 @@ class EcosystemPlotter:
             ax4_twin = ax4.twinx()
             
             # Plot makanan
-            ax4.plot(range(len(self.population_history['total_food'])), 
-                    self.population_history['total_food'], 
+            food_steps, total_food = self._thin(*self._series('total_food'))
+            ax4.plot(food_steps, total_food, 
                     color=self.colors['environment'], linewidth=2, label='Total Makanan')
             ax4.set_xlabel('Langkah Waktu')
             ax4.set_ylabel('Total Makanan', color=self.colors['environment'])
             ax4.tick_params(axis='y', labelcolor=self.colors['environment'])
             
             # Plot suhu
-            ax4_twin.plot(range(len(self.population_history['avg_temperature'])), 
-                         self.population_history['avg_temperature'], 
+            temp_steps, avg_temperature = self._thin(*self._series('avg_temperature'))
+            ax4_twin.plot(temp_steps, avg_temperature, 
                          color='orange', linewidth=2, label='Suhu Rata-rata')
             ax4_twin.set_ylabel('Suhu (°C)', color='orange')
             ax4_twin.tick_params(axis='y', labelcolor='orange')
@@ -146,8 +268,7 @@ class EcosystemPlotter:
                     ha='center', va='center', transform=ax4.transAxes, fontsize=12)
             ax4.set_title('Kondisi Lingkungan')
         
-        plt.tight_layout()
-        plt.show()
+        self._finish(fig, 'ecosystem_metrics')
     
     def plot_summary_analysis(self):
         """
@@ -189,10 +310,12 @@ class EcosystemPlotter:
                     f'{value:.1f}\n({interpretation})', ha='center', va='bottom', fontsize=9)
         
         # 3. Timeline Populasi (Simple)
-        time_steps = range(len(self.population_history['herbivore']))
-        ax3.plot(time_steps, self.population_history['herbivore'], 
+        time_steps, herbivores = self._series('herbivore')
+        _, carnivores = self._series('carnivore')
+        time_steps, herbivores, carnivores = self._thin(time_steps, herbivores, carnivores)
+        ax3.plot(time_steps, herbivores, 
                 color=self.colors['herbivore'], linewidth=2, label='Herbivora')
-        ax3.plot(time_steps, self.population_history['carnivore'], 
+        ax3.plot(time_steps, carnivores, 
                 color=self.colors['carnivore'], linewidth=2, label='Karnivora')
         ax3.set_xlabel('Langkah Waktu')
         ax3.set_ylabel('Populasi')
@@ -237,18 +360,25 @@ class EcosystemPlotter:
                 verticalalignment='top', fontfamily='monospace',
                 bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
         
-        plt.tight_layout()
-        plt.show()
+        self._finish(fig, 'summary_analysis')
     
-    def _calculate_rolling_std(self, data: List[float], window_size: int) -> List[float]:
+    def _calculate_rolling_std(self, data: List[float], window_size: int) -> np.ndarray:
         """
-        Hitung rolling standard deviation
+        Hitung rolling standard deviation (vektorial, jumlah kumulatif)
+        Nilai ke-k = np.std(data[k:k+window_size]) untuk k = 0 .. len(data)-window_size-1
         """
-        rolling_std = []
-        for i in range(window_size, len(data)):
-            window_data = data[i-window_size:i]
-            rolling_std.append(np.std(window_data))
-        return rolling_std
+        values = np.asarray(data, dtype=float)
+        count = len(values) - window_size
+        if count <= 0:
+            return np.empty(0)
+        # Geser ke mean global agar jumlah kuadrat tidak kehilangan presisi
+        shifted = values - values.mean()
+        cumsum = np.concatenate(([0.0], np.cumsum(shifted)))
+        cumsum_sq = np.concatenate(([0.0], np.cumsum(shifted * shifted)))
+        sums = cumsum[window_size:window_size + count] - cumsum[:count]
+        sums_sq = cumsum_sq[window_size:window_size + count] - cumsum_sq[:count]
+        variance = sums_sq / window_size - (sums / window_size) ** 2
+        return np.sqrt(np.maximum(variance, 0.0))
     
     def plot_all(self):
         """
@@ -273,9 +403,236 @@ class EcosystemPlotter:
             print(f"❌ Error dalam membuat plot: {e}")
             print("🔍 Pastikan data simulasi lengkap dan matplotlib terinstall")
 
-def create_plots(statistics: Dict[str, Any]):
+def create_plots(statistics: Dict[str, Any], start: int = None, stop: int = None,
+                 output_dir: str = None, max_points: int = DEFAULT_MAX_POINTS):
+    """
+    Fungsi helper untuk membuat semua plot (opsional rentang langkah [start, stop))
+    Dengan output_dir, grafik disimpan sebagai PNG tanpa membuka window
+    """
+    plotter = EcosystemPlotter(statistics, start, stop, max_points=max_points,
+                               output_dir=output_dir)
+    plotter.plot_all()
+    return plotter
+
+# ----------------------------------------------------------------------
+# Ensemble replikasi (array replikasi x langkah, boleh memmap)
+# ----------------------------------------------------------------------
+
+# Jumlah elemen maksimum per blok kolom yang dimuat sekaligus dari memmap
+ENSEMBLE_BLOCK_ELEMENTS = 4_000_000
+
+
+def _column_blocks(array: np.ndarray):
+    """Potongan kolom (langkah) berukuran terbatas: (offset, blok float64)"""
+    width = max(1, ENSEMBLE_BLOCK_ELEMENTS // max(1, array.shape[0]))
+    for start in range(0, array.shape[1], width):
+        yield start, np.asarray(array[:, start:start + width], dtype=np.float64)
+
+
+def ensemble_bands(array: np.ndarray, percentiles: Tuple[float, float] = (5, 95)) -> Dict[str, np.ndarray]:
+    """
+    Rata-rata dan pita persentil per langkah dari array (replikasi x langkah)
+    NaN (replikasi yang sudah berhenti) diabaikan; percentiles=None = rata-rata saja
+    """
+    n_steps = array.shape[1]
+    mean = np.full(n_steps, np.nan)
+    low = np.full(n_steps, np.nan)
+    high = np.full(n_steps, np.nan)
+    count = np.zeros(n_steps, dtype=np.int64)
+    for start, block in _column_blocks(array):
+        stop = start + block.shape[1]
+        present = ~np.isnan(block)
+        count[start:stop] = present.sum(axis=0)
+        filled = count[start:stop] > 0
+        if not filled.any():
+            continue
+        columns = block[:, filled]
+        index = np.arange(start, stop)[filled]
+        mean[index] = np.nanmean(columns, axis=0)
+        if percentiles is None:
+            continue
+        # np.percentile jauh lebih cepat; nanpercentile hanya untuk kolom ber-NaN
+        complete = count[index] == block.shape[0]
+        if complete.any():
+            low[index[complete]], high[index[complete]] = np.percentile(
+                columns[:, complete], percentiles, axis=0)
+        if not complete.all():
+            low[index[~complete]], high[index[~complete]] = np.nanpercentile(
+                columns[:, ~complete], percentiles, axis=0)
+    return {'mean': mean, 'low': low, 'high': high, 'count': count}
+
+
+def extinction_times(array: np.ndarray, steps: np.ndarray = None) -> np.ndarray:
+    """
+    Langkah pertama populasi = 0 per replikasi (NaN jika tidak pernah punah)
+    """
+    first = np.full(array.shape[0], -1, dtype=np.int64)
+    for start, block in _column_blocks(array):
+        hits = block <= 0
+        found = hits.any(axis=1) & (first < 0)
+        first[found] = start + hits[found].argmax(axis=1)
+    times = np.full(array.shape[0], np.nan)
+    extinct = first >= 0
+    steps = np.arange(array.shape[1]) if steps is None else np.asarray(steps)
+    times[extinct] = steps[first[extinct]]
+    return times
+
+
+def phase_density(prey: np.ndarray, predator: np.ndarray, bins: int = 80):
+    """
+    Histogram 2D (mangsa, predator) semua replikasi dan langkah, diakumulasi per blok
+    Returns: (counts, prey_edges, predator_edges)
+    """
+    prey_range = [np.inf, -np.inf]
+    predator_range = [np.inf, -np.inf]
+    for (_, x), (_, y) in zip(_column_blocks(prey), _column_blocks(predator)):
+        if np.isnan(x).all():
+            continue
+        prey_range = [min(prey_range[0], np.nanmin(x)), max(prey_range[1], np.nanmax(x))]
+        predator_range = [min(predator_range[0], np.nanmin(y)), max(predator_range[1], np.nanmax(y))]
+    if not np.isfinite(prey_range[0]):
+        prey_range = predator_range = [0.0, 1.0]
+    prey_range[1] = max(prey_range[1], prey_range[0] + 1)
+    predator_range[1] = max(predator_range[1], predator_range[0] + 1)
+
+    counts = np.zeros((bins, bins))
+    for (_, x), (_, y) in zip(_column_blocks(prey), _column_blocks(predator)):
+        valid = ~(np.isnan(x) | np.isnan(y))
+        block_counts, _, _ = np.histogram2d(
+            x[valid], y[valid], bins=bins, range=[prey_range, predator_range])
+        counts += block_counts
+    prey_edges = np.linspace(prey_range[0], prey_range[1], bins + 1)
+    predator_edges = np.linspace(predator_range[0], predator_range[1], bins + 1)
+    return counts, prey_edges, predator_edges
+
+
+class EnsemblePlotter:
+    """
+    Visualisasi ensemble replikasi: rata-rata dengan pita 5-95% per spesies,
+    histogram waktu kepunahan, dan awan kepadatan phase plot
+
+    Contoh:
+        results = run_forked_replicates(sim, 200, n_replicates=100, steps=1000)
+        ensemble = stack_replicates(results, path='runs/ensemble')
+        EnsemblePlotter(load_ensemble('runs/ensemble'), output_dir='plots').plot_all()
+    """
+    
+    SPECIES = (('herbivore', 'Herbivora (Kelinci)', '#2E8B57'),
+               ('elk', 'Elk', '#8B4513'),
+               ('carnivore', 'Karnivora (Serigala)', '#CD5C5C'))
+    
+    def __init__(self, ensemble: Dict[str, np.ndarray], percentiles: Tuple[float, float] = (5, 95),
+                 max_points: int = DEFAULT_MAX_POINTS, output_dir: str = None, dpi: int = 100):
+        self.ensemble = ensemble
+        self.percentiles = percentiles
+        self.species = [item for item in self.SPECIES if item[0] in ensemble]
+        if not self.species:
+            raise ValueError("Ensemble tidak berisi seri spesies (herbivore/elk/carnivore)")
+        first = ensemble[self.species[0][0]]
+        self.steps = np.asarray(ensemble.get('steps', np.arange(first.shape[1])))
+        self.n_replicates = first.shape[0]
+        
+        self.max_points = max_points
+        self.output_dir = output_dir
+        self.dpi = dpi
+        self.saved_files: List[str] = []
+    
+    def _finish(self, fig, name: str):
+        path = finish_figure(fig, name, self.output_dir, self.dpi)
+        if path:
+            self.saved_files.append(path)
+    
+    def plot_bands(self):
+        """Rata-rata trajektori dengan pita persentil per spesies"""
+        low_p, high_p = self.percentiles
+        fig, axes = plt.subplots(len(self.species), 1, figsize=(12, 3.5 * len(self.species)),
+                                 sharex=True, squeeze=False)
+        for ax, (key, label, color) in zip(axes[:, 0], self.species):
+            bands = ensemble_bands(self.ensemble[key], self.percentiles)
+            indices = downsample_indices(np.nan_to_num(bands['mean']), np.nan_to_num(bands['high']),
+                                         np.nan_to_num(bands['low']), max_points=self.max_points)
+            steps = self.steps[indices]
+            ax.fill_between(steps, bands['low'][indices], bands['high'][indices],
+                            color=color, alpha=0.25, label=f"{low_p:g}–{high_p:g}%")
+            ax.plot(steps, bands['mean'][indices], color=color, linewidth=2, label='Rata-rata')
+            ax.set_ylabel('Populasi')
+            ax.set_title(f"{label} — {self.n_replicates} replikasi")
+            ax.legend(loc='upper right')
+            ax.grid(True, alpha=0.3)
+        axes[-1, 0].set_xlabel('Langkah Waktu')
+        self._finish(fig, 'ensemble_bands')
+    
+    def plot_extinction_times(self, bins: int = 30):
+        """Histogram langkah kepunahan per spesies (bertumpuk, bin sama)"""
+        fig, ax = plt.subplots(figsize=(10, 6))
+        times = {key: extinction_times(self.ensemble[key], self.steps) for key, _, _ in self.species}
+        extinct = {key: values[~np.isnan(values)] for key, values in times.items()}
+        summary = [f"{label}: {len(extinct[key])}/{self.n_replicates} punah"
+                   for key, label, _ in self.species]
+        pooled = np.concatenate(list(extinct.values()))
+        if len(pooled):
+            edges = np.histogram_bin_edges(pooled, bins=bins)
+            baseline = np.zeros(len(edges) - 1)
+            for key, label, color in self.species:
+                if len(extinct[key]):
+                    counts, _ = np.histogram(extinct[key], bins=edges)
+                    ax.stairs(baseline + counts, edges, baseline=baseline, fill=True,
+                              alpha=0.7, color=color, label=label)
+                    baseline = baseline + counts
+        ax.set_xlabel('Langkah kepunahan')
+        ax.set_ylabel('Jumlah replikasi')
+        ax.set_title('Distribusi Waktu Kepunahan\n' + ' | '.join(summary))
+        if ax.get_legend_handles_labels()[0]:
+            ax.legend()
+        ax.grid(True, alpha=0.3)
+        self._finish(fig, 'ensemble_extinction')
+    
+    def plot_phase_density(self, prey: str = 'herbivore', predator: str = 'carnivore',
+                           bins: int = 80):
+        """Awan kepadatan phase plot semua replikasi dengan trajektori rata-rata"""
+        from matplotlib.colors import LogNorm
+        
+        counts, prey_edges, predator_edges = phase_density(
+            self.ensemble[prey], self.ensemble[predator], bins)
+        fig, ax = plt.subplots(figsize=(9, 7))
+        mesh = ax.pcolormesh(prey_edges, predator_edges, np.ma.masked_equal(counts.T, 0),
+                             norm=LogNorm(vmin=1, vmax=max(1, counts.max())), cmap='viridis')
+        fig.colorbar(mesh, ax=ax, label='Langkah x replikasi')
+        
+        prey_mean = ensemble_bands(self.ensemble[prey], None)['mean']
+        predator_mean = ensemble_bands(self.ensemble[predator], None)['mean']
+        valid = ~(np.isnan(prey_mean) | np.isnan(predator_mean))
+        prey_mean, predator_mean = prey_mean[valid], predator_mean[valid]
+        if len(prey_mean):
+            indices = downsample_indices(prey_mean, predator_mean, max_points=self.max_points)
+            ax.plot(prey_mean[indices], predator_mean[indices], color='white', linewidth=1.5,
+                    label='Rata-rata ensemble')
+            ax.legend(facecolor='gray')
+        ax.set_xlabel('Populasi Mangsa')
+        ax.set_ylabel('Populasi Predator')
+        ax.set_title('Awan Kepadatan Phase Plot')
+        self._finish(fig, 'ensemble_phase_density')
+    
+    def plot_all(self):
+        """
+        Plot semua visualisasi ensemble
+        """
+        print(f"📊 Membuat visualisasi ensemble ({self.n_replicates} replikasi)...")
+        self.plot_bands()
+        self.plot_extinction_times()
+        if 'herbivore' in self.ensemble and 'carnivore' in self.ensemble:
+            self.plot_phase_density()
+        print("✅ Visualisasi ensemble selesai!")
+
+
+def create_ensemble_plots(ensemble, output_dir: str = None,
+                          max_points: int = DEFAULT_MAX_POINTS) -> EnsemblePlotter:
     """
-    Fungsi helper untuk membuat semua plot
+    Fungsi helper untuk plot ensemble; ensemble = dict array atau folder stack_replicates
     """
-    plotter = EcosystemPlotter(statistics)
-    plotter.plot_all()
\ No newline at end of file
+    if isinstance(ensemble, str):
+        from models.replicates import load_ensemble
+        ensemble = load_ensemble(ensemble)
+    plotter = EnsemblePlotter(ensemble, max_points=max_points, output_dir=output_dir)
+    plotter.plot_all()
+    return plotter
@@ -3,23 +3,72 @@ Real-time visualization untuk simulasi ekosistem
 Menampilkan animasi live saat simulasi berjalan
 """
 
+import time
+
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
+from matplotlib.colors import LinearSegmentedColormap, to_rgba
 from matplotlib.patches import Circle
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from collections import deque
 
+# Kunci spesies frame berdasarkan SpeciesType.value agen
+FRAME_SPECIES = {'herbivore': 'herbivore', 'large_herbivore': 'elk', 'carnivore': 'carnivore'}
+
+# Di atas populasi ini peta memakai raster kepadatan per spesies, bukan scatter per agen
+DENSITY_THRESHOLD = 2000
+
+
+def density_raster(xs: np.ndarray, ys: np.ndarray, width: int, height: int) -> np.ndarray:
+    """
+    Jumlah agen per sel (width x height) dengan satu np.bincount, O(agen + sel)
+    """
+    counts = np.bincount(xs.astype(np.intp) * height + ys, minlength=width * height)
+    return counts[:width * height].reshape(width, height)
+
+
+def build_frame(simulation_step: int, agents: List, env_stats: Dict) -> Dict[str, Any]:
+    """
+    Ringkas state simulasi menjadi satu frame visualisasi (picklable, tanpa objek agen)
+    Posisi agen hidup dikelompokkan per spesies sebagai array int32
+    """
+    coords = {key: ([], []) for key in FRAME_SPECIES.values()}
+    for agent in agents:
+        if agent.alive:
+            xs, ys = coords[FRAME_SPECIES[agent.species_type.value]]
+            xs.append(agent.x)
+            ys.append(agent.y)
+    positions = {key: (np.array(xs, dtype=np.int32), np.array(ys, dtype=np.int32))
+                 for key, (xs, ys) in coords.items()}
+    return {
+        'step': simulation_step,
+        'counts': {key: len(xs) for key, (xs, _) in positions.items()},
+        'env_stats': env_stats,
+        'positions': positions
+    }
+
 class RealTimeVisualizer:
     """
     Kelas untuk visualisasi real-time simulasi ekosistem
+    Artist (imshow, scatter, line, text, twin axis) dibuat sekali lalu hanya datanya
+    yang diperbarui per frame; blitting dipakai jika backend mendukung
     """
     
-    def __init__(self, width: int, height: int, max_history: int = 200):
+    def __init__(self, width: int, height: int, max_history: int = 200, history=None,
+                 blit: bool = True, density_threshold: int = DENSITY_THRESHOLD):
         self.width = width
         self.height = height
         self.max_history = max_history
         
+        # Populasi total di atas batas ini digambar sebagai raster kepadatan
+        self.density_threshold = density_threshold
+        self.density_mode = False
+        
+        # Arsip history simulasi (HistoryArchive) untuk query rentang waktu apa pun
+        self.history = history
+        self.view_range = None         # (start, stop); None = max_history langkah terakhir
+        
         # Data history untuk plotting
         self.time_history = deque(maxlen=max_history)
         self.herbivore_history = deque(maxlen=max_history)
@@ -27,6 +76,20 @@ class RealTimeVisualizer:
         self.temperature_history = deque(maxlen=max_history)
         self.food_history = deque(maxlen=max_history)
         
+        # Waktu render per frame (detik)
+        self.render_times = deque(maxlen=max_history)
+        
+        # Colors
+        self.colors = {
+            'herbivore': '#2E8B57',  # Sea Green
+            'elk': '#8B4513',        # Saddle Brown
+            'carnivore': '#CD5C5C',  # Indian Red
+            'food_high': '#90EE90',  # Light Green
+            'food_medium': '#FFFF99', # Light Yellow
+            'food_low': '#FFB6C1',   # Light Pink
+            'empty': '#F5F5DC'       # Beige
+        }
+        
         # Setup figure dengan subplots
         self.fig = plt.figure(figsize=(16, 10))
         self.fig.suptitle('🌱 Real-Time Ecosystem Simulation', fontsize=16, fontweight='bold')
@@ -38,18 +101,17 @@ class RealTimeVisualizer:
         self.ax_phase = plt.subplot2grid((2, 3), (1, 1))               # Phase plot
         self.ax_stats = plt.subplot2grid((2, 3), (1, 2))               # Statistics
         
-        # Setup axes
-        self._setup_axes()
+        # Twin axis makanan dibuat sekali (bukan setiap frame)
+        self.ax_food = self.ax_environment.twinx()
         
-        # Colors
-        self.colors = {
-            'herbivore': '#2E8B57',  # Sea Green
-            'carnivore': '#CD5C5C',  # Indian Red
-            'food_high': '#90EE90',  # Light Green
-            'food_medium': '#FFFF99', # Light Yellow
-            'food_low': '#FFB6C1',   # Light Pink
-            'empty': '#F5F5DC'       # Beige
-        }
+        # Blitting hanya jika backend mendukung
+        self.blit = blit and getattr(self.fig.canvas, 'supports_blit', False)
+        self._background = None
+        self._limits = {}
+        
+        # Setup axes dan artist
+        self._setup_axes()
+        self._create_artists()
         
         print("🎬 Real-time visualizer initialized")
     
@@ -71,10 +133,13 @@ class RealTimeVisualizer:
         self.ax_population.grid(True, alpha=0.3)
         
         # 3. Environment conditions
-        self.ax_environment.set_title('🌡️ Environment')
+        self.ax_environment.set_title('🌡️ Environment Conditions')
         self.ax_environment.set_xlabel('Time Steps')
-        self.ax_environment.set_ylabel('Temperature (°C)')
+        self.ax_environment.set_ylabel('Temperature (°C)', color='red')
+        self.ax_environment.tick_params(axis='y', labelcolor='red')
         self.ax_environment.grid(True, alpha=0.3)
+        self.ax_food.set_ylabel('Total Food', color='green')
+        self.ax_food.tick_params(axis='y', labelcolor='green')
         
         # 4. Phase plot
         self.ax_phase.set_title('🔄 Phase Plot (Lotka-Volterra)')
@@ -86,6 +151,105 @@ class RealTimeVisualizer:
         self.ax_stats.axis('off')
         self.ax_stats.set_title('📊 Live Statistics')
     
+    def _create_artists(self):
+        """Buat semua artist sekali; frame berikutnya hanya memperbarui datanya"""
+        from data.config_fixed import ENVIRONMENT_CONFIG
+        
+        animated = self.blit
+        
+        # Food background (skala warna tetap agar tidak perlu dihitung ulang)
+        self.food_image = self.ax_spatial.imshow(
+            np.zeros((self.height, self.width)), extent=[0, self.width, 0, self.height],
+            origin='lower', cmap='YlOrBr', alpha=0.6, aspect='auto',
+            vmin=0, vmax=ENVIRONMENT_CONFIG['max_food_per_cell'], animated=animated)
+        self.herbivore_scatter = self.ax_spatial.scatter(
+            [], [], c=self.colors['herbivore'], s=30, marker='o',
+            label='🐰 Herbivora', alpha=0.8, animated=animated)
+        self.elk_scatter = self.ax_spatial.scatter(
+            [], [], c=self.colors['elk'], s=40, marker='s',
+            label='🦌 Elk', alpha=0.8, animated=animated)
+        self.carnivore_scatter = self.ax_spatial.scatter(
+            [], [], c=self.colors['carnivore'], s=50, marker='^',
+            label='🐺 Karnivora', alpha=0.8, animated=animated)
+        self.ax_spatial.legend(loc='upper right')
+        self.species_scatters = {'herbivore': self.herbivore_scatter, 'elk': self.elk_scatter,
+                                 'carnivore': self.carnivore_scatter}
+        
+        # Raster kepadatan per spesies (transparan di sel kosong), disembunyikan
+        # sampai populasi melewati density_threshold
+        self.density_images = {}
+        for key in self.species_scatters:
+            cmap = LinearSegmentedColormap.from_list(
+                f"density_{key}", [to_rgba(self.colors[key], 0.0), to_rgba(self.colors[key], 0.9)])
+            self.density_images[key] = self.ax_spatial.imshow(
+                np.ma.masked_all((self.height, self.width)),
+                extent=[0, self.width, 0, self.height], origin='lower', cmap=cmap,
+                aspect='auto', interpolation='nearest', vmin=0, vmax=1,
+                visible=False, animated=animated)
+        
+        self.herbivore_line, = self.ax_population.plot(
+            [], [], color=self.colors['herbivore'], linewidth=2,
+            label='🐰 Herbivora', marker='o', markersize=3, animated=animated)
+        self.carnivore_line, = self.ax_population.plot(
+            [], [], color=self.colors['carnivore'], linewidth=2,
+            label='🐺 Karnivora', marker='^', markersize=3, animated=animated)
+        self.ax_population.legend()
+        
+        self.temperature_line, = self.ax_environment.plot(
+            [], [], color='red', linewidth=2, label='Temperature', animated=animated)
+        self.food_line, = self.ax_food.plot(
+            [], [], color='green', linewidth=2, label='Total Food', animated=animated)
+        
+        self.phase_line, = self.ax_phase.plot(
+            [], [], color='purple', linewidth=1.5, alpha=0.7, animated=animated)
+        self.phase_start = self.ax_phase.scatter(
+            [], [], color='green', s=100, marker='o', label='Start', zorder=5, animated=animated)
+        self.phase_current = self.ax_phase.scatter(
+            [], [], color='red', s=100, marker='X', label='Current', zorder=5, animated=animated)
+        self.ax_phase.legend()
+        
+        self.stats_text = self.ax_stats.text(
+            0.05, 0.95, '', transform=self.ax_stats.transAxes,
+            fontsize=10, fontfamily='monospace', verticalalignment='top',
+            bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8), animated=animated)
+        
+        self._animated_artists = [
+            self.food_image, *self.density_images.values(), *self.species_scatters.values(),
+            self.herbivore_line, self.carnivore_line, self.temperature_line, self.food_line,
+            self.phase_line, self.phase_start, self.phase_current, self.stats_text
+        ]
+    
+    def set_history(self, history):
+        """Pakai arsip history simulasi sebagai sumber data grafik time-series"""
+        self.history = history
+    
+    def set_view_range(self, start: int = None, stop: int = None):
+        """
+        Atur rentang langkah [start, stop) yang ditampilkan grafik time-series
+        Tanpa argumen: kembali ke max_history langkah terakhir
+        """
+        self.view_range = None if start is None and stop is None else (start, stop)
+    
+    def _series(self, key: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (langkah, nilai) untuk grafik: dari arsip history jika ada, selain itu dari deque
+        """
+        if self.history is not None and hasattr(self.history, 'query'):
+            if self.view_range is None:
+                start, stop = max(0, self.history.steps - self.max_history), None
+            else:
+                start, stop = self.view_range
+            data = self.history.query(key, start, stop)
+            return data['step'], data['mean']
+        
+        buffers = {
+            'herbivore': self.herbivore_history,
+            'carnivore': self.carnivore_history,
+            'avg_temperature': self.temperature_history,
+            'total_food': self.food_history
+        }
+        return np.fromiter(self.time_history, dtype=float), np.fromiter(buffers[key], dtype=float)
+    
     def update_data(self, simulation_step: int, agents: List, environment, env_stats: Dict):
         """
         Update data untuk visualisasi real-time
@@ -96,11 +260,19 @@ class RealTimeVisualizer:
             environment: Environment object
             env_stats: Statistik lingkungan
         """
-        from agents.base_agent import HerbivoreAgent, CarnivoreAgent
+        self.render_frame(build_frame(simulation_step, agents, env_stats), environment.food)
+    
+    def render_frame(self, frame: Dict[str, Any], food: np.ndarray):
+        """
+        Gambar satu frame (dari build_frame) dengan array makanan width x height
+        Dipakai langsung maupun oleh proses visualizer terpisah
+        """
+        start = time.perf_counter()
         
-        # Hitung populasi
-        herbivore_count = len([a for a in agents if a.alive and isinstance(a, HerbivoreAgent)])
-        carnivore_count = len([a for a in agents if a.alive and isinstance(a, CarnivoreAgent)])
+        simulation_step = frame['step']
+        env_stats = frame['env_stats']
+        herbivore_count = frame['counts']['herbivore']
+        carnivore_count = frame['counts']['carnivore']
         
         # Update history
         self.time_history.append(simulation_step)
@@ -109,133 +281,127 @@ class RealTimeVisualizer:
         self.temperature_history.append(env_stats['avg_temperature'])
         self.food_history.append(env_stats['total_food'])
         
-        # Update all plots
-        self._update_spatial_view(agents, environment)
-        self._update_population_plot()
-        self._update_environment_plot()
-        self._update_phase_plot()
-        self._update_statistics(simulation_step, herbivore_count, carnivore_count, env_stats)
+        # Update data semua artist
+        self._update_spatial_view(frame['positions'], food)
+        rescaled = self._update_population_plot()
+        rescaled |= self._update_environment_plot()
+        rescaled |= self._update_phase_plot()
+        self._update_statistics(simulation_step, herbivore_count, carnivore_count, env_stats,
+                                frame['counts'].get('elk', 0))
         
         # Refresh display
-        plt.pause(0.001)  # Small pause to allow GUI update
+        self._draw(full=rescaled)
+        self.render_times.append(time.perf_counter() - start)
     
-    def _update_spatial_view(self, agents: List, environment):
-        """Update spatial view dengan posisi agen dan kondisi lingkungan"""
-        from agents.base_agent import HerbivoreAgent, CarnivoreAgent
-        
-        self.ax_spatial.clear()
-        self.ax_spatial.set_xlim(0, self.width)
-        self.ax_spatial.set_ylim(0, self.height)
-        self.ax_spatial.set_aspect('equal')
-        self.ax_spatial.set_title('🗺️ Ecosystem Map')
-        
-        # Plot food density sebagai background
-        food_matrix = np.zeros((self.width, self.height))
-        for x in range(self.width):
-            for y in range(self.height):
-                cell = environment.get_cell(x, y)
-                food_matrix[x, y] = cell.food
-        
-        # Show food as background heatmap
-        im = self.ax_spatial.imshow(food_matrix.T, 
-                                   extent=[0, self.width, 0, self.height],
-                                   origin='lower', cmap='YlOrBr', alpha=0.6, aspect='auto')
-        
-        # Plot agents
-        herbivore_x = [a.x + 0.5 for a in agents if a.alive and isinstance(a, HerbivoreAgent)]
-        herbivore_y = [a.y + 0.5 for a in agents if a.alive and isinstance(a, HerbivoreAgent)]
-        carnivore_x = [a.x + 0.5 for a in agents if a.alive and isinstance(a, CarnivoreAgent)]
-        carnivore_y = [a.y + 0.5 for a in agents if a.alive and isinstance(a, CarnivoreAgent)]
-        
-        # Plot herbivores as green circles
-        if herbivore_x:
-            self.ax_spatial.scatter(herbivore_x, herbivore_y, 
-                                  c=self.colors['herbivore'], s=30, 
-                                  marker='o', label='🐰 Herbivora', alpha=0.8)
-        
-        # Plot carnivores as red triangles
-        if carnivore_x:
-            self.ax_spatial.scatter(carnivore_x, carnivore_y, 
-                                  c=self.colors['carnivore'], s=50, 
-                                  marker='^', label='🐺 Karnivora', alpha=0.8)
-        
-        self.ax_spatial.legend(loc='upper right')
-        self.ax_spatial.set_xlabel('X Position')
-        self.ax_spatial.set_ylabel('Y Position')
+    def _draw(self, full: bool):
+        """
+        Gambar ulang: penuh jika batas axis berubah, selain itu blit artist saja
+        """
+        canvas = self.fig.canvas
+        if not self.blit:
+            canvas.draw_idle()
+            canvas.flush_events()
+            return
+        if full or self._background is None:
+            # Background tanpa artist animasi (tick, label, grid, legend)
+            canvas.draw()
+            self._background = canvas.copy_from_bbox(self.fig.bbox)
+        else:
+            canvas.restore_region(self._background)
+        for artist in self._animated_artists:
+            artist.axes.draw_artist(artist)
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+    
+    def _set_limits(self, name: str, ax, x, y, margin: float = 0.15) -> bool:
+        """
+        Perbarui batas axis hanya jika data keluar dari batas saat ini
+        (dengan ruang tambahan agar gambar ulang penuh jarang terjadi)
+        Mengembalikan True jika batas berubah
+        """
+        if len(x) == 0:
+            return False
+        x_low, x_high = float(np.min(x)), float(np.max(x))
+        y_low, y_high = float(np.min(y)), float(np.max(y))
+        current = self._limits.get(name)
+        if current is not None:
+            cx0, cx1, cy0, cy1 = current
+            if cx0 <= x_low and x_high <= cx1 and cy0 <= y_low and y_high <= cy1:
+                return False
+        x_pad = max(1.0, (x_high - x_low) * margin)
+        y_pad = max(1.0, abs(y_high - y_low) * margin)
+        limits = (x_low - x_pad if name == 'phase' else x_low, x_high + x_pad,
+                  y_low - y_pad, y_high + y_pad)
+        ax.set_xlim(limits[0], limits[1])
+        ax.set_ylim(limits[2], limits[3])
+        self._limits[name] = limits
+        return True
     
-    def _update_population_plot(self):
+    def _update_spatial_view(self, positions: Dict[str, Tuple[np.ndarray, np.ndarray]],
+                             food: np.ndarray):
+        """
+        Update spatial view dengan posisi agen dan kondisi lingkungan
+        Populasi kecil: scatter per agen; di atas density_threshold: raster kepadatan
+        per spesies sehingga biaya frame dibatasi ukuran grid, bukan jumlah agen
+        """
+        # Food background: array makanan langsung, tanpa loop per sel
+        self.food_image.set_data(food.T)
+        
+        population = sum(len(xs) for xs, _ in positions.values())
+        self.density_mode = population > self.density_threshold
+        
+        for key, scatter in self.species_scatters.items():
+            xs, ys = positions.get(key, (np.empty(0, np.int32), np.empty(0, np.int32)))
+            image = self.density_images[key]
+            scatter.set_visible(not self.density_mode)
+            image.set_visible(self.density_mode)
+            if self.density_mode:
+                raster = density_raster(xs, ys, self.width, self.height)
+                image.set_data(np.ma.masked_equal(raster.T, 0))
+                image.set_clim(0, max(1, int(raster.max())))
+                scatter.set_offsets(np.empty((0, 2)))
+            else:
+                # Posisi agen (tengah sel)
+                scatter.set_offsets(np.column_stack((xs + 0.5, ys + 0.5)))
+    
+    def _update_population_plot(self) -> bool:
         """Update plot dinamika populasi"""
-        self.ax_population.clear()
-        
-        if len(self.time_history) > 1:
-            self.ax_population.plot(list(self.time_history), list(self.herbivore_history), 
-                                  color=self.colors['herbivore'], linewidth=2, 
-                                  label='🐰 Herbivora', marker='o', markersize=3)
-            self.ax_population.plot(list(self.time_history), list(self.carnivore_history), 
-                                  color=self.colors['carnivore'], linewidth=2, 
-                                  label='🐺 Karnivora', marker='^', markersize=3)
-        
-        self.ax_population.set_title('📈 Population Dynamics')
-        self.ax_population.set_xlabel('Time Steps')
-        self.ax_population.set_ylabel('Population')
-        self.ax_population.legend()
-        self.ax_population.grid(True, alpha=0.3)
+        steps, herbivores = self._series('herbivore')
+        _, carnivores = self._series('carnivore')
+        self.herbivore_line.set_data(steps, herbivores)
+        self.carnivore_line.set_data(steps, carnivores)
+        if len(steps) < 2:
+            return False
+        # Sumbu waktu bergeser setiap langkah; batas diperbarui per blok 10% jendela
+        return self._set_limits('population', self.ax_population, steps,
+                                np.concatenate((herbivores, carnivores)))
     
-    def _update_environment_plot(self):
+    def _update_environment_plot(self) -> bool:
         """Update plot kondisi lingkungan"""
-        self.ax_environment.clear()
-        
-        if len(self.time_history) > 1:
-            # Temperature line
-            ax_temp = self.ax_environment
-            ax_temp.plot(list(self.time_history), list(self.temperature_history), 
-                        color='red', linewidth=2, label='Temperature')
-            ax_temp.set_ylabel('Temperature (°C)', color='red')
-            ax_temp.tick_params(axis='y', labelcolor='red')
-            
-            # Food line (secondary y-axis)
-            ax_food = ax_temp.twinx()
-            ax_food.plot(list(self.time_history), list(self.food_history), 
-                        color='green', linewidth=2, label='Total Food')
-            ax_food.set_ylabel('Total Food', color='green')
-            ax_food.tick_params(axis='y', labelcolor='green')
-        
-        self.ax_environment.set_title('🌡️ Environment Conditions')
-        self.ax_environment.set_xlabel('Time Steps')
-        self.ax_environment.grid(True, alpha=0.3)
+        steps, temperature = self._series('avg_temperature')
+        food_steps, food = self._series('total_food')
+        self.temperature_line.set_data(steps, temperature)
+        self.food_line.set_data(food_steps, food)
+        if len(steps) < 2:
+            return False
+        changed = self._set_limits('temperature', self.ax_environment, steps, temperature)
+        changed |= self._set_limits('food', self.ax_food, food_steps, food)
+        return changed
     
-    def _update_phase_plot(self):
+    def _update_phase_plot(self) -> bool:
         """Update phase plot Lotka-Volterra"""
-        self.ax_phase.clear()
-        
-        if len(self.herbivore_history) > 5:
-            # Plot trajectory
-            self.ax_phase.plot(list(self.herbivore_history), list(self.carnivore_history), 
-                             color='purple', linewidth=1.5, alpha=0.7)
-            
-            # Mark start and current position
-            if len(self.herbivore_history) > 0:
-                # Start point
-                self.ax_phase.scatter(self.herbivore_history[0], self.carnivore_history[0], 
-                                    color='green', s=100, marker='o', 
-                                    label='Start', zorder=5)
-                
-                # Current point
-                self.ax_phase.scatter(self.herbivore_history[-1], self.carnivore_history[-1], 
-                                    color='red', s=100, marker='X', 
-                                    label='Current', zorder=5)
-        
-        self.ax_phase.set_title('🔄 Phase Plot (Lotka-Volterra)')
-        self.ax_phase.set_xlabel('Herbivore Population')
-        self.ax_phase.set_ylabel('Carnivore Population')
-        self.ax_phase.legend()
-        self.ax_phase.grid(True, alpha=0.3)
+        _, herbivores = self._series('herbivore')
+        _, carnivores = self._series('carnivore')
+        if len(herbivores) <= 5:
+            return False
+        self.phase_line.set_data(herbivores, carnivores)
+        self.phase_start.set_offsets([[herbivores[0], carnivores[0]]])
+        self.phase_current.set_offsets([[herbivores[-1], carnivores[-1]]])
+        return self._set_limits('phase', self.ax_phase, herbivores, carnivores)
     
-    def _update_statistics(self, step: int, herb_count: int, carn_count: int, env_stats: Dict):
+    def _update_statistics(self, step: int, herb_count: int, carn_count: int, env_stats: Dict,
+                           elk_count: int = 0):
         """Update statistics text"""
-        self.ax_stats.clear()
-        self.ax_stats.axis('off')
-        
         # Calculate ratios and trends
         ratio = carn_count / max(1, herb_count)
         
@@ -254,6 +420,8 @@ class RealTimeVisualizer:
             elif self.carnivore_history[-1] < self.carnivore_history[-2]:
                 trend_carn = "↘"
         
+        render_ms = 1000 * self.render_times[-1] if self.render_times else 0.0
+        
         # Create statistics text
         stats_text = f"""
 📊 LIVE STATISTICS
@@ -261,6 +429,7 @@ class RealTimeVisualizer:
 ⏱️ Step: {step}
 
 🐰 Herbivora: {herb_count} {trend_herb}
+🦌 Elk: {elk_count}
 🐺 Karnivora: {carn_count} {trend_carn}
 
 ⚖️ Ratio P:M: {ratio:.3f}
@@ -272,13 +441,17 @@ class RealTimeVisualizer:
 📈 Food Density: {env_stats['food_density']:.1f}
 
 🎯 Status: {'🟢 Stable' if 0.1 <= ratio <= 0.3 else '🟡 Unstable'}
+🖼️ Render: {render_ms:.1f} ms/frame{' (raster)' if self.density_mode else ''}
         """
-        
-        self.ax_stats.text(0.05, 0.95, stats_text, 
-                          transform=self.ax_stats.transAxes,
-                          fontsize=10, fontfamily='monospace',
-                          verticalalignment='top',
-                          bbox=dict(boxstyle='round', facecolor='lightgray', alpha=0.8))
+        self.stats_text.set_text(stats_text)
+    
+    def render_stats(self) -> Dict[str, float]:
+        """Statistik waktu render per frame (ms)"""
+        if not self.render_times:
+            return {'frames': 0, 'mean_ms': 0.0, 'p95_ms': 0.0, 'max_ms': 0.0}
+        times = np.fromiter(self.render_times, dtype=float) * 1000
+        return {'frames': len(times), 'mean_ms': float(times.mean()),
+                'p95_ms': float(np.percentile(times, 95)), 'max_ms': float(times.max())}
     
     def show(self):
         """Tampilkan window visualisasi"""
@@ -288,11 +461,17 @@ class RealTimeVisualizer:
     
     def close(self):
         """Tutup visualisasi"""
+        stats = self.render_stats()
         plt.close(self.fig)
-        print("🎬 Real-time visualization closed")
+        print(f"🎬 Real-time visualization closed "
+              f"(render {stats['mean_ms']:.1f} ms/frame rata-rata, p95 {stats['p95_ms']:.1f} ms, "
+              f"{'blit' if self.blit else 'redraw'})")
 
-def create_realtime_visualizer(width: int, height: int) -> RealTimeVisualizer:
+def create_realtime_visualizer(width: int, height: int, history=None,
+                               density_threshold: int = None) -> RealTimeVisualizer:
     """
     Factory function untuk membuat real-time visualizer
     """
-    return RealTimeVisualizer(width, height)
\ No newline at end of file
+    if density_threshold is None:
+        density_threshold = DENSITY_THRESHOLD
+    return RealTimeVisualizer(width, height, history=history, density_threshold=density_threshold)
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+Real-time visualizer di proses terpisah
+Simulasi hanya mengirim frame ringkas (populasi, statistik lingkungan, posisi per
+spesies) lewat queue berukuran kecil; proses visualizer menggambar dengan
+RealTimeVisualizer. Array makanan Environment dipindah ke shared memory sehingga
+proses visualizer membacanya langsung tanpa salinan atau pickling
+
+    • Frame dibatasi max_fps di sisi simulasi (langkah di antaranya tidak dikirim)
+    • Jika renderer tertinggal dan queue penuh, frame baru dibuang (tidak menunggu)
+    • Renderer selalu menggambar frame terbaru yang ada di queue
+"""
+
+import time
+import queue
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, Any
+
+import numpy as np
+
+
+def _visualizer_main(width: int, height: int, shm_name: str, frames, stats, max_fps: float,
+                     density_threshold: int):
+    """
+    Loop proses visualizer: ambil frame terbaru, gambar, batasi FPS
+    """
+    import matplotlib.pyplot as plt
+    from .realtime import RealTimeVisualizer
+
+    # Proses spawn berbagi resource tracker dengan simulasi; unlink dilakukan pemilik
+    shm = shared_memory.SharedMemory(name=shm_name)
+    food = np.ndarray((width, height), dtype=np.float64, buffer=shm.buf)
+    visualizer = RealTimeVisualizer(width, height, density_threshold=density_threshold)
+    visualizer.show()
+
+    min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+    try:
+        while True:
+            try:
+                frame = frames.get(timeout=0.1)
+            except queue.Empty:
+                plt.pause(0.05)            # Jaga window tetap responsif
+                continue
+
+            # Buang frame lama, gambar yang terbaru saja
+            stale = 0
+            while frame is not None:
+                try:
+                    newer = frames.get_nowait()
+                except queue.Empty:
+                    break
+                frame = newer
+                stale += 1
+            if frame is None:
+                break
+
+            start = time.perf_counter()
+            visualizer.render_frame(frame, food)
+            elapsed = time.perf_counter() - start
+            with stats.get_lock():
+                stats[0] += 1              # Frame digambar
+                stats[1] += stale          # Frame dibuang oleh renderer
+            if elapsed < min_interval:
+                plt.pause(min_interval - elapsed)
+    finally:
+        del food
+        visualizer.close()
+        shm.close()
+
+
+class VisualizerProcess:
+    """
+    Pengganti RealTimeVisualizer di proses simulasi dengan antarmuka serupa
+
+    Contoh:
+        visualizer = VisualizerProcess(width, height, max_fps=10)
+        visualizer.start(sim.environment)
+        for step in range(steps):
+            sim.step()
+            visualizer.update_data(step, sim.agents, sim.environment)
+        visualizer.close()
+    """
+
+    def __init__(self, width: int, height: int, max_fps: float = 10.0, queue_size: int = 2,
+                 density_threshold: int = None):
+        from .realtime import DENSITY_THRESHOLD
+
+        self.width = width
+        self.height = height
+        self.max_fps = max_fps
+        self.queue_size = queue_size
+        self.density_threshold = DENSITY_THRESHOLD if density_threshold is None else density_threshold
+
+        self._context = multiprocessing.get_context('spawn')
+        self._frames = None
+        self._stats = None
+        self._process = None
+        self._shm = None
+        self._environment = None
+        self._last_submit = 0.0
+
+        self.frames_sent = 0
+        self.frames_dropped = 0          # Queue penuh, frame tidak terkirim
+        self.frames_skipped = 0          # Dilewati karena batas FPS
+
+    def start(self, environment):
+        """
+        Pindahkan array makanan ke shared memory lalu jalankan proses visualizer
+        """
+        self._shm = shared_memory.SharedMemory(create=True, size=environment.food.nbytes)
+        environment.use_food_buffer(self._shm.buf)
+        self._environment = environment
+
+        self._frames = self._context.Queue(maxsize=self.queue_size)
+        self._stats = self._context.Array('q', 2)
+        self._process = self._context.Process(
+            target=_visualizer_main,
+            args=(self.width, self.height, self._shm.name, self._frames, self._stats, self.max_fps,
+                  self.density_threshold),
+            daemon=True
+        )
+        self._process.start()
+        print(f"🎬 Visualizer berjalan di proses terpisah (pid {self._process.pid}, "
+              f"maks {self.max_fps:g} FPS)")
+
+    def show(self):
+        """Kompatibel dengan RealTimeVisualizer (window dibuka oleh proses visualizer)"""
+
+    @property
+    def alive(self) -> bool:
+        return self._process is not None and self._process.is_alive()
+
+    def update_data(self, simulation_step: int, agents, environment, env_stats: Dict = None) -> bool:
+        """
+        Kirim frame jika batas FPS mengizinkan; tidak pernah menunggu renderer
+        Mengembalikan True jika frame masuk queue
+        """
+        if not self.alive:
+            return False
+        now = time.perf_counter()
+        if self.max_fps > 0 and now - self._last_submit < 1.0 / self.max_fps:
+            self.frames_skipped += 1
+            return False
+        self._last_submit = now
+
+        # Renderer tertinggal: buang frame tanpa membangunnya
+        if self._frames.full():
+            self.frames_dropped += 1
+            return False
+
+        from .realtime import build_frame
+
+        frame = build_frame(simulation_step, agents, env_stats or environment.get_stats())
+        try:
+            self._frames.put_nowait(frame)
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+        self.frames_sent += 1
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Statistik frame: dikirim, dilewati (FPS), dibuang (queue/renderer), digambar"""
+        rendered, stale = (self._stats[0], self._stats[1]) if self._stats is not None else (0, 0)
+        return {
+            'sent': self.frames_sent,
+            'skipped_fps': self.frames_skipped,
+            'dropped_queue': self.frames_dropped,
+            'dropped_renderer': stale,
+            'rendered': rendered
+        }
+
+    def close(self, timeout: float = 5.0):
+        """
+        Hentikan proses visualizer dan kembalikan array makanan ke memori biasa
+        """
+        if self._process is not None:
+            try:
+                self._frames.put(None, timeout=timeout)
+            except queue.Full:
+                pass
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+
+        if self._environment is not None:
+            self._environment.release_food_buffer()
+            self._environment = None
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+        stats = self.stats()
+        print(f"🎬 Visualizer ditutup: {stats['rendered']} frame digambar, "
+              f"{stats['skipped_fps']} dilewati (batas FPS), "
+              f"{stats['dropped_queue'] + stats['dropped_renderer']} dibuang")
+
+
+def create_visualizer_process(width: int, height: int, max_fps: float = 10.0,
+                              density_threshold: int = None) -> VisualizerProcess:
+    """
+    Factory function untuk visualizer di proses terpisah
+    """
+    return VisualizerProcess(width, height, max_fps=max_fps, density_threshold=density_threshold)
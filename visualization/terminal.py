@@ -0,0 +1,282 @@
+"""
+Dashboard terminal (ANSI) untuk memantau simulasi di mesin headless tanpa matplotlib
+Menampilkan sparkline populasi per spesies, makanan, dan suhu, peta kepadatan agen
+dengan karakter blok Unicode, serta waktu per fase pipeline
+
+Thread latar belakang menggambar ulang dengan laju tetap. Simulasi hanya membuat
+snapshot saat thread memintanya (fase pipeline 'dashboard' memeriksa satu Event),
+sehingga loop simulasi tidak pernah menunggu renderer
+"""
+
+import sys
+import time
+import shutil
+import threading
+from collections import deque
+from typing import Dict, Any, List, Optional
+
+import numpy as np
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+DENSITY_CHARS = " ·░▒▓█"
+
+# Seri sparkline: (kunci history, label, kode warna ANSI)
+SPARK_SERIES = (
+    ('herbivore', '🐰 Kelinci ', '32'),
+    ('elk', '🦌 Elk     ', '33'),
+    ('carnivore', '🐺 Serigala', '31'),
+    ('total_food', '🍃 Makanan ', '92'),
+    ('avg_temperature', '🌡️  Suhu    ', '91'),
+)
+
+# Warna sel peta berdasarkan spesies dominan
+MAP_COLORS = {'herbivore': '32', 'elk': '33', 'carnivore': '31'}
+
+
+def sparkline(values: np.ndarray, width: int) -> str:
+    """
+    Sparkline Unicode selebar width karakter (nilai dirata-rata per kolom)
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(values) == 0:
+        return ""
+    if len(values) > width:
+        edges = np.linspace(0, len(values), width + 1).astype(int)
+        values = np.add.reduceat(values, edges[:-1]) / np.diff(edges)
+    low, high = values.min(), values.max()
+    if high - low < 1e-12:
+        levels = np.full(len(values), len(SPARK_CHARS) // 2, dtype=int)
+    else:
+        levels = ((values - low) / (high - low) * (len(SPARK_CHARS) - 1)).round().astype(int)
+    return ''.join(SPARK_CHARS[i] for i in levels)
+
+
+def density_map(positions: Dict[str, tuple], width: int, height: int,
+                cols: int, rows: int, color: bool = True) -> List[str]:
+    """
+    Peta kepadatan agen grid width x height diperkecil menjadi cols x rows karakter
+    Tingkat blok = kepadatan total, warna = spesies dominan di sel
+    """
+    cols = max(1, min(cols, width))
+    rows = max(1, min(rows, height))
+    counts = {}
+    for key, (xs, ys) in positions.items():
+        cx = np.asarray(xs, dtype=np.intp) * cols // width
+        cy = np.asarray(ys, dtype=np.intp) * rows // height
+        counts[key] = np.bincount(cy * cols + cx, minlength=rows * cols).reshape(rows, cols)
+
+    species = list(counts)
+    if not species:
+        return [" " * cols for _ in range(rows)]
+    stacked = np.stack([counts[key] for key in species])
+    total = stacked.sum(axis=0)
+    dominant = stacked.argmax(axis=0)
+    peak = max(1, int(total.max()))
+    levels = np.ceil(total / peak * (len(DENSITY_CHARS) - 1)).astype(int)
+
+    lines = []
+    # Baris teratas = y terbesar (sama dengan peta matplotlib origin='lower')
+    for row in range(rows - 1, -1, -1):
+        chars = []
+        for col in range(cols):
+            char = DENSITY_CHARS[levels[row, col]]
+            if color and levels[row, col] > 0:
+                char = f"\x1b[{MAP_COLORS.get(species[dominant[row, col]], '37')}m{char}\x1b[0m"
+            chars.append(char)
+        lines.append(''.join(chars))
+    return lines
+
+
+def take_snapshot(simulation, spark_steps: int) -> Dict[str, Any]:
+    """
+    Salin data yang dibutuhkan dashboard dari simulasi (dipanggil di thread simulasi)
+    """
+    from .realtime import build_frame
+
+    history = simulation.population_history
+    frame = build_frame(simulation.time_step, simulation.agents, {})
+    return {
+        'step': simulation.time_step,
+        'time': time.perf_counter(),
+        'record': dict(simulation.latest_record or {}),
+        'events': {kind: dict(values) for kind, values in simulation.step_events.items()},
+        'series': {key: history[key][-spark_steps:] for key, _, _ in SPARK_SERIES
+                   if key in history},
+        'positions': frame['positions'],
+        'phases': {phase.name: (phase.last_ns / 1e6,
+                                phase.total_ns / phase.calls / 1e6 if phase.calls else 0.0)
+                   for phase in simulation.pipeline if phase.enabled}
+    }
+
+
+def _dashboard_phase(simulation, phase):
+    """Fase pipeline: buat snapshot hanya jika thread dashboard memintanya"""
+    dashboard = simulation.dashboard
+    if dashboard._wanted.is_set():
+        dashboard._wanted.clear()
+        dashboard.snapshot = take_snapshot(simulation, dashboard.spark_steps)
+
+
+class TerminalDashboard:
+    """
+    Dashboard terminal yang digambar ulang refresh_hz kali per detik oleh thread sendiri
+
+    Contoh:
+        dashboard = TerminalDashboard(refresh_hz=2)
+        dashboard.attach(sim)
+        for _ in range(steps):
+            sim.step()
+        dashboard.detach(sim)
+    """
+
+    def __init__(self, refresh_hz: float = 2.0, spark_steps: int = 500,
+                 stream=None, color: Optional[bool] = None):
+        if refresh_hz <= 0:
+            raise ValueError("refresh_hz harus > 0")
+        self.refresh_hz = refresh_hz
+        self.spark_steps = spark_steps
+        self.stream = stream or sys.stdout
+        self.ansi = self.stream.isatty() if color is None else color
+
+        self.snapshot: Optional[Dict[str, Any]] = None
+        self.frames_drawn = 0
+        self.width = 0
+        self.height = 0
+
+        self._wanted = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._previous: Optional[Dict[str, Any]] = None
+
+        # Pesan selama run (ditampilkan di dashboard, dicetak ulang saat detach)
+        self.messages: deque = deque(maxlen=5)
+        self._all_messages: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Siklus hidup
+    # ------------------------------------------------------------------
+
+    def attach(self, simulation):
+        """Pasang fase snapshot di akhir pipeline dan mulai thread render"""
+        simulation.dashboard = self
+        self.width = simulation.width
+        self.height = simulation.height
+        if 'dashboard' not in simulation.pipeline:
+            simulation.pipeline.register('dashboard', _dashboard_phase)
+        self._wanted.set()
+
+        if self.ansi:
+            # Layar alternatif, kursor disembunyikan
+            self.stream.write("\x1b[?1049h\x1b[?25l")
+            self.stream.flush()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='terminal-dashboard', daemon=True)
+        self._thread.start()
+
+    def detach(self, simulation):
+        """Hentikan thread, lepas fase snapshot, dan cetak frame terakhir"""
+        if 'dashboard' in simulation.pipeline:
+            simulation.pipeline.remove('dashboard')
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if getattr(simulation, 'dashboard', None) is self:
+            simulation.dashboard = None
+
+        if self.ansi:
+            self.stream.write("\x1b[?25h\x1b[?1049l")
+        # Frame terakhir tetap terlihat setelah layar alternatif ditutup
+        self.messages.clear()
+        self.snapshot = take_snapshot(simulation, self.spark_steps)
+        self.stream.write('\n'.join(self.render(self.snapshot, ansi=False)) + '\n')
+        for message in self._all_messages:
+            self.stream.write(message + '\n')
+        self.stream.flush()
+
+    def log(self, message: str):
+        """Pengganti print selama dashboard aktif"""
+        self.messages.append(message.strip())
+        self._all_messages.append(message)
+
+    def _loop(self):
+        interval = 1.0 / self.refresh_hz
+        while not self._stop.wait(interval):
+            snapshot = self.snapshot
+            self._wanted.set()                # Minta snapshot baru untuk frame berikutnya
+            if snapshot is None or snapshot is self._previous:
+                continue
+            self._draw(snapshot)
+
+    def _draw(self, snapshot: Dict[str, Any]):
+        lines = self.render(snapshot, ansi=self.ansi)
+        if self.ansi:
+            text = "\x1b[H" + ''.join(line + "\x1b[K\n" for line in lines) + "\x1b[J"
+        else:
+            text = '\n'.join(lines) + '\n\n'
+        self.stream.write(text)
+        self.stream.flush()
+        self._previous = snapshot
+        self.frames_drawn += 1
+
+    # ------------------------------------------------------------------
+    # Render
+    # ------------------------------------------------------------------
+
+    def _rate(self, snapshot: Dict[str, Any]) -> float:
+        """Langkah per detik sejak snapshot sebelumnya"""
+        previous = self._previous
+        if previous is None or snapshot['time'] <= previous['time']:
+            return 0.0
+        return (snapshot['step'] - previous['step']) / (snapshot['time'] - previous['time'])
+
+    def render(self, snapshot: Dict[str, Any], ansi: bool = False) -> List[str]:
+        """Susun baris-baris dashboard dari satu snapshot"""
+        columns, rows = shutil.get_terminal_size((100, 40))
+        spark_width = max(10, columns - 32)
+        record = snapshot['record']
+        births = snapshot['events'].get('births', {})
+        deaths = snapshot['events'].get('deaths', {})
+
+        lines = [f"🌱 Ecosystem dashboard — langkah {snapshot['step']}"
+                 f"   ({self._rate(snapshot):.1f} langkah/detik, refresh {self.refresh_hz:g} Hz)",
+                 ""]
+
+        for key, label, code in SPARK_SERIES:
+            values = snapshot['series'].get(key)
+            if values is None or len(values) == 0:
+                continue
+            line = sparkline(values, spark_width)
+            if ansi:
+                line = f"\x1b[{code}m{line}\x1b[0m"
+            current = values[-1]
+            change = ""
+            if key in births:
+                change = f" +{births[key]}/-{deaths.get(key, 0)}"
+            lines.append(f"{label} {current:>9.1f}{change:<10} {line}")
+
+        # Peta kepadatan (sisa tinggi terminal, rasio aspek karakter ~1:2)
+        map_rows = max(4, min(rows - len(lines) - len(snapshot['phases']) - 6, 24))
+        map_cols = max(10, min(columns - 2, int(map_rows * 2 * self.width / max(1, self.height))))
+        population = sum(record.get(key, 0) for key in ('herbivore', 'elk', 'carnivore'))
+        lines.append("")
+        lines.append(f"🗺️  Kepadatan agen ({population} agen, grid {self.width}x{self.height})")
+        lines.extend(density_map(snapshot['positions'], self.width, self.height,
+                                 map_cols, map_rows, color=ansi))
+
+        lines.append("")
+        lines.append(f"⏱️  {'Fase':<14} {'terakhir':>10} {'rata-rata':>10}")
+        for name, (last_ms, mean_ms) in snapshot['phases'].items():
+            lines.append(f"   {name:<14} {last_ms:>8.2f}ms {mean_ms:>8.2f}ms")
+
+        if self.messages:
+            lines.append("")
+            lines.extend(list(self.messages))
+        return lines
+
+
+def create_terminal_dashboard(refresh_hz: float = 2.0) -> TerminalDashboard:
+    """
+    Factory function untuk dashboard terminal
+    """
+    return TerminalDashboard(refresh_hz=refresh_hz)